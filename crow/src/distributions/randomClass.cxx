@@ -40,6 +40,14 @@ double RandomClass::random() {
     return (_rng->_backend()-_rng->_backend.min())/_range;
   }
 
+std::vector<double> RandomClass::randomVector(unsigned int n) {
+    std::vector<double> values(n);
+    for(unsigned int i = 0; i < n; i++) {
+      values[i] = random();
+    }
+    return values;
+}
+
 int RandomClass::get_rng_state() {
     return _counter;
 }
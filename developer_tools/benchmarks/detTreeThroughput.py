@@ -0,0 +1,81 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the branch bookkeeping throughput (branches/sec) of the Dynamic Event Tree
+  samplers on a synthetic tree. For each finished branch, the node of the branch is looked up
+  in the tree (as DynamicEventTree._retrieveParentNode does) and its child branches are
+  created and appended. The lookup uses the name index of the tree, or the full traversal
+  of the tree (list(root.iter(name))[0]) used before the index was introduced.
+
+  Usage:
+    python detTreeThroughput.py [--nodes 1000,10000,100000] [--children 2] [--traversalNodes 10000]
+"""
+import os
+import sys
+import time
+import argparse
+from collections import deque
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, 'framework'))
+sys.path.append(frameworkDir)
+
+from utils import TreeStructure as ETS
+
+def runBenchmark(nNodes, nChildren, indexed):
+  """
+    Grows a tree, branch by branch, until it has nNodes nodes.
+    @ In, nNodes, int, number of nodes of the final tree
+    @ In, nChildren, int, number of branches created by each finished branch
+    @ In, indexed, bool, if True use the name index to find the finished branches, otherwise traverse the tree
+    @ Out, branchesPerSec, float, throughput
+  """
+  root = ETS.HierarchicalNode('DET_1')
+  root.add('name', 'DET_1')
+  tree = ETS.HierarchicalTree(root)
+  finished = deque(['DET_1'])
+  created = 1
+  start = time.time()
+  while created < nNodes:
+    name = finished.popleft()
+    if indexed:
+      parentNode = tree.findByName(name)
+    else:
+      parentNode = list(root.iter(name))[0]
+    for child in range(1, min(nChildren, nNodes - created) + 1):
+      rname = name + '-' + str(child)
+      subGroup = ETS.HierarchicalNode(rname)
+      subGroup.add('parent', name)
+      subGroup.add('name', rname)
+      subGroup.add('conditionalPb', 1.0 / nChildren)
+      parentNode.appendBranch(subGroup)
+      finished.append(rname)
+      created += 1
+  elapsed = time.time() - start
+  return (created - 1) / elapsed
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='Dynamic Event Tree branch bookkeeping benchmark')
+  parser.add_argument('--nodes', type=str, default='1000,10000,100000', help='comma-separated tree sizes')
+  parser.add_argument('--children', type=int, default=2, help='number of branches created by each finished branch')
+  parser.add_argument('--traversalNodes', type=int, default=10000, help='largest tree size for which the traversal lookup is run')
+  args = parser.parse_args()
+  sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+  print('{:>10s} {:>26s} {:>26s} {:>9s}'.format('nodes', 'traversal (branches/sec)', 'indexed (branches/sec)', 'speedup'))
+  for nNodes in [int(n) for n in args.nodes.split(',')]:
+    after = runBenchmark(nNodes, args.children, indexed=True)
+    if nNodes <= args.traversalNodes:
+      before = runBenchmark(nNodes, args.children, indexed=False)
+      print('{:>10d} {:>26.1f} {:>26.1f} {:>9.2f}'.format(nNodes, before, after, after/before))
+    else:
+      print('{:>10d} {:>26s} {:>26.1f} {:>9s}'.format(nNodes, '-', after, '-'))
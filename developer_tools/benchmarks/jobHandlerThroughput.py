@@ -0,0 +1,111 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Benchmark of the JobHandler throughput (jobs/sec) for no-op internal jobs.
+  It compares the event-driven scheduler (runners notify the JobHandler, the
+  step loop blocks on JobHandler.waitForJobEvent) with the legacy loops, where
+  both the JobHandler and the step were sleep-polling.
+
+  Usage:
+    python jobHandlerThroughput.py [--jobs 2000] [--batchSize 1,4,16]
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+
+frameworkDir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, 'framework'))
+sys.path.append(frameworkDir)
+
+from utils import utils
+utils.find_crow(frameworkDir)
+utils.add_path_recursively(os.path.join(frameworkDir, 'contrib', 'pp'))
+
+import MessageHandler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet'})
+
+from JobHandler import JobHandler
+from Decorators.Parallelization import Parallel
+
+stepSleepTime = 0.005 # default Step sleepTime
+
+@Parallel()
+def noop():
+  """
+    Job that does nothing
+    @ In, None
+    @ Out, noop, dict, empty evaluation
+  """
+  return {}
+
+def pollingLoop(jobHandler):
+  """
+    The JobHandler loop as it was before the event-driven scheduler
+    @ In, jobHandler, JobHandler, the job handler
+    @ Out, None
+  """
+  while not jobHandler.completed:
+    jobHandler.fillJobQueue()
+    jobHandler.cleanJobQueue()
+    time.sleep(jobHandler.sleepTime)
+
+def runBenchmark(nJobs, batchSize, polling):
+  """
+    Submits nJobs no-op jobs and collects them as a MultiRun step does.
+    @ In, nJobs, int, number of jobs to run
+    @ In, batchSize, int, number of parallel slots (RunInfo batchSize)
+    @ In, polling, bool, if True use the legacy sleep-polling loops
+    @ Out, jobsPerSec, float, throughput
+  """
+  jobHandler = JobHandler()
+  jobHandler.applyRunInfo({'batchSize':batchSize, 'maxQueueSize':None, 'internalParallel':False})
+  jobHandler.initialize()
+  if polling:
+    loop = threading.Thread(target=pollingLoop, args=(jobHandler,))
+  else:
+    loop = threading.Thread(target=jobHandler.startLoop)
+  loop.daemon = True
+  loop.start()
+  submitted = 0
+  collected = 0
+  start = time.time()
+  jobEvent = jobHandler.currentJobEvent()
+  while collected < nJobs:
+    for job in jobHandler.getFinished():
+      job.getEvaluation()
+      collected += 1
+    for _ in range(min(jobHandler.availability(), nJobs - submitted)):
+      jobHandler.addJob((), noop, 'noop_{}'.format(submitted))
+      submitted += 1
+    if polling:
+      time.sleep(stepSleepTime)
+    else:
+      jobEvent = jobHandler.waitForJobEvent(jobEvent, timeout=stepSleepTime)
+  elapsed = time.time() - start
+  jobHandler.shutdown()
+  loop.join()
+  return nJobs / elapsed
+
+if __name__ == '__main__':
+  parser = argparse.ArgumentParser(description='JobHandler throughput benchmark')
+  parser.add_argument('--jobs', type=int, default=2000, help='number of no-op jobs')
+  parser.add_argument('--batchSize', type=str, default='1,4,16', help='comma-separated batch sizes')
+  args = parser.parse_args()
+  print('{:>10s} {:>22s} {:>22s} {:>9s}'.format('batchSize', 'polling (jobs/sec)', 'event (jobs/sec)', 'speedup'))
+  for batchSize in [int(b) for b in args.batchSize.split(',')]:
+    before = runBenchmark(args.jobs, batchSize, polling=True)
+    after = runBenchmark(args.jobs, batchSize, polling=False)
+    print('{:>10d} {:>22.1f} {:>22.1f} {:>9.2f}'.format(batchSize, before, after, after/before))
@@ -196,6 +196,16 @@ class CodeInterfaceBase(utils.metaclass_insert(abc.ABCMeta,object)):
     for e in exts:
       self.inputExtensions.append(e)
 
+  def getReadOnlyInputs(self, inputFiles):
+    """
+      This method returns the input files that are never modified (by the code interface or by the code itself),
+      so that they can be linked in the run directories instead of copied (see the <inputStaging> node of the Code).
+      By default, all the input files are considered modifiable.
+      @ In, inputFiles, list, list of the original input files
+      @ Out, readOnly, list, list of the indices (in inputFiles) of the read-only input files
+    """
+    return []
+
   def addDefaultExtension(self):
     """
       This method sets a list of default extensions a specific code interface accepts for the input files.
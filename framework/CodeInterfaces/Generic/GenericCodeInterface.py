@@ -44,6 +44,7 @@ class GenericCode(CodeInterfaceBase):
     self.execPostfix      = ''       # executioner command postfix (e.g. -zcvf)
     self.caseName         = None     # base label for outgoing files, should default to inputFileName
     self.fixedOutFileName = None     # CSV output filename of the run code (in case it is hardcoded in the driven code)
+    self._inputTemplate   = None     # GenericParser of the original input files, copied for each new input
 
   def _readMoreXML(self,xmlNode):
     """
@@ -60,6 +61,27 @@ class GenericCode(CodeInterfaceBase):
       else:
         self.fixedOutFileName = '.'.join(self.fixedOutFileName.split(".")[:-1])
 
+  def initialize(self, runInfo, oriInputFiles):
+    """
+      Method to initialize the run of a new step.
+      The original input files are parsed once here; each new input is then generated from a copy of
+      the parsed template (the input files of each run are copies of the original ones).
+      @ In, runInfo, dict,  dictionary of the info in the <RunInfo> XML block
+      @ In, oriInputFiles, list, list of the original input files
+      @ Out, None
+    """
+    CodeInterfaceBase.initialize(self, runInfo, oriInputFiles)
+    origfiles = [inputFile for inputFile in oriInputFiles if inputFile.getExt() in self.getInputExtension()]
+    self._inputTemplate = GenericParser.GenericParser(origfiles)
+
+  def getReadOnlyInputs(self, inputFiles):
+    """
+      Only the input files with one of the input extensions are modified by this interface.
+      @ In, inputFiles, list, list of the original input files
+      @ Out, readOnly, list, list of the indices (in inputFiles) of the read-only input files
+    """
+    return [index for index, inputFile in enumerate(inputFiles) if inputFile.getExt() not in self.getInputExtension()]
+
   def addDefaultExtension(self):
     """
       The Generic code interface does not accept any default input types.
@@ -178,7 +200,10 @@ class GenericCode(CodeInterfaceBase):
     for index,inputFile in enumerate(origInputFiles):
       if inputFile.getExt() in self.getInputExtension():
         origfiles.append(inputFile)
-    parser = GenericParser.GenericParser(infiles)
+    if self._inputTemplate is not None:
+      parser = self._inputTemplate.copy()
+    else:
+      parser = GenericParser.GenericParser(infiles)
     parser.modifyInternalDictionary(**Kwargs)
     parser.writeNewInput(infiles,origfiles)
     return currentInputFiles
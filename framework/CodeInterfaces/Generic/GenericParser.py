@@ -20,6 +20,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 
 import os
 import sys
+import copy
 import numpy as np
 from utils import mathUtils
 # numpy with version 1.14.0 and upper will change the floating point type and print
@@ -62,68 +63,90 @@ class GenericParser():
     self.segments  = {} # segments[inputFile]
     self.printTag = 'GENERIC_PARSER'
     for inputFile in self.inputFiles:
-      infileName = inputFile.getFilename()#os.path.basename(inputFile)
-      self.segments[infileName] = []
-      if not os.path.exists(inputFile.getAbsFile()):
-        ## Make sure to cast the inputFile to a string as it may be File object.
-        raise IOError('Input file not found: ' + str(inputFile))
-      seg = ''
-      lines = inputFile.readlines()
-      inputFile.close()
-      for line in lines:
-        while self.prefixKey in line and self.postfixKey in line:
-          self.segments[infileName].append(seg)
-          start = line.find(self.prefixKey)
-          end = line.find(self.postfixKey,start+1)
-          var = line[start+len(self.prefixKey):end]
-          if defaultDelim in var or formatDelim in var:
-            optionalPos = [None]*2
-            optionalPos[0], optionalPos[1] = var.find(defaultDelim), var.find(formatDelim)
-            if optionalPos[0] == -1:
-              optionalPos[0]  = sys.maxsize
-            if optionalPos[1] == -1:
-              optionalPos[1] = sys.maxsize
-            defval    = var[optionalPos[0]+1:min(optionalPos[1],len(var))] if optionalPos[0] < optionalPos[1] else var[min(optionalPos[0]+1,len(var)):len(var)]
-            varformat = var[min(optionalPos[1]+1,len(var)):len(var)] if optionalPos[0] < optionalPos[1] else var[optionalPos[1]+1:min(optionalPos[0],len(var))]
-            var = var[0:min(optionalPos)]
-            if var in self.defaults.keys() and optionalPos[0] != sys.maxsize:
-              print('multiple default values given for variable',var)
-            if var in self.formats.keys() and optionalPos[1] != sys.maxsize:
-              print('multiple format values given for variable',var)
-            #TODO allow the user to specify take-last or take-first?
-            if var not in self.defaults.keys() and optionalPos[0] != sys.maxsize:
-              self.defaults[var] = {}
-            if var not in self.formats.keys()  and optionalPos[1] != sys.maxsize:
-              self.formats[var ] = {}
-            if optionalPos[0] != sys.maxsize:
-              self.defaults[var][infileName]=defval
-            if optionalPos[1] != sys.maxsize:
-              # check if the format is valid
-              if not any(formVal in varformat for formVal in self.acceptFormats.keys()):
-                try:
-                  int(varformat)
-                except ValueError:
-                  raise ValueError("the format specified for wildcard "+ line[start+len(self.prefixKey):end] +
-                                                     " is unknown. Available are either a plain integer or the following "+" ".join(self.acceptFormats.keys()))
-                self.formats[var][infileName ]=varformat,int
-              else:
-                for formVal in self.acceptFormats.keys():
-                  if formVal in varformat:
-                    self.formats[var][infileName ]=varformat,self.acceptFormats[formVal]; break
-          self.segments[infileName].append(line[:start])
-          self.segments[infileName].append(var)
-          if var not in self.varPlaces.keys():
-            self.varPlaces[var] = {infileName:[len(self.segments[infileName])-1]}
-          elif infileName not in self.varPlaces[var].keys():
-            self.varPlaces[var][infileName]=[len(self.segments[infileName])-1]
-          else:
-            self.varPlaces[var][infileName].append(len(self.segments[infileName])-1)
-          #self.segments.append(line[end+1:])
-          line=line[end+1:]
-          seg = ''
+      self._parseFile(inputFile, defaultDelim, formatDelim)
+
+  def _parseFile(self, inputFile, defaultDelim, formatDelim):
+    """
+      Parses an input file, splitting it in the segments around the variables to replace.
+      @ In, inputFile, FileObject, the input file to parse
+      @ In, defaultDelim, string, the string used between prefix and postfix to set default values
+      @ In, formatDelim, string, the string used between prefix and postfix to set the format of the value
+      @ Out, None
+    """
+    infileName = inputFile.getFilename()#os.path.basename(inputFile)
+    self.segments[infileName] = []
+    if not os.path.exists(inputFile.getAbsFile()):
+      ## Make sure to cast the inputFile to a string as it may be File object.
+      raise IOError('Input file not found: ' + str(inputFile))
+    seg = ''
+    lines = inputFile.readlines()
+    inputFile.close()
+    for line in lines:
+      while self.prefixKey in line and self.postfixKey in line:
+        self.segments[infileName].append(seg)
+        start = line.find(self.prefixKey)
+        end = line.find(self.postfixKey,start+1)
+        var = line[start+len(self.prefixKey):end]
+        if defaultDelim in var or formatDelim in var:
+          optionalPos = [None]*2
+          optionalPos[0], optionalPos[1] = var.find(defaultDelim), var.find(formatDelim)
+          if optionalPos[0] == -1:
+            optionalPos[0]  = sys.maxsize
+          if optionalPos[1] == -1:
+            optionalPos[1] = sys.maxsize
+          defval    = var[optionalPos[0]+1:min(optionalPos[1],len(var))] if optionalPos[0] < optionalPos[1] else var[min(optionalPos[0]+1,len(var)):len(var)]
+          varformat = var[min(optionalPos[1]+1,len(var)):len(var)] if optionalPos[0] < optionalPos[1] else var[optionalPos[1]+1:min(optionalPos[0],len(var))]
+          var = var[0:min(optionalPos)]
+          if var in self.defaults.keys() and optionalPos[0] != sys.maxsize:
+            print('multiple default values given for variable',var)
+          if var in self.formats.keys() and optionalPos[1] != sys.maxsize:
+            print('multiple format values given for variable',var)
+          #TODO allow the user to specify take-last or take-first?
+          if var not in self.defaults.keys() and optionalPos[0] != sys.maxsize:
+            self.defaults[var] = {}
+          if var not in self.formats.keys()  and optionalPos[1] != sys.maxsize:
+            self.formats[var ] = {}
+          if optionalPos[0] != sys.maxsize:
+            self.defaults[var][infileName]=defval
+          if optionalPos[1] != sys.maxsize:
+            # check if the format is valid
+            if not any(formVal in varformat for formVal in self.acceptFormats.keys()):
+              try:
+                int(varformat)
+              except ValueError:
+                raise ValueError("the format specified for wildcard "+ line[start+len(self.prefixKey):end] +
+                                                   " is unknown. Available are either a plain integer or the following "+" ".join(self.acceptFormats.keys()))
+              self.formats[var][infileName ]=varformat,int
+            else:
+              for formVal in self.acceptFormats.keys():
+                if formVal in varformat:
+                  self.formats[var][infileName ]=varformat,self.acceptFormats[formVal]; break
+        self.segments[infileName].append(line[:start])
+        self.segments[infileName].append(var)
+        if var not in self.varPlaces.keys():
+          self.varPlaces[var] = {infileName:[len(self.segments[infileName])-1]}
+        elif infileName not in self.varPlaces[var].keys():
+          self.varPlaces[var][infileName]=[len(self.segments[infileName])-1]
         else:
-          seg+=line
-      self.segments[infileName].append(seg)
+          self.varPlaces[var][infileName].append(len(self.segments[infileName])-1)
+        #self.segments.append(line[end+1:])
+        line=line[end+1:]
+        seg = ''
+      else:
+        seg+=line
+    self.segments[infileName].append(seg)
+
+  def copy(self):
+    """
+      Creates a new parser using this one as a template, without reading and parsing the input files again.
+      The variable placements, defaults and formats are shared with this parser (they are not modified by
+      the new samples), while the segments that get filled with the sampled values are copied.
+      @ In, None
+      @ Out, new, GenericParser, the new parser
+    """
+    new = copy.copy(self)
+    new.segments = dict((infileName, list(segments)) for infileName, segments in self.segments.items())
+    return new
 
   def modifyInternalDictionary(self,**Kwargs):
     """
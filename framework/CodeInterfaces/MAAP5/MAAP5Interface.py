@@ -80,6 +80,8 @@ class MAAP5(GenericCode):
     """
     self.samplerType=samplerType
     if 'dynamiceventtree' in str(samplerType).lower():
+      # the branch inputs are modified here, so they must be parsed again
+      self._inputTemplate = None
       if Kwargs['RAVEN_parentID'] == 'None':
         self.oriInput(oriInputFiles) #original input files are checked only the first time
       self.stopSimulation(currentInputFiles, Kwargs)
@@ -38,6 +38,28 @@ class MooseBasedApp(CodeInterfaceBase):
     self.outputPrefix = 'out~'
     self.vectorPPFound = None # Indicates if a MOOSE vector postprocessor is in use
     self.vectorPPDict = None  # Contains information about the postprocessor used
+    self._inputTemplate = None   # MOOSEparser of the original input file, reused for each new input
+    self._genericTemplate = None # GenericParser of the original "generic" input files, copied for each new input
+
+  def initialize(self, runInfo, oriInputFiles):
+    """
+      Method to initialize the run of a new step.
+      The original input files are parsed once here; each new input is then generated from the parsed
+      templates (the input files of each run are copies of the original ones).
+      @ In, runInfo, dict,  dictionary of the info in the <RunInfo> XML block
+      @ In, oriInputFiles, list, list of the original input files
+      @ Out, None
+    """
+    CodeInterfaceBase.initialize(self, runInfo, oriInputFiles)
+    self._inputTemplate, self._genericTemplate = None, None
+    genericOriInput = []
+    for inputFile in oriInputFiles:
+      if inputFile.getAbsFile().endswith(self.getInputExtension()):
+        self._inputTemplate = MOOSEparser.MOOSEparser(inputFile.getAbsFile())
+      if inputFile.getType().lower() == "generic":
+        genericOriInput.append(inputFile)
+    if genericOriInput:
+      self._genericTemplate = GenericParser.GenericParser(genericOriInput)
 
   def generateCommand(self, inputFiles, executable, clargs=None, fargs=None, preExec=None):
     """
@@ -67,6 +89,15 @@ class MooseBasedApp(CodeInterfaceBase):
     returnCommand = executeCommand, outputfile
     return returnCommand
 
+  def getReadOnlyInputs(self, inputFiles):
+    """
+      Only the MOOSE input file and the "generic" input files are modified by this interface (e.g. the mesh files are not).
+      @ In, inputFiles, list, list of the original input files
+      @ Out, readOnly, list, list of the indices (in inputFiles) of the read-only input files
+    """
+    return [index for index, inputFile in enumerate(inputFiles)
+            if not inputFile.getAbsFile().endswith(self.getInputExtension()) and inputFile.getType().lower() != "generic"]
+
   def createNewInput(self, currentInputFiles, oriInputFiles, samplerType, **Kwargs):
     """
       this generates a new input file depending on which sampler has been chosen
@@ -95,7 +126,11 @@ class MooseBasedApp(CodeInterfaceBase):
     # build output file names # TODO this probably isn't necessary thanks to file structures anymore
     outName = self.outputPrefix + currentInputFiles[index].getBase()
     # get a parser for the input file
-    parser = MOOSEparser.MOOSEparser(currentInputFiles[index].getAbsFile())
+    # (the parsed original input is never modified by modifyOrAdd, so it can be reused)
+    if self._inputTemplate is not None:
+      parser = self._inputTemplate
+    else:
+      parser = MOOSEparser.MOOSEparser(currentInputFiles[index].getAbsFile())
     # apply the requested modifications
     modifDict = self._expandVarNames(**Kwargs)
     ### set up output to place in a csv
@@ -109,7 +144,10 @@ class MooseBasedApp(CodeInterfaceBase):
     self.vectorPPFound, self.vectorPPDict = parser.vectorPostProcessor()
     # or this.
     if genericInput:
-      parser = GenericParser.GenericParser(genericInput)
+      if self._genericTemplate is not None:
+        parser = self._genericTemplate.copy()
+      else:
+        parser = GenericParser.GenericParser(genericInput)
       parser.modifyInternalDictionary(**Kwargs)
       parser.writeNewInput(genericInput, genericOriInput)
 
@@ -33,6 +33,14 @@ class Relap5(CodeInterfaceBase):
   """
     this class is used a part of a code dictionary to specialize Model.Code for RELAP5-3D Version 4.0.3
   """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    CodeInterfaceBase.__init__(self)
+    self._inputTemplate = None # RELAPparser of the original input file, copied for each new (non-DET) input
 
   def initialize(self, runInfo, oriInputFiles):
     """
@@ -45,6 +53,8 @@ class Relap5(CodeInterfaceBase):
     self.detVars = [] # in case of DET
     index = self._findInputFileIndex(oriInputFiles)
     parser = RELAPparser.RELAPparser(oriInputFiles[index].getAbsFile())
+    # the input files of each run are copies of the original one, so the parsed input is kept as template
+    self._inputTemplate = parser
     self.numberOfDecks = parser.maxNumberOfDecks
     cards = []
     for operator in self.operators:
@@ -320,7 +330,12 @@ class Relap5(CodeInterfaceBase):
     # find input file index
     index = self._findInputFileIndex(currentInputFiles)
     # instanciate the parser
-    parser = RELAPparser.RELAPparser(currentInputFiles[index].getAbsFile(), self.det)
+    if self._inputTemplate is not None and not self.det:
+      # copy the parsed original input instead of reading and parsing it again
+      parser = copy.deepcopy(self._inputTemplate)
+    else:
+      # DET branches restart from different inputs, with the trips added to the minor edits
+      parser = RELAPparser.RELAPparser(currentInputFiles[index].getAbsFile(), self.det)
     if self.det:
       self.inputAliases = Kwargs.get('alias').get('input')
       self._samplersDictionary[samplerType] = self.dynamicEventTreeForRELAP5
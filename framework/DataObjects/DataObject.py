@@ -311,6 +311,18 @@ class DataObject(utils.metaclass_insert(abc.ABCMeta, BaseEntity)):
     """
     pass
 
+  @abc.abstractmethod
+  def addRealizations(self,rlzs):
+    """
+      Adds several "rows" (or "samples") to this data object at once.
+      Note that rlzs can include many more variables than this data object actually wants.
+      @ In, rlzs, dict, {var:vals} format where
+                         "var" is the variable name as a string,
+                         "vals" is a np.ndarray whose first dimension runs over the realizations.
+      @ Out, None
+    """
+    pass
+
   @abc.abstractmethod
   def addVariable(self,varName,values,classify='meta'):
     """
@@ -30,8 +30,10 @@ import xarray as xr
 # relative import for RAVEN, local import for unit tests
 try:
   from .DataObject import DataObject
+  from . import RealizationIndex
 except ValueError:
   from DataObject import DataObject
+  import RealizationIndex
 
 import CsvLoader
 from utils import utils, cached_ndarray, xmlUtils, mathUtils
@@ -64,8 +66,8 @@ class DataSet(DataObject):
     self.type             = 'DataSet'
     self.types            = None             # list of type objects, for each realization entry
     self.printTag         = self.name
-    self.defaultDtype     = object
     self._scaleFactors    = {}               # mean, sigma for data for matching purposes
+    self._matchIndexes    = {}               # indexes of the values for matching purposes, as {(exact, vars):index}
     self._alignedIndexes  = {}               # dict {index:values} of indexes with aligned coordinates (so they are not in the collector, but here instead)
     self._neededForReload = [self.sampleTag] # metavariables required to reload this data object.
 
@@ -197,8 +199,8 @@ class DataSet(DataObject):
     #
     #  Yours truly, talbpw, May 2019
     #########
-    # protect against back-changing realization
-    rlz = copy.deepcopy(rlz)
+    # protect against back-changing realization (the arrays stored as they are are copied when collected)
+    rlz = dict(rlz)
     # if index map was included, remove that now before checking variables
     indexMap = rlz.pop('_indexMap', None)
     if indexMap is not None:
@@ -222,32 +224,42 @@ class DataSet(DataObject):
 
     ## check alignment of indexes
     self._checkAlignedIndexes(rlz)
-    #  NB If no scalar entry is made, this construction fails.  In that case,
-    #  instead of treating each dataarrray as an object, numpy.asarray calls their asarray methods,
-    #  unfolding them and making a full numpy array with more dimensions, instead of effectively
-    #  a list of realizations, where each realization is effectively a list of xr.DataArray objects.
-    #
-    #  To mitigate this behavior, we forcibly add a [0.0] entry to each realization, then exclude
-    #  it once the realizations are constructed.  This seems like an innefficient option; others
-    #  should be explored.  - talbpaul, 12/2017
-    # newData is a numpy array of realizations,
-    #   each of which is a numpy array of some combination of scalar values and/or xr.DataArrays.
-    #   This is because the cNDarray collector expects a LIST of realization, not a single realization.
-    #   Maybe the "append" method should be renamed to "extend" or changed to append one at a time.
-    ## set realizations as a list of realizations (which are ordered lists)
-    newData = np.array(list(rlz[var] for var in self._orderedVars)+[0.0], dtype=object)
-    newData = newData[:-1]
     # if data storage isn't set up, set it up
     if self._collector is None:
       self._collector = self._newCollector(width=len(rlz))
-    # append
-    self._collector.append(newData)
+    # append; scalars go in the typed columns of the collector, while ND values (arrays) are stored as objects
+    self._collector.append(list(copy.deepcopy(rlz[var]) if isinstance(rlz[var], np.ndarray) else rlz[var] for var in self._orderedVars))
 
     # if hierarchical, clear the parent as an ending
     self._clearParentEndingStatus(rlz)
     # reset scaling factors, kd tree
     self._resetScaling()
 
+  def addRealizations(self, rlzs):
+    """
+      Adds several "rows" (or "samples") to this data object at once.
+      As for addRealization, rlzs can include many more variables than this data object actually wants.
+      @ In, rlzs, dict, {var:vals} format where
+                         "var" is the variable name as a string,
+                         "vals" is a np.ndarray whose first dimension runs over the realizations.
+      @ Out, None
+    """
+    columns = dict((var, rlzs[var]) for var in self.getVars() + self.indexes if var in rlzs)
+    sizes = set(len(vals) for vals in columns.values())
+    if len(sizes) > 1:
+      self.raiseAnError(IndexError,'Provided realizations for "{}" have inconsistent lengths: {}'.format(self.name, sorted(sizes)))
+    numRlz = sizes.pop() if sizes else 0
+    # the first realization sets up the collector (and the checks, data types, etc.) as usual
+    start = 0
+    if numRlz > 0 and self._canExtendCollector(columns):
+      self.addRealization(dict((var, np.atleast_1d(vals[0])) for var, vals in columns.items()))
+      # the others only have scalars, so they go straight in the collector columns
+      rest = list(np.asarray(columns[var][1:]) for var in self._orderedVars)
+      self._collector.extend(rest)
+      start = numRlz
+    for r in range(start, numRlz):
+      self.addRealization(dict((var, np.atleast_1d(vals[r])) for var, vals in columns.items()))
+
   def addVariable(self,varName,values,classify='meta',indices=None):
     """
       Adds a variable/column to the data.  "values" needs to be as long as self.size.
@@ -530,7 +542,6 @@ class DataSet(DataObject):
                                      if asDataSet: xarray.Dataset, all matching realizations as xarray.Dataset OR None if not found
                                      else        : list, list of matching realizatiions as [{var:value1}, {var:value2}, ...]
     """
-    # TODO convert input space to KD tree for faster searching -> XArray.DataArray has this built in?
     ## first, check that some direction was given, either an index or a match to find
     if (index is None and (matchDict is None and noMatchDict is None)) or (index is not None and (matchDict is not None or noMatchDict is not None)):
       self.raiseAnError(TypeError,'Either "index" OR ("matchDict" and/or "noMatchDict") (not both) must be specified to use "realization!"')
@@ -571,14 +582,16 @@ class DataSet(DataObject):
     ## END select by index
     ## START collect by matching realization
     else: # matchDict must not be None
-      # if nothing in data, try collector
-      if numInData == 0:
-        # if nothing in data OR collector, we can't have a match
-        if numInCollector == 0:
-          return 0, None
-        # otherwise, get it from the collector
-        else:
-          index, rlz = self._getRealizationFromCollectorByValue(matchDict, noMatchDict, tol=tol, first=first)
+      # if nothing in data OR collector, we can't have a match
+      if numInData == 0 and numInCollector == 0:
+        return 0, None
+      # look up only the realizations close to the requested values, if they can be indexed
+      found = self._getRealizationFromIndexByValue(matchDict, noMatchDict, tol=tol, unpackXArray=unpackXArray, first=first)
+      if found is not None:
+        index, rlz = found
+      # otherwise, if nothing in data, try collector
+      elif numInData == 0:
+        index, rlz = self._getRealizationFromCollectorByValue(matchDict, noMatchDict, tol=tol, first=first)
       # otherwise, first try to find it in the data
       else:
         index, rlz = self._getRealizationFromDataByValue(matchDict, noMatchDict, tol=tol, unpackXArray=unpackXArray)# should we add options=options to this one as well?
@@ -639,6 +652,7 @@ class DataSet(DataObject):
       self._scaleFactors.pop(variable,None)
     #either way reset kdtree
     self.inputKDTree = None
+    self._matchIndexes = {}
 
   def renameVariable(self,old,new):
     """
@@ -672,6 +686,7 @@ class DataSet(DataObject):
     # change scaling factor entry
     if old in self._scaleFactors:
       self._scaleFactors[new] = self._scaleFactors.pop(old)
+    self._matchIndexes = {}
     if self._data is not None:
       self._data = self._data.rename({old:new})
 
@@ -687,6 +702,7 @@ class DataSet(DataObject):
     self._meta = {}
     self._alignedIndexes = {}
     self._scaleFactors = {}
+    self._matchIndexes = {}
 
   def setData(self, data, meta):
     """
@@ -698,6 +714,7 @@ class DataSet(DataObject):
     assert isinstance(data, xr.Dataset)
     self._collector = None
     self._data = data
+    self._matchIndexes = {}
     self._meta = meta
     # if we have meta information, we can reconstruct the IO space for this DO
     if 'DataSet' in meta:
@@ -838,6 +855,25 @@ class DataSet(DataObject):
       rlz['_indexMap'] = self.getDimensions()
     return rlz
 
+  def _canExtendCollector(self, columns):
+    """
+      Checks if realizations provided by column (see addRealizations) can be added directly to the collector,
+      i.e. if they are made of scalar variables only and no per-realization action is needed.
+      @ In, columns, dict, {var:vals} with the realization values of each variable
+      @ Out, canExtend, bool, True if the columns can be added to the collector with a single extension
+    """
+    # indexes need alignment checks and hierarchical data needs the parent endings updated, for each realization
+    if self.indexes or 'RAVEN_parentID' in self.getVars():
+      return False
+    if set(columns) != set(self.getVars()):
+      return False
+    for var, vals in columns.items():
+      if not isinstance(vals, np.ndarray) or vals.ndim != 1 or vals.dtype == object:
+        return False
+      if self.getDimensions(var)[var] not in [[self.sampleTag], []]:
+        return False
+    return True
+
   def _changeVariableValue(self,index,var,value):
     """
       Changes the value of a variable for a particular realization in the data object, in collector or data.
@@ -850,6 +886,8 @@ class DataSet(DataObject):
     """
     assert(var in self._orderedVars)
     assert(mathUtils.isSingleValued(value)) #['float','str','int','unicode','bool'])
+    # the indexes of the values of this variable are not valid anymore
+    self._matchIndexes = dict((key, index) for key, index in self._matchIndexes.items() if var not in key[1])
     lenColl = len(self._collector) if self._collector is not None else 0
     lenData = len(self._data[self.sampleTag]) if self._data      is not None else 0
     # if it's in the data ...
@@ -857,7 +895,7 @@ class DataSet(DataObject):
       self._data[var].values[index] = value
     # if it's in the collector ...
     elif index < lenColl + lenData:
-      self._collector[index][self._orderedVars.index(var)] = value
+      self._collector[index - lenData, self._orderedVars.index(var)] = value
     else:
       self.raiseAnError(IndexError,'Requested value change for realization "{}", which is past the end of the data object!'.format(index))
 
@@ -1131,6 +1169,39 @@ class DataSet(DataObject):
       toClear = toClear.isel({dim:np.unique(toClear[dim], return_index=True)[1]})
     return toClear
 
+  def _collectorRowMatches(self, r, matchIndices, matchVals, avoidIndices, avoidVals, tol):
+    """
+      Checks if a realization in the collector matches the provided values (see _getRealizationFromCollectorByValue).
+      Float values match within the relative tolerance "tol", other values must be equal.
+      @ In, r, int, index of the realization in the collector
+      @ In, matchIndices, tuple(int), collector columns of the variables to match
+      @ In, matchVals, tuple, values to match, one per column in matchIndices
+      @ In, avoidIndices, tuple(int), collector columns of the variables to AVOID matching
+      @ In, avoidVals, tuple, values (or lists of values) to avoid, one per column in avoidIndices
+      @ In, tol, float, tolerance to which match should be made
+      @ Out, match, bool, True if the realization matches
+    """
+    # find matches first
+    if matchIndices:
+      for e, element in enumerate(self._collector[r, matchIndices]):
+        if mathUtils.isAFloatOrInt(element):
+          match = mathUtils.compareFloats(matchVals[e], element, tol=tol)
+        else:
+          match = matchVals[e] == element
+        if not match:
+          return False
+    # avoid antimatches if we match so far
+    if avoidIndices:
+      # NOTE there may be multiple entries per var in noMatch
+      for e, element in enumerate(self._collector[r, avoidIndices]):
+        if mathUtils.isAFloatOrInt(element):
+          for avoid in np.atleast_1d(avoidVals[e]):
+            if mathUtils.compareFloats(avoid, element, tol=tol):
+              return False
+        elif element in np.atleast_1d(avoidVals[e]): # TODO histories?
+          return False
+    return True
+
   def _convertArrayListToDataset(self,array,action='return'):
     """
       Converts a 1-D array of xr.DataArrays into a xr.Dataset, then takes action on self._data:
@@ -1299,7 +1370,7 @@ class DataSet(DataObject):
                 if val is None:
                   val = self._collector[r, self._orderedVars.index(idx)]
                 coords[idx] = val
-              self._collector[r][v] = self.constructNDSample(values, dims, coords, name=str(r))
+              self._collector[r, v] = self.constructNDSample(values, dims, coords, name=str(r))
             # then collapse these entries into a single datarray
             arrays[var] = self._collapseNDtoDataArray(self._collector[:,v], var, dtype=dtype)
         # if it's a dataarray, then that's old-style histories, no-can do right now
@@ -1339,6 +1410,35 @@ class DataSet(DataObject):
       self._clearAlignment()
     return self._data
 
+  def _dataRowMatches(self, index, match, noMatch, tol):
+    """
+      Checks if a realization in the data matches the provided values (see _getRealizationFromDataByValue).
+      Float values match within "tol" once scaled, other values must be equal.
+      @ In, index, int, index of the realization in the data
+      @ In, match, dict, elements to match
+      @ In, noMatch, dict, elements to AVOID matching (should not match within tolerance)
+      @ In, tol, float, tolerance to which match should be made
+      @ Out, match, bool, True if the realization matches
+    """
+    for var, val in match.items():
+      value = self._data[var].values[index]
+      if mathUtils.isAFloatOrInt(val):
+        loc, scale = self._getScalingFactors(var)
+        if not abs((value - loc)/scale - (val - loc)/scale) < tol:
+          return False
+      elif not value == val:
+        return False
+    for var, vals in (noMatch or {}).items():
+      value = self._data[var].values[index]
+      vals = np.atleast_1d(vals)
+      if mathUtils.isAFloatOrInt(vals[0]):
+        loc, scale = self._getScalingFactors(var)
+        if any(abs((value - loc)/scale - (val - loc)/scale) < tol for val in vals):
+          return False
+      elif any(value == val for val in vals):
+        return False
+    return True
+
   def _formatRealization(self,rlz):
     """
       Formats realization without truncating data
@@ -1357,11 +1457,12 @@ class DataSet(DataObject):
         # indexes have the correct dtype.  In the first pass, they aren't going into the collector, but into alignedIndexes.
         rlz[var] = np.array(rlz[var],dtype=dtype)
     # for now, leave them as the arrays they are, except single entries need converting
+    allDims = self.getDimensions()
     for var, val in rlz.items():
       # if an index variable, skip it
       if var in self._pivotParams:
         continue
-      dims = self.getDimensions(var)[var]
+      dims = allDims[var]
       ## change dimensionless to floats -> TODO use operator to collapse!
       if dims in [[self.sampleTag], []]:
         if len(val) == 1:
@@ -1496,20 +1597,9 @@ class DataSet(DataObject):
     self._orderedVars = self.vars + self.indexes
     # make a collector from scratch
     rows = len(utils.first(source.values()))
-    cols = len(self._orderedVars)
-    # can this for-loop be done in a comprehension?  The dtype seems to be a bit of an issue.
-    data = np.zeros([rows,cols],dtype=object)
-    for v,var in enumerate(self._orderedVars):
-      if len(source[var].shape) > 1:
-        # we can't set all at once, because the user gave us an ND array instead of a np.array(dtype=object) of np.array.
-        #    if we try -> ValueError: "could not broadcast input array from shape (#rlz,#time) into shape (#rlz)
-        for i in range(len(data)):
-          data[i,v] = source[var][i]
-      else:
-        # we can set it at once, the fast way.
-        data[:,v] = source[var]
-    # set up collector as cached nd array of values -> TODO might be some wasteful copying here
-    self._collector = cached_ndarray.cNDarray(values=data,dtype=object)
+    self._collector = self._newCollector(width=len(self._orderedVars), length=rows)
+    # scalar variables are set at once, the fast way; for ND arrays, each realization is an entry
+    self._collector.extend(list(source[var] for var in self._orderedVars))
     # set datatypes for each variable
     rlz = self.realization(index=0)
     self._setDataTypes(rlz)
@@ -1553,6 +1643,7 @@ class DataSet(DataObject):
                 self.name.strip(),'":',",".join(requiredDims))
     self._orderedVars = self.vars
     self._data = datasetSub
+    self._matchIndexes = {}
     for key, val in self._data.attrs.items():
       self._meta[key] = val
 
@@ -1580,6 +1671,42 @@ class DataSet(DataObject):
       _type = object
     return _type
 
+  def _getMatchIndex(self, variables, exact):
+    """
+      Provides the index of the values of some scalar variables in all the realizations (data, then collector),
+      used to find the realizations matching some values. The index is kept up to date with the realizations
+      added since the last call, and removed (see self._matchIndexes) when the stored values are changed.
+      @ In, variables, tuple(str), the variables to index (only one if "exact")
+      @ In, exact, bool, if True the values must be matched exactly (e.g. strings), otherwise they are floats
+      @ Out, index, RealizationIndex.PointIndex or RealizationIndex.LabelIndex, the index (None if not possible)
+    """
+    key = (exact, variables)
+    index = self._matchIndexes.get(key)
+    if index is False:
+      # these values cannot be indexed
+      return None
+    if index is None or index.size > self.size:
+      index = RealizationIndex.LabelIndex() if exact else RealizationIndex.PointIndex(len(variables))
+      self._matchIndexes[key] = index
+    if index.size < self.size:
+      try:
+        values = self._getScalarValues(variables, index.size, self.size)
+        if exact:
+          values = values[0]
+          if any(mathUtils.isAFloatOrInt(value) for value in values):
+            raise TypeError('numerical values are matched within a tolerance')
+          hash(tuple(values))
+        else:
+          values = np.asarray(values, dtype=float).T
+          if not np.all(np.isfinite(values)):
+            raise ValueError('non-finite values cannot be indexed')
+      except (TypeError, ValueError) as e:
+        self.raiseADebug('Values of "{}" cannot be indexed for matching: {}'.format(','.join(variables), e))
+        self._matchIndexes[key] = False
+        return None
+      index.append(values)
+    return index
+
   def _getRealizationFromCollectorByIndex(self,index):
     """
       Obtains a realization from the collector storage using the provided index.
@@ -1615,53 +1742,22 @@ class DataSet(DataObject):
 
     assert(self._collector is not None)
 
-    # TODO KD Tree for faster values -> still want in collector?
-    # TODO slow double loop
+    # NOTE a search using an index of the values is tried first in "realization", this is the full search
     matchVars, matchVals = zip(*toMatch.items()) if toMatch else ([], [])
     avoidVars, avoidVals = zip(*noMatch.items()) if noMatch else ([], [])
-    matchIndices = tuple(self._orderedVars.index(var) for var in matchVars)# What did we use this in?
+    matchIndices = tuple(self._orderedVars.index(var) for var in matchVars)
+    avoidIndices = tuple(self._orderedVars.index(var) for var in avoidVars)
     if not first:
       rr, rlz = [], []
-    for r, row in enumerate(self._collector[:]): #TODO: CAN WE MAKE R START FROM LAST MATCHINDEXES ?
-      match = True
-      # find matches first
-      if toMatch:
-        possibleMatch = self._collector[r, matchIndices]
-        for e, element in enumerate(np.atleast_1d(possibleMatch)):
-          if mathUtils.isAFloatOrInt(element):
-            match &= mathUtils.compareFloats(matchVals[e], element, tol=tol)
-          else:
-            match &= matchVals[e] == element
-          if not match:
-            break
-      # avoid antimatches if we match so far
-      if match and noMatch:
-        # NOTE there may be multiple entries per var in noMatch
-        possibleAvoid = self._collector[r, tuple(self._orderedVars.index(var) for var in avoidVars)]
-        for e, element in enumerate(np.atleast_1d(possibleAvoid)):
-          var = avoidVars[e]
-          if mathUtils.isAFloatOrInt(element):
-            for avoid in np.atleast_1d(avoidVals[e]):
-              match &= not mathUtils.compareFloats(avoid, element, tol=tol)
-              if not match:
-                break
-          else:
-            match &= element not in np.atleast_1d(avoidVals[e]) # TODO histories?
-          if not match:
-            break
-      if match:
+    for r in range(len(self._collector)):
+      if self._collectorRowMatches(r, matchIndices, matchVals, avoidIndices, avoidVals, tol):
         if first:
-          break
-        else:
-          rr.append(r)
-          rlz.append(self._getRealizationFromCollectorByIndex(r))
-    if match:
-      if first:
-        return r, self._getRealizationFromCollectorByIndex(r)
-      else:
-        return rr, rlz
-    else:
-      return len(self), None
+          return r, self._getRealizationFromCollectorByIndex(r)
+        rr.append(r)
+        rlz.append(self._getRealizationFromCollectorByIndex(r))
+    if not first and rr:
+      return rr, rlz
+    return len(self), None
 
   def _getRealizationFromDataByIndex(self,index, unpackXArray=False):
     """
@@ -1740,6 +1836,65 @@ class DataSet(DataObject):
       return len(self),None
     return idx,self._getRealizationFromDataByIndex(idx,unpackXArray)
 
+  def _getRealizationFromIndexByValue(self, match, noMatch, tol=1e-15, unpackXArray=False, first=True):
+    """
+      Obtains the realizations matching the provided values using an index of the stored values (see _getMatchIndex),
+      so that only the few candidates close to the requested values are checked. The results are the same as
+      searching the data (see _getRealizationFromDataByValue) and then the collector (see
+      _getRealizationFromCollectorByValue). If the search cannot use an index (e.g. no variables to match,
+      ND variables, non-finite values), returns None, meaning that the full search is needed.
+      @ In, match, dict, elements to match
+      @ In, noMatch, dict, elements to AVOID matching (should not match within tolerance)
+      @ In, tol, float, optional, tolerance to which match should be made
+      @ In, unpackXArray, bool, optional, True if the coordinates of the xarray variables must be exposed in the dict
+      @ In, first, bool, optional, return the first matching realization in the collector only?
+      @ Out, found, tuple or None, (index, rlz) as returned by "realization", or None if the index cannot be used
+    """
+    if not match or not tol < 1.0 or any(var not in self._orderedVars for var in itertools.chain(match, noMatch or {})):
+      return None
+    floatVars = tuple(sorted(var for var, val in match.items() if mathUtils.isAFloatOrInt(val)))
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    if floatVars:
+      point = np.array([match[var] for var in floatVars], dtype=float)
+      if not np.all(np.isfinite(point)):
+        return None
+      index = self._getMatchIndex(floatVars, exact=False)
+      if index is None:
+        return None
+      # search radius (in the original units) that includes the matches both in the data (scaled, absolute tolerance)
+      # and in the collector (relative tolerance), with some room for round-off: candidates are checked afterwards
+      radius = 0.0
+      for var, val in zip(floatVars, point):
+        loc, scale = self._getScalingFactors(var) if numInData else (0.0, 0.0)
+        varRadius = max(tol*abs(scale), tol*abs(val)/(1.0 - tol))
+        radius = max(radius, varRadius*(1.0 + 1e-6) + 16*np.finfo(float).eps*(abs(val) + abs(loc) + varRadius))
+      candidates = index.query(point, radius)
+    else:
+      var = sorted(match)[0]
+      index = self._getMatchIndex((var,), exact=True)
+      if index is None:
+        return None
+      candidates = index.query(match[var])
+    # the data are searched first: only its first match is reported
+    for g in candidates:
+      if g >= numInData:
+        break
+      if self._dataRowMatches(g, match, noMatch, tol):
+        idx = self._data[self.sampleTag].values.item(g)
+        return idx, self._getRealizationFromDataByIndex(idx, unpackXArray)
+    # then the collector
+    matchVars, matchVals = zip(*match.items())
+    avoidVars, avoidVals = zip(*noMatch.items()) if noMatch else ([], [])
+    matchIndices = tuple(self._orderedVars.index(var) for var in matchVars)
+    avoidIndices = tuple(self._orderedVars.index(var) for var in avoidVars)
+    rr = [g - numInData for g in candidates if g >= numInData and
+          self._collectorRowMatches(g - numInData, matchIndices, matchVals, avoidIndices, avoidVals, tol)]
+    if not rr:
+      return len(self), None
+    if first:
+      return rr[0], self._getRealizationFromCollectorByIndex(rr[0])
+    return rr, list(self._getRealizationFromCollectorByIndex(r) for r in rr)
+
   def _getRequestedElements(self, options):
     """
       Obtains a list of the elements to be written, based on defaults and options[what]
@@ -1768,6 +1923,29 @@ class DataSet(DataObject):
       keep = set(self._inputs + self._outputs + self._metavars + self._neededForReload)
     return keep
 
+  def _getScalarValues(self, variables, start, end):
+    """
+      Collects the values of scalar variables in a range of realizations, counting first the realizations
+      in the data and then the ones in the collector.
+      @ In, variables, tuple(str), the variables
+      @ In, start, int, index of the first realization
+      @ In, end, int, index past the last realization
+      @ Out, values, list(np.ndarray), values of each variable in the realizations
+    """
+    numInData = len(self._data[self.sampleTag]) if self._data is not None else 0
+    values = []
+    for var in variables:
+      if self.getDimensions(var)[var]:
+        raise TypeError('variable "{}" is not a scalar'.format(var))
+      parts = []
+      if start < numInData:
+        parts.append(self._data[var].values[start:min(end, numInData)])
+      if end > numInData:
+        column = self._getVariableIndex(var)
+        parts.append(np.asarray(self._collector[max(start, numInData) - numInData:end - numInData, column]))
+      values.append(np.concatenate(parts) if len(parts) > 1 else parts[0])
+    return values
+
   def _getScalingFactors(self, var):
     """
       Returns (or defaults) scaling factors.
@@ -1841,16 +2019,14 @@ class DataSet(DataObject):
     # otherwise, return happily and continue loading the CSV
     return dims
 
-  def _newCollector(self,width=1,length=100,dtype=None):
+  def _newCollector(self,width=1,length=100):
     """
       Creates a new collector object and returns it.
       @ In, width, int, optional, width of collector
       @ In, length, int, optional, initial length of (allocated) collector
-      @ In, dtype, type, optional, type of entires (float if all float, usually should be object)
+      @ Out, collector, cached_ndarray.cColumnarArray, the new collector (typed columns for scalars, objects otherwise)
     """
-    if dtype is None:
-      dtype = self.defaultDtype # set in subclasses if different
-    return cached_ndarray.cNDarray(width=width,length=length,dtype=dtype)
+    return cached_ndarray.cColumnarArray(width=width,length=length)
 
   def _readPandasCSV(self, fname, nullOK=None):
     """
@@ -0,0 +1,116 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Indexes of the values of the realizations stored in the DataObjects, used to find the
+  realizations matching some values (see DataSet.realization) without scanning all of them.
+  Both indexes only grow: realizations are identified by their position in the DataObject.
+"""
+#External Modules------------------------------------------------------------------------------------
+import numpy as np
+from scipy import spatial
+#External Modules End--------------------------------------------------------------------------------
+
+class PointIndex(object):
+  """
+    Index of the values of some scalar (float) variables, answering "which realizations are within a distance
+    of this point" queries. The realizations are kept in a KD-tree plus a buffer with the most recent ones;
+    the tree is rebuilt (when queried) only once the buffer is larger than a fraction of the tree, so that
+    appending realizations one at a time is amortized.
+  """
+  def __init__(self, dimension, minBuffer=64, rebuildFraction=0.25):
+    """
+      Constructor
+      @ In, dimension, int, number of variables (coordinates) of each point
+      @ In, minBuffer, int, optional, maximum number of points scanned linearly before the tree is rebuilt
+      @ In, rebuildFraction, float, optional, maximum size of the buffer as fraction of the tree size
+      @ Out, None
+    """
+    self.size = 0                                 # number of indexed realizations
+    self._points = np.empty((100, dimension))     # coordinates of the points (cached capacity)
+    self._tree = None                             # KD-tree with the first _treeSize points
+    self._treeSize = 0
+    self._minBuffer = minBuffer
+    self._rebuildFraction = rebuildFraction
+
+  def append(self, points):
+    """
+      Adds the points of new realizations to the index.
+      @ In, points, np.ndarray, coordinates of the new points with shape (# realizations, dimension)
+      @ Out, None
+    """
+    new = len(points)
+    if self.size + new > len(self._points):
+      capacity = len(self._points)
+      while capacity < self.size + new:
+        capacity *= 4
+      grown = np.empty((capacity, self._points.shape[1]))
+      grown[:self.size] = self._points[:self.size]
+      self._points = grown
+    self._points[self.size:self.size+new] = points
+    self.size += new
+
+  def query(self, point, radius):
+    """
+      Finds the points whose coordinates are all within "radius" of "point" (i.e. within the infinity norm).
+      @ In, point, np.ndarray, the coordinates of the point
+      @ In, radius, float, the maximum distance along each coordinate
+      @ Out, found, np.ndarray, sorted indices of the realizations found
+    """
+    buffered = self.size - self._treeSize
+    if buffered > max(self._minBuffer, self._rebuildFraction*self._treeSize):
+      # the tree keeps a reference to its data, so pass a copy (the cache could be overwritten when growing)
+      self._tree = spatial.cKDTree(self._points[:self.size].copy())
+      self._treeSize = self.size
+    found = []
+    if self._tree is not None:
+      found.extend(self._tree.query_ball_point(point, radius, p=np.inf))
+    if self.size > self._treeSize:
+      buffer = self._points[self._treeSize:self.size]
+      found.extend(self._treeSize + np.where(np.all(np.abs(buffer - point) <= radius, axis=1))[0])
+    return np.sort(np.asarray(found, dtype=int))
+
+class LabelIndex(object):
+  """
+    Index of the values of a variable that is matched exactly (e.g. the "prefix" of the realizations).
+  """
+  def __init__(self):
+    """
+      Constructor
+      @ In, None
+      @ Out, None
+    """
+    self.size = 0       # number of indexed realizations
+    self._rows = {}     # {value: [indices of the realizations with this value]}
+
+  def append(self, values):
+    """
+      Adds the values of new realizations to the index.
+      @ In, values, np.ndarray, the values of the new realizations (must be hashable)
+      @ Out, None
+    """
+    for r, value in enumerate(values):
+      self._rows.setdefault(value, []).append(self.size + r)
+    self.size += len(values)
+
+  def query(self, value):
+    """
+      Finds the realizations with the given value.
+      @ In, value, object, the value to look for
+      @ Out, found, list, sorted indices of the realizations found
+    """
+    try:
+      return self._rows.get(value, [])
+    except TypeError:
+      # unhashable values cannot be in the index
+      return []
@@ -159,6 +159,15 @@ class DateBase(BaseEntity, InputDataUser):
     path = os.path.join(self.databaseDir, self.filename)
     return path
 
+  def flush(self):
+    """
+      Writes to file any realization collected in memory but not yet stored, if the database buffers them.
+      Called at the end of the Steps that use this database as Output.
+      @ In, None
+      @ Out, None
+    """
+    pass
+
   @abc.abstractmethod
   def saveDataToFile(self, source):
     """
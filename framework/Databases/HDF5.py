@@ -27,6 +27,7 @@ import numpy as np
 #Internal Modules------------------------------------------------------------------------------------
 from utils import InputData, InputTypes
 from h5py_interface_creator import hdf5Database as h5Data
+from h5py_interface_creator import hdf5ColumnarDatabase as h5ColumnarData
 from DataObjects import PointSet, HistorySet
 from .Database import DateBase
 #Internal Modules End--------------------------------------------------------------------------------
@@ -36,6 +37,31 @@ class HDF5(DateBase):
     class to handle h5py (hdf5) databases,
     Used to add and retrieve attributes and values from said database
   """
+  @classmethod
+  def getInputSpecification(cls):
+    """
+      Method to get a reference to a class that specifies the input data for
+      class cls.
+      @ In, cls, the class for which we are retrieving the specification
+      @ Out, spec, InputData.ParameterInput, class to use for
+        specifying input of cls.
+    """
+    spec = super(HDF5, cls).getInputSpecification()
+    spec.addParam('layout', InputTypes.makeEnumType('hdf5Layout', 'hdf5LayoutType', ['groups', 'columnar']),
+        descr=r"""structure of the file. With \xmlString{groups}, each realization is stored in its own group,
+              which allows to store hierarchical (e.g. Dynamic Event Tree) realizations. With \xmlString{columnar},
+              the values of each variable are stored in a single dataset, which is much faster to write and read
+              for large numbers of realizations. When reading, the layout of the existing file is used.
+              \default{groups}""")
+    spec.addParam('compression', InputTypes.makeEnumType('hdf5Compression', 'hdf5CompressionType', ['gzip', 'lzf', 'none']),
+        descr=r"""compression algorithm of the datasets. \default{gzip} for the \xmlString{columnar} layout,
+              \xmlString{none} otherwise""")
+    spec.addSub(InputData.parameterInputFactory('bufferSize', contentType=InputTypes.IntegerType,
+        descr=r"""number of realizations collected in memory before writing them to the file, for the
+              \xmlString{columnar} layout. Any realization still in memory is written at the end of the Step.
+              \default{100}"""))
+    return spec
+
   #####################
   # __magic__
   def __init__(self):
@@ -51,6 +77,9 @@ class HDF5(DateBase):
     self._allvars  = []
     self.printTag = 'DATABASE-HDF5'
     self._extension = '.h5'
+    self._layout = 'groups'     # structure of the file to create, "groups" or "columnar"
+    self._compression = None    # compression algorithm (None for the default of the layout)
+    self._bufferSize = 100      # number of realizations collected before writing them (columnar layout only)
 
   def __getstate__(self):
     """
@@ -78,7 +107,7 @@ class HDF5(DateBase):
     """
     self.__dict__.update(newstate)
     self.exist = True
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist)
+    self.database = self._createDatabase()
 
   def _handleInput(self, paramInput):
     """
@@ -86,6 +115,14 @@ class HDF5(DateBase):
       @ In, paramInput, ParameterInput, the already parsed input.
       @ Out, None
     """
+    # these are needed before the database is initialized (in the base class)
+    self._layout = paramInput.parameterValues.get('layout', 'groups')
+    self._compression = paramInput.parameterValues.get('compression', None)
+    bufferNode = paramInput.findFirst('bufferSize')
+    if bufferNode is not None:
+      if bufferNode.value < 1:
+        self.raiseAnError(IOError, f'HDF5 database "{self.name}": <bufferSize> must be a positive integer, got {bufferNode.value}!')
+      self._bufferSize = bufferNode.value
     super(HDF5, self)._handleInput(paramInput)
 
   #####################
@@ -107,7 +144,34 @@ class HDF5(DateBase):
       @ Out, None
     """
     super(HDF5, self).initializeDatabase()
-    self.database = h5Data(self.name, self.databaseDir, self.filename, self.exist, self.variables)
+    self.database = self._createDatabase()
+
+  def _createDatabase(self):
+    """
+      Creates the underlying database object, according to the layout of the file (existing or to create).
+      @ In, None
+      @ Out, database, h5Data or h5ColumnarData, the database object
+    """
+    if self.exist:
+      columnar = h5ColumnarData.isColumnar(self.get_fullpath())
+    else:
+      columnar = self._layout == 'columnar'
+    if columnar:
+      compression = 'gzip' if self._compression is None else self._compression
+      database = h5ColumnarData(self.name, self.databaseDir, self.filename, self.exist, self.variables,
+                                compression=None if compression == 'none' else compression, bufferSize=self._bufferSize)
+    else:
+      compression = None if self._compression == 'none' else self._compression
+      database = h5Data(self.name, self.databaseDir, self.filename, self.exist, self.variables, compression=compression)
+    return database
+
+  def flush(self):
+    """
+      Writes to file any realization collected in memory but not yet stored.
+      @ In, None
+      @ Out, None
+    """
+    self.database.flush()
 
   def saveDataToFile(self, source):
     """
@@ -219,11 +283,34 @@ class HDF5(DateBase):
       @ Out, allData, list of arrays, all the data from this data object.
     """
     allRealizationNames = self.database.retrieveAllHistoryNames()
+    if isinstance(self.database, h5ColumnarData):
+      # all the realizations are read at once, then sorted by name as below
+      allData = self.database.allRealizations()
+      order = sorted(range(len(allRealizationNames)), key=lambda r: allRealizationNames[r])
+      return [allData[r] for r in order]
     # instead to use a OrderedDict in the database, I sort the names here (it is much faster)
     allRealizationNames.sort()
     allData = [self.realization(name) for name in allRealizationNames]
     return allData
 
+  def getVariable(self, var, start=None, stop=None):
+    """
+      Reads the values of a variable for a range of realizations (in insertion order).
+      For the columnar layout, only the requested values are read from the file.
+      @ In, var, str, the variable name
+      @ In, start, int, optional, the index of the first realization (default: the first one)
+      @ In, stop, int, optional, the end of the range of realizations (default: the last one)
+      @ Out, values, np.ndarray or list, the values of the realizations (np.ndarray if the variable has a single
+        value in each realization, list of np.ndarray otherwise, keeping the shape of multidimensional values)
+    """
+    if isinstance(self.database, h5ColumnarData):
+      return self.database.getVariable(var, start, stop)
+    names = self.database.retrieveAllHistoryNames()[start:stop]
+    values = [self.realization(name)[var] for name in names]
+    if all(len(vals) == 1 for vals in values):
+      values = np.concatenate(values) if values else np.zeros(0)
+    return values
+
   def realization(self,index=None,matchDict=None,tol=1e-15):
     """
       Method to obtain a realization from the data, either by index (e.g. realization number) or matching value.
@@ -23,6 +23,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 import os
 import numpy as np
 import xarray as xr
+import netCDF4
 
 from utils import InputData, InputTypes, xmlUtils, mathUtils
 from .Database import DateBase
@@ -44,6 +45,11 @@ class NetCDF(DateBase):
     spec = super(NetCDF, cls).getInputSpecification()
     spec.description = r"""File storage format based on NetCDF4 protocol, which is natively compatible
                        with xarray DataSets used in RAVEN DataObjects."""
+    spec.addSub(InputData.parameterInputFactory('bufferSize', contentType=InputTypes.IntegerType,
+        descr=r"""number of realizations collected in memory before writing them to the file. The realizations
+              are appended to the file, which is rewritten only if the new realizations are not consistent with
+              the stored ones (e.g. different index coordinates). Any realization still in memory is written
+              at the end of the Step. \default{1}"""))
     return spec
 
   def __init__(self):
@@ -56,6 +62,32 @@ class NetCDF(DateBase):
     self.printTag = 'DATABASE-NetCDF'  # For printing verbosity labels
     self._format = 'netcdf4'  # writing format for disk
     self._extension = '.nc'
+    self._bufferSize = 1      # number of realizations collected before writing them
+    self._buffer = []         # realizations (as xr.Dataset) not yet written to file
+    self._counter = None      # sample ID of the next realization (None if to be read from file)
+
+  def _handleInput(self, paramInput):
+    """
+      Function to handle the common parts of the database parameter input.
+      @ In, paramInput, ParameterInput, the already parsed input.
+      @ Out, None
+    """
+    super()._handleInput(paramInput)
+    bufferNode = paramInput.findFirst('bufferSize')
+    if bufferNode is not None:
+      if bufferNode.value < 1:
+        self.raiseAnError(IOError, f'NetCDF database "{self.name}": <bufferSize> must be a positive integer, got {bufferNode.value}!')
+      self._bufferSize = bufferNode.value
+
+  def initializeDatabase(self):
+    """
+      Initialize underlying database object.
+      @ In, None
+      @ Out, None
+    """
+    super().initializeDatabase()
+    self._buffer = []
+    self._counter = None
 
   def saveDataToFile(self, source):
     """
@@ -63,6 +95,8 @@ class NetCDF(DateBase):
       @ In, source, DataObjects.DataObject, object to write to file
       @ Out, None
     """
+    # realizations already added come first
+    self.flush()
     ds, meta = source.getData()
     # we actually just tell the DataSet to write out as netCDF
     path = self.get_fullpath()
@@ -87,12 +121,9 @@ class NetCDF(DateBase):
       # NOTE order matters! This preserves the sampling order in which data was inserted
       #      into this database
       ds = xr.concat((exists, ds), 'RAVEN_sample_ID')
-    # if this is open somewhere else, we can't write to it
-    # TODO is there a way to check if it's writable? I can't find one ...
-    try:
-      ds.to_netcdf(path, engine=self._format)
-    except PermissionError:
-      self.raiseAnError(PermissionError, f'NetCDF file "{path}" denied RAVEN permission to write! Is it open in another program?')
+    self._writeFile(ds, path)
+    # the next sample ID depends on the data just written
+    self._counter = None
 
   def loadIntoData(self, target):
     """
@@ -100,6 +131,7 @@ class NetCDF(DateBase):
       @ In, target, DataObjects.DataObjet, object to write data into
       @ Out, None
     """
+    self.flush()
     # the main data
     # NOTE: DO NOT use open_dataset unless you wrap it in a "with xr.open_dataset(f) as ds"!
     # -> open_dataset does NOT close the file object after loading!
@@ -123,17 +155,14 @@ class NetCDF(DateBase):
     """
     # apparently we're storing samples!
     # -> do we already have data present?
-    path = self.get_fullpath()
-    if os.path.isfile(path):
-      # load data as 100 sample chunks, lazily (not into memory)
-      # -> using the argument "chunks" triggers the lazy loading using dask
-      # existing = xr.open_dataset(path, chunks={'RAVEN_sample_ID': 100}) # TODO user option
-      existing = True
-      with xr.open_dataset(path) as ds: # autocloses at end of scope
-        counter = int(ds.RAVEN_sample_ID.values[-1]) + 1
-    else:
-      existing = None
-      counter = 0
+    if self._counter is None:
+      path = self.get_fullpath()
+      if os.path.isfile(path):
+        with xr.open_dataset(path) as ds: # autocloses at end of scope
+          self._counter = int(ds.RAVEN_sample_ID.values[-1]) + 1
+      else:
+        self._counter = 0
+    counter = self._counter
     # create DS from realization # TODO make a feature of the Realization object
     indexMap = rlz.get('_indexMap', [{}])[0]
     indices = list(set().union(*(set(x) for x in indexMap.values())))
@@ -150,11 +179,95 @@ class NetCDF(DateBase):
         vals = vals[0]
       coords = dict((idx, rlz[idx]) for idx in indexMap.get(var, []))
       xarrs[var] = xr.DataArray(vals, dims=dims, coords=coords).expand_dims(dim={'RAVEN_sample_ID': [counter]})
-    rlzDS = xr.Dataset(xarrs)
-    if existing:
+    self._buffer.append(xr.Dataset(xarrs))
+    self._counter += 1
+    if len(self._buffer) >= self._bufferSize:
+      self.flush()
+
+  def flush(self):
+    """
+      Writes to file the realizations collected in memory, appending them to the stored ones.
+      @ In, None
+      @ Out, None
+    """
+    if not self._buffer:
+      return
+    # after research, best approach is concatenating xr.DataSet along RAVEN_sample_ID dim
+    new = xr.concat(self._buffer, dim='RAVEN_sample_ID') if len(self._buffer) > 1 else self._buffer[0]
+    self._buffer = []
+    path = self.get_fullpath()
+    if os.path.isfile(path):
+      if self._appendToFile(new, path):
+        return
+      # the new realizations do not fit the stored structure, so rewrite everything
+      self.raiseADebug(f'Rewriting NetCDF database "{path}" to store realizations with a different structure')
       with xr.open_dataset(path) as ds: # autocloses at end of scope
-        # after research, best approach is concatenating xr.DataSet along RAVEN_sample_ID dim
-        new = xr.concat((ds, rlzDS), dim='RAVEN_sample_ID')
-    else:
-      new = rlzDS
-    new.to_netcdf(path) # TODO would appending instead of writing work for new samples? I doubt it.
+        new = xr.concat((ds, new), dim='RAVEN_sample_ID').load()
+    self._writeFile(new, path)
+
+  def _appendToFile(self, new, path):
+    """
+      Appends realizations to the file along its (unlimited) sample dimension, without rewriting the data
+      already stored. This is possible only if the new realizations have the same variables and (non-sample)
+      coordinates of the stored ones, with compatible types.
+      @ In, new, xr.Dataset, the realizations to append
+      @ In, path, str, path of the file
+      @ Out, appended, bool, True if appended, False if the file must be rewritten instead
+    """
+    with netCDF4.Dataset(path, 'a') as nc:
+      samples = nc.dimensions.get('RAVEN_sample_ID')
+      if samples is None or not samples.isunlimited() or set(new.variables) != set(nc.variables):
+        return False
+      for dim, size in new.sizes.items():
+        if dim != 'RAVEN_sample_ID' and (dim not in nc.dimensions or len(nc.dimensions[dim]) != size):
+          return False
+      for name, var in new.variables.items():
+        stored = nc.variables[name]
+        if var.dims != stored.dimensions:
+          return False
+        if 'RAVEN_sample_ID' not in var.dims:
+          # coordinates of the other indexes must be the same
+          if not np.array_equal(var.values, np.ma.getdata(stored[:])):
+            return False
+        elif var.dims[0] != 'RAVEN_sample_ID' or not self._isCompatible(var.dtype, stored):
+          return False
+      # everything is consistent, so append
+      start = len(samples)
+      for name, var in new.variables.items():
+        if 'RAVEN_sample_ID' in var.dims:
+          values = var.values
+          if values.dtype.kind == 'U':
+            values = values.astype(object)
+          nc.variables[name][start:start + len(values)] = values
+    return True
+
+  @staticmethod
+  def _isCompatible(dtype, stored):
+    """
+      Checks if values can be written in a variable of a NetCDF file without changing their meaning.
+      @ In, dtype, np.dtype, type of the values
+      @ In, stored, netCDF4.Variable, the variable in the file
+      @ Out, compatible, bool, True if compatible
+    """
+    # strings are stored as variable length strings
+    if stored.dtype is str:
+      return dtype.kind in 'UO'
+    # booleans are stored as integers with a "dtype" attribute (see xarray)
+    if 'dtype' in stored.ncattrs() and stored.getncattr('dtype') == 'bool':
+      return dtype.kind == 'b'
+    return dtype.kind in 'biuf' and np.can_cast(dtype, stored.dtype, casting='same_kind')
+
+  def _writeFile(self, ds, path):
+    """
+      Writes a dataset to file, with the sample dimension unlimited so that realizations can be appended.
+      @ In, ds, xr.Dataset, the data to write
+      @ In, path, str, path of the file
+      @ Out, None
+    """
+    unlimited = ['RAVEN_sample_ID'] if 'RAVEN_sample_ID' in ds.dims else None
+    # if this is open somewhere else, we can't write to it
+    # TODO is there a way to check if it's writable? I can't find one ...
+    try:
+      ds.to_netcdf(path, engine=self._format, unlimited_dims=unlimited)
+    except PermissionError:
+      self.raiseAnError(PermissionError, f'NetCDF file "{path}" denied RAVEN permission to write! Is it open in another program?')
@@ -391,14 +391,29 @@ class BoostDistribution(Distribution):
     self.dimensionality  = 1
     self.distType        = 'Continuous'
 
+  @staticmethod
+  def _evaluateArray(function, x):
+    """
+      Evaluates a vector function of the crow distribution (e.g. cdfVector) at each entry of an array.
+      The loop over the entries is performed in crow, calling the same scalar method used for a single
+      coordinate, so the results are identical to the ones obtained point by point.
+      @ In, function, method, crow method taking and returning a vector of floats
+      @ In, x, list or np.array, the coordinates (any shape)
+      @ Out, values, np.array, the values of the function at each coordinate (same shape as x)
+    """
+    x = np.asarray(x, dtype=float)
+    values = function(distribution1D.vectord_cxx(x.ravel().tolist()))
+    values = np.fromiter(values, dtype=float, count=x.size).reshape(x.shape)
+    return values
+
   def cdf(self,x):
     """
       Function to get the cdf at a provided coordinate
-      @ In, x, float, value to get the cdf at
-      @ Out, retunrCdf, float, requested cdf
+      @ In, x, float or np.array, value(s) to get the cdf at
+      @ Out, retunrCdf, float or np.array, requested cdf
     """
     if hasattr(x,'__len__'):
-      returnCdf = np.array([self.cdf(i) for i in x])
+      returnCdf = self._evaluateArray(self._distribution.cdfVector, x)
     else:
       returnCdf = self._distribution.cdf(x)
     return returnCdf
@@ -406,12 +421,11 @@ class BoostDistribution(Distribution):
   def ppf(self,x):
     """
       Function to get the inverse cdf at a provided coordinate
-      @ In, x, float, value to get the inverse cdf at
-      @ Out, retunrPpf, float, requested inverse cdf
+      @ In, x, float or np.array, value(s) to get the inverse cdf at
+      @ Out, retunrPpf, float or np.array, requested inverse cdf
     """
-    # TODO speed this up by doing it in Crow, not in python
     if hasattr(x,'__len__'):
-      returnPpf = np.array([self.ppf(i) for i in x])
+      returnPpf = self._evaluateArray(self._distribution.inverseCdfVector, x)
     else:
       returnPpf = self._distribution.inverseCdf(x)
     return returnPpf
@@ -419,10 +433,13 @@ class BoostDistribution(Distribution):
   def pdf(self,x):
     """
       Function to get the pdf at a provided coordinate
-      @ In, x, float, value to get the pdf at
-      @ Out, returnPdf, float, requested pdf
+      @ In, x, float or np.array, value(s) to get the pdf at
+      @ Out, returnPdf, float or np.array, requested pdf
     """
-    returnPdf = self._distribution.pdf(x)
+    if hasattr(x,'__len__'):
+      returnPdf = self._evaluateArray(self._distribution.pdfVector, x)
+    else:
+      returnPdf = self._distribution.pdf(x)
     return returnPdf
 
   def logPdf(self,x):
@@ -493,8 +510,8 @@ class BoostDistribution(Distribution):
     if size is None:
       rvsValue = self.ppf(random())
     else:
-      # TODO to speed up, do this on the C side instead of in python
-      rvsValue = np.array([self.rvs() for _ in range(size)])
+      # same random numbers (and in the same order) of "size" calls without size
+      rvsValue = self.ppf(random(samples=size, keepMatrix=True).ravel())
     return rvsValue
 
   def selectedRvs(self, discardedElems):
@@ -1717,9 +1734,11 @@ class Categorical(Distribution):
   def pdf(self,x):
     """
       Function that calculates the pdf value of x
-      @ In, x, float/string, value to get the pdf at
-      @ Out, pdfValue, float, requested pdf
+      @ In, x, float/string or np.array, value(s) to get the pdf at
+      @ Out, pdfValue, float or np.array, requested pdf
     """
+    if isinstance(x, (list, np.ndarray)):
+      return np.array([self.pdf(i) for i in x])
     if x in self.values:
       pdfValue =  self.mapping[x]
     else:
@@ -1729,9 +1748,11 @@ class Categorical(Distribution):
   def cdf(self,x):
     """
       Function to get the cdf value of x
-      @ In, x, float/string, value to get the cdf at
-      @ Out, cumulative, float, requested cdf
+      @ In, x, float/string or np.array, value(s) to get the cdf at
+      @ Out, cumulative, float or np.array, requested cdf
     """
+    if isinstance(x, (list, np.ndarray)):
+      return np.array([self.cdf(i) for i in x])
     sortedMapping = sorted(self.mapping.items(), key=operator.itemgetter(0))
     if x in self.values:
       cumulative=0.0
@@ -1745,23 +1766,32 @@ class Categorical(Distribution):
   def ppf(self,x):
     """
       Function that calculates the inverse of the cdf given 0 =< x =< 1
-      @ In, x, float, value to get the ppf at
-      @ Out, element[0], float/string, requested inverse cdf
+      @ In, x, float or np.array, value(s) to get the ppf at
+      @ Out, element[0], float/string or np.array, requested inverse cdf
     """
     sortedMapping = sorted(self.mapping.items(), key=operator.itemgetter(0))
+    if hasattr(x,'__len__'):
+      # np.cumsum accumulates in the same order as the loop below, so the same state is selected
+      cumulative = np.cumsum([element[1] for element in sortedMapping])
+      states = np.array([float(element[0]) for element in sortedMapping])
+      indices = np.searchsorted(cumulative, np.asarray(x, dtype=float), side='left')
+      return states[np.minimum(indices, len(states)-1)]
     cumulative=0.0
     for element in sortedMapping:
       cumulative += element[1]
       if cumulative >= x:
         return float(element[0])
 
-  def rvs(self):
+  def rvs(self, size=None):
     """
       Return a random state of the categorical distribution
-      @ In, None
-      @ Out, rvsValue, float, the random state
+      @ In, size, int, optional, number of entries to return (one if None)
+      @ Out, rvsValue, float or np.array, the random state(s)
     """
-    rvsValue = self.ppf(random())
+    if size is None:
+      rvsValue = self.ppf(random())
+    else:
+      rvsValue = self.ppf(random(samples=size, keepMatrix=True).ravel())
     return rvsValue
 
 DistributionsCollection.addSub(Categorical.getInputSpecification())
@@ -1917,12 +1947,16 @@ class UniformDiscrete(Distribution):
     """
     return self.categoricalDist.ppf(x)
 
-  def rvs(self):
+  def rvs(self, size=None):
     """
       Return a random state of the distribution
-      @ In, None
-      @ Out, rvsValue, float, the random state
+      @ In, size, int, optional, number of entries to return (one if None)
+      @ Out, rvsValue, float or np.array, the random state(s)
     """
+    if size is not None:
+      if self.strategy == 'withReplacement':
+        return self.categoricalDist.rvs(size)
+      return np.array([self.rvs() for _ in range(size)])
     if self.strategy == 'withReplacement':
       return self.categoricalDist.rvs()
     else:
@@ -2803,11 +2837,13 @@ class Custom1D(Distribution):
   def cdf(self,x):
     """
       Function that calculates the cdf value of x
-      @ In, x, scalar , coordinates to get the cdf at
-      @ Out, pdfValue, scalar, requested pdf
+      @ In, x, scalar or np.array, coordinate(s) to get the cdf at
+      @ Out, pdfValue, scalar or np.array, requested pdf
     """
     if self.functionType == 'cdf':
       cdfValue = self.cdfFunc(x)
+    elif hasattr(x,'__len__'):
+      cdfValue = np.array([self.pdfFunc.integral(self.data[0][0],i) for i in x])
     else:
       cdfValue = self.pdfFunc.integral(self.data[0][0],x)
     return cdfValue
@@ -2821,13 +2857,16 @@ class Custom1D(Distribution):
     ppfValue = self.invCDF(x)
     return ppfValue
 
-  def rvs(self):
+  def rvs(self, size=None):
     """
       Return a random state of the custom1D distribution
-      @ In, None
-      @ Out, rvsValue, float/string, the random state
+      @ In, size, int, optional, number of entries to return (one if None)
+      @ Out, rvsValue, float/string or np.array, the random state(s)
     """
-    rvsValue = self.ppf(random())
+    if size is None:
+      rvsValue = self.ppf(random())
+    else:
+      rvsValue = self.ppf(random(samples=size, keepMatrix=True).ravel())
     return rvsValue
 
 DistributionsCollection.addSub(Custom1D.getInputSpecification())
@@ -2898,9 +2937,11 @@ class LogUniform(Distribution):
   def pdf(self,x):
     """
       Function that calculates the pdf value of x
-      @ In, x, float , coordinates to get the pdf at
-      @ Out, pdfValue, float, requested pdf
+      @ In, x, float or np.array, coordinate(s) to get the pdf at
+      @ Out, pdfValue, float or np.array, requested pdf
     """
+    if hasattr(x,'__len__'):
+      return np.array([self.pdf(i) for i in x])
     if self.base == 'natural':
       pdfValue = 1./(self.upperBound-self.lowerBound) * 1./x
     else:
@@ -2910,9 +2951,11 @@ class LogUniform(Distribution):
   def cdf(self,x):
     """
       Function that calculates the cdf value of x
-      @ In, x, float , coordinates to get the cdf at
-      @ Out, pdfValue, float, requested pdf
+      @ In, x, float or np.array, coordinate(s) to get the cdf at
+      @ Out, pdfValue, float or np.array, requested pdf
     """
+    if hasattr(x,'__len__'):
+      return np.array([self.cdf(i) for i in x])
     if self.base == 'natural':
       cdfValue = (math.log(x)-self.lowerBound)/(self.upperBound-self.lowerBound)
     else:
@@ -2922,22 +2965,27 @@ class LogUniform(Distribution):
   def ppf(self,x):
     """
       Return the ppf of given coordinate
-      @ In, x, float, the x coordinates
-      @ Out, ppfValue, float, ppf values
+      @ In, x, float or np.array, the x coordinate(s)
+      @ Out, ppfValue, float or np.array, ppf values
     """
+    if hasattr(x,'__len__'):
+      return np.array([self.ppf(i) for i in x])
     if self.base == 'natural':
       ppfValue = math.exp((self.upperBound-self.lowerBound)*x + self.lowerBound)
     else:
       ppfValue = 10.**((self.upperBound-self.lowerBound)*x + self.lowerBound)
     return ppfValue
 
-  def rvs(self):
+  def rvs(self, size=None):
     """
       Return a random value
-      @ In, None
-      @ Out, rvsValue, float, the random value
+      @ In, size, int, optional, number of entries to return (one if None)
+      @ Out, rvsValue, float or np.array, the random value(s)
     """
-    rvsValue = self.ppf(random())
+    if size is None:
+      rvsValue = self.ppf(random())
+    else:
+      rvsValue = self.ppf(random(samples=size, keepMatrix=True).ravel())
     return rvsValue
 
 DistributionsCollection.addSub(LogUniform.getInputSpecification())
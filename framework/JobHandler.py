@@ -64,10 +64,17 @@ class JobHandler(BaseType):
     self.isRayInitialized = False
     ## Variable containing the info about the RAY parallel server. If None, multi-threading is used
     self.rayServer = None
+    ## Pool of persistent local worker processes (RunInfo processPool). If None, it is not used
+    self.processPool = None
 
-    ## Sleep time for collecting/inquiring/submitting new jobs
+    ## Sleep time for collecting/inquiring/submitting new jobs. Only used for
+    ## polling runners that are not able to notify their completion (e.g. ray)
     self.sleepTime = 1e-4 #0.005
 
+    ## Maximum time the polling thread stays idle when all the running jobs are
+    ## able to notify their completion (safety net only, it is woken up by events)
+    self.maxWaitTime = 0.5
+
     ## Is the execution completed? When True, the JobHandler is shut down
     self.completed = False
 
@@ -106,6 +113,13 @@ class JobHandler(BaseType):
     ############################################################################
 
     self.__queueLock = threading.RLock()
+    ## Event used to wake up the polling thread (startLoop) when there is
+    ## something to do (a new job has been queued or a running job ended)
+    self.__loopEvent = threading.Event()
+    ## Condition (sharing the __queueLock) and counter used to notify the clients
+    ## (e.g. the Steps) that a job has been started or has finished
+    self.__jobEvents = threading.Condition(self.__queueLock)
+    self.__jobEventCounter = 0
     ## List of submitted job identifiers, includes jobs that have completed as
     ## this list is not cleared until a new step is entered
     self.__submittedJobs = []
@@ -206,8 +220,11 @@ class JobHandler(BaseType):
           self.raiseADebug("Remote servers      : ", " , ".join(servers))
 
     else:
-      ## We are just using threading
+      ## We are just using threading (or the local process pool, if requested)
       self.rayServer = None
+      if self.runInfoDict.get('processPool', False) and self.processPool is None:
+        self.processPool = Runners.ProcessPool(self.runInfoDict['batchSize'])
+        self.raiseADebug('Process pool initialized with {} workers'.format(self.processPool.numWorkers))
 
     self.isRayInitialized = True
 
@@ -282,15 +299,67 @@ class JobHandler(BaseType):
     """
     This function begins the polling loop for the JobHandler where it will
     constantly fill up its running queue with jobs in its pending queue and
-    unload finished jobs into its finished queue to be extracted by
+    unload finished jobs into its finished queue to be extracted by the Steps
+    (see getFinished).
+
+    The loop sleeps until a job is queued or a running job notifies its
+    completion; runners that cannot notify (see Runner.notifiesWhenDone) are
+    polled every self.sleepTime seconds.
+    @ In, None
+    @ Out, None
     """
     while not self.completed:
+      ## clear before looking at the queues, so that any event raised while we
+      ## are filling/cleaning them is not lost and the wait below returns immediately
+      self.__loopEvent.clear()
       self.fillJobQueue()
       self.cleanJobQueue()
-      ## TODO May want to revisit this:
-      ## http://stackoverflow.com/questions/29082268/python-time-sleep-vs-event-wait
-      ## probably when we move to Python 3.
-      time.sleep(self.sleepTime)
+      self.__loopEvent.wait(self.sleepTime if self.__needsPolling() else self.maxWaitTime)
+
+  def __needsPolling(self):
+    """
+      Checks if any of the running jobs is not able to notify its completion
+      @ In, None
+      @ Out, needsPolling, bool, True if the running jobs need to be polled
+    """
+    for run in self.__running + self.__clientRunning:
+      if run is not None and not run.notifiesWhenDone:
+        return True
+    return False
+
+  def __notifyJobEvent(self):
+    """
+      Notifies the clients waiting in waitForJobEvent that a job has been
+      started or has finished. Must be called while holding the __queueLock.
+      @ In, None
+      @ Out, None
+    """
+    self.__jobEventCounter += 1
+    self.__jobEvents.notify_all()
+
+  def currentJobEvent(self):
+    """
+      Returns the counter of the job events (jobs started or finished) that
+      happened so far. It is meant to be passed to waitForJobEvent.
+      @ In, None
+      @ Out, currentJobEvent, int, the job event counter
+    """
+    with self.__queueLock:
+      return self.__jobEventCounter
+
+  def waitForJobEvent(self, lastEvent, timeout=None):
+    """
+      Blocks the caller until a job has been started or has finished after the
+      event "lastEvent" (see currentJobEvent), or until "timeout" expires.
+      Events that happen between two calls are not lost, since the counter is
+      compared with the one seen by the caller.
+      @ In, lastEvent, int, the last job event seen by the caller
+      @ In, timeout, float, optional, maximum waiting time in seconds (None waits forever)
+      @ Out, currentJobEvent, int, the job event counter on exit
+    """
+    with self.__jobEvents:
+      self.__jobEvents.wait_for(lambda: self.__jobEventCounter != lastEvent or self.completed, timeout)
+      return self.__jobEventCounter
 
   def addJob(self, args, functionToRun, identifier, metadata=None, forceUseThreads = False, uniqueHandler="any", clientQueue = False, groupInfo = None):
     """
@@ -322,7 +391,16 @@ class JobHandler(BaseType):
     """
     assert "original_function" in dir(functionToRun), "to parallelize a function, it must be" \
            " decorated with RAVEN Parallel decorator"
-    if self.rayServer is None or forceUseThreads:
+    ## Code models spend their time waiting for the external process, so the threads are enough for them
+    if self.processPool is not None and not forceUseThreads and not (len(args) > 0 and isinstance(args[0], Models.Code)):
+      internalJob = Runners.factory.returnInstance('ProcessPoolRunner', args,
+                                                   functionToRun.original_function,
+                                                   processPool=self.processPool,
+                                                   identifier=identifier,
+                                                   metadata=metadata,
+                                                   uniqueHandler=uniqueHandler,
+                                                   profile=self.__profileJobs)
+    elif self.rayServer is None or forceUseThreads:
       internalJob = Runners.factory.returnInstance('SharedMemoryRunner', args,
                                                    functionToRun.original_function,
                                                    identifier=identifier,
@@ -342,26 +420,37 @@ class JobHandler(BaseType):
     internalJob.clientRunner = clientQueue
     #  set the groupping id if present
     if groupInfo is not None:
-      groupId =  groupInfo['id']
-      # TODO: create method in Runner to set flags,ids,etc in the instanciated runner
-      internalJob.groupId = groupId
-      if groupId not in self.__batching:
-        # NOTE: The size of the group is only set once the first job beloning to a group is added
-        #       ***** THE size of a group is IMMUTABLE *****
-        self.__batching[groupId] = {"counter": 0, "ids": [], "size": groupInfo['size'], 'finished': []}
-      self.__batching[groupId]["counter"] += 1
-      if self.__batching[groupId]["counter"] > self.__batching[groupId]["size"]:
-        self.raiseAnError(RuntimeError, "group id {} is full. Size reached:".format(groupId))
-      self.__batching[groupId]["ids"].append(identifier)
+      self.__addToGroup(internalJob, groupInfo)
     # add the runner in the Queue
     self.reAddJob(internalJob)
 
+  def __addToGroup(self, runner, groupInfo):
+    """
+      Registers a runner as a member of a group of runs (batching)
+      @ In, runner, Runner instance, the runner to register
+      @ In, groupInfo, dict, {id:string, size:int} (see addJob)
+      @ Out, None
+    """
+    groupId =  groupInfo['id']
+    # TODO: create method in Runner to set flags,ids,etc in the instanciated runner
+    runner.groupId = groupId
+    if groupId not in self.__batching:
+      # NOTE: The size of the group is only set once the first job beloning to a group is added
+      #       ***** THE size of a group is IMMUTABLE *****
+      self.__batching[groupId] = {"counter": 0, "ids": [], "size": groupInfo['size'], 'finished': []}
+    self.__batching[groupId]["counter"] += 1
+    if self.__batching[groupId]["counter"] > self.__batching[groupId]["size"]:
+      self.raiseAnError(RuntimeError, "group id {} is full. Size reached:".format(groupId))
+    runner.groupIndex = self.__batching[groupId]["counter"] - 1
+    self.__batching[groupId]["ids"].append(runner.identifier)
+
   def reAddJob(self, runner):
     """
       Method to add a runner object in the queue
       @ In, runner, Runner Instance, this is the instance of the runner that we want to readd in the queque
       @ Out, None
     """
+    runner.setDoneCallback(self.__loopEvent.set)
     with self.__queueLock:
       if not runner.clientRunner:
         self.__queue.append(runner)
@@ -370,6 +459,7 @@ class JobHandler(BaseType):
       if self.__profileJobs:
         runner.trackTime('queue')
       self.__submittedJobs.append(runner.identifier)
+    self.__loopEvent.set()
 
   def addClientJob(self, args, functionToRun, identifier, metadata=None, uniqueHandler="any"):
     """
@@ -394,7 +484,7 @@ class JobHandler(BaseType):
                 forceUseThreads = True, uniqueHandler = uniqueHandler,
                 clientQueue = True)
 
-  def addFinishedJob(self, data, metadata=None, uniqueHandler="any", profile=False):
+  def addFinishedJob(self, data, metadata=None, uniqueHandler="any", profile=False, groupInfo=None):
     """
       Takes an already-finished job (for example, a restart realization) and adds it to the finished queue.
       @ In, data, dict, completed realization
@@ -406,6 +496,7 @@ class JobHandler(BaseType):
         method jobHandler.getFinished, the uniqueHandler needs to be provided.
         If uniqueHandler == 'any', every "client" can get this runner
       @ In, profile, bool, optional, if True then at de-construction timing statements will be printed
+      @ In, groupInfo, dict, optional, {id:string, size:int} of the group (batch) this run belongs to (see addJob)
       @ Out, None
     """
     # create a placeholder runner
@@ -415,7 +506,10 @@ class JobHandler(BaseType):
                                          profile=profile)
     # place it on the finished queue
     with self.__queueLock:
+      if groupInfo is not None:
+        self.__addToGroup(run, groupInfo)
       self.__finished.append(run)
+      self.__notifyJobEvent()
 
   def isFinished(self):
     """
@@ -604,6 +698,9 @@ class JobHandler(BaseType):
         if removeFinished:
           if len(self.__batching[groupId]['finished']) ==  self.__batching[groupId]['size']:
             doneBatch = self.__batching.pop(groupId)
+            # the runs of a group (including the already-finished ones, see addFinishedJob) are returned in
+            # submission order, independently of the order they finished in
+            doneBatch['finished'].sort(key=lambda run: run.groupIndex)
             finished.append(doneBatch['finished'])
         else:
           doneBatch = self.__batching[groupId]
@@ -678,6 +775,8 @@ class JobHandler(BaseType):
     ## concerned about this potential inconsistency)
     if len(emptySlots) > 0 and len(self.__queue) > 0:
       with self.__queueLock:
+        ## the queue is being emptied, so new jobs can be accepted
+        self.__notifyJobEvent()
         for i in emptySlots:
           ## The queue could be emptied during this loop, so we will to break
           ## out as soon as that happens so we don't hog the lock.
@@ -722,6 +821,7 @@ class JobHandler(BaseType):
     emptySlots = [i for i,run in enumerate(self.__clientRunning) if run is None]
     if len(emptySlots) > 0 and len(self.__clientQueue) > 0:
       with self.__queueLock:
+        self.__notifyJobEvent()
         for i in emptySlots:
           if len(self.__clientQueue) > 0:
             self.__clientRunning[i] = self.__clientQueue.popleft()
@@ -752,6 +852,7 @@ class JobHandler(BaseType):
             self.__finished.append(run)
             self.__finished[-1].trackTime('jobHandler_finished')
             runList[i] = None
+            self.__notifyJobEvent()
 
   def setProfileJobs(self,profile=False):
     """
@@ -763,12 +864,16 @@ class JobHandler(BaseType):
 
   def startingNewStep(self):
     """
-      Method to reset the __submittedJobs to an empty list.
+      Method to reset the __submittedJobs to an empty list (and the objects
+      cached by the process pool, if any).
       @ In, None
       @ Out, None
     """
     with self.__queueLock:
       self.__submittedJobs = []
+    ## the models might have changed (e.g. ROMs trained), so the workers need fresh copies
+    if self.processPool is not None:
+      self.processPool.clearCache()
 
   def shutdown(self):
     """
@@ -778,8 +883,13 @@ class JobHandler(BaseType):
     @ Out, None
     """
     self.completed = True
+    self.__loopEvent.set()
+    with self.__queueLock:
+      self.__notifyJobEvent()
     if _rayAvail and self.rayServer:
      ray.shutdown()
+    if self.processPool is not None:
+      self.processPool.shutdown()
 
 
   def terminateAll(self):
@@ -796,6 +906,7 @@ class JobHandler(BaseType):
         unfinishedRuns = [run for run in runList if run is not None]
         for run in unfinishedRuns:
           run.kill()
+    self.__loopEvent.set()
 
   def terminateJobs(self, ids):
     """
@@ -821,5 +932,6 @@ class JobHandler(BaseType):
           else:
             queue.remove(job)
           self.raiseADebug('Terminated job "{}" by request.'.format(job.identifier))
+    self.__loopEvent.set()
     if len(ids):
       self.raiseADebug('Tried to remove some jobs but not found in any queues:',', '.join(ids))
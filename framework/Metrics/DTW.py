@@ -21,9 +21,11 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 #End compatibility block for Python 3----------------------------------------------------------------
 
 #External Modules------------------------------------------------------------------------------------
+import itertools
 import numpy as np
 import copy
 import scipy.spatial.distance as spatialDistance
+from scipy.ndimage import maximum_filter1d, minimum_filter1d
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -36,6 +38,17 @@ class DTW(Metric):
     Dynamic Time Warping Metric
     Class for measuring similarity between two variables X and Y, i.e. two temporal sequences
   """
+  # local distances evaluated directly on the anti-diagonals of the cost matrix, without computing it
+  # with scipy, as function of the differences with shape (..., numVariables, numCells)
+  _diagonalDistances = {'euclidean':   lambda d: np.sqrt(np.einsum('...ij,...ij->...j', d, d)),
+                        'l2':          lambda d: np.sqrt(np.einsum('...ij,...ij->...j', d, d)),
+                        'sqeuclidean': lambda d: np.einsum('...ij,...ij->...j', d, d),
+                        'cityblock':   lambda d: np.abs(d).sum(axis=-2),
+                        'manhattan':   lambda d: np.abs(d).sum(axis=-2),
+                        'l1':          lambda d: np.abs(d).sum(axis=-2),
+                        'chebyshev':   lambda d: np.abs(d).max(axis=-2)}
+  # maximum number of cost matrix cells (pairs times cells of an anti-diagonal) processed at once
+  _batchCells = 2**20
 
   @classmethod
   def getInputSpecification(cls):
@@ -50,6 +63,7 @@ class DTW(Metric):
     orderInputType = InputTypes.makeEnumType("order","orderType",["0","1"])
     inputSpecification.addSub(InputData.parameterInputFactory("order",contentType=orderInputType),quantity=InputData.Quantity.one)
     inputSpecification.addSub(InputData.parameterInputFactory("localDistance",contentType=InputTypes.StringType),quantity=InputData.Quantity.one)
+    inputSpecification.addSub(InputData.parameterInputFactory("window",contentType=InputTypes.IntegerType))
 
     return inputSpecification
 
@@ -65,6 +79,8 @@ class DTW(Metric):
     # the ID of distance function to be employed to determine the local distance evaluation of two time series
     # Available options are provided by scipy pairwise distances, i.e. cityblock, cosine, euclidean, manhattan.
     self.localDistance    = None
+    # radius of the Sakoe-Chiba band (in time steps) constraining the warping path, None for no constraint
+    self.window           = None
     # True indicates the metric needs to be able to handle dynamic data
     self._dynamicHandling = True
     # True indicates the metric needs to be able to handle pairwise data
@@ -84,16 +100,23 @@ class DTW(Metric):
         self.order = int(child.value)
       elif child.getName() == "localDistance":
         self.localDistance = child.value
+      elif child.getName() == "window":
+        if child.value < 0:
+          self.raiseAnError(IOError, 'DTW "{}": <window> must be a non-negative integer, got {}!'.format(self.name, child.value))
+        self.window = child.value
 
   def __evaluateLocal__(self, x, y, weights = None, axis = 0, **kwargs):
     """
       This method computes DTW distance between two inputs x and y based on given metric
       @ In, x, numpy.ndarray, array containing data of x, if 1D array is provided,
         the array will be reshaped via x.reshape(-1,1), shape (n_samples, ), if 2D
-        array is provided, shape (n_samples, n_time_steps)
+        array is provided, shape (n_samples, n_time_steps).
+        If y is None, the pairwise mode is used and x is a list of histories, each one
+        with shape (n_samples, n_time_steps)
       @ In, y, numpy.ndarray, array containing data of y, if 1D array is provided,
         the array will be reshaped via y.reshape(-1,1), shape (n_samples, ), if 2D
-        array is provided, shape (n_samples, n_time_steps)
+        array is provided, shape (n_samples, n_time_steps).
+        In pairwise mode, None or a list of histories
       @ In, weights, array_like (numpy.array or list), optional, weights associated
         with input, shape (n_samples) if axis = 0, otherwise shape (n_time_steps)
       @ In, axis, integer, optional, axis along which a metric is performed, default is 0,
@@ -101,10 +124,12 @@ class DTW(Metric):
         If metric postprocessor is used, the first dimension is the RAVEN_sample_ID,
         and the second dimension is the pivotParameter if HistorySet is provided.
       @ In, kwargs, dict, dictionary of parameters characteristic of each metric
-      @ Out, value, float, metric result
+      @ Out, value, float or numpy.ndarray, metric result (2D array of distances in pairwise mode)
     """
+    if y is None or isinstance(y, list):
+      return self.pairwiseDistance(x, y, cutoff=kwargs.get('cutoff', np.inf))
     assert (isinstance(x, np.ndarray))
-    assert (isinstance(x, np.ndarray))
+    assert (isinstance(y, np.ndarray))
     tempX = copy.copy(x)
     tempY = copy.copy(y)
     if axis == 0:
@@ -116,66 +141,135 @@ class DTW(Metric):
       tempY = tempY.T
     else:
       self.raiseAnError(IOError, "Valid axis value should be '0' or '1' for the evaluate method of metric", self.name)
-
-    if len(tempX.shape) == 1:
-      tempX = tempX.reshape(1,-1)
-    if len(tempY.shape) == 1:
-      tempY = tempY.reshape(1,-1)
-    X = np.empty(tempX.shape)
-    Y = np.empty(tempY.shape)
-    for index in range(len(tempX)):
-      if self.order == 1:
-        X[index] = np.gradient(tempX[index])
-        Y[index] = np.gradient(tempY[index])
-      else:
-        X[index] = tempX[index]
-        Y[index] = tempY[index]
-    value = self.dtwDistance(X, Y)
+    value = self.dtwDistance(self._prepare(tempX), self._prepare(tempY), cutoff=kwargs.get('cutoff', np.inf))
     return value
 
-  def dtwDistance(self, x, y):
+  def _prepare(self, x):
+    """
+      Reshapes a history as a float matrix and, for the derivative DTW, replaces it with its gradient
+      @ In, x, numpy.ndarray, history with shape (n_time_steps, ) or (n_samples, n_time_steps)
+      @ Out, x, numpy.ndarray, history with shape (n_samples, n_time_steps)
+    """
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    if self.order == 1:
+      x = np.gradient(x, axis=1) if x.shape[1] > 1 else np.zeros(x.shape)
+    return x
+
+  def dtwDistance(self, x, y, cutoff=np.inf):
     """
       This method actually calculates the distance between two histories x and y
-      @ In, x, numpy.ndarray, data matrix for x
-      @ In, y, numpy.ndarray, data matrix for y
+      @ In, x, numpy.ndarray, data matrix for x, shape (n_samples, n_time_steps)
+      @ In, y, numpy.ndarray, data matrix for y, shape (n_samples, n_time_steps)
+      @ In, cutoff, float, optional, distances larger than cutoff are not needed: their computation
+        is abandoned as soon as they are known to exceed it and they are returned as inf
       @ Out, value, float, distance between x and y
     """
-    r, c = len(x[0,:]), len(y[0,:])
-    D0 = np.zeros((r + 1, c + 1))
-    D0[0, 1:] = np.inf
-    D0[1:, 0] = np.inf
-    D1 = D0[1:, 1:]
-    D1 = spatialDistance.cdist(x.T,y.T, metric=self.localDistance)
-    C = D1.copy()
-    for i in range(r):
-      for j in range(c):
-        D1[i, j] += min(D0[i, j], D0[i, j+1], D0[i+1, j])
-    if len(x)==1:
-      path = np.zeros(len(y)), range(len(y))
-    elif len(y) == 1:
-      path = range(len(x)), np.zeros(len(x))
+    return self._batchDistance(x[np.newaxis], y[np.newaxis], cutoff)[0]
+
+  def pairwiseDistance(self, histories, others=None, cutoff=np.inf):
+    """
+      Computes the DTW distance between each pair of histories. The pairs with the same lengths
+      are computed together, in batches.
+      @ In, histories, list, histories (numpy.ndarray with shape (n_samples, n_time_steps), or
+        (n_time_steps, ) for single variables)
+      @ In, others, list, optional, histories to compare with; if None, the (symmetric) distances
+        among histories are computed
+      @ In, cutoff, float, optional, distances larger than cutoff are returned as inf, skipping
+        (when possible) their computation
+      @ Out, distances, numpy.ndarray, 2D array with shape (len(histories), len(others))
+    """
+    histories = [self._prepare(h) for h in histories]
+    symmetric = others is None
+    others = histories if symmetric else [self._prepare(h) for h in others]
+    distances = np.zeros((len(histories), len(others)))
+    if symmetric:
+      pairs = itertools.combinations(range(len(histories)), 2)
     else:
-      path = self.tracePath(D0)
-    return D1[-1, -1]
+      pairs = itertools.product(range(len(histories)), range(len(others)))
+    # group the pairs by shape, so that each group can be computed in batches
+    groups = {}
+    for i, j in pairs:
+      groups.setdefault((histories[i].shape, others[j].shape), []).append((i, j))
+    for (shapeX, shapeY), group in groups.items():
+      group = np.asarray(group)
+      batchSize = max(1, self._batchCells // (shapeX[0] * min(shapeX[1], shapeY[1])))
+      for start in range(0, len(group), batchSize):
+        batch = group[start:start + batchSize]
+        x = np.stack([histories[i] for i in batch[:, 0]])
+        y = np.stack([others[j] for j in batch[:, 1]])
+        distances[batch[:, 0], batch[:, 1]] = self._batchDistance(x, y, cutoff)
+    if symmetric:
+      distances = distances + distances.T
+    return distances
+
+  def lowerBound(self, x, y):
+    """
+      Computes the LB_Keogh lower bound of the DTW distances between histories with the same length,
+      i.e. the distance of x from the envelope of y within the warping window.
+      The bound is available only for local distances that do not decrease when any coordinate
+      difference grows (euclidean, sqeuclidean, cityblock, chebyshev and their aliases).
+      @ In, x, numpy.ndarray, histories with shape (n_pairs, n_samples, n_time_steps)
+      @ In, y, numpy.ndarray, histories with shape (n_pairs, n_samples, n_time_steps)
+      @ Out, bound, numpy.ndarray, lower bounds with shape (n_pairs, ), None if not available
+    """
+    distance = self._diagonalDistances.get(self.localDistance)
+    if distance is None or x.shape != y.shape:
+      return None
+    window = x.shape[2] if self.window is None else self.window
+    size = min(2 * window + 1, 2 * x.shape[2] + 1)
+    upper = maximum_filter1d(y, size, axis=2, mode='nearest')
+    lower = minimum_filter1d(y, size, axis=2, mode='nearest')
+    return distance(x - np.clip(x, lower, upper)).sum(axis=-1)
 
-  def tracePath(self, D):
-    """
-      This method calculate the time warping path given a local distance matrix D
-      @ In, D,  numpy.ndarray (2D), local distance matrix D
-      @ Out, p, numpy.ndarray (1D), path along horizontal direction
-      @ Out, q, numpy.ndarray (1D), path along vertical direction
-    """
-    i,j = np.array(D.shape) - 2
-    p,q = [i], [j]
-    while ((i > 0) or (j > 0)):
-      tb = np.argmin((D[i, j], D[i, j+1], D[i+1, j]))
-      if (tb == 0):
-        i -= 1
-        j -= 1
-      elif (tb == 1):
-        i -= 1
+  def _batchDistance(self, x, y, cutoff=np.inf):
+    """
+      Computes the DTW distances of a batch of pairs of histories, sweeping the cost matrix by
+      anti-diagonals: the cells of an anti-diagonal only depend on the two previous ones, so each
+      one is computed at once for all the pairs.
+      @ In, x, numpy.ndarray, histories with shape (n_pairs, n_samples, r)
+      @ In, y, numpy.ndarray, histories with shape (n_pairs, n_samples, c)
+      @ In, cutoff, float, optional, distances larger than cutoff are returned as inf
+      @ Out, value, numpy.ndarray, distances with shape (n_pairs, )
+    """
+    nPairs, _, r = x.shape
+    c = y.shape[2]
+    value = np.full(nPairs, np.inf)
+    active = np.arange(nPairs)
+    if np.isfinite(cutoff):
+      bound = self.lowerBound(x, y)
+      if bound is not None:
+        active = active[bound <= cutoff]
+        x, y = x[active], y[active]
+    if not len(active):
+      return value
+    distance = self._diagonalDistances.get(self.localDistance)
+    if distance is None:
+      # generic scipy distance, the full local distance matrices are needed
+      costs = np.stack([spatialDistance.cdist(xp.T, yp.T, metric=self.localDistance) for xp, yp in zip(x, y)])
+    # Sakoe-Chiba band, wide enough to always contain a path to the last cell
+    band = max(r, c) if self.window is None else max(self.window, abs(r - c))
+    # accumulated costs of the previous two anti-diagonals, indexed by the row plus one,
+    # with the (virtual) corner cell before the first one at zero cost
+    previous2 = np.full((len(active), r + 1), np.inf)
+    previous2[:, 0] = 0.
+    previous1 = np.full((len(active), r + 1), np.inf)
+    for k in range(r + c - 1):
+      low = max(0, k - c + 1, (k - band + 1) // 2)
+      high = min(k, r - 1, (k + band) // 2)
+      rows = np.arange(low, high + 1)
+      if distance is None:
+        cost = costs[:, rows, k - rows]
       else:
-        j -= 1
-      p.insert(0, i)
-      q.insert(0, j)
-    return np.array(p), np.array(q)
+        cost = distance(x[:, :, rows] - y[:, :, k - rows])
+      current = np.full((len(active), r + 1), np.inf)
+      current[:, low + 1:high + 2] = cost + np.minimum(np.minimum(previous2[:, low:high + 1], previous1[:, low:high + 1]),
+                                                       previous1[:, low + 1:high + 2])
+      previous2, previous1 = previous1, current
+      if np.isfinite(cutoff) and np.all(current[:, low + 1:high + 2].min(axis=1) > cutoff):
+        # every path crosses this anti-diagonal, so all the distances exceed the cutoff
+        return value
+    result = previous1[:, r]
+    if np.isfinite(cutoff):
+      result[result > cutoff] = np.inf
+    value[active] = result
+    return value
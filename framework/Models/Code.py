@@ -61,6 +61,11 @@ class Code(Model):
     inputSpecification.addSub(InputData.parameterInputFactory("executable", contentType=InputTypes.StringType))
     inputSpecification.addSub(InputData.parameterInputFactory("walltime", contentType=InputTypes.FloatType))
     inputSpecification.addSub(InputData.parameterInputFactory("preexec", contentType=InputTypes.StringType))
+    StagingType = InputTypes.makeEnumType("inputStaging", "inputStagingType", ["copy", "hardlink", "symlink"])
+    inputSpecification.addSub(InputData.parameterInputFactory("inputStaging", contentType=StagingType))
+    inputSpecification.addSub(InputData.parameterInputFactory("scratchDir", contentType=InputTypes.StringType))
+    SuccessfulRunsType = InputTypes.makeEnumType("successfulRuns", "successfulRunsType", ["keep", "delete", "archive"])
+    inputSpecification.addSub(InputData.parameterInputFactory("successfulRuns", contentType=SuccessfulRunsType))
 
     ## Begin command line arguments tag
     ClargsInput = InputData.parameterInputFactory("clargs")
@@ -122,6 +127,11 @@ class Code(Model):
     self.foundPreExec = True     # True indicates the pre-executable is found, otherwise not found
     self.maxWallTime = None      # If set, this indicates the maximum CPU time a job can take.
     self._ravenWorkingDir = None # RAVEN's working dir
+    self.inputStaging = 'copy'   # how the read-only input files are placed in the run directories (copy, hardlink, symlink)
+    self.scratchDir = None       # directory (e.g. node-local) where the runs are executed, if any
+    self.scratchWorkingDir = None # location where the code is currently running, if in the scratch directory
+    self.successfulRuns = 'keep' # what to do with the directories of the successful runs (keep, delete, archive)
+    self._readOnlyInputs = set() # indices of the original input files that are never modified by the code interface
 
   def applyRunInfo(self, runInfo):
     """
@@ -150,6 +160,12 @@ class Code(Model):
         self.maxWallTime = child.value
       if child.getName() =='preexec':
         self.preExec = child.value
+      elif child.getName() == 'inputStaging':
+        self.inputStaging = child.value
+      elif child.getName() == 'scratchDir':
+        self.scratchDir = os.path.expanduser(child.value.strip())
+      elif child.getName() == 'successfulRuns':
+        self.successfulRuns = child.value
       elif child.getName() == 'clargs':
         argtype    = child.parameterValues['type']      if 'type'      in child.parameterValues else None
         arg        = child.parameterValues['arg']       if 'arg'       in child.parameterValues else None
@@ -343,6 +359,12 @@ class Code(Model):
       # the deepcopy is needed to avoid the code interface
       # developer to modify the content of the runInfoDict
       self.code.initialize(copy.deepcopy(runInfoDict), self.oriInputFiles)
+    # the input files that can be linked (instead of copied) in the run directories
+    self._readOnlyInputs = set(self.code.getReadOnlyInputs(self.oriInputFiles)) if self.inputStaging != 'copy' else set()
+    # the runs can be executed in a scratch directory, the outputs are harvested in the working directory
+    self.scratchWorkingDir = None
+    if self.scratchDir is not None:
+      self.scratchWorkingDir = os.path.join(os.path.abspath(os.path.join(runInfoDict['WorkingDir'], self.scratchDir)), runInfoDict['stepName'])
 
   def createNewInput(self,currentInput,samplerType,**kwargs):
     """
@@ -369,10 +391,14 @@ class Code(Model):
     if not found:
       self.raiseAnError(IOError,'None of the input files has one of the extensions requested by code '
                                   + self.subType +': ' + ' '.join(self.code.getInputExtension()))
-    subDirectory = os.path.join(self.workingDir, kwargs['prefix'] if 'prefix' in kwargs.keys() else '1')
+    if 'dynamiceventtree' in str(samplerType).lower() and (self.scratchWorkingDir is not None or self.successfulRuns != 'keep'):
+      self.raiseAnError(IOError, 'The run directories of the parent branches are needed by the Dynamic Event Tree samplers, '
+                                 'so <scratchDir> and <successfulRuns> cannot be used by code '+self.name+'!')
+    runDir = self.scratchWorkingDir if self.scratchWorkingDir is not None else self.workingDir
+    subDirectory = os.path.join(runDir, kwargs['prefix'] if 'prefix' in kwargs.keys() else '1')
 
     if not os.path.exists(subDirectory):
-      os.mkdir(subDirectory)
+      os.makedirs(subDirectory)
     for index in range(len(newInputSet)):
       subSubDirectory = os.path.join(subDirectory,newInputSet[index].subDirectory)
       ## Currently, there are no tests that verify the lines below can be hit
@@ -383,7 +409,7 @@ class Code(Model):
         os.makedirs(subSubDirectory)
       ##########################################################################
       newInputSet[index].setPath(subSubDirectory)
-      shutil.copy(self.oriInputFiles[index].getAbsFile(),subSubDirectory)
+      self._stageInputFile(self.oriInputFiles[index].getAbsFile(), subSubDirectory, index in self._readOnlyInputs)
 
     kwargs['subDirectory'] = subDirectory
     kwargs['alias'] = self.alias
@@ -398,6 +424,62 @@ class Code(Model):
 
     return (newInput,kwargs)
 
+  def _stageInputFile(self, source, directory, readOnly):
+    """
+      Places an original input file in a run directory, either copying or linking it (if read-only).
+      @ In, source, str, path of the original input file
+      @ In, directory, str, the (run) directory where to place the file
+      @ In, readOnly, bool, True if the file is never modified by the code interface
+      @ Out, None
+    """
+    destination = os.path.join(directory, os.path.basename(source))
+    # never write through a link left by a previous run in the same directory
+    if os.path.lexists(destination):
+      os.remove(destination)
+    if readOnly and self.inputStaging != 'copy':
+      try:
+        if self.inputStaging == 'hardlink':
+          os.link(source, destination)
+        else:
+          os.symlink(source, destination)
+        return
+      except OSError:
+        # e.g. hard links across file systems or symbolic links not allowed
+        self.raiseADebug('Not able to '+self.inputStaging+' "'+source+'", copying it instead')
+    shutil.copy(source, destination)
+
+  def _finalizeRunDirectory(self, subDirectory, prefix, succeeded):
+    """
+      Harvests the files generated by a run executed in the scratch directory (moving them into the working
+      directory) and prunes or archives the directory of a successful run, if requested.
+      @ In, subDirectory, str, the directory where the run has been executed
+      @ In, prefix, str, the identifier of the run
+      @ In, succeeded, bool, True if the run ended smoothly
+      @ Out, None
+    """
+    runDirectory = os.path.join(self.workingDir, prefix)
+    if self.scratchWorkingDir is not None:
+      # the read-only inputs staged in the run directory are left out
+      staged = set(os.path.normpath(os.path.join(self.oriInputFiles[index].subDirectory, self.oriInputFiles[index].getFilename()))
+                   for index in self._readOnlyInputs)
+      for root, _, files in os.walk(subDirectory):
+        relRoot = os.path.relpath(root, subDirectory)
+        for fileName in files:
+          relFile = os.path.normpath(os.path.join(relRoot, fileName))
+          if relFile in staged:
+            continue
+          if not os.path.isdir(os.path.join(runDirectory, relRoot)):
+            os.makedirs(os.path.join(runDirectory, relRoot))
+          destination = os.path.join(runDirectory, relFile)
+          if os.path.lexists(destination):
+            os.remove(destination)
+          shutil.move(os.path.join(root, fileName), destination)
+      shutil.rmtree(subDirectory, ignore_errors=True)
+    if succeeded and self.successfulRuns != 'keep' and os.path.isdir(runDirectory):
+      if self.successfulRuns == 'archive':
+        shutil.make_archive(runDirectory, 'gztar', root_dir=self.workingDir, base_dir=prefix)
+      shutil.rmtree(runDirectory, ignore_errors=True)
+
   def _expandCommand(self, origCommand):
     """
       Function to expand a command from string to list.
@@ -700,6 +782,7 @@ class Code(Model):
         for f in fileList:
           os.remove(f)
 
+      self._finalizeRunDirectory(metaData['subDirectory'], kwargs.get('prefix', '1'), True)
       return exportDict
 
     else:
@@ -714,6 +797,7 @@ class Code(Model):
       else:
         self.raiseAMessage(" No output " + absOutputFile)
       self.raiseAMessage("*"*50)
+      self._finalizeRunDirectory(metaData['subDirectory'], kwargs.get('prefix', '1'), False)
 
       ## If you made it here, then the run must have failed
       return None
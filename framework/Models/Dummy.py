@@ -194,6 +194,18 @@ class Dummy(Model):
     output.addRealization(result)
     # END can be abstracted to base class
 
+  def collectOutputBatch(self,finishedJob,output):
+    """
+      Method that collects the outputs of a block of samples evaluated by a single job (see submitBatch)
+      @ In, finishedJob, InternalRunner object, instance of the run just finished
+      @ In, output, "DataObjects" object, output where the results of the calculation needs to be stored
+      @ Out, None
+    """
+    result = finishedJob.getEvaluation()
+    # alias system
+    self._replaceVariablesNamesWithAliasSystem(result,'output',True)
+    output.addRealizations(result)
+
   def collectOutputFromDict(self,exportDict,output,options=None):
     """
       Collect results from a dictionary
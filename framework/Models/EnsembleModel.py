@@ -23,7 +23,6 @@ import io
 import sys
 import copy
 import numpy as np
-import time
 import itertools
 from collections import OrderedDict
 from Decorators.Parallelization import Parallel
@@ -31,7 +30,7 @@ from Decorators.Parallelization import Parallel
 
 #Internal Modules------------------------------------------------------------------------------------
 from .Dummy import Dummy
-from utils import utils, InputData
+from utils import utils, InputData, mathUtils
 from utils import graphStructure
 from Runners import Error as rerror
 #Internal Modules End--------------------------------------------------------------------------------
@@ -78,9 +77,14 @@ class EnsembleModel(Dummy):
     self.localTargetEvaluations = {}                    # temporary storage of target evaluation data objects
     self.maxIterations          = 30                    # max number of iterations (in case of non-linear system activated)
     self.convergenceTol         = 1.e-3                 # tolerance of the iteration scheme (if activated) => L2 norm
+    self.acceleration           = 'none'                # acceleration scheme of the iterations (if activated) [none, Aitken, Anderson]
+    self.accelerationDepth      = 5                     # number of previous iterations used by the Anderson acceleration
+    self.relaxation             = 1.0                   # (initial) relaxation factor of the iterations (if activated)
     self.initialConditions      = {}                    # dictionary of initial conditions in case non-linear system is detected
     self.initialStartModels     = []                    # list of models that will execute first.
     self.ensembleModelGraph     = None                  # graph object (graphStructure.graphObject)
+    self.modelDependencies      = {}                    # models whose results are needed by each model {'modelName':set(modelNames)}
+    self.couplingVariables      = set()                 # variables that are inputs of the models (coupling variables if outputs too)
     self.printTag               = 'EnsembleModel MODEL' # print tag
     self.parallelStrategy = 1                           # parallel strategy [1=MPI like (internalParallel), 2=threads]
     self.runInfoDict = None                             # dictionary containing run info in case of parallelStrategy=2
@@ -153,6 +157,18 @@ class EnsembleModel(Dummy):
         self.maxIterations  = int(child.text)
       elif child.tag == 'tolerance':
         self.convergenceTol = float(child.text)
+      elif child.tag == 'acceleration':
+        self.acceleration = child.text.strip()
+        if self.acceleration not in ['none', 'Aitken', 'Anderson']:
+          self.raiseAnError(IOError, 'Unknown acceleration scheme "'+self.acceleration+'"! Available are: none, Aitken, Anderson')
+      elif child.tag == 'accelerationDepth':
+        self.accelerationDepth = int(child.text)
+        if self.accelerationDepth < 1:
+          self.raiseAnError(IOError, 'The "accelerationDepth" must be a positive integer. Got '+child.text.strip())
+      elif child.tag == 'relaxation':
+        self.relaxation = float(child.text)
+        if self.relaxation <= 0.:
+          self.raiseAnError(IOError, 'The "relaxation" factor must be positive. Got '+child.text.strip())
       elif child.tag == 'initialStartModels':
         self.initialStartModels = list(inp.strip() for inp in child.text.strip().split(','))
       elif child.tag == 'initialConditions':
@@ -340,6 +356,11 @@ class EnsembleModel(Dummy):
         self.raiseAnError(IOError, "The 'initialStartModels' xml node is missing, this is required siince the Picard's iteration is activated!")
       if len(self.initialConditions.keys()) == 0:
         self.raiseAnError(IOError,"Picard's iterations mode activated but no intial conditions provided!")
+      if self.acceleration != 'none':
+        self.raiseAMessage("Picard's iterations accelerated with the "+self.acceleration+" scheme")
+      # number of iterations, final residue and residue of each iteration (indexed by PicardIteration) of each sample
+      self.addMetaKeys(['PicardIterations', 'PicardResidue', 'PicardResidueHistory'],
+                       params={'PicardResidueHistory':['PicardIteration']})
     else:
       if len(self.initialStartModels) !=0:
         self.raiseAnError(IOError, "The 'initialStartModels' xml node is not needed for non-Picard calculations, since the running sequence can be automatically determined by the code! Please delete this node to avoid a mistake.")
@@ -353,6 +374,14 @@ class EnsembleModel(Dummy):
           if self.orderList.index(source) >= indexModelIn:
             self.raiseAnError(IOError, 'In model "'+modelIn+'" the "metadataToTransfer" named "'+metadataToGet+
                                        '" is linked to the source"'+source+'" that will be executed after this model.')
+    # models whose results are needed by each model (the edges of the ensemble model graph, plus the metadata sources)
+    self.modelDependencies = dict((modelIn, set()) for modelIn in self.modelsDictionary.keys())
+    for modelIn, outputModels in modelsToOutputModels.items():
+      for modelOut in outputModels:
+        self.modelDependencies[modelOut].add(modelIn)
+    self.couplingVariables = set(itertools.chain.from_iterable(self.modelsDictionary[modelIn]['Input'] for modelIn in self.modelsDictionary.keys()))
+    for modelIn in self.modelsDictionary.keys():
+      self.modelDependencies[modelIn].update(source for _, source, _ in self.modelsInputDictionary[modelIn]['metadataToTransfer'])
     self.needToCheckInputs = True
     # write debug statements
     self.raiseADebug("Specs of Graph Network represented by EnsembleModel:")
@@ -490,6 +519,28 @@ class EnsembleModel(Dummy):
     for modelIn in self.modelsDictionary.keys():
       self.modelsDictionary[modelIn]['Instance'].getAdditionalInputEdits(inputInfo)
 
+  def getEvaluationState(self):
+    """
+      Returns the states carried by the evaluations of the sub-models (see Model.getEvaluationState).
+      @ In, None
+      @ Out, state, dict, {modelName: state} of the sub-models that have one (None if none has)
+    """
+    state = {}
+    for modelName, modelInfo in self.modelsDictionary.items():
+      modelState = modelInfo['Instance'].getEvaluationState()
+      if modelState is not None:
+        state[modelName] = modelState
+    return state if state else None
+
+  def setEvaluationState(self, state):
+    """
+      Restores the states carried by the evaluations of the sub-models (see getEvaluationState).
+      @ In, state, dict, {modelName: state} of the sub-models
+      @ Out, None
+    """
+    for modelName, modelState in state.items():
+      self.modelsDictionary[modelName]['Instance'].setEvaluationState(modelState)
+
   @Parallel()
   def evaluateSample(self, myInput, samplerType, kwargs):
     """
@@ -595,8 +646,19 @@ class EnsembleModel(Dummy):
           residueContainer[modelIn]['residue'][out] = np.zeros(1)
           residueContainer[modelIn]['iterValues'][0][out] = np.zeros(1)
           residueContainer[modelIn]['iterValues'][1][out] = np.zeros(1)
+    else:
+      # linear system, the models are executed as soon as their inputs are available
+      if jobHandler is not None:
+        returnDict = {}
+        self.__runModelGraph(identifier, originalInput, inputKwargs, inRunTargetEvaluations, samplerType, jobHandler,
+                             returnDict, gotOutputs, typeOutputs, tempOutputs)
+        returnEvaluation = returnDict, inRunTargetEvaluations, tempOutputs
+        return returnEvaluation
 
     maxIterations = self.maxIterations if self.activatePicard else 1
+    accelerate = self.acceleration != 'none' or self.relaxation != 1.
+    accelerationHistory = {'iterates':[], 'residues':[], 'relaxation':self.relaxation}
+    residueHistory = []
     iterationCount = 0
     while iterationCount < maxIterations:
       returnDict     = {}
@@ -604,52 +666,11 @@ class EnsembleModel(Dummy):
 
       if self.activatePicard:
         self.raiseAMessage("Picard's Iteration "+ str(iterationCount))
+        # values of the coupling variables this iteration starts from
+        startValues = self.__getCouplingValues(gotOutputs)
 
       for modelCnt, modelIn in enumerate(self.orderList):
-        # clear the model's Target Evaluation data object
-        # in case there are metadataToTransfer, let's collect them from the source
-        metadataToTransfer = None
-        if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          metadataToTransfer = {}
-        for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
-          if metadataToGet in returnDict[source]['general_metadata']:
-            metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          elif metadataToGet in returnDict[source]['response']:
-            metaDataValue = returnDict[source]['response'][metadataToGet]
-            metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
-            metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
-          else:
-            self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
-        # get dependent outputs
-        dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs, typeOutputs)
-        # if nonlinear system, check for initial coditions
-        if iterationCount == 1  and self.activatePicard:
-          sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
-          conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
-          for initialConditionToSet in conditionsToCheck:
-            if initialConditionToSet in self.initialConditions.keys():
-              dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
-            else:
-              self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
-        # set new identifiers
-        inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
-        inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
-        if metadataToTransfer is not None:
-          inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
-
-        for key, value in dependentOutput.items():
-          inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
-          ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
-          ## Who has this information? -- DPM 4/11/17
-          inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
-        self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
-        ## FIXME: this will come after we rework the "runInfo" collection in the code
-        ## if run info is present, we need to pass to to kwargs
-        ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
-        ##  inputKwargs[modelIn].update(self.runInfoDict)
+        self.__prepareModelInput(modelIn, identifier, inputKwargs, returnDict, gotOutputs, typeOutputs, iterationCount)
 
         retDict, gotOuts, evaluation = self.__advanceModel(identifier, self.modelsDictionary[modelIn],
                                                         originalInput[modelIn], inputKwargs[modelIn],
@@ -682,6 +703,7 @@ class EnsembleModel(Dummy):
           iterOne  += residueContainer[modelIn]['iterValues'][1].values()
         residueContainer['TotalResidue'] = np.linalg.norm(np.asarray(iterOne)-np.asarray(iterZero))
         self.raiseAMessage("Picard's Iteration Norm: "+ str(residueContainer['TotalResidue']))
+        residueHistory.append(np.max(residueContainer['TotalResidue']))
         residualPass = residueContainer['TotalResidue'] <= self.convergenceTol
         # sometimes there can be multiple residual values
         if hasattr(residualPass,'__len__'):
@@ -689,9 +711,191 @@ class EnsembleModel(Dummy):
         if residualPass:
           self.raiseAMessage("Picard's Iteration converged. Norm: "+ str(residueContainer['TotalResidue']))
           break
+        if accelerate and iterationCount < maxIterations:
+          self.__accelerateIteration(gotOutputs, startValues, accelerationHistory)
+    if self.activatePicard:
+      picardMeta = {'PicardIterations':np.atleast_1d(iterationCount),
+                    'PicardResidue':np.atleast_1d(residueHistory[-1]),
+                    'PicardResidueHistory':np.asarray(residueHistory),
+                    'PicardIteration':np.arange(1, iterationCount+1)}
+      for modelIn in self.orderList:
+        returnDict[modelIn]['response'].update(picardMeta)
+        tempOutputs[modelIn] = dict(tempOutputs[modelIn], **picardMeta)
     returnEvaluation = returnDict, inRunTargetEvaluations, tempOutputs
     return returnEvaluation
 
+  def __getCouplingValues(self, gotOutputs):
+    """
+      This method is aimed to collect the values of the coupling variables (the outputs of the models that
+      are inputs of other models) in the outputs of the models
+      @ In, gotOutputs, list, the outputs of each model (ordered as self.orderList)
+      @ Out, couplingValues, dict, the values of the coupling variables {(modelIndex, variable):value}
+    """
+    couplingValues = {}
+    for modelCnt, modelIn in enumerate(self.orderList):
+      for var in self.modelsDictionary[modelIn]['Output']:
+        if var in gotOutputs[modelCnt] and var in self.couplingVariables:
+          couplingValues[(modelCnt, var)] = np.asarray(gotOutputs[modelCnt][var], dtype=float)
+    return couplingValues
+
+  def __accelerateIteration(self, gotOutputs, startValues, history):
+    """
+      This method is aimed to apply the acceleration scheme to the Picard's iterations, replacing the values of
+      the coupling variables (that the next iteration will start from) with the accelerated ones
+      @ In, gotOutputs, list, the outputs of each model (ordered as self.orderList), modified in place
+      @ In, startValues, dict, the values of the coupling variables the iteration started from
+        ({(modelIndex, variable):value}, see __getCouplingValues)
+      @ In, history, dict, the previous iterates and residues of the coupling variables and the current
+        relaxation factor, updated in place
+      @ Out, None
+    """
+    newValues = self.__getCouplingValues(gotOutputs)
+    if set(startValues) != set(newValues) or any(startValues[key].shape != newValues[key].shape for key in newValues):
+      # the iteration did not start from a full set of coupling values (e.g. first iteration)
+      history['iterates'], history['residues'] = [], []
+      return
+    keys = sorted(newValues)
+    iterate = np.concatenate([startValues[key].ravel() for key in keys])
+    residue = np.concatenate([newValues[key].ravel() for key in keys]) - iterate
+    history['iterates'] = (history['iterates'] + [iterate])[-(self.accelerationDepth+1):]
+    history['residues'] = (history['residues'] + [residue])[-(self.accelerationDepth+1):]
+    if self.acceleration == 'Anderson':
+      newIterate = mathUtils.andersonMixing(history['iterates'], history['residues'], self.relaxation)
+    else:
+      if self.acceleration == 'Aitken' and len(history['residues']) > 1:
+        history['relaxation'] = mathUtils.aitkenRelaxation(history['residues'][-2], residue, history['relaxation'])
+      newIterate = iterate + history['relaxation'] * residue
+    self.raiseADebug("Picard's Iteration residue norm: "+str(np.linalg.norm(residue))+
+                     ", relaxation factor: "+str(history['relaxation']))
+    # store the accelerated values, that will be used by the models in the next iteration
+    start = 0
+    for modelCnt, var in keys:
+      end = start + newValues[(modelCnt, var)].size
+      gotOutputs[modelCnt] = dict(gotOutputs[modelCnt])
+      gotOutputs[modelCnt][var] = newIterate[start:end].reshape(newValues[(modelCnt, var)].shape)
+      start = end
+
+  def __prepareModelInput(self, modelIn, identifier, inputKwargs, returnDict, gotOutputs, typeOutputs, iterationCount):
+    """
+      This method is aimed to set up the input of a sub-model, collecting the outputs (and metadata) of the
+      models it depends on
+      @ In, modelIn, string, name of the model to set up
+      @ In, identifier, str, current job identifier
+      @ In, inputKwargs, dict, dictionary of kwargs for each model (the one of modelIn is updated in place)
+      @ In, returnDict, dict, the results of the models already executed ({modelName:results})
+      @ In, gotOutputs, list, list of dictionary outputs of the models (ordered as self.orderList)
+      @ In, typeOutputs, list, list of the types of the target evaluations of the models (ordered as self.orderList)
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ Out, None
+    """
+    # in case there are metadataToTransfer, let's collect them from the source
+    metadataToTransfer = None
+    if self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      metadataToTransfer = {}
+    for metadataToGet, source, alias in self.modelsInputDictionary[modelIn]['metadataToTransfer']:
+      if metadataToGet in returnDict[source]['general_metadata']:
+        metaDataValue = returnDict[source]['general_metadata'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      elif metadataToGet in returnDict[source]['response']:
+        metaDataValue = returnDict[source]['response'][metadataToGet]
+        metaDataValue = metaDataValue[0] if len(metaDataValue) == 1 else metaDataValue
+        metadataToTransfer[metadataToGet if alias is None else alias] = metaDataValue
+      else:
+        self.raiseAnError(RuntimeError,'metadata "'+metadataToGet+'" is not present among the ones available in source "'+source+'"!')
+    # get dependent outputs
+    dependentOutput = self.__retrieveDependentOutput(modelIn, gotOutputs, typeOutputs)
+    # if nonlinear system, check for initial coditions
+    if iterationCount == 1  and self.activatePicard:
+      sampledVars = inputKwargs[modelIn]['SampledVars'].keys()
+      conditionsToCheck = set(self.modelsDictionary[modelIn]['Input']) - set(itertools.chain(dependentOutput.keys(),sampledVars))
+      for initialConditionToSet in conditionsToCheck:
+        if initialConditionToSet in self.initialConditions.keys():
+          dependentOutput[initialConditionToSet] = self.initialConditions[initialConditionToSet]
+        else:
+          self.raiseAnError(IOError,"No initial conditions provided for variable "+ initialConditionToSet)
+    # set new identifiers
+    inputKwargs[modelIn]['prefix']        = modelIn+utils.returnIdSeparator()+identifier
+    inputKwargs[modelIn]['uniqueHandler'] = self.name+identifier
+    if metadataToTransfer is not None:
+      inputKwargs[modelIn]['metadataToTransfer'] = metadataToTransfer
+
+    for key, value in dependentOutput.items():
+      inputKwargs[modelIn]["SampledVars"  ][key] =  dependentOutput[key]
+      ## FIXME it is a mistake (Andrea). The SampledVarsPb for this variable should be transferred from outside
+      ## Who has this information? -- DPM 4/11/17
+      inputKwargs[modelIn]["SampledVarsPb"][key] =  1.0
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVars"  ],'input',False)
+    self._replaceVariablesNamesWithAliasSystem(inputKwargs[modelIn]["SampledVarsPb"],'input',False)
+    ## FIXME: this will come after we rework the "runInfo" collection in the code
+    ## if run info is present, we need to pass to to kwargs
+    ##if self.runInfoDict and 'Code' == self.modelsDictionary[modelIn]['Instance'].type:
+    ##  inputKwargs[modelIn].update(self.runInfoDict)
+
+  def __runModelGraph(self, identifier, originalInput, inputKwargs, inRunTargetEvaluations, samplerType, jobHandler,
+                      returnDict, gotOutputs, typeOutputs, tempOutputs):
+    """
+      This method is aimed to execute the sub-models of a linear system through the jobHandler, following the
+      ensemble model graph: all the models whose inputs are available are submitted at once, so that the
+      independent models run concurrently
+      @ In, identifier, str, current job identifier
+      @ In, originalInput, dict, the inputs of each model ({modelName:inputList})
+      @ In, inputKwargs, dict, dictionary of kwargs for each model
+      @ In, inRunTargetEvaluations, dict, target evaluation of each model ({modelName:DataObject})
+      @ In, samplerType, str, sampler Type
+      @ In, jobHandler, jobHandler instance, the jobHandler instance
+      @ In, returnDict, dict, the results of each model, filled in place ({modelName:results})
+      @ In, gotOutputs, list, the outputs of each model (ordered as self.orderList), filled in place
+      @ In, typeOutputs, list, the types of the target evaluations (ordered as self.orderList), filled in place
+      @ In, tempOutputs, dict, the "unprojected" evaluation of each model, filled in place ({modelName:evaluation})
+      @ Out, None
+    """
+    toSubmit = list(self.orderList)
+    running = {} # {localIdentifier:modelName}
+    while toSubmit or running:
+      # submit all the models whose inputs are available
+      for modelIn in [model for model in toSubmit if self.modelDependencies[model].issubset(returnDict)]:
+        toSubmit.remove(modelIn)
+        self.__prepareModelInput(modelIn, identifier, inputKwargs, returnDict, gotOutputs, typeOutputs, 1)
+        localIdentifier = self.__submitModel(self.modelsDictionary[modelIn], originalInput[modelIn], inputKwargs[modelIn],
+                                             samplerType, jobHandler)
+        running[localIdentifier] = modelIn
+      # any job event after this point wakes us up, so that no completion is missed
+      jobEvent = jobHandler.currentJobEvent()
+      finished = [localIdentifier for localIdentifier in running if jobHandler.isThisJobFinished(localIdentifier)]
+      if not finished:
+        jobHandler.waitForJobEvent(jobEvent, timeout=1.)
+        continue
+      for localIdentifier in finished:
+        modelIn = running.pop(localIdentifier)
+        modelCnt = self.orderList.index(modelIn)
+        finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=self.name+identifier)
+        if isinstance(finishedRun[0].getEvaluation(), rerror):
+          # the model failed, so the models still running are not needed anymore
+          jobHandler.terminateJobs(list(running.keys()))
+        retDict, gotOuts, evaluation = self.__collectModel(identifier, self.modelsDictionary[modelIn], finishedRun,
+                                                           inRunTargetEvaluations[modelIn], 1, jobHandler)
+        returnDict[modelIn] = retDict
+        typeOutputs[modelCnt] = inRunTargetEvaluations[modelIn].type
+        gotOutputs[modelCnt] =  gotOuts
+        tempOutputs[modelIn] = evaluation
+
+  def __submitModel(self, modelToExecute, origInputList, inputKwargs, samplerType, jobHandler):
+    """
+      This method is aimed to submit a sub-model to the jobHandler (parallelStrategy == 2)
+      @ In, modelToExecute, super(Model), Model instance than needs to be avanced
+      @ In, origInputList, list, list of model input
+      @ In, inputKwargs, dict, dictionary of kwargs for this model
+      @ In, samplerType, str, sampler Type
+      @ In, jobHandler, jobHandler instance, jobHandler instance
+      @ Out, localIdentifier, str, the identifier of the submitted job
+    """
+    self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
+    inputKwargs.pop("jobHandler", None)
+    modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
+    localIdentifier = inputKwargs['prefix']
+    return localIdentifier
+
   def __advanceModel(self, identifier, modelToExecute, origInputList, inputKwargs, inRunTargetEvaluations, samplerType, iterationCount, jobHandler = None):
     """
       This method is aimed to advance the execution of a sub-model and to collect the data using
@@ -708,34 +912,51 @@ class EnsembleModel(Dummy):
       @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
       @ Out, evaluation, dict, the evaluation dictinary with the "unprojected" data
     """
-    returnDict = {}
-
-    self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
-    localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
     if self.parallelStrategy == 1:
+      self.raiseADebug('Submitting model',modelToExecute['Instance'].name)
       # we evaluate the model directly
       try:
         evaluation = modelToExecute['Instance'].evaluateSample.original_function(modelToExecute['Instance'], origInputList, samplerType, inputKwargs)
       except Exception as e:
-        excType, excValue, excTrace = sys.exc_info()
+        evaluation = sys.exc_info()
+      return self.__collectModel(identifier, modelToExecute, evaluation, inRunTargetEvaluations, iterationCount)
+    # run the model
+    localIdentifier = self.__submitModel(modelToExecute, origInputList, inputKwargs, samplerType, jobHandler)
+    ## wait until the model finishes, in order to get ready to run the subsequential one
+    jobEvent = jobHandler.currentJobEvent()
+    while not jobHandler.isThisJobFinished(localIdentifier):
+      jobEvent = jobHandler.waitForJobEvent(jobEvent, timeout=1.)
+    # get job that just finished to gather the results
+    finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=self.name+identifier)
+    return self.__collectModel(identifier, modelToExecute, finishedRun, inRunTargetEvaluations, iterationCount, jobHandler)
+
+  def __collectModel(self, identifier, modelToExecute, finishedRun, inRunTargetEvaluations, iterationCount, jobHandler = None):
+    """
+      This method is aimed to collect the data of a sub-model that has been executed, using the realization
+      @ In, identifier, str, current job identifier
+      @ In, modelToExecute, super(Model), Model instance that has been executed
+      @ In, finishedRun, list or dict or tuple, the finished jobs from the jobHandler (parallelStrategy == 2),
+        otherwise the evaluation of the model (or the exception info if it failed)
+      @ In, inRunTargetEvaluations, DataObject, target evaluation for the model
+      @ In, iterationCount, int, iteration counter (1 if not picard)
+      @ In, jobHandler, jobHandler instance, optional, jobHandler instance (available only if parallelStrategy == 2)
+      @ Out, returnDict, dict, dictionary containing the data extracted from the target evaluation
+      @ Out, gotOutputs, dict, dictionary containing all the data coming out the model
+      @ Out, evaluation, dict, the evaluation dictinary with the "unprojected" data
+    """
+    returnDict = {}
+    localIdentifier =  modelToExecute['Instance'].name+utils.returnIdSeparator()+identifier
+    if self.parallelStrategy == 1:
+      evaluation = finishedRun
+      if isinstance(evaluation, tuple):
+        # the exception info of the failed evaluation
+        excType, excValue, excTrace = evaluation
         evaluation = None
     else:
-      moveOn = False
-      while not moveOn:
-        # run the model
-        inputKwargs.pop("jobHandler", None)
-        modelToExecute['Instance'].submit(origInputList, samplerType, jobHandler, **inputKwargs)
-        ## wait until the model finishes, in order to get ready to run the subsequential one
-        while not jobHandler.isThisJobFinished(localIdentifier):
-          time.sleep(1.e-3)
-        moveOn = True
-      # get job that just finished to gather the results
-      finishedRun = jobHandler.getFinished(jobIdentifier = localIdentifier, uniqueHandler=self.name+identifier)
       evaluation = finishedRun[0].getEvaluation()
       if isinstance(evaluation, rerror):
         evaluation = None
-        excType, excValue, excTrace = finishedRun.exceptionTrace
-        e = rerror
+        excType, excValue, excTrace = finishedRun[0].exceptionTrace
         # the model failed
         for modelToRemove in list(set(self.orderList) - set([modelToExecute['Instance'].name])):
           jobHandler.getFinished(jobIdentifier = modelToRemove + utils.returnIdSeparator() + identifier, uniqueHandler = self.name + identifier)
@@ -778,5 +999,3 @@ class EnsembleModel(Dummy):
     returnDict['general_metadata'] = inRunTargetEvaluations.getMeta(general=True)
 
     return returnDict, gotOutputs, evaluation
-
-
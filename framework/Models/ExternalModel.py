@@ -20,13 +20,13 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 
 #External Modules------------------------------------------------------------------------------------
 import copy
+import itertools
 import numpy as np
 import inspect
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
 from .Dummy import Dummy
-import CustomCommandExecuter
 from utils import utils, InputData, InputTypes, mathUtils
 from Decorators.Parallelization import Parallel
 #Internal Modules End--------------------------------------------------------------------------------
@@ -191,52 +191,41 @@ class ExternalModel(Dummy):
       @ Out, (outcomes,self), tuple, tuple containing the dictionary of the results (pos 0) and the self (pos 1)
     """
     externalSelf        = utils.Object()
-    #self.sim=__import__(self.ModuleToLoad)
-    modelVariableValues = {}
-    for key in self.modelVariableType.keys():
-      modelVariableValues[key] = None
+    # the variables are bound directly in the namespace of "self", so any name is accepted
+    # (the ones that are not valid identifiers can be reached through getattr or the "Inputs" dictionary)
+    externalNamespace   = externalSelf.__dict__
+    # copy the state of the external model, that must not be modified by a (possibly concurrent) evaluation
     for key, value in self.initExtSelf.__dict__.items():
-      CustomCommandExecuter.execCommand('self.'+ key +' = copy.copy(object)',self=externalSelf,object=value)  # exec('externalSelf.'+ key +' = copy.copy(value)')
-      modelVariableValues[key] = copy.copy(value)
-    for key in Input.keys():
-      if key in modelVariableValues.keys():
-        modelVariableValues[key] = copy.copy(Input[key])
+      externalNamespace[key] = copy.copy(value)
+    modelVariableValues = dict.fromkeys(self.modelVariableType)
+    modelVariableValues.update(externalNamespace)
     if 'createNewInput' not in dir(self.sim):
       InputDict = {}
     else:
       InputDict = Input
-    #if 'createNewInput' not in dir(self.sim):
     additionalKeys = []
     if '_indexMap' in Input.keys():
       additionalKeys.append('_indexMap')
-    for key in Input.keys():
-      if key in modelVariables.keys() or key in additionalKeys:
+    for key in itertools.chain(self.modelVariableType, additionalKeys):
+      if key in Input:
         modelVariableValues[key] = copy.copy(Input[key])
-    for key in list(self.modelVariableType.keys()) + additionalKeys:
       # add the variable as a member of "self"
-      try:
-        CustomCommandExecuter.execCommand('self.'+ key +' = copy.copy(object["'+key+'"])',self=externalSelf,object=modelVariableValues) #exec('externalSelf.'+ key +' = copy.copy(modelVariableValues[key])')  #self.__uploadSolution()
-      # if variable name is too strange to be a member of "self", then skip it
-      except SyntaxError:
-        self.raiseAWarning('Variable "{}" could not be added to "self" due to complex name.  Find it in "Inputs" dictionary instead.'.format(key))
-    #else:
-    #  InputDict = Input
+      externalNamespace[key] = modelVariableValues[key]
     # only pass the variables and their values according to the model itself.
     for key in Input.keys():
-      if key in self.modelVariableType.keys() or key in additionalKeys:
+      if key in self.modelVariableType or key in additionalKeys:
         InputDict[key] = Input[key]
 
     self.sim.run(externalSelf, InputDict)
 
     for key in self.modelVariableType:
-      try:
-        # Note, the following string can't be converted using {} formatting, at least as far as I can tell.
-        CustomCommandExecuter.execCommand('object["'+key+'"]  = copy.copy(self.'+key+')', self=externalSelf,object=modelVariableValues) #exec('modelVariableValues[key]  = copy.copy(externalSelf.'+key+')') #self.__pointSolution()
-      except (SyntaxError, AttributeError):
-        self.raiseAWarning('Variable "{}" cannot be read from "self" due to complex name.  Retaining original value.'.format(key))
-    for key in self.initExtSelf.__dict__.keys():
-      # Note, the following string can't be converted using {} formatting, at least as far as I can tell.
-      CustomCommandExecuter.execCommand('self.' +key+' = copy.copy(object.'+key+')', self=self.initExtSelf, object=externalSelf) #exec('self.initExtSelf.' +key+' = copy.copy(externalSelf.'+key+')')
+      if key in externalNamespace:
+        modelVariableValues[key] = externalNamespace[key]
+      else:
+        self.raiseAWarning('Variable "{}" cannot be read from "self".  Retaining original value.'.format(key))
+    for key in self.initExtSelf.__dict__:
+      if key in externalNamespace:
+        self.initExtSelf.__dict__[key] = copy.copy(externalNamespace[key])
     if None in self.modelVariableType.values():
       errorFound = False
       for key in self.modelVariableType:
@@ -295,6 +284,71 @@ class ExternalModel(Dummy):
       rlz['_indexMap'][0].update(evalIndexMap)
     return rlz
 
+  def getEvaluationState(self):
+    """
+      Returns the variables that the external module keeps in "self" from one evaluation to the next
+      (the ones set by its "initialize", updated at the end of each "run", see _externalRun).
+      @ In, None
+      @ Out, state, dict, the variables of the external model (None if there are none)
+    """
+    return dict(self.initExtSelf.__dict__) if self.initExtSelf.__dict__ else None
+
+  def setEvaluationState(self, state):
+    """
+      Restores the variables that the external module keeps in "self" (see getEvaluationState).
+      @ In, state, dict, the variables of the external model
+      @ Out, None
+    """
+    self.initExtSelf.__dict__.update(state)
+
+  def canEvaluateBatch(self):
+    """
+      Checks if this model is able to evaluate a whole block of samples in a single job (see evaluateBatch).
+      This is possible if the external module declares its "run" method as vectorized ("vectorizedRun = True"),
+      i.e. able to evaluate arrays containing the values of all the samples of the block.
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if the model can evaluate blocks of samples
+    """
+    return bool(getattr(self.sim, 'vectorizedRun', False))
+
+  @Parallel()
+  def evaluateBatch(self, myInput, samplerType, batch):
+    """
+        This will evaluate a block of samples on this model, with a single call of the (vectorized) "run"
+        method of the external module, where each variable holds the values of all the samples.
+        @ In, myInput, list, the inputs (list) to start from to generate the new one
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, batch, dict, the information coming from the sampler for the block (see Sampler.generateInputBatch),
+           a mandatory key is the 'SampledVars' that contains a dictionary {'name variable':np.array(nSamples)}
+        @ Out, rlz, dict, the block of realizations in columns ({var:np.array(nSamples)})
+    """
+    nRuns = len(batch['prefix'])
+    Input = self.createNewInput(myInput, samplerType, **batch)
+    inRun = copy.copy(self._manipulateInput(Input[0][0]))
+    result, _ = self._externalRun(inRun, Input[1])
+    result.pop('_indexMap', None)
+    # build the realizations in the same order of evaluateSample
+    rlz = dict(inRun)
+    rlz.update(result)
+    # metadata: per-sample entries are already arrays, the shared ones are repeated for each sample
+    for var, val in batch.items():
+      if isinstance(val, np.ndarray) and len(val) == nRuns:
+        rlz[var] = val
+      elif not isinstance(val, (dict, list, np.ndarray)):
+        rlz[var] = np.full(nRuns, val)
+    rlz.update(batch['SampledVars'])
+    rlz.pop('_indexMap', None)
+    for var, val in rlz.items():
+      val = np.atleast_1d(val)
+      if len(val) == 1 and nRuns > 1:
+        # the same value for all the samples
+        val = np.repeat(val, nRuns)
+      elif len(val) != nRuns:
+        self.raiseAnError(RuntimeError, 'The vectorized "run" of the external model "{}" returned {} values for variable "{}", '.format(self.name, len(val), var)+
+                          'while one value for each of the {} samples (or a single value) is expected!'.format(nRuns))
+      rlz[var] = val
+    return rlz
+
   def collectOutput(self,finishedJob,output,options=None):
     """
       Method that collects the outputs from the previous run
@@ -383,8 +383,11 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
     """
     nRuns = 1
     batchMode =  kwargs.get("batchMode", False)
+    restartPoints = {}
     if batchMode:
       nRuns = kwargs["batchInfo"]['nRuns']
+      # members of the batch already evaluated (e.g. found in restart), {index: realization}
+      restartPoints = kwargs["batchInfo"].get('restartPoints', {})
 
     for index in range(nRuns):
       if batchMode:
@@ -396,6 +399,12 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
       uniqueHandler = kw.get("uniqueHandler",'any')
       forceThreads = kw.get("forceThreads",False)
 
+      if index in restartPoints:
+        # "submit" the finished run, so that the batch is still collected as a whole
+        jobHandler.addFinishedJob(restartPoints[index], metadata=kw, uniqueHandler=uniqueHandler,
+                                  groupInfo={'id': kwargs['batchInfo']['batchId'], 'size': nRuns})
+        continue
+
       ## These kw are updated by createNewInput, so the job either should not
       ## have access to the metadata, or it needs to be updated from within the
       ## evaluateSample function, which currently is not possible since that
@@ -410,6 +419,47 @@ class Model(utils.metaclass_insert(abc.ABCMeta, BaseEntity, Assembler, InputData
                         uniqueHandler=uniqueHandler, forceUseThreads=forceThreads,
                         groupInfo={'id': kwargs['batchInfo']['batchId'], 'size': nRuns} if batchMode else None)
 
+  def canEvaluateBatch(self):
+    """
+      Checks if this model is able to evaluate a whole block of samples in a single job
+      (see submitBatch). By default, each sample is evaluated by its own job.
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if the model implements "evaluateBatch"
+    """
+    return False
+
+  def getEvaluationState(self):
+    """
+      Returns the state that the evaluations of this model carry from one to the next, if any.
+      The jobs run in other processes (see the ProcessPoolRunner) send it back to the master
+      together with their outcome, while any other change they make to the model is lost.
+      @ In, None
+      @ Out, state, object, the state of the evaluations (None if they do not change the model)
+    """
+    return None
+
+  def setEvaluationState(self, state):
+    """
+      Restores the state carried by the evaluations of this model (see getEvaluationState).
+      @ In, state, object, the state of the evaluations
+      @ Out, None
+    """
+    pass
+
+  def submitBatch(self, myInput, samplerType, jobHandler, batch):
+    """
+        This will submit a block of samples (see Sampler.generateInputBatch) to be
+        evaluated by this model in a single job (see evaluateBatch).
+        @ In, myInput, list, the inputs (list) to start from to generate the new one
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, jobHandler, JobHandler instance, the global job handler instance
+        @ In, batch, dict, the information coming from the sampler for the block of samples,
+           a mandatory key is the 'SampledVars' that contains a dictionary {'name variable':np.array(nSamples)}
+        @ Out, None
+    """
+    jobHandler.addJob((self, myInput, samplerType, batch), self.__class__.evaluateBatch, batch['batchId'], metadata=batch,
+                      uniqueHandler=batch.get('uniqueHandler', 'any'), forceUseThreads=batch.get('forceThreads', False))
+
   def addOutputFromExportDictionary(self,exportDict,output,options,jobIdentifier):
     """
       Method that collects the outputs from them export dictionary
@@ -218,7 +218,7 @@ class BasicStatistics(PostProcessorInterface):
         if not currentInput.checkIndexAlignment(indexesToCheck=self.pivotParameter):
           self.raiseAnError(IOError, "The data provided by the data objects", currentInput.name, "is not synchronized!")
         self.pivotValue = inputDataset[self.pivotParameter].values
-        if self.pivotValue.size != len(inputDataset.groupby(self.pivotParameter)):
+        if self.pivotValue.size != np.unique(self.pivotValue).size:
           msg = "Duplicated values were identified in pivot parameter, please use the 'HistorySetSync'" + \
           " PostProcessor to syncronize your data before running 'BasicStatistics' PostProcessor."
           self.raiseAnError(IOError, msg)
@@ -568,29 +568,39 @@ class BasicStatistics(PostProcessorInterface):
   def _computeWeightedPercentile(self,arrayIn,pbWeight,percent=0.5):
     """
       Method to compute the weighted percentile in a array of data
-      @ In, arrayIn, list/numpy.array, the array of values from which the percentile needs to be estimated
-      @ In, pbWeight, list/numpy.array, the reliability weights that correspond to the values in 'array'
-      @ In, percent, float, the percentile that needs to be computed (between 0.01 and 1.0)
-      @ Out, result, float, the percentile
+      @ In, arrayIn, list/numpy.array, the array of values from which the percentile needs to be estimated,
+        with the samples along the first axis (e.g. [#samples] or [#samples, #pivotValues]); the percentile
+        is computed independently for each index of the other axes
+      @ In, pbWeight, list/numpy.array, the reliability weights that correspond to the samples in 'arrayIn'
+      @ In, percent, float or list, the percentile(s) that needs to be computed (between 0.01 and 1.0)
+      @ Out, result, float or numpy.array, the percentile (with the shape of the other axes of arrayIn), or the
+        percentiles stacked along the first axis if percent is a list
     """
-
-    idxs                   = np.argsort(np.asarray(list(zip(pbWeight,arrayIn)))[:,1])
+    arrayIn = np.asarray(arrayIn)
+    pbWeight = np.asarray(pbWeight)
+    idxs = np.argsort(arrayIn, axis=0)
     # Inserting [0.0,arrayIn[idxs[0]]] is needed when few samples are generated and
     # a percentile that is < that the first pb weight is requested. Otherwise the median
     # is returned.
-    sortedWeightsAndPoints = np.insert(np.asarray(list(zip(pbWeight[idxs],arrayIn[idxs]))),0,[0.0,arrayIn[idxs[0]]],axis=0)
-    weightsCDF             = np.cumsum(sortedWeightsAndPoints[:,0])
-    # This step returns the index of the array which is < than the percentile, because
-    # the insertion create another entry, this index should shift to the bigger side
-    indexL = utils.first(np.asarray(weightsCDF >= percent).nonzero())[0]
-    # This step returns the indices (list of index) of the array which is > than the percentile
-    indexH = utils.first(np.asarray(weightsCDF > percent).nonzero())
-    try:
-      # if the indices exists that means the desired percentile lies between two data points
-      # with index as indexL and indexH[0]. Calculate the midpoint of these two points
-      result = 0.5*(sortedWeightsAndPoints[indexL,1]+sortedWeightsAndPoints[indexH[0],1])
-    except IndexError:
-      result = sortedWeightsAndPoints[indexL,1]
+    sortedPoints = np.take_along_axis(arrayIn, idxs, axis=0)
+    sortedPoints = np.concatenate((sortedPoints[:1], sortedPoints), axis=0)
+    weightsCDF = np.cumsum(np.insert(pbWeight[idxs], 0, 0.0, axis=0), axis=0)
+    result = []
+    for pct in np.atleast_1d(percent):
+      # This step returns the index of the array which is < than the percentile, because
+      # the insertion create another entry, this index should shift to the bigger side
+      # (the last point, if the weights sum up to slightly less than the percentile)
+      above = weightsCDF >= pct
+      indexL = np.where(above.any(axis=0), above.argmax(axis=0), len(weightsCDF) - 1)
+      # This step returns the index of the array which is > than the percentile
+      above = weightsCDF > pct
+      indexH = above.argmax(axis=0)
+      pointL = np.take_along_axis(sortedPoints, np.expand_dims(indexL, 0), axis=0)[0]
+      pointH = np.take_along_axis(sortedPoints, np.expand_dims(indexH, 0), axis=0)[0]
+      # if the index H exists that means the desired percentile lies between two data points
+      # with index as indexL and indexH. Calculate the midpoint of these two points
+      result.append(np.where(above.any(axis=0), 0.5*(pointL+pointH), pointL))
+    result = np.asarray(result) if isinstance(percent, (list, tuple, np.ndarray)) else result[0][()]
     return result
 
 
@@ -779,12 +789,11 @@ class BasicStatistics(PostProcessorInterface):
           targWeight = relWeight[target].values
           targDa = dataSet[target]
           if self.pivotParameter in targDa.sizes.keys():
-            quantile = [self._computeWeightedPercentile(group.values,targWeight,percent=0.5) for label,group in targDa.groupby(self.pivotParameter)]
-          else:
-            quantile = self._computeWeightedPercentile(targDa.values,targWeight,percent=0.5)
-          if self.pivotParameter in targDa.sizes.keys():
+            # all the pivot values at once
+            quantile = self._computeWeightedPercentile(targDa.transpose(self.sampleTag,self.pivotParameter).values,targWeight,percent=0.5)
             da = xr.DataArray(quantile,dims=(self.pivotParameter),coords={self.pivotParameter:self.pivotValue})
           else:
+            quantile = self._computeWeightedPercentile(targDa.values,targWeight,percent=0.5)
             da = xr.DataArray(quantile)
           medianSet[target] = da
       else:
@@ -935,16 +944,12 @@ class BasicStatistics(PostProcessorInterface):
         for target in needed[metric]['targets']:
           targWeight = relWeight[target].values
           targDa = dataSet[target]
-          quantile = []
-          for pct in percent:
-            if self.pivotParameter in targDa.sizes.keys():
-              qtl = [self._computeWeightedPercentile(group.values,targWeight,percent=pct) for label,group in targDa.groupby(self.pivotParameter)]
-            else:
-              qtl = self._computeWeightedPercentile(targDa.values,targWeight,percent=pct)
-            quantile.append(qtl)
           if self.pivotParameter in targDa.sizes.keys():
+            # all the percentiles and pivot values at once
+            quantile = self._computeWeightedPercentile(targDa.transpose(self.sampleTag,self.pivotParameter).values,targWeight,percent=percent)
             da = xr.DataArray(quantile,dims=('percent',self.pivotParameter),coords={'percent':percent,self.pivotParameter:self.pivotValue})
           else:
+            quantile = self._computeWeightedPercentile(targDa.values,targWeight,percent=percent)
             da = xr.DataArray(quantile,dims=('percent'),coords={'percent':percent})
           percentileSet[target] = da
 
@@ -1003,10 +1008,9 @@ class BasicStatistics(PostProcessorInterface):
         featSet = dataSet.sel(**{'variable':features}).values
         targSet = dataSet.sel(**{'variable':targets}).values
         pivotVals = dataSet.coords[self.pivotParameter].values
-        da = None
-        for i in range(len(pivotVals)):
-          ds = self.sensitivityCalculation(features,targets,featSet[i,:,:],targSet[i,:,:],intersectionSet)
-          da = ds if da is None else xr.concat([da,ds], dim=self.pivotParameter)
+        # the regressions are independent for each pivot value, but are concatenated only once
+        da = xr.concat([self.sensitivityCalculation(features,targets,featSet[i,:,:],targSet[i,:,:],intersectionSet)
+                        for i in range(len(pivotVals))], dim=self.pivotParameter)
         da.coords[self.pivotParameter] = pivotVals
       else:
         # construct target and feature matrices
@@ -1040,15 +1044,11 @@ class BasicStatistics(PostProcessorInterface):
       varianceSet = self._computeVariance(dataSet,meanSet,pbWeight=relWeight,dim=self.sampleTag)
       dataSet = dataSet - meanSet
       if self.pivotParameter in dataSet.sizes.keys():
-        ds = None
+        # construct target and feature matrices, for all the pivot values at once
         paramDA = dataSet.to_array().transpose(self.pivotParameter,'variable',self.sampleTag).values
         varianceDA = varianceSet[targVars].to_array().transpose(self.pivotParameter,'variable').values
         pivotVals = dataSet.coords[self.pivotParameter].values
-        for i in range(len(pivotVals)):
-          # construct target and feature matrices
-          paramSamples = paramDA[i,...]
-          da = self.covarianceCalculation(paramDA[i,...],fact,varianceDA[i,:],targVars)
-          ds = da if ds is None else xr.concat([ds,da], dim=self.pivotParameter)
+        ds = self.covarianceCalculation(paramDA,fact,varianceDA,targVars)
         ds.coords[self.pivotParameter] = pivotVals
         calculations[metric] = ds
       else:
@@ -1077,12 +1077,9 @@ class BasicStatistics(PostProcessorInterface):
       targCoords = reducedCovar.coords['targets'].values
       if self.pivotParameter in reducedCovar.sizes.keys():
         pivotCoords = reducedCovar.coords[self.pivotParameter].values
-        ds = None
-        for label, group in reducedCovar.groupby(self.pivotParameter):
-          corrMatrix = self.corrCoeff(group.values)
-          da = xr.DataArray(corrMatrix, dims=('targets','features'), coords={'targets':targCoords,'features':targCoords})
-          ds = da if ds is None else xr.concat([ds,da], dim=self.pivotParameter)
-        ds.coords[self.pivotParameter] = pivotCoords
+        corrMatrix = self.corrCoeff(reducedCovar.transpose(self.pivotParameter,'targets','features').values)
+        ds = xr.DataArray(corrMatrix, dims=(self.pivotParameter,'targets','features'),
+                          coords={self.pivotParameter:pivotCoords,'targets':targCoords,'features':targCoords})
         calculations[metric] = ds
       else:
         corrMatrix = self.corrCoeff(reducedCovar.values)
@@ -1103,10 +1100,7 @@ class BasicStatistics(PostProcessorInterface):
       targCoords = reducedCovar.coords['targets'].values
       if self.pivotParameter in reducedCovar.sizes.keys():
         pivotCoords = reducedCovar.coords[self.pivotParameter].values
-        ds = None
-        for label, group in reducedCovar.groupby(self.pivotParameter):
-          da = self.varianceDepSenCalculation(targCoords,group.values)
-          ds = da if ds is None else xr.concat([ds,da], dim=self.pivotParameter)
+        ds = self.varianceDepSenCalculation(targCoords,reducedCovar.transpose(self.pivotParameter,'targets','features').values)
         ds.coords[self.pivotParameter] = pivotCoords
         calculations[metric] = ds
       else:
@@ -1181,18 +1175,18 @@ class BasicStatistics(PostProcessorInterface):
       Unbiased weighted covariance matrix,   weights is not None, bias is 0
       Biased weighted covariance matrix,     weights is not None, bias is 1
       can be calcuated depending on the selection of the inputs.
-      @ In,  covM, numpy.array, [#targets,#targets] covariance matrix
-      @ Out, covM, numpy.array, [#targets,#targets] correlation matrix
+      @ In,  covM, numpy.array, [#targets,#targets] covariance matrix (or [#pivotValues,#targets,#targets] covariance matrices)
+      @ Out, covM, numpy.array, [#targets,#targets] correlation matrix (or [#pivotValues,#targets,#targets] correlation matrices)
     """
     try:
-      d = np.diag(covM)
+      d = np.diagonal(covM, axis1=-2, axis2=-1)
     except ValueError:
       # scalar covariance
       # nan if incorrect value (nan, inf, 0), 1 otherwise
       return covM / covM
     stdDev = np.sqrt(d)
-    covM /= stdDev[:,None]
-    covM /= stdDev[None,:]
+    covM /= stdDev[...,:,None]
+    covM /= stdDev[...,None,:]
     return covM
 
   def sensitivityCalculation(self,featVars, targVars, featSamples, targSamples, intersectionSet):
@@ -1250,44 +1244,53 @@ class BasicStatistics(PostProcessorInterface):
     """
       This method computes the covariance of given sample matrix
       @ In, paramSamples, numpy.ndarray, [#parameters, #samples], array of parameters
+        (or [#pivotValues, #parameters, #samples], to compute the covariance for each pivot value)
       @ In, fact, float, the unbiase correction factor
-      @ In, variance, numpy.ndarray, [#parameters], variance of parameters
+      @ In, variance, numpy.ndarray, [#parameters] (or [#pivotValues, #parameters]), variance of parameters
       @ In, targVars, list, the list of parameters
-      @ Out, da, xarray.DataArray, contains the calculations of covariance
+      @ Out, da, xarray.DataArray, contains the calculations of covariance, with dimensions (targets, features)
+        (or (pivotParameter, targets, features))
     """
+    # contiguous operands, so that each product is done by BLAS (as np.dot does)
+    paramSamples = np.ascontiguousarray(paramSamples)
     if self.pbPresent:
-      paramSamplesT = (paramSamples*self.realizationWeight['ProbabilityWeight'].values).T
+      paramSamplesT = np.swapaxes(paramSamples*self.realizationWeight['ProbabilityWeight'].values, -1, -2)
     else:
-      paramSamplesT = paramSamples.T
-    cov = np.dot(paramSamples, paramSamplesT.conj())
+      paramSamplesT = np.swapaxes(paramSamples, -1, -2)
+    cov = np.matmul(paramSamples, np.ascontiguousarray(paramSamplesT.conj()))
     cov *= fact
-    np.fill_diagonal(cov,variance)
-    da = xr.DataArray(cov, dims=('targets','features'), coords={'targets':targVars,'features':targVars})
+    diag = np.arange(cov.shape[-1])
+    cov[...,diag,diag] = variance
+    dims = ('targets','features') if cov.ndim == 2 else (self.pivotParameter,'targets','features')
+    da = xr.DataArray(cov, dims=dims, coords={'targets':targVars,'features':targVars})
     return da
 
   def varianceDepSenCalculation(self,targCoords, cov):
     """
       This method computes the covariance of given sample matrix
       @ In, targCoords, list, the list of parameters
-      @ In, cov, numpy.ndarray, the covariance of parameters
-      @ Out, da, xarray.DataArray, contains the calculations of variance dependent sensitivities
+      @ In, cov, numpy.ndarray, the covariance of parameters (or [#pivotValues, #parameters, #parameters], the
+        covariance for each pivot value)
+      @ Out, da, xarray.DataArray, contains the calculations of variance dependent sensitivities, with dimensions
+        (targets, features) (or (pivotParameter, targets, features))
     """
-    senMatrix = np.zeros((len(targCoords), len(targCoords)))
+    senMatrix = np.zeros(cov.shape)
     if self.multipleFeatures:
       for p, param in enumerate(targCoords):
-        covX = np.delete(cov,p,axis=0)
-        covX = np.delete(covX,p,axis=1)
-        covYX = np.delete(cov[p,:],p)
-        sensCoef = np.dot(covYX,np.linalg.pinv(covX))
-        sensCoef = np.insert(sensCoef,p,1.0)
-        senMatrix[p,:] = sensCoef
+        covX = np.delete(cov,p,axis=-2)
+        covX = np.delete(covX,p,axis=-1)
+        covYX = np.delete(cov[...,p,:],p,axis=-1)
+        sensCoef = np.matmul(covYX[...,None,:],np.linalg.pinv(covX))[...,0,:]
+        sensCoef = np.insert(sensCoef,p,1.0,axis=-1)
+        senMatrix[...,p,:] = sensCoef
     else:
       for p, param in enumerate(targCoords):
-        covX = cov[p,p]
-        covYX = cov[:,p]
-        sensCoef = covYX / covX
-        senMatrix[:,p] = sensCoef
-    da = xr.DataArray(senMatrix, dims=('targets','features'), coords={'targets':targCoords,'features':targCoords})
+        covX = cov[...,p,p]
+        covYX = cov[...,:,p]
+        sensCoef = covYX / covX[...,None]
+        senMatrix[...,:,p] = sensCoef
+    dims = ('targets','features') if cov.ndim == 2 else (self.pivotParameter,'targets','features')
+    da = xr.DataArray(senMatrix, dims=dims, coords={'targets':targCoords,'features':targCoords})
     return da
 
   def run(self, inputIn):
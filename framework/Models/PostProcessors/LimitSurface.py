@@ -18,7 +18,6 @@ Created on July 10, 2013
 """
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
-import copy
 from collections import OrderedDict
 #External Modules End--------------------------------------------------------------------------------
 
@@ -363,28 +362,31 @@ class LimitSurface(PostProcessorInterface):
       except:
         pass
     self.surfPoint, evaluations, listSurfPoint = OrderedDict().fromkeys(allGridNames), OrderedDict().fromkeys(allGridNames) ,OrderedDict().fromkeys(allGridNames)
+    # the grids of all the nodes are evaluated by the ROM in a single (batched) call
     for nodeName in allGridNames:
-      #if skipMainGrid == True and nodeName == self.name: continue
-      self.testMatrix[nodeName] = np.zeros(self.gridEntity.returnParameter("gridShape",nodeName))
       self.gridCoord[nodeName] = self.gridEntity.returnGridAsArrayOfCoordinates(nodeName=nodeName)
-      tempDict ={}
-      for  varId, varName in enumerate(self.axisName):
-        tempDict[varName] = self.gridCoord[nodeName][:,varId]
-      self.testMatrix[nodeName].shape     = (self.gridCoord[nodeName].shape[0])                       #rearrange the grid matrix such as is an array of values
-      self.testMatrix[nodeName][:]        = self.ROM.evaluate(tempDict)[self.externalFunction.name]   #get the prediction on the testing grid
-      self.testMatrix[nodeName].shape     = self.gridEntity.returnParameter("gridShape",nodeName)     #bring back the grid structure
+    allCoords = np.concatenate([self.gridCoord[nodeName] for nodeName in allGridNames], axis=0)
+    tempDict = {}
+    for varId, varName in enumerate(self.axisName):
+      tempDict[varName] = allCoords[:,varId]
+    allPredictions = np.asarray(self.ROM.evaluate(tempDict)[self.externalFunction.name]).ravel()
+    self.raiseADebug('LimitSurface: Prediction performed')
+    start = 0
+    for nodeName in allGridNames:
+      #if skipMainGrid == True and nodeName == self.name: continue
+      nPoints = self.gridCoord[nodeName].shape[0]
+      self.testMatrix[nodeName] = allPredictions[start:start+nPoints].reshape(self.gridEntity.returnParameter("gridShape",nodeName)) #get the prediction on the testing grid
+      start += nPoints
       self.gridCoord[nodeName].shape      = self.gridEntity.returnParameter("gridCoorShape",nodeName) #bring back the grid structure
-      self.raiseADebug('LimitSurface: Prediction performed')
       # here next the points that are close to any change are detected by a gradient (it is a pre-screener)
       if self.nVar > 1:
-        toBeTested = np.squeeze(np.dstack(np.nonzero(np.sum(np.abs(np.gradient(self.testMatrix[nodeName])), axis = 0))))
+        candidates = np.sum(np.abs(np.gradient(self.testMatrix[nodeName])), axis = 0) != 0
       else:
-        toBeTested = np.squeeze(np.dstack(np.nonzero(np.abs(np.gradient(self.testMatrix[nodeName])))))
-      toBeTested = np.atleast_2d(toBeTested).T if self.nVar == 1 else toBeTested
+        candidates = np.abs(np.gradient(self.testMatrix[nodeName])) != 0
       #printing----------------------
       self.raiseADebug('LimitSurface:  Limit surface candidate points')
       if self.getVerbosity() == 'debug':
-        for coordinate in np.rollaxis(toBeTested, 0):
+        for coordinate in np.argwhere(candidates):
           myStr = ''
           for iVar, varnName in enumerate(self.axisName):
             myStr += varnName + ': ' + str(coordinate[iVar]) + '      '
@@ -395,11 +397,11 @@ class LimitSurface(PostProcessorInterface):
       listSurfPointNegative, listSurfPointPositive = [], []
       if self.lsSide in ["negative", "both"]:
         # it returns the list of points belonging to the limit state surface and resulting in a negative response by the ROM
-        listSurfPointNegative = self.__localLimitStateSearch__(toBeTested, -1, nodeName)
+        listSurfPointNegative = self.__localLimitStateSearch__(candidates, -1, nodeName)
         nNegPoints = len(listSurfPointNegative)
       if self.lsSide in ["positive", "both"]:
         # it returns the list of points belonging to the limit state surface and resulting in a positive response by the ROM
-        listSurfPointPositive = self.__localLimitStateSearch__(toBeTested, 1, nodeName)
+        listSurfPointPositive = self.__localLimitStateSearch__(candidates, 1, nodeName)
         nPosPoints = len(listSurfPointPositive)
       listSurfPoint[nodeName] = listSurfPointNegative + listSurfPointPositive
       #printing----------------------
@@ -428,39 +430,34 @@ class LimitSurface(PostProcessorInterface):
       returnSurface = (self.surfPoint, evaluations, listSurfPoint) if returnListSurfCoord else (self.surfPoint, evaluations)
     return returnSurface
 
-  def __localLimitStateSearch__(self, toBeTested, sign, nodeName):
+  def __localLimitStateSearch__(self, candidates, sign, nodeName):
     """
       It returns the list of points belonging to the limit state surface and resulting in
       positive or negative responses by the ROM, depending on whether ''sign''
       equals either -1 or 1, respectively.
-      @ In, toBeTested, np.ndarray, the nodes to be tested
+      The sign changes are detected comparing the testMatrix with itself shifted by one node along each axis.
+      @ In, candidates, np.ndarray, boolean mask (with the grid shape) of the nodes to be tested
       @ In, sign, int, the sign that should be tested (-1 or +1)
       @ In, nodeName, string, the sub-grid name
-      @ Out, listSurfPoint, list, the list of limit surface coordinates
+      @ Out, listSurfPoint, list, the list of limit surface coordinates (grid indices, in C order)
     """
-    #TODO: This approach might be extremely slow. It must be replaced with matrix operations
-    listSurfPoint = []
-    gridShape = self.gridEntity.returnParameter("gridShape",nodeName)
-    myIdList = np.zeros(self.nVar,dtype=int)
-    putIt = np.zeros(self.nVar,dtype=bool)
-    for coordinate in np.rollaxis(toBeTested, 0):
-      myIdList[:] = coordinate
-      putIt[:]    = False
-      if self.testMatrix[nodeName][tuple(coordinate)] * sign > 0:
-        for iVar in range(self.nVar):
-          if coordinate[iVar] + 1 < gridShape[iVar]:
-            myIdList[iVar] += 1
-            if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-              putIt[iVar] = True
-              listSurfPoint.append(copy.copy(coordinate))
-              break
-            myIdList[iVar] -= 1
-            if coordinate[iVar] > 0:
-              myIdList[iVar] -= 1
-              if self.testMatrix[nodeName][tuple(myIdList)] * sign <= 0:
-                putIt[iVar] = True
-                listSurfPoint.append(copy.copy(coordinate))
-                break
-              myIdList[iVar] += 1
-      #if len(set(putIt)) == 1 and  list(set(putIt))[0] == True: listSurfPoint.append(copy.copy(coordinate))
+    values = self.testMatrix[nodeName] * sign
+    nDim = values.ndim
+    # nodes with at least a neighbour (along any axis) on the other side of the limit surface
+    changes = np.zeros(values.shape, dtype=bool)
+    for axis in range(nDim):
+      nNodes = values.shape[axis]
+      if nNodes < 2:
+        continue
+      # following neighbour: node i against node i+1
+      node = tuple(slice(0, nNodes-1) if d == axis else slice(None) for d in range(nDim))
+      neighbour = tuple(slice(1, nNodes) if d == axis else slice(None) for d in range(nDim))
+      changes[node] |= values[neighbour] <= 0
+      # preceding neighbour: node i against node i-1 (only checked for nodes having a following neighbour too)
+      if nNodes > 2:
+        node = tuple(slice(1, nNodes-1) if d == axis else slice(None) for d in range(nDim))
+        neighbour = tuple(slice(0, nNodes-2) if d == axis else slice(None) for d in range(nDim))
+        changes[node] |= values[neighbour] <= 0
+    onSurface = candidates & (values > 0) & changes
+    listSurfPoint = list(np.argwhere(onSurface))
     return listSurfPoint
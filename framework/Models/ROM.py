@@ -107,6 +107,8 @@ class ROM(Dummy):
     metric.addParam('type', InputTypes.StringType, True)
     segment.addSub(metric)
     segment.addSub(InputData.parameterInputFactory('macroParameter', contentType=InputTypes.StringType))
+    ## number of processes training and evaluating the segments
+    segment.addSub(InputData.parameterInputFactory('numWorkers', contentType=InputTypes.IntegerType))
     inputSpecification.addSub(segment)
     ##### END ROMCollection
     # pickledROM
@@ -1514,6 +1516,51 @@ class ROM(Dummy):
     rlz.update(dict((var,np.atleast_1d(inRun[var] if var in kwargs['SampledVars'] else result[var])) for var in set(itertools.chain(result.keys(),inRun.keys()))))
     return rlz
 
+  def canEvaluateBatch(self):
+    """
+      Checks if this model is able to evaluate a whole block of samples in a single job.
+      This is possible for the static (not time-dependent) ROMs only.
+      @ In, None
+      @ Out, canEvaluateBatch, bool, True if the model can evaluate blocks of samples
+    """
+    engine = self.supervisedEngine
+    if engine is None or engine.isADynamicModel or engine.canHandleDynamicData:
+      return False
+    return not isinstance(engine.supervisedContainer[0], SupervisedLearning.Collection)
+
+  @Parallel()
+  def evaluateBatch(self, myInput, samplerType, batch):
+    """
+        This will evaluate a block of samples on this model. If the underlying ROM
+        accepts several points per request (ROMmultiRequest), the whole block is
+        evaluated in a single call, otherwise the points are evaluated one by one.
+        @ In, myInput, list, the inputs (list) to start from to generate the new one
+        @ In, samplerType, string, is the type of sampler that is calling to generate a new input
+        @ In, batch, dict, the information coming from the sampler for the block (see Sampler.generateInputBatch),
+           a mandatory key is the 'SampledVars' that contains a dictionary {'name variable':np.array(nSamples)}
+        @ Out, rlz, dict, the block of realizations in columns ({var:np.array(nSamples)})
+    """
+    nRuns = len(batch['prefix'])
+    Input = self.createNewInput(myInput, samplerType, **batch)
+    inRun = self._manipulateInput(Input[0])
+    if self.supervisedEngine.supervisedContainer[0].ROMmultiRequest:
+      result = self.evaluate(inRun)
+    else:
+      results = [self.evaluate(dict((var, val[i:i+1] if len(val) == nRuns else val) for var, val in inRun.items())) for i in range(nRuns)]
+      result = dict((var, np.concatenate([res[var] for res in results])) for var in results[0])
+    self._replaceVariablesNamesWithAliasSystem(result, 'output', True)
+    self._replaceVariablesNamesWithAliasSystem(inRun, 'input', True)
+    self._replaceVariablesNamesWithAliasSystem(batch['SampledVars'], 'input', True)
+    # metadata: per-sample entries are already arrays, the shared ones are repeated for each sample
+    rlz = {}
+    for var, val in batch.items():
+      if isinstance(val, np.ndarray) and len(val) == nRuns:
+        rlz[var] = val
+      elif not isinstance(val, (dict, list, np.ndarray)):
+        rlz[var] = np.full(nRuns, val)
+    rlz.update(dict((var, np.atleast_1d(inRun[var] if var in batch['SampledVars'] else result[var])) for var in set(itertools.chain(result.keys(), inRun.keys()))))
+    return rlz
+
   def setAdditionalParams(self, params):
     """
       Used to set parameters at a time other than initialization (such as deserializing).
@@ -27,9 +27,9 @@
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
 from scipy.special import comb
+from scipy.spatial.distance import cdist
 from collections import deque, defaultdict
 import xarray as xr
-import copy
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -382,7 +382,7 @@ class GeneticAlgorithm(RavenSampled):
   # Run Methods #
   ###############
 
-  def _useRealization(self, info, rlz1):
+  def _useRealization(self, info, rlz):
     """
       Used to feedback the collected runs into actionable items within the sampler.
       This is called by localFinalizeActualSampling, and hence should contain the main skeleton.
@@ -397,8 +397,6 @@ class GeneticAlgorithm(RavenSampled):
     self.incrementIteration(traj)
     info['step'] = self.counter
 
-    rlz=copy.deepcopy(rlz1)
-
     # Developer note: each algorithm step is indicated by a number followed by the generation number
     # e.g., '5 @ n-1' refers to step 5 for generation n-1 (i.e., previous generation)
     # for more details refer to GRP-Raven-development/Disceret_opt channel on MS Teams
@@ -441,48 +439,58 @@ class GeneticAlgorithm(RavenSampled):
       # 4 @ n: repair/replacement
       # repair should only happen if multiple genes in a single chromosome have the same values (),
       # and at the same time the sampling of these genes should be with Out replacement.
-      needsRepair = False
-      for chrom in range(self._nChildren):
-        unique = set(childrenMutated.data[chrom,:])
-        if len(childrenMutated.data[chrom,:]) != len(unique):
-          for var in self.toBeSampled.keys(): ## TODO: there must be a smarter way to check if a variables strategy is without replacement
-            if (hasattr(self.distDict[var],'strategy') and self.distDict[var].strategy == 'withoutReplacement'):
-              needsRepair = True
-              break
-      if needsRepair:
+      withoutReplacement = any(getattr(self.distDict[var],'strategy',None) == 'withoutReplacement' for var in self.toBeSampled)
+      if withoutReplacement and self._hasRepeatedGenes(childrenMutated.data):
         children = self._repairInstance(childrenMutated,variables=list(self.toBeSampled),distInfo=self.distDict)
       else:
-        children = copy.deepcopy(childrenMutated)
+        children = childrenMutated
       # Make sure no children are exactly similar to parents
-      flag = True
       counter = 0
-      while flag and counter < self._populationSize:
+      repeated = self._findRepeatedChromosomes(population.data, children.data)
+      while repeated.size and counter < self._populationSize:
         counter += 1
-        repeated =[]
-        for i in range(np.shape(population.data)[0]):
-          for j in range(i,np.shape(children.data)[0]):
-            if all(population.data[i,:]==children.data[j,:]):
-              repeated.append(j)
-        repeated = list(set(repeated))
-        if repeated:
-          newChildren = self._mutationInstance(offSprings=children[repeated,:],locs = self._mutationLocs, mutationProb=self._mutationProb,variables=list(self.toBeSampled))
-          children.data[repeated,:] = newChildren.data
-        else:
-          flag = False
+        newChildren = self._mutationInstance(offSprings=children[repeated,:],locs = self._mutationLocs, mutationProb=self._mutationProb,variables=list(self.toBeSampled))
+        children.data[repeated,:] = newChildren.data
+        repeated = self._findRepeatedChromosomes(population.data, children.data)
 
       self.batch = np.shape(children)[0]
 
-      daChildren = xr.DataArray(children,
-                              dims=['chromosome','Gene'],
-                              coords={'chromosome': np.arange(np.shape(children)[0]),
-                                      'Gene':list(self.toBeSampled)})
       # 5 @ n: Submit children batch
       # submit children coordinates (x1,...,xm), i.e., self.childrenCoordinates
-      for i in range(np.shape(daChildren)[0]):
-        newRlz={}
-        for _,var in enumerate(self.toBeSampled.keys()):
-          newRlz[var] = float(daChildren.loc[i,var].values)
-        self._submitRun(copy.deepcopy(newRlz), traj, self.getIteration(traj))
+      variables = list(self.toBeSampled)
+      for chromosome in np.atleast_2d(children.data).tolist():
+        newRlz = dict((var, float(val)) for var, val in zip(variables, chromosome))
+        self._submitRun(newRlz, traj, self.getIteration(traj))
+
+  @staticmethod
+  def _hasRepeatedGenes(chromosomes):
+    """
+      Checks if any chromosome contains the same value in more than one gene
+      @ In, chromosomes, np.array, the chromosomes (nChromosomes x nGenes)
+      @ Out, repeated, bool, True if at least one chromosome has repeated genes
+    """
+    chromosomes = np.sort(np.atleast_2d(chromosomes), axis=1)
+    return bool(np.any(chromosomes[:,1:] == chromosomes[:,:-1]))
+
+  @staticmethod
+  def _findRepeatedChromosomes(population, children):
+    """
+      Finds the children identical to a chromosome of the population, comparing the child j with the
+      chromosomes i <= j of the population
+      @ In, population, np.array, the population (nPopulation x nGenes)
+      @ In, children, np.array, the children (nChildren x nGenes)
+      @ Out, repeated, np.array, sorted indexes of the children found in the population
+    """
+    # contiguous rows, hashed as a whole through a void view (+ 0. turns -0. into 0., as "==" does)
+    population = np.ascontiguousarray(np.atleast_2d(population), dtype=float) + 0.
+    children = np.ascontiguousarray(np.atleast_2d(children), dtype=float) + 0.
+    rowType = np.dtype((np.void, population.dtype.itemsize * population.shape[1]))
+    # first index of each chromosome in the population
+    firstIndex = {}
+    for i, row in enumerate(population.view(rowType).ravel()):
+      firstIndex.setdefault(row.tobytes(), i)
+    repeated = [j for j, row in enumerate(children.view(rowType).ravel()) if firstIndex.get(row.tobytes(), j + 1) <= j]
+    return np.array(sorted(repeated), dtype=int)
 
   def _datasetToDataArray(self,rlzDataset):
     """
@@ -569,12 +577,13 @@ class GeneticAlgorithm(RavenSampled):
       @ In, fitness, xr.DataArray, fitness values at each chromosome of the realization
       @ Out, point, dict, point used in this realization
     """
-    optPoints,fit,obj = zip(*[[x,y,z] for x,y,z in sorted(zip(np.atleast_2d(population.data),np.atleast_1d(fitness.data),objectiveVal),reverse=True,key=lambda x: (x[1]))])
-    point = dict((var,float(optPoints[0][i])) for i,var in enumerate(self.toBeSampled.keys()))
-    if (self.counter>1 and obj[0] < self.bestObjective) or self.counter == 1:
+    # the fittest chromosome (the first one in case of ties)
+    best = int(np.argmax(np.atleast_1d(fitness.data)))
+    point = dict((var,float(np.atleast_2d(population.data)[best,i])) for i,var in enumerate(self.toBeSampled.keys()))
+    if (self.counter>1 and objectiveVal[best] < self.bestObjective) or self.counter == 1:
       self.bestPoint = point
-      self.bestFitness = fit[0]
-      self.bestObjective = obj[0]
+      self.bestFitness = np.atleast_1d(fitness.data)[best]
+      self.bestObjective = objectiveVal[best]
     return point
 
   def _checkAcceptability(self, traj):
@@ -700,24 +709,21 @@ class GeneticAlgorithm(RavenSampled):
       @ In, p, float, the order of norm
       @ Out, _GDp, float, the modified generational distance $\frac{1}{n_A} \Sigma_{i=1}^{n_A}min_{b \in B} dist(ai,B)$
     """
-    s = 0
     n = np.shape(a)[0]
-    for i in range(n):
-      s += self._popDist(a[i,:],b)**p
+    s = np.sum(self._popDist(a,b)**p)
     return (1/n * s)**(1/p)
 
   def _popDist(self,ai,b,q=2):
     """
       Minimum Minkowski distance from a_i to B (nearest point in B)
-      @ In, ai, 1d array, the ith chromosome in the generation A
+      @ In, ai, 1d or 2d array, the ith chromosome in the generation A (or the whole generation A, one chromosome per row)
       @ In, b, np.array, population B
       @ In, q, integer, order of the norm
-      @ Out, _popDist, float, the minimum distance from ai to B $inf_(\|ai-bj\|_q)**\frac{1}{q}$
+      @ Out, _popDist, float or np.array, the minimum distance from ai to B $inf_(\|ai-bj\|_q)**\frac{1}{q}$
+                       (one distance per row if ai is 2d)
     """
-    nrm=[]
-    for j in range(np.shape(b)[0]):
-      nrm.append(np.linalg.norm(ai-b[j,:],q))
-    return min(nrm)
+    dist = cdist(np.atleast_2d(ai), np.atleast_2d(b), 'minkowski', p=q).min(axis=1)
+    return dist if np.ndim(ai) > 1 else dist[0]
 
   def _ahd(self,a,b):
     """
@@ -735,11 +741,7 @@ class GeneticAlgorithm(RavenSampled):
       @ In, b, np.array, new population B
       @ Out, _GD, float, the generational distance $\frac{1}{n_A} \max_{i \in A}min_{b \in B} dist(ai,B)$
     """
-    s = []
-    n = np.shape(a)[0]
-    for i in range(n):
-      s.append(self._popDist(a[i,:],b))
-    return max(s)
+    return np.max(self._popDist(a,b))
 
   def _updateConvergence(self, traj, new, old, acceptable):
     """
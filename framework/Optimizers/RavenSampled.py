@@ -81,8 +81,22 @@ class RavenSampled(Optimizer):
               of \xmlString{final}, only the final optimal solution for each trajectory will be written.
               In case of \xmlString{every}, the \xmlNode{SolutionExport} will be updated with each iteration
               of the Optimizer.""")
+    cache = InputData.parameterInputFactory('evaluationCache', contentType=InputTypes.BoolType,
+        printPriority=100,
+        descr=r"""if True, the optimizer does not send back to the Model the points that have already been
+              evaluated, for example the repeated chromosomes of a \xmlNode{GeneticAlgorithm} or the
+              repeated gradient probes of a \xmlNode{GradientDescent}. The realization of the already-evaluated point is
+              taken from the \xmlNode{TargetEvaluation} instead, so the jobs are used only for new points.
+              Two points are considered the same if all the (denormalized) optimization variables are equal,
+              once rounded to the \xmlAttr{resolution}. Since the realizations already present in the
+              \xmlNode{TargetEvaluation} (for example loaded from a previous optimization) are used as well, the
+              cache persists across optimizations sharing the \xmlNode{TargetEvaluation}. \default{False}""")
+    cache.addParam('resolution', param_type=InputTypes.FloatType, required=False,
+        descr=r"""the resolution to which the optimization variables are rounded to identify the already-evaluated
+              points. \default{1e-12}""")
     init.addSub(limit)
     init.addSub(write)
+    init.addSub(cache)
     return specs
 
   @classmethod
@@ -120,6 +134,10 @@ class RavenSampled(Optimizer):
     self._stepTracker = {}  # action tracking: what is collected, what needs collecting?
     self._optPointHistory = {}  # by traj, is a deque (-1 is most recent)
     self._maxHistLen = 2  # FIXME who should set this?
+    self._useEvaluationCache = False  # if True, the already-evaluated points are not sent to the Model
+    self._cacheResolution = 1e-12  # resolution of the optimization variables to identify the evaluated points
+    self._evaluationCache = {}  # {rounded point: row in TargetEvaluation} of the evaluated points
+    self._cacheIndexed = 0  # number of rows of the TargetEvaluation already in the cache
     # __private
     self.__stepCounter = {}  # tracks the "generation" or "iteration" of each trajectory -> iteration is defined by inheritor
     # additional methods
@@ -144,6 +162,15 @@ class RavenSampled(Optimizer):
       writeSteps = init.findFirst('writeSteps')
       if writeSteps is not None:
         self._writeSteps = writeSteps.value
+      # evaluationCache
+      cache = init.findFirst('evaluationCache')
+      if cache is not None:
+        self._useEvaluationCache = cache.value
+        resolution = cache.parameterValues.get('resolution')
+        if resolution is not None:
+          if resolution <= 0:
+            self.raiseAnError(IOError, f'The "resolution" of <evaluationCache> must be positive, got {resolution}!')
+          self._cacheResolution = resolution
     # additional checks
     if self.limit is None:
       self.raiseAnError(IOError, 'A <limit> is required for any RavenSampled Optimizer!')
@@ -156,6 +183,8 @@ class RavenSampled(Optimizer):
       @ Out, None
     """
     Optimizer.initialize(self, externalSeeding=externalSeeding, solutionExport=solutionExport)
+    self._evaluationCache = {}
+    self._cacheIndexed = 0
 
   ###############
   # Run Methods #
@@ -220,6 +249,7 @@ class RavenSampled(Optimizer):
     if self.batch > 1:
       self.inputInfo['batchMode'] = True
       batchData = []
+      restartPoints = {}
       self.batchId += 1
     else:
       self.inputInfo['batchMode'] = False
@@ -251,12 +281,74 @@ class RavenSampled(Optimizer):
         inputInfo['SampledVars'] = self.values
         inputInfo['batchId'] = self.batchId
         batchData.append(copy.deepcopy(inputInfo))
+        # the points of the batch already evaluated are not sent to the Model (see Model.submit)
+        _, inExisting, source = self._findEvaluatedPoint()
+        if inExisting is not None:
+          restartPoints[len(batchData) - 1] = self._formatRestartRealization(inExisting, source, batchData[-1])
       else:
         inputInfo['SampledVars'] = self.values
         inputInfo['batchId'] = self.batchId
         self.inputInfo.update(inputInfo)
     if self.batch > 1:
-      self.inputInfo['batchInfo'] = {'nRuns': self.batch, 'batchRealizations': batchData, 'batchId': str('gen_' + str(self.batchId))}
+      if restartPoints:
+        self.raiseADebug(f'{len(restartPoints)} of {self.batch} points of batch {self.batchId} have already been evaluated')
+      self.inputInfo['batchInfo'] = {'nRuns': self.batch, 'batchRealizations': batchData, 'batchId': str('gen_' + str(self.batchId)),
+                                     'restartPoints': restartPoints}
+
+  def _checkRestartForEvaluation(self):
+    """
+      Checks restart data object (if any) and the evaluation cache (if requested) for a matching realization.
+      @ In, None
+      @ Out, index, int, index of matching realization (None if not found)
+      @ Out, inExisting, dict, matching realization (None if not found)
+      @ Out, source, DataObject, the data object containing the matching realization (None if not found)
+    """
+    if self.inputInfo.get('batchMode', False):
+      # each point of the batch has already been checked in localGenerateInput
+      return None, None, None
+    return self._findEvaluatedPoint()
+
+  def _findEvaluatedPoint(self):
+    """
+      Searches the current point (self.values) among the already-evaluated ones, first in the restart
+      data object (if any) and then in the evaluation cache (if requested).
+      @ In, None
+      @ Out, index, int, index of matching realization (None if not found)
+      @ Out, inExisting, dict, matching realization (None if not found)
+      @ Out, source, DataObject, the data object containing the matching realization (None if not found)
+    """
+    index, inExisting, source = Optimizer._checkRestartForEvaluation(self)
+    if inExisting is None and self._useEvaluationCache:
+      self._updateEvaluationCache()
+      index = self._evaluationCache.get(self._cacheKey([self.values[var] for var in self.toBeSampled]))
+      if index is not None:
+        inExisting = self._targetEvaluation.realization(index=index, unpackXArray=True)
+        source = self._targetEvaluation
+    return index, inExisting, source
+
+  def _cacheKey(self, point):
+    """
+      Identifies an (denormalized) point in the evaluation cache.
+      @ In, point, list, the values of the optimization variables (ordered as self.toBeSampled)
+      @ Out, key, tuple, the point rounded to the cache resolution
+    """
+    return tuple(np.round(np.asarray(point, dtype=float) / self._cacheResolution).tolist())
+
+  def _updateEvaluationCache(self):
+    """
+      Adds to the evaluation cache the realizations collected in the TargetEvaluation since the last update.
+      @ In, None
+      @ Out, None
+    """
+    size = len(self._targetEvaluation)
+    if size <= self._cacheIndexed:
+      return
+    data = self._targetEvaluation.asDataset()
+    points = np.column_stack([data[var].values[self._cacheIndexed:] for var in self.toBeSampled])
+    for row, point in enumerate(points, start=self._cacheIndexed):
+      # the first evaluation of a point is kept
+      self._evaluationCache.setdefault(self._cacheKey(point), row)
+    self._cacheIndexed = size
 
   # @profile
   def localFinalizeActualSampling(self, job, model, inp):
@@ -21,11 +21,9 @@
 """
 
 import numpy as np
-import xarray as xr
-import copy
-from utils import randomUtils
-from copy import deepcopy
 from scipy.special import comb
+from utils import randomUtils
+from utils.gaUtils import chromosomesToDataArray
 from itertools import combinations
 
 # @profile
@@ -41,11 +39,8 @@ def onePointCrossover(parents,**kwargs):
   """
   nParents,nGenes = np.shape(parents)
   # Number of children = 2* (nParents choose 2)
-  children = xr.DataArray(np.zeros((int(2*comb(nParents,2)),nGenes)),
-                              dims=['chromosome','Gene'],
-                              coords={'chromosome': np.arange(int(2*comb(nParents,2))),
-                                      'Gene':kwargs['variables']})
-
+  first, second = _parentsPairs(parents)
+  nPairs = len(first)
 
   # defaults
   if (kwargs['crossoverProb'] == None) or ('crossoverProb' not in kwargs.keys()):
@@ -53,12 +48,9 @@ def onePointCrossover(parents,**kwargs):
   else:
     crossoverProb = kwargs['crossoverProb']
 
-  # create children
-  parentsPairs = list(combinations(parents,2))
-
-  for ind,parent in enumerate(parentsPairs):
-    parent = np.array(parent).reshape(2,-1) # two parents at a time
-
+  # sample the crossover location of each pair; pairs that do not mate get a location past the last gene
+  locations = np.full(nPairs, nGenes)
+  for ind in range(nPairs):
     if randomUtils.random(dim=1,samples=1) <= crossoverProb:
       if (kwargs['points'] == None) or ('points' not in kwargs.keys()):
         point = list([randomUtils.randomIntegers(1,nGenes-1,None)])
@@ -66,15 +58,14 @@ def onePointCrossover(parents,**kwargs):
         raise ValueError('Crossover point cannot be larger than number of Genes (variables)')
       else:
         point = kwargs['points']
-      for i in range(nGenes):
-        if len(point)>1:
-          raise ValueError('In one Point Crossover a single crossover location should be provided!')
-        children[2*ind:2*ind+2,i] = copy.deepcopy(parent[np.arange(0,2)*(i<point[0])+np.arange(-1,-3,-1)*(i>=point[0]),i])
-    else:
-      # Each child is just a copy of the parents
-      children[2*ind:2*ind+2,:] = copy.deepcopy(parent)
+      if len(point)>1:
+        raise ValueError('In one Point Crossover a single crossover location should be provided!')
+      locations[ind] = point[0]
 
-  return children
+  # create children: the genes from the crossover location on are swapped
+  swap = np.arange(nGenes)[np.newaxis,:] >= locations[:,np.newaxis]
+  children = _mate(first, second, swap)
+  return chromosomesToDataArray(children, kwargs['variables'])
 
 def uniformCrossover(parents,**kwargs):
   """
@@ -85,30 +76,20 @@ def uniformCrossover(parents,**kwargs):
           Shape is nParents x len(chromosome) i.e, number of Genes/Vars
     @ Out, children, xr.DataArray, children resulting from the crossover. Shape is nParents x len(chromosome) i.e, number of Genes/Vars
   """
-  nParents,nGenes = np.shape(parents)
-  children = xr.DataArray(np.zeros((int(2*comb(nParents,2)),np.shape(parents)[1])),
-                              dims=['chromosome','Gene'],
-                              coords={'chromosome': np.arange(int(2*comb(nParents,2))),
-                                      'Gene':parents.coords['Gene'].values})
-
   if (kwargs['crossoverProb'] == None) or ('crossoverProb' not in kwargs.keys()):
     crossoverProb = randomUtils.random(dim=1, samples=1)
   else:
     crossoverProb = kwargs['crossoverProb']
 
-  index = 0
-  parentsPairs = list(combinations(parents,2))
-  for parentPair in parentsPairs:
-    parent1 = parentPair[0].values
-    parent2 = parentPair[1].values
-    children1,children2 = uniformCrossoverMethod(parent1,parent2,crossoverProb)
-    children[index]   = copy.deepcopy(children1)
-    children[index+1] = copy.deepcopy(children2)
-    index = index + 1
-  return children
+  first, second = _parentsPairs(parents)
+  children1,children2 = uniformCrossoverMethod(first,second,crossoverProb)
+  children = np.empty((2*len(first),np.shape(parents)[1]))
+  children[0::2] = children1
+  children[1::2] = children2
+  return chromosomesToDataArray(children, parents.coords['Gene'].values)
 
 
-def twoPointsCrossover(parents, parentIndexes,**kwargs):
+def twoPointsCrossover(parents, parentIndexes=None,**kwargs):
   """
     Method designed to perform a two point crossover on 2 parents:
     Partition each parents in three sequences (A,B,C):
@@ -118,7 +99,7 @@ def twoPointsCrossover(parents, parentIndexes,**kwargs):
     children1 = A1 B2 C1
     children2 = A2 B1 C2
     @ In, parents, xr.DataArray, parents involved in the mating process
-    @ In, parentIndexes, list, list containing pairs of parents
+    @ In, parentIndexes, list, optional, list containing pairs of parents, default is all the pairs of parents
     @ In, kwargs, dict, dictionary of parameters for this mutation method:
           parents, 2D array, parents in the current mating process.
           Shape is nParents x len(chromosome) i.e, number of Genes/Vars
@@ -127,34 +108,25 @@ def twoPointsCrossover(parents, parentIndexes,**kwargs):
     @ Out, children, xr.DataArray, children resulting from the crossover. Shape is nParents x len(chromosome) i.e, number of Genes/Vars
   """
   nParents,nGenes = np.shape(parents)
-  children = xr.DataArray(np.zeros((int(2*comb(nParents,2)),np.shape(parents)[1])),
-                              dims=['chromosome','Gene'],
-                              coords={'chromosome': np.arange(int(2*comb(nParents,2))),
-                                      'Gene':parents.coords['Gene'].values})
-  index = 0
-  for couples in parentIndexes:
+  if parentIndexes is None:
+    parentIndexes = list(combinations(range(nParents),2))
+  parentIndexes = np.atleast_2d(parentIndexes)
+  values = np.atleast_2d(np.asarray(parents))
+  # sample the sequence to be swapped for each couple
+  bounds = np.zeros((len(parentIndexes),2),dtype=int)
+  for index in range(len(parentIndexes)):
     locRangeList = list(range(0,nGenes))
-    index1 = randomUtils.randomIntegers(0, len(locRangeList), caller=None, engine=None)
+    index1 = randomUtils.randomIntegers(0, len(locRangeList)-1, caller=None, engine=None)
     loc1 = locRangeList[index1]
     locRangeList.pop(loc1)
-    index2 = randomUtils.randomIntegers(0, len(locRangeList), caller=None, engine=None)
+    index2 = randomUtils.randomIntegers(0, len(locRangeList)-1, caller=None, engine=None)
     loc2 = locRangeList[index2]
-    if loc1>loc2:
-      locL=loc2
-      locU=loc1
-    elif loc1<loc2:
-      locL=loc1
-      locU=loc2
-
-    parent1 = parents[couples[0]].values
-    parent2 = parents[couples[1]].values
-    children1,children2 = twoPointsCrossoverMethod(parent1,parent2,locL,locU)
-
-    children[index]=copy.deepcopy(children1)
-    children[index+1]=copy.deepcopy(children2)
-    index = index + 2
-
-  return children
+    bounds[index] = min(loc1,loc2), max(loc1,loc2)
+  genes = np.arange(nGenes)[np.newaxis,:]
+  swap = (genes >= bounds[:,0:1]) & (genes <= bounds[:,1:2])
+  children = np.zeros((int(2*comb(nParents,2)),nGenes))
+  children[:2*len(parentIndexes)] = _mate(values[parentIndexes[:,0]], values[parentIndexes[:,1]], swap)
+  return chromosomesToDataArray(children, parents.coords['Gene'].values)
 
 __crossovers = {}
 __crossovers['onePointCrossover']  = onePointCrossover
@@ -189,34 +161,50 @@ def twoPointsCrossoverMethod(parent1,parent2,locL,locU):
     @ Out, children1: first generated array
     @ Out, children2: second generated array
   """
-  children1 = copy.deepcopy(parent1)
-  children2 = copy.deepcopy(parent2)
-
-  seqB1 = parent1.values[locL:locU+1]
-  seqB2 = parent2.values[locL:locU+1]
-
-  children1[locL:locU+1] = seqB2
-  children2[locL:locU+1] = seqB1
+  children1 = np.array(parent1)
+  children2 = np.array(parent2)
+  children1[...,locL:locU+1] = parent2[...,locL:locU+1]
+  children2[...,locL:locU+1] = parent1[...,locL:locU+1]
   return children1,children2
 
 def uniformCrossoverMethod(parent1,parent2,crossoverProb):
   """
-    Method designed to perform a uniform crossover on 2 arrays
+    Method designed to perform a uniform crossover on 2 arrays (or on 2 stacks of arrays, one couple per row)
     @ In, parent1: first array
     @ In, parent2: second array
     @ In, crossoverProb: crossover probability for each gene
     @ Out, children1: first generated array
     @ Out, children2: second generated array
   """
-  children1 = np.zeros(parent1.size)
-  children2 = np.zeros(parent2.size)
+  parent1 = np.asarray(parent1)
+  parent2 = np.asarray(parent2)
+  nGenes = parent1.shape[-1]
+  # one random number for each gene, drawn couple by couple
+  keep = randomUtils.random(dim=nGenes, samples=parent1.size//nGenes, keepMatrix=True).reshape(parent1.shape) < crossoverProb
+  children1 = np.where(keep, parent1, parent2)
+  children2 = np.where(keep, parent2, parent1)
+  return children1,children2
 
-  for pos in range(parent1.size):
-    if randomUtils.random(dim=1,samples=1)<crossoverProb:
-      children1[pos] = parent1[pos]
-      children2[pos] = parent2[pos]
-    else:
-      children1[pos] = parent2[pos]
-      children2[pos] = parent1[pos]
+def _parentsPairs(parents):
+  """
+    Lists all the couples of parents, in the order given by itertools.combinations
+    @ In, parents, xr.DataArray or np.array, parents involved in the mating process (nParents x nGenes)
+    @ Out, first, np.array, first parent of each couple (nPairs x nGenes)
+    @ Out, second, np.array, second parent of each couple (nPairs x nGenes)
+  """
+  values = np.atleast_2d(np.asarray(parents))
+  first, second = np.triu_indices(values.shape[0], k=1)
+  return values[first], values[second]
 
-  return children1,children2
+def _mate(first, second, swap):
+  """
+    Creates two children for each couple of parents, exchanging the genes marked by swap
+    @ In, first, np.array, first parent of each couple (nPairs x nGenes)
+    @ In, second, np.array, second parent of each couple (nPairs x nGenes)
+    @ In, swap, np.array, boolean mask of the genes taken from the other parent (nPairs x nGenes)
+    @ Out, children, np.array, children, the two of each couple one after the other (2*nPairs x nGenes)
+  """
+  children = np.empty((2*len(first),np.shape(first)[1]))
+  children[0::2] = np.where(swap, second, first)
+  children[1::2] = np.where(swap, first, second)
+  return children
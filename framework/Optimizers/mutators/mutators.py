@@ -23,10 +23,8 @@
   @authors: Mohammad Abdo, Diego Mandelli, Andrea Alfonsi
 """
 import numpy as np
-import xarray as xr
-from operator import itemgetter
-from utils import utils, randomUtils
-import copy
+from utils import randomUtils
+from utils.gaUtils import chromosomesToDataArray
 
 def swapMutator(offSprings,**kwargs):
   """
@@ -47,18 +45,14 @@ def swapMutator(offSprings,**kwargs):
   else:
     loc1 = kwargs['locs'][0]
     loc2 = kwargs['locs'][1]
-  # initializing children
-  children = xr.DataArray(np.zeros((np.shape(offSprings))),
-                          dims=['chromosome','Gene'],
-                          coords={'chromosome': np.arange(np.shape(offSprings)[0]),
-                                  'Gene':kwargs['variables']})
-  for i in range(np.shape(offSprings)[0]):
-    children[i] = copy.deepcopy(offSprings[i])
-    ## TODO What happens if loc1 or 2 is out of range?! should we raise an error?
-    if randomUtils.random(dim=1,samples=1)<=kwargs['mutationProb']:
-      children[i,loc1] = offSprings[i,loc2]
-      children[i,loc2] = offSprings[i,loc1]
-  return children
+  ## TODO What happens if loc1 or 2 is out of range?! should we raise an error?
+  values = np.atleast_2d(offSprings.data)
+  children = np.array(values, dtype=float)
+  # one random number for each child, the same sequence obtained child by child
+  mutate = randomUtils.random(dim=1, samples=values.shape[0], keepMatrix=True)[:,0] <= kwargs['mutationProb']
+  children[mutate,loc1] = values[mutate,loc2]
+  children[mutate,loc2] = values[mutate,loc1]
+  return chromosomesToDataArray(children, kwargs['variables'])
 
 # @profile
 def scrambleMutator(offSprings,**kwargs):
@@ -81,19 +75,15 @@ def scrambleMutator(offSprings,**kwargs):
       l = randomUtils.randomIntegers(0,offSprings.sizes['Gene']-1,None)
       locs.append(l)
     locs = list(set(locs))
-  nMutable = len(locs)
-    # initializing children
-  children = xr.DataArray(np.zeros((np.shape(offSprings))),
-                          dims=['chromosome','Gene'],
-                          coords={'chromosome': np.arange(np.shape(offSprings)[0]),
-                                  'Gene':kwargs['variables']})
-  for i in range(np.shape(offSprings)[0]):
-    children[i] = copy.deepcopy(offSprings[i])
-    new = list(itemgetter(*locs)(offSprings[i].values))
-    for ind,element in enumerate(locs):
-      if randomUtils.random(dim=1,samples=1)< kwargs['mutationProb']:
-        children[i,locs[0]:locs[-1]+1] = randomUtils.randomPermutation(list(offSprings.data[i,locs[0]:locs[-1]+1]),None)
-  return children
+  values = np.atleast_2d(offSprings.data)
+  children = np.array(values, dtype=float)
+  if locs:
+    scrambled = slice(locs[0],locs[-1]+1)
+    for i in range(values.shape[0]):
+      for _ in locs:
+        if randomUtils.random(dim=1,samples=1)< kwargs['mutationProb']:
+          children[i,scrambled] = randomUtils.randomPermutation(list(values[i,scrambled]),None)
+  return chromosomesToDataArray(children, kwargs['variables'])
 
 def bitFlipMutator(offSprings,**kwargs):
   """
@@ -106,24 +96,25 @@ def bitFlipMutator(offSprings,**kwargs):
           mutationProb, float, probability that governs the mutation process, i.e., if prob < random number, then the mutation will occur
     @ Out, offSprings, xr.DataArray, children resulting from the crossover process
   """
-  for child in offSprings:
+  values = offSprings.values
+  for child in values:
     # the mutation is performed for each child independently
     if randomUtils.random(dim=1,samples=1)<kwargs['mutationProb']:
       # sample gene location to be flipped: i.e., determine loc
-      chromosomeSize = child.values.shape[0]
-      loc = randomUtils.randomIntegers(0, chromosomeSize, caller=None, engine=None)
+      chromosomeSize = child.shape[0]
+      loc = randomUtils.randomIntegers(0, chromosomeSize-1, caller=None, engine=None)
       ##############
       # sample value: i.e., determine newValue
       if kwargs['sampleRange']=='local':
-        rangeValues = list(set(offSprings[:,loc].values))
+        rangeValues = list(set(values[:,loc]))
       else: #kwargs['sampleRange']=='global'
-        rangeValues = offSprings.values.ravel().tolist()
-      rangeValues.pop(child.values[loc])
-      newValuePos = randomUtils.randomIntegers(0, len(rangeValues), caller=None, engine=None)
+        rangeValues = values.ravel().tolist()
+      rangeValues.remove(child[loc])
+      newValuePos = randomUtils.randomIntegers(0, len(rangeValues)-1, caller=None, engine=None)
       newValue = rangeValues[newValuePos]
       ##############
       # gene at location loc is flipped from current value to newValue
-      child.values[loc] = newValue
+      child[loc] = newValue
 
   return offSprings
 
@@ -138,29 +129,21 @@ def inversionMutator(offSprings,**kwargs):
           mutationProb, float, probability that governs the mutation process, i.e., if prob < random number, then the mutation will occur
     @ Out, offSprings, xr.DataArray, children resulting from the crossover process
   """
-  for child in offSprings:
+  for child in offSprings.values:
     # the mutation is performed for each child independently
     if randomUtils.random(dim=1,samples=1)<kwargs['mutationProb']:
       # sample gene locations: i.e., determine loc1 and loc2
-      locRangeList = list(range(0,child.values.shape[0]))
-      index1 = randomUtils.randomIntegers(0, len(locRangeList), caller=None, engine=None)
+      locRangeList = list(range(0,child.shape[0]))
+      index1 = randomUtils.randomIntegers(0, len(locRangeList)-1, caller=None, engine=None)
       loc1 = locRangeList[index1]
       locRangeList.pop(loc1)
-      index2 = randomUtils.randomIntegers(0, len(locRangeList), caller=None, engine=None)
+      index2 = randomUtils.randomIntegers(0, len(locRangeList)-1, caller=None, engine=None)
       loc2 = locRangeList[index2]
-      if loc1>loc2:
-        locL=loc2
-        locU=loc1
-      elif loc1<loc2:
-        locL=loc1
-        locU=loc2
+      locL = min(loc1,loc2)
+      locU = max(loc1,loc2)
       ##############
-      # select sequence to be mirrored and mirror it
-      seq=child.values[locL:locU+1]
-      mirrSeq = seq[::-1]
-      ##############
-      # insert mirrored sequence into child
-      child.values[locL:locU+1]=mirrSeq
+      # select sequence to be mirrored, mirror it and insert it into child
+      child[locL:locU+1] = child[locL:locU+1][::-1].copy()
 
   return offSprings
 
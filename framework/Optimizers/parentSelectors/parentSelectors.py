@@ -24,7 +24,6 @@
 
 import numpy as np
 import xarray as xr
-import copy
 from utils import randomUtils
 
 # For mandd: to be updated with RAVEN official tools
@@ -42,8 +41,8 @@ def rouletteWheel(population,**kwargs):
     @ Out, selectedParents, xr.DataArray, selected parents, i.e. np.shape(selectedParents) = nParents x nGenes.
   """
   # Arguments
-  pop = copy.deepcopy(population)
-  fitness = copy.deepcopy(kwargs['fitness'])
+  pop = np.atleast_2d(population.values)
+  fitness = np.atleast_1d(np.asarray(kwargs['fitness'], dtype=float))
   nParents= kwargs['nParents']
   # if nparents = population size then do nothing (whole population are parents)
   if nParents == pop.shape[0]:
@@ -51,27 +50,22 @@ def rouletteWheel(population,**kwargs):
   elif nParents > pop.shape[0]:
     raise IOError('Number of parents is greater than population size')
   # begin the roulette selection algorithm
+  # imagine a wheel that is partitioned according to the selection probabilities
+  # set a random pointer for each parent
+  roulettePointers = randomUtils.random(dim=1, samples=nParents, keepMatrix=True)[:,0]
+  available = np.arange(pop.shape[0])
+  selected = np.zeros(nParents, dtype=int)
+  for i, roulettePointer in enumerate(roulettePointers):
+    selectionProb = fitness[available]/np.sum(fitness[available]) # Share of the pie (rouletteWheel)
+    # the selected chromosome is the first one whose cumulative share reaches the pointer
+    counter = min(np.searchsorted(np.cumsum(selectionProb), roulettePointer), len(available)-1)
+    selected[i] = available[counter]
+    available = np.delete(available, counter)
   selectedParent = xr.DataArray(
-        np.zeros((nParents,np.shape(pop)[1])),
+        pop[selected].astype(float),
         dims=['chromosome','Gene'],
         coords={'chromosome':np.arange(nParents),
                 'Gene': kwargs['variables']})
-  # imagine a wheel that is partitioned according to the selection probabilities
-
-  for i in range(nParents):
-    # set a random pointer
-    roulettePointer = randomUtils.random(dim=1, samples=1)
-    # initialize Probability
-    counter = 0
-    selectionProb = fitness.data/np.sum(fitness.data) # Share of the pie (rouletteWheel)
-    sumProb = selectionProb[counter]
-
-    while sumProb < roulettePointer :
-      counter += 1
-      sumProb += selectionProb[counter]
-    selectedParent[i,:] = pop.values[counter,:]
-    pop = np.delete(pop, counter, axis=0)
-    fitness = np.delete(fitness,counter,axis=0)
   return selectedParent
 
 def tournamentSelection(population,**kwargs):
@@ -84,17 +78,11 @@ def tournamentSelection(population,**kwargs):
           variables, list, variable names
     @ Out, newPopulation, xr.DataArray, selected parents,
   """
-  fitness = copy.deepcopy(kwargs['fitness'])
+  fitness = np.atleast_1d(np.asarray(kwargs['fitness']))
   nParents= kwargs['nParents']
-  pop = copy.deepcopy(population)
+  pop = np.atleast_2d(population.values)
 
-  popSize = population.values.shape[0]
-
-  selectedParent = xr.DataArray(
-      np.zeros((nParents,np.shape(pop)[1])),
-      dims=['chromosome','Gene'],
-      coords={'chromosome':np.arange(nParents),
-              'Gene': kwargs['variables']})
+  popSize = pop.shape[0]
 
   if nParents >= popSize/2.0:
     # generate combination of 2 with replacement
@@ -104,12 +92,14 @@ def tournamentSelection(population,**kwargs):
     selectionList = np.atleast_2d(randomUtils.randomChoice(list(range(0,popSize)), 2*nParents))
 
   selectionList = selectionList.reshape(nParents,2)
+  # the fittest of each pair wins
+  winners = np.where(fitness[selectionList[:,0]] > fitness[selectionList[:,1]], selectionList[:,0], selectionList[:,1])
 
-  for index,pair in enumerate(selectionList):
-    if fitness[pair[0]]>fitness[pair[1]]:
-      selectedParent[index,:] = pop.values[pair[0],:]
-    else: # fitness[pair[1]]>fitness[pair[0]]:
-      selectedParent[index,:] = pop.values[pair[1],:]
+  selectedParent = xr.DataArray(
+      pop[winners].astype(float),
+      dims=['chromosome','Gene'],
+      coords={'chromosome':np.arange(nParents),
+              'Gene': kwargs['variables']})
 
   return selectedParent
 
@@ -124,8 +114,8 @@ def rankSelection(population,**kwargs):
           nParents, int, number of required parents.
     @ Out, newPopulation, xr.DataArray, selected parents,
   """
-  fitness = copy.deepcopy(kwargs['fitness'])
-  pop = copy.deepcopy(population)
+  fitness = np.atleast_1d(np.asarray(kwargs['fitness']))
+  pop = population
 
   index = np.arange(0,pop.shape[0])
   rank = np.arange(0,pop.shape[0])
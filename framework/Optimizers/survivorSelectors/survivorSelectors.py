@@ -24,7 +24,6 @@
 
 import numpy as np
 import xarray as xr
-import copy
 
 # @profile
 def ageBased(newRlz,**kwargs):
@@ -48,21 +47,18 @@ def ageBased(newRlz,**kwargs):
   else:
     popAge = kwargs['age']
   offSpringsFitness = np.atleast_1d(kwargs['offSpringsFitness'])
-  offSprings = xr.DataArray(np.atleast_2d(newRlz[kwargs['variables']].to_array().transpose()),
-                            dims=['chromosome','Gene'],
-                            coords={'chromosome':np.arange(np.shape(np.atleast_2d(newRlz[kwargs['variables']].to_array().transpose()))[0]),
-                                    'Gene': kwargs['variables']})
+  offSprings = np.atleast_2d(newRlz[kwargs['variables']].to_array().transpose().data)
   population = np.atleast_2d(kwargs['population'].data)
   popFitness = np.atleast_1d(kwargs['fitness'].data)
   # sort population, popFitness according to age
-  sortedAge,sortedPopulation,sortedFitness = zip(*[[x,y,z] for x,y,z in sorted(zip(popAge,population,popFitness),key=lambda x: (x[0], -x[2]))])# if equal age then use descending fitness
-  sortedAge,sortedPopulation,sortedFitness = list(sortedAge),np.atleast_1d(list(sortedPopulation)),np.atleast_1d(list(sortedFitness))
-  newPopulation = copy.deepcopy(sortedPopulation)
-  newFitness    = copy.deepcopy(sortedFitness)
-  newAge = list(map(lambda x:x+1, copy.deepcopy(sortedAge)))
-  newPopulation[-1:-np.shape(offSprings)[0]-1:-1] = offSprings
-  newFitness[-1:-np.shape(offSprings)[0]-1:-1] = offSpringsFitness
-  newAge[-1:-np.shape(offSprings)[0]-1:-1] = [0]*np.shape(offSprings)[0]
+  order = np.lexsort((-popFitness, np.asarray(popAge)))# if equal age then use descending fitness
+  newPopulation = population[order]
+  newFitness    = popFitness[order]
+  newAge = (np.asarray(popAge)[order] + 1).tolist()
+  nOffSprings = np.shape(offSprings)[0]
+  newPopulation[-1:-nOffSprings-1:-1] = offSprings
+  newFitness[-1:-nOffSprings-1:-1] = offSpringsFitness
+  newAge[-1:-nOffSprings-1:-1] = [0]*nOffSprings
   # converting back to DataArrays
   newPopulation = xr.DataArray(newPopulation,
                                dims=['chromosome','Gene'],
@@ -102,19 +98,15 @@ def fitnessBased(newRlz,**kwargs):
   population = np.atleast_2d(kwargs['population'].data)
   popFitness = np.atleast_1d(kwargs['fitness'].data)
 
-  newPopulation = copy.deepcopy(population)
-  newFitness = copy.deepcopy(popFitness)
-  newAge = list(map(lambda x:x+1, copy.deepcopy(popAge)))
-  newPopulationMerged = np.concatenate([newPopulation,offSprings])
-  newFitness = np.concatenate([newFitness,offSpringsFitness])
-  newAge.extend([0]*len(offSpringsFitness))
+  newPopulationMerged = np.concatenate([population,offSprings])
+  newFitness = np.concatenate([popFitness,offSpringsFitness])
+  newAge = np.concatenate([np.asarray(popAge)+1,np.zeros(len(offSpringsFitness),dtype=int)])
 
-  # sort population, popFitness according to age
-  sortedFitness,sortedAge,sortedPopulation = zip(*[(x,y,z) for x,y,z in sorted(zip(newFitness,newAge,newPopulationMerged),reverse=True,key=lambda x: (x[0], -x[1]))])
-  sortedFitnessT,sortedAgeT,sortedPopulationT = np.atleast_1d(list(sortedFitness)),list(sortedAge),np.atleast_1d(list(sortedPopulation))
-  newPopulationSorted = sortedPopulationT[:-len(offSprings)]
-  newFitness = sortedFitnessT[:-len(offSprings)]
-  newAge = sortedAgeT[:-len(offSprings)]
+  # sort population, popFitness according to descending fitness (if equal fitness then the youngest first)
+  order = np.lexsort((newAge, -newFitness))[:-len(offSprings)]
+  newPopulationSorted = newPopulationMerged[order]
+  newFitness = newFitness[order]
+  newAge = newAge[order].tolist()
 
   newPopulationArray = xr.DataArray(newPopulationSorted,
                                dims=['chromosome','Gene'],
@@ -83,6 +83,20 @@ class OrthogonalPolynomial(MessageUser):
     inps=self.params+[self.pointMod(pt)]
     return self._evPoly(order,*inps) * self.norm(order)
 
+  def evaluateTable(self,maxOrder,pts):
+    """
+      Returns the polynomials of all the orders up to 'maxOrder' evaluated at each of the points 'pts',
+      so that table[i,o] is the same as self(o,pts[i]).
+      @ In, maxOrder, int, highest order at which polynomials should be evaluated
+      @ In, pts, np.array, 1-D array of values at which polynomials should be evaluated
+      @ Out, table, np.array, (len(pts),maxOrder+1) evaluations of the polynomials
+    """
+    orders = np.arange(maxOrder+1)
+    modPts = np.asarray(self.pointMod(np.asarray(pts,dtype=float)),dtype=float)
+    inps = self.params+[modPts[:,np.newaxis]]
+    norms = np.array([self.norm(o) for o in orders])
+    return self._evPoly(orders[np.newaxis,:],*inps) * norms
+
   def __getstate__(self):
     """
       Pickle dump method.
@@ -24,6 +24,7 @@ from .Runner import Runner
 from .DistributedMemoryRunner import DistributedMemoryRunner
 from .InternalRunner import InternalRunner
 from .PassthroughRunner import PassthroughRunner
+from .ProcessPoolRunner import ProcessPoolRunner
 from .SharedMemoryRunner import SharedMemoryRunner
 
 class RunnerFactory(EntityFactory):
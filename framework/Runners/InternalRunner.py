@@ -51,7 +51,7 @@ class InternalRunner(Runner):
     self.exceptionTrace = None    # sys.exc_info() if an error occurred while running
 
     ## These things cannot be deep copied
-    self.skipOnCopy = ['functionToRun','thread','__queueLock']
+    self.skipOnCopy = ['functionToRun','thread','__queueLock','_doneCallback']
 
   def __deepcopy__(self,memo):
     """
@@ -0,0 +1,395 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Runner (and its pool of persistent worker processes) for running internal
+  objects in separate processes on the local machine, without Ray.
+"""
+#External Modules------------------------------------------------------------------------------------
+import sys
+import threading
+import traceback
+import multiprocessing
+from multiprocessing import connection as mpConnection
+import cloudpickle
+#External Modules End--------------------------------------------------------------------------------
+
+#Internal Modules------------------------------------------------------------------------------------
+from BaseClasses import BaseType
+from .InternalRunner import InternalRunner
+#Internal Modules End--------------------------------------------------------------------------------
+
+class ProcessPoolRunner(InternalRunner):
+  """
+    Class for running internal objects (e.g. ExternalModels, ROMs) in one of the
+    worker processes of a ProcessPool. Differently from the SharedMemoryRunner,
+    the evaluations are not serialized by the GIL.
+  """
+  notifiesWhenDone = True
+
+  def __init__(self, args, functionToRun, processPool=None, **kwargs):
+    """
+      Init method
+      @ In, args, list, this is a list of arguments that will be passed as
+        function parameters into whatever method is stored in functionToRun.
+        e.g., functionToRun(*args)
+      @ In, functionToRun, method or function, function that needs to be run
+      @ In, processPool, ProcessPool, the pool of worker processes that runs the job
+      @ In, kwargs, dict, additional arguments to pass to base
+      @ Out, None
+    """
+    super().__init__(args, functionToRun, **kwargs)
+    self.processPool = processPool
+    ## set by the pool as soon as the worker returned the outcome of the job
+    self.done = False
+    self.skipOnCopy.append('processPool')
+
+  def isDone(self):
+    """
+      Method to check if the calculation associated with this Runner is finished
+      @ In, None
+      @ Out, finished, bool, is it finished?
+    """
+    ## If the process has not been started yet, then return False
+    if not self.started:
+      return False
+    return self.done
+
+  def getReturnCode(self):
+    """
+      Returns the return code from running the code.
+      @ In, None
+      @ Out, returnCode, int,  the return code of this evaluation
+    """
+    if self.done and self.runReturn is None:
+      self.returnCode = -1
+    return self.returnCode
+
+  def _collectRunnerResponse(self):
+    """
+      Method to add the process response in the internal variable (pointer)
+      self.runReturn. The response is stored by the pool when the job ends.
+      @ In, None
+      @ Out, None
+    """
+    self.hasBeenAdded = True
+
+  def start(self):
+    """
+      Method to start the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    try:
+      self.processPool.submit(self)
+      self.trackTime('runner_started')
+      self.started = True
+    except Exception as ae:
+      self.exceptionTrace = sys.exc_info()
+      self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
+      self.returnCode = -1
+
+  def setOutcome(self, success, outcome):
+    """
+      Stores the outcome of the job and notifies its completion. Called by the
+      ProcessPool when the worker process answered.
+      @ In, success, bool, True if the function returned without raising
+      @ In, outcome, bytes or str, the serialized return value of the function
+        (if success) or the formatted traceback of the failure
+      @ Out, None
+    """
+    try:
+      if success:
+        self.runReturn = cloudpickle.loads(outcome)
+      else:
+        sys.stderr.write('Exception in process worker running job "{}":\n{}'.format(self.identifier, outcome))
+        self.returnCode = -1
+    except Exception:
+      self.exceptionTrace = sys.exc_info()
+      traceback.print_exc()
+      self.returnCode = -1
+    finally:
+      self.done = True
+      self._notifyDone()
+
+  def kill(self):
+    """
+      Method to kill the job associated to this Runner
+      @ In, None
+      @ Out, None
+    """
+    if self.started and not self.done:
+      self.raiseADebug('Terminating the worker process of job "{}"'.format(self.identifier))
+      self.processPool.kill(self)
+    self.trackTime('runner_killed')
+
+class ProcessPool(object):
+  """
+    Persistent pool of local worker processes used by the ProcessPoolRunner.
+    When the first argument of a job is a RAVEN object (e.g. the Model in
+    Model.evaluateSample), each worker keeps it in a cache, so that the object
+    is serialized and sent to a worker only once (until "clearCache" is called,
+    i.e. at the beginning of each Step) and not for every job.
+    Hence the jobs work on copies of the object: the changes they make to it are
+    lost, except for the state declared by the object through its
+    "getEvaluationState" method (e.g. the variables that an ExternalModel keeps
+    in "self"). The workers send this state back with the outcome of the jobs
+    that changed it, the master stores it in its object and forwards it to the
+    other workers with their next job. As for the threads, concurrent jobs start
+    from the state available when they were submitted, and the last one to end
+    wins.
+  """
+  def __init__(self, numWorkers):
+    """
+      Init method
+      @ In, numWorkers, int, number of worker processes
+      @ Out, None
+    """
+    self.numWorkers = max(1, int(numWorkers))
+    ## "fork" keeps the modules (e.g. the ExternalModel modules) imported by the master available to the workers
+    methods = multiprocessing.get_all_start_methods()
+    self.__context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    self.__lock = threading.RLock()
+    self.__workers = [None]*self.numWorkers     # (process, connection) for each worker, None if not running
+    self.__warm = [{} for _ in range(self.numWorkers)] # {objectKey: state version} of the objects cached by each worker
+    self.__pending = {}                         # {taskId: (workerIndex, runner)}
+    self.__nextTaskId = 0
+    self.__generation = 0                       # incremented when the cached objects are no longer valid
+    self.__payloads = {}                        # {objectKey: serialized object} of the current generation
+    self.__states = {}                          # {objectKey: (version, serialized state)} of the evaluation states
+    self.__collector = None
+    self.__closed = False
+
+  def submit(self, runner):
+    """
+      Sends the job of a runner to one of the workers. Idle workers that already
+      have the object cached are preferred. The evaluation state of the object is
+      sent too, if the worker does not have its latest version.
+      @ In, runner, ProcessPoolRunner, the runner to execute
+      @ Out, None
+    """
+    args = tuple(runner.args)
+    with self.__lock:
+      if self.__closed:
+        raise RuntimeError('The process pool has been shut down')
+      objectKey = None
+      if len(args) > 0 and isinstance(args[0], BaseType):
+        objectKey = (self.__generation, id(args[0]))
+        jobPayload = cloudpickle.dumps((runner.functionToRun, args[1:]))
+      else:
+        jobPayload = cloudpickle.dumps((runner.functionToRun, args))
+      worker = self.__selectWorker(objectKey)
+      objectPayload = None
+      statePayload = None
+      if objectKey is not None:
+        if objectKey not in self.__payloads:
+          ## the serialized object includes its current state (version 0)
+          self.__payloads[objectKey] = cloudpickle.dumps(args[0])
+          self.__states[objectKey] = (0, None)
+        version, state = self.__states[objectKey]
+        if objectKey not in self.__warm[worker]:
+          objectPayload = self.__payloads[objectKey]
+        if self.__warm[worker].get(objectKey, 0) != version:
+          statePayload = state
+        self.__warm[worker][objectKey] = version
+      taskId = self.__nextTaskId
+      self.__nextTaskId += 1
+      self.__pending[taskId] = (worker, runner)
+      self.__workers[worker][1].send((taskId, objectKey, objectPayload, statePayload, jobPayload))
+
+  def __selectWorker(self, objectKey):
+    """
+      Returns the index of the worker to use for the next job, (re)starting it if needed
+      @ In, objectKey, tuple or None, the key of the object to be cached
+      @ Out, worker, int, index of the worker
+    """
+    load = [0]*self.numWorkers
+    for index, _ in self.__pending.values():
+      load[index] += 1
+    ## the least loaded worker, preferring the ones that already know the object
+    worker = min(range(self.numWorkers), key=lambda i: (load[i], objectKey not in self.__warm[i]))
+    if self.__workers[worker] is None:
+      self.__startWorker(worker)
+    return worker
+
+  def __startWorker(self, worker):
+    """
+      Starts a worker process (and the thread collecting the results, if not running yet)
+      @ In, worker, int, index of the worker
+      @ Out, None
+    """
+    masterEnd, workerEnd = self.__context.Pipe()
+    process = self.__context.Process(target=_workerLoop, args=(workerEnd,), name='RAVEN-worker-{}'.format(worker))
+    process.daemon = True
+    process.start()
+    workerEnd.close()
+    self.__workers[worker] = (process, masterEnd)
+    self.__warm[worker] = {}
+    if self.__collector is None:
+      self.__collector = threading.Thread(target=self.__collect, name='RAVEN-process-pool')
+      self.__collector.daemon = True
+      self.__collector.start()
+
+  def __collect(self):
+    """
+      Loop (run by the collector thread) receiving the outcomes of the jobs from the workers
+      @ In, None
+      @ Out, None
+    """
+    while True:
+      with self.__lock:
+        connections = {worker[1]: w for w, worker in enumerate(self.__workers) if worker is not None}
+        if self.__closed and not connections:
+          break
+      ## the timeout only bounds the time needed to see new (or restarted) workers
+      for conn in mpConnection.wait(list(connections), timeout=0.1):
+        try:
+          taskId, success, outcome, statePayload = conn.recv()
+        except (EOFError, OSError):
+          self.__workerDied(connections[conn])
+          continue
+        with self.__lock:
+          worker, runner = self.__pending.pop(taskId)
+        if statePayload is not None:
+          self.__updateState(worker, runner, statePayload)
+        runner.setOutcome(success, outcome)
+
+  def __updateState(self, worker, runner, statePayload):
+    """
+      Stores the evaluation state changed by a job in the object of the master,
+      as the new version to be forwarded to the other workers
+      @ In, worker, int, index of the worker that ran the job
+      @ In, runner, ProcessPoolRunner, the runner of the job
+      @ In, statePayload, bytes, the serialized evaluation state
+      @ Out, None
+    """
+    obj = runner.args[0]
+    with self.__lock:
+      objectKey = (self.__generation, id(obj))
+      ## the state of the jobs of previous generations (i.e. Steps) is still kept by the master object
+      if objectKey in self.__states:
+        version = self.__states[objectKey][0] + 1
+        self.__states[objectKey] = (version, statePayload)
+        if objectKey in self.__warm[worker]:
+          self.__warm[worker][objectKey] = version
+    try:
+      obj.setEvaluationState(cloudpickle.loads(statePayload))
+    except Exception:
+      traceback.print_exc()
+
+  def __workerDied(self, worker):
+    """
+      Cleans up after a worker process that ended (killed or crashed), failing its jobs
+      @ In, worker, int, index of the worker
+      @ Out, None
+    """
+    with self.__lock:
+      process, conn = self.__workers[worker]
+      self.__workers[worker] = None
+      self.__warm[worker] = {}
+      lost = [taskId for taskId, (w, _) in self.__pending.items() if w == worker]
+      runners = [self.__pending.pop(taskId)[1] for taskId in lost]
+    conn.close()
+    process.join()
+    for runner in runners:
+      runner.setOutcome(False, 'worker process ended with exit code {}\n'.format(process.exitcode))
+
+  def kill(self, runner):
+    """
+      Kills the job of a runner, terminating the worker process that is running it
+      @ In, runner, ProcessPoolRunner, the runner to kill
+      @ Out, None
+    """
+    with self.__lock:
+      for worker, pendingRunner in self.__pending.values():
+        if pendingRunner is runner:
+          self.__workers[worker][0].terminate()
+          break
+
+  def clearCache(self):
+    """
+      Invalidates the objects cached by the workers (e.g. because a new Step is
+      starting and the Models might have changed, for example trained ROMs)
+      @ In, None
+      @ Out, None
+    """
+    with self.__lock:
+      self.__generation += 1
+      self.__payloads = {}
+      self.__states = {}
+
+  def shutdown(self):
+    """
+      Stops the worker processes
+      @ In, None
+      @ Out, None
+    """
+    with self.__lock:
+      self.__closed = True
+      for worker in self.__workers:
+        if worker is not None:
+          try:
+            worker[1].send(None)
+          except (OSError, ValueError):
+            pass
+
+def _workerLoop(conn):
+  """
+    Loop run by each worker process: receives the jobs, runs them and sends back
+    their outcomes. The objects received are cached (one generation at a time).
+    If a job changes the evaluation state of its object, the new state is sent
+    back with the outcome.
+    @ In, conn, multiprocessing.connection.Connection, connection with the master process
+    @ Out, None
+  """
+  cache = {}
+  while True:
+    try:
+      message = conn.recv()
+    except (EOFError, KeyboardInterrupt):
+      break
+    if message is None:
+      break
+    taskId, objectKey, objectPayload, statePayload, jobPayload = message
+    try:
+      if objectPayload is not None:
+        ## only the objects of the current generation are kept
+        cache = {key: obj for key, obj in cache.items() if key[0] == objectKey[0]}
+        cache[objectKey] = cloudpickle.loads(objectPayload)
+      function, args = cloudpickle.loads(jobPayload)
+      stateBefore = None
+      if objectKey is not None:
+        obj = cache[objectKey]
+        if statePayload is not None:
+          obj.setEvaluationState(cloudpickle.loads(statePayload))
+        args = (obj,) + tuple(args)
+        stateBefore = _dumpEvaluationState(obj)
+      result = cloudpickle.dumps(function(*args))
+      stateAfter = _dumpEvaluationState(args[0]) if objectKey is not None else None
+      outcome = (taskId, True, result, stateAfter if stateAfter != stateBefore else None)
+    except BaseException:
+      outcome = (taskId, False, traceback.format_exc(), None)
+    conn.send(outcome)
+  conn.close()
+
+def _dumpEvaluationState(obj):
+  """
+    Serializes the evaluation state of an object (see Model.getEvaluationState)
+    @ In, obj, object, the object run by the job
+    @ Out, _dumpEvaluationState, bytes, the serialized state (None if the object has no state)
+  """
+  getState = getattr(obj, 'getEvaluationState', None)
+  if getState is None:
+    return None
+  state = getState()
+  return None if state is None else cloudpickle.dumps(state)
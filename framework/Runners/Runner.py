@@ -37,6 +37,10 @@ class Runner(MessageUser):
     Generic base class for running codes and models in parallel environments
     both internally (shared data) and externally.
   """
+  ## True if the runner calls its "done" callback when it finishes, so that the
+  ## JobHandler does not need to poll it
+  notifiesWhenDone = False
+
   def __init__(self, identifier=None, metadata=None, uniqueHandler="any", profile=False):
     """
       Initialize command variable
@@ -55,7 +59,9 @@ class Runner(MessageUser):
     self.metadata       = copy.copy(metadata)
     self.uniqueHandler  = uniqueHandler
     self.groupId        = None  # the id of the group this run belong to (batching, if activated)
+    self.groupIndex     = None  # the position of this run in its group (submission order, if batching)
     self.started        = False
+    self._doneCallback  = None  # function called (with no arguments) when the run ends
 
     ## First attempt to use a user-specified identifier name
     if identifier is not None:
@@ -123,6 +129,24 @@ class Runner(MessageUser):
     """
     return self.metadata
 
+  def setDoneCallback(self, callback):
+    """
+      Sets the function to call when this run ends (e.g. to wake up the JobHandler).
+      Only used if the runner is able to notify its completion (see notifiesWhenDone)
+      @ In, callback, function, function called without arguments when the run ends
+      @ Out, None
+    """
+    self._doneCallback = callback
+
+  def _notifyDone(self):
+    """
+      Calls the "done" callback, if any
+      @ In, None
+      @ Out, None
+    """
+    if self._doneCallback is not None:
+      self._doneCallback()
+
   def trackTime(self,event):
     """
       Records the time under 'event'.
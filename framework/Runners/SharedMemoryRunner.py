@@ -25,6 +25,7 @@ import time
 import ctypes
 import inspect
 import threading
+import traceback
 
 #External Modules End--------------------------------------------------------------------------------
 
@@ -37,6 +38,8 @@ class SharedMemoryRunner(InternalRunner):
     Class for running internal objects in a threaded fashion using the built-in
     threading library
   """
+  notifiesWhenDone = True
+
   def __init__(self, args, functionToRun, **kwargs):
     """
       Init method
@@ -54,6 +57,8 @@ class SharedMemoryRunner(InternalRunner):
     ## Other parameters manipulated internally
     self.subque = collections.deque()
     #self.subque = queue.Queue()
+    ## set by the thread as soon as functionToRun returns (the thread might still be alive)
+    self.threadDone = False
 
     self.skipOnCopy.append('subque')
 
@@ -70,7 +75,7 @@ class SharedMemoryRunner(InternalRunner):
     if self.thread is None:
       return True
     else:
-      return not self.thread.is_alive()
+      return self.threadDone or not self.thread.is_alive()
 
   def getReturnCode(self):
     """
@@ -111,7 +116,8 @@ class SharedMemoryRunner(InternalRunner):
       @ Out, None
     """
     try:
-      self.thread = InterruptibleThread(target = lambda q, *arg : q.append(self.functionToRun(*arg)),
+      self.threadDone = False
+      self.thread = InterruptibleThread(target = self._threadTarget,
                                      name = self.identifier,
                                      args=(self.subque,) + tuple(self.args))
 
@@ -124,6 +130,26 @@ class SharedMemoryRunner(InternalRunner):
       self.raiseAWarning(self.__class__.__name__ + " job "+self.identifier+" failed with error:"+ str(ae) +" !",'ExceptedError')
       self.returnCode = -1
 
+  def _threadTarget(self, subque, *args):
+    """
+      Method executed by the thread: runs the function, stores its return value
+      and notifies the completion of the job (even if it failed)
+      @ In, subque, collections.deque, container for the return value of the function
+      @ In, args, list, arguments of the function to run
+      @ Out, None
+    """
+    try:
+      subque.append(self.functionToRun(*args))
+    except BaseException:
+      ## report the failure here, instead of leaving it to the thread, so that
+      ## the traceback is printed before the JobHandler is notified
+      self.exceptionTrace = sys.exc_info()
+      sys.stderr.write('Exception in thread {}:\n'.format(threading.current_thread().name))
+      traceback.print_exc()
+    finally:
+      self.threadDone = True
+      self._notifyDone()
+
   def kill(self):
     """
       Method to kill the job associated to this Runner
@@ -364,7 +364,8 @@ class AdaptiveDynamicEventTree(DynamicEventTree, LimitSurfaceSearch):
     for key,value in self.inputInfo.items():
       subGroup.add(key,copy.copy(value))
     if endInfo:
-      subGroup.add('endInfo',copy.deepcopy(endInfo))
+      # the end information of the parent is never modified, so the branches share it
+      subGroup.add('endInfo',endInfo)
 
   def localStillReady(self,ready):
     """
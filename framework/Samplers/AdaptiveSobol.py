@@ -88,6 +88,7 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     #identification
     self.type            = 'AdaptiveSobolSampler'
     self.printTag        = 'SAMPLER ADAPTIVE SOBOL'
+    self.ableToGenerateInputBatch = False #new points depend on the collected solutions
     self.stateCounter    = 0       #counts number of times adaptive step moves forward
 
     #input parameters
@@ -88,6 +88,7 @@ class AdaptiveSparseGrid(SparseGridCollocation, AdaptiveSampler):
     #identification
     self.type                    = 'AdaptiveSparseGridSampler'
     self.printTag                = self.type
+    self.ableToGenerateInputBatch = False #new points depend on the collected solutions
     #assembler objects
     self.solns                   = None   #TimePointSet of solutions -> assembled
     self.ROM                     = None   #eventual final ROM object
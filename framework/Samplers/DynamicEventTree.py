@@ -99,6 +99,7 @@ class DynamicEventTree(Grid):
     """
     Grid.__init__(self)
     self.onlySampleAfterCollecting = True # see note in Steps.MultiRun about the not-point-sampler loop
+    self.ableToGenerateInputBatch = False # branches are generated from the outcome of the previous runs
     # Working directory (Path of the directory in which all the outputs,etc. are stored)
     self.workingDir                        = ""
     # (optional) if not present, the sampler will not change the relative keyword in the input file
@@ -194,10 +195,7 @@ class DynamicEventTree(Grid):
       @ In, idj, string, the identifier of a job object
       @ Out, parentNode, TreeStructure.Node, the parent node of the job linked to idj
     """
-    if(idj == self.TreeInfo[self.rootToJob[idj]].getrootnode().name):
-      parentNode = self.TreeInfo[self.rootToJob[idj]].getrootnode()
-    else:
-      parentNode = list(self.TreeInfo[self.rootToJob[idj]].getrootnode().iter(idj))[0]
+    parentNode = self.TreeInfo[self.rootToJob[idj]].findByName(idj)
     return parentNode
 
   def localFinalizeActualSampling(self,jobObject,model,myInput,genRunQueue=True):
@@ -554,11 +552,15 @@ class DynamicEventTree(Grid):
       if forceEvent == True:
         self.branchCountOnLevel = 1
         nBranches -= 1
+    # the end information stored in the branches is the same for all of them (and it is not modified)
+    popped = endInfo.pop('parentNode')
+    branchEndInfo = copy.deepcopy(endInfo)
+    endInfo['parentNode'] = popped
     # Loop over the branches for which the inputs must be created
     for _ in range(nBranches):
       self.counter += 1
       self.branchCountOnLevel += 1
-      branchedLevel = copy.deepcopy(branchedLevelParent)
+      branchedLevel = dict(branchedLevelParent)
       # Get Parent node name => the branch name is creating appending to this name  a comma and self.branchCountOnLevel counter
       rname = endInfo['parentNode'].get('name') + '-' + str(self.branchCountOnLevel)
       # create a subgroup that will be appended to the parent element in the xml tree structure
@@ -691,9 +693,7 @@ class DynamicEventTree(Grid):
       self.RunQueue['identifiers'].append(self.inputInfo['prefix'])
       for key,value in self.inputInfo.items():
         subGroup.add(key,copy.copy(value))
-      popped = endInfo.pop('parentNode')
-      subGroup.add('endInfo',copy.deepcopy(endInfo))
-      endInfo['parentNode'] = popped
+      subGroup.add('endInfo',branchEndInfo)
       del branchedLevel
 
   def _createRunningQueue(self, model, myInput, forceEvent=False):
@@ -765,7 +765,7 @@ class DynamicEventTree(Grid):
       root.add('running',True)
       root.add('queue',False)
     else:
-      subElm = list(root.iter(jobId))[0]
+      subElm = root.findByName(jobId)
       if(subElm):
         subElm.add('runEnded',False)
         subElm.add('running',True)
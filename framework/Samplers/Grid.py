@@ -81,6 +81,7 @@ class Grid(ForwardSampler):
     """
     super().__init__()
     self.printTag = 'SAMPLER GRID'
+    self.ableToGenerateInputBatch = True
     self.axisName = []                 # the name of each axis (variable)
     self.gridInfo = {}                 # {'name of the variable':Type}  --> Type: CDF/Value
     self.externalgGridCoord = False    # boolean attribute. True if the coordinate list has been filled by external source (see factorial sampler)
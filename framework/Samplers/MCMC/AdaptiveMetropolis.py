@@ -67,6 +67,7 @@ class AdaptiveMetropolis(MCMC):
     self._orderedVars = OrderedDict() # ordered dict of variables that is used to construct proposal function
     self._orderedVarsList = [] # List of ordered variables
     self._adaptiveInterval = 20 # The number of sample steps for each adaptive update of scaling and covariance parameters
+    self._chainAttributes += ['_lambda', '_gamma', '_ensembleMean', '_ensembleCov', '_proposal']
 
   def handleInput(self, paramInput):
     """
@@ -237,6 +238,16 @@ class AdaptiveMetropolis(MCMC):
           value = dist.rvs()
           for i, var in enumerate(orderedVars):
             self._updateValues[var] = value[i]
+    self._initializeChains()
+
+  def _startChain(self):
+    """
+      Sets the starting point of a new chain (other than the first one), sampling the prior distributions.
+      @ In, None
+      @ Out, None
+    """
+    MCMC._startChain(self)
+    self._ensembleMean = np.asarray([self._updateValues[var] for var in self._orderedVarsList])
 
   def constructProposalDistribution(self, mu, cov):
     """
@@ -263,9 +274,8 @@ class AdaptiveMetropolis(MCMC):
       @ Out, None
     """
     self.values.update(self._updateValues)
-    if self.counter > 1:
-      self._localReady = False
-      newVal = self._proposal.rvs()
+    if self._iteration > 1:
+      newVal = self._rvs(self._proposal)
       # update sampled value using proposal distribution
       for i, var in enumerate(self._orderedVarsList):
         ## scaling for the new generated inputs
@@ -322,7 +332,7 @@ class AdaptiveMetropolis(MCMC):
       @ Out, None
     """
     MCMC.localFinalizeActualSampling(self, jobObject, model, myInput)
-    if self.counter > 1:
+    if self._iteration > 1:
       self._updateAdaptiveParams(self.netLogPosterior, self._currentRlz)
 
   def _useRealization(self, newRlz, currentRlz):
@@ -363,29 +373,19 @@ class AdaptiveMetropolis(MCMC):
     """
     ### first use normal strategy (tuneScalingParam) to update scaling parameter until burnIn
     ### Reset scaling and then start to use adaptive approach to update scaling and cov parameters
-    if self.counter == self._burnIn:
+    if self._iteration == self._burnIn:
       self._lambda = self._scaling**2
       self._scaling = 1.
       self._tune = False
-    elif self.counter > self._burnIn:
+    elif self._iteration > self._burnIn:
       orderedVarsVals = np.asarray([rlz[var] for var in self._orderedVarsList])
       ## update _lambda and _gamma
-      self._gamma = 1.0/np.sqrt(self.counter-self._burnIn+1.0)
+      self._gamma = 1.0/np.sqrt(self._iteration-self._burnIn+1.0)
       self._lambda = self._lambda * np.exp(self._gamma * (np.exp(alpha) - self._optAlpha))
-      if self.counter % self._adaptiveInterval == 0:
+      if self._iteration % self._adaptiveInterval == 0:
         diff = orderedVarsVals - self._ensembleMean
         self._ensembleMean += self._gamma * diff
         self._ensembleCov += self._gamma * (np.outer(diff, diff)-self._ensembleCov)
         ## update proposal distribution
         size = len(self._ensembleMean)
         self._proposal = self.constructProposalDistribution(np.zeros(size), self._lambda*self._ensembleCov.ravel())
-
-  def localStillReady(self, ready):
-    """
-      Determines if sampler is prepared to provide another input.  If not, and
-      if jobHandler is finished, this will end sampling.
-      @ In,  ready, bool, a boolean representing whether the caller is prepared for another input.
-      @ Out, ready, bool, a boolean representing whether the caller is prepared for another input.
-    """
-    ready = self._localReady and MCMC.localStillReady(self, ready)
-    return ready
@@ -92,6 +92,12 @@ class MCMC(AdaptiveSampler):
     tuneInterval = InputData.parameterInputFactory("tuneInterval", contentType=InputTypes.IntegerType,
         descr=r"""The number of sample steps for each tuning of scaling parameter""")
     samplerInitInput.addSub(tuneInterval)
+    chains = InputData.parameterInputFactory("chains", contentType=InputTypes.IntegerType,
+        descr=r"""The number of independent Markov chains sampled concurrently. Each chain has one sample
+        in flight at a time, so up to this number of Model evaluations run in parallel. The first chain starts
+        from the \xmlNode{initial} values, the other ones from points sampled from the prior distributions.
+        The \xmlNode{limit} and \xmlNode{burnIn} apply to each chain. \default{1}""")
+    samplerInitInput.addSub(chains)
     inputSpecification.addSub(samplerInitInput)
     likelihoodInp = InputData.parameterInputFactory("likelihood",contentType=InputTypes.StringType,
         printPriority=5,
@@ -125,8 +131,8 @@ class MCMC(AdaptiveSampler):
       @ Out, vars, dict, {varName: manual description} for each solution export option
     """
     vars = super(AdaptiveSampler, cls).getSolutionExportVariableNames()
-    # TODO: multiple chains for MCMC
     new = {'traceID': 'integer identifying which iteration a Markov chain is on',
+           'chainID': 'integer identifying the Markov chain (only if multiple chains are sampled)',
            '{VAR}': r'any variable from the \xmlNode{TargetEvaluation} input or output at current iteration',
            'LogPosterior': 'log-posterior distribution value',
            'AcceptRate': 'the accept rate of MCMC algorithm'
@@ -157,7 +163,6 @@ class MCMC(AdaptiveSampler):
     self.toBeCalibrated = {} # parameters that will be calibrated
     self._correlated = False # True if input variables are correlated else False
     self.netLogPosterior = 0.0 # log-posterior vs iteration
-    self._localReady = True # True if the submitted job finished
     self._currentRlz = None # dict stores the current realizations, i.e. {var: val}
     self._acceptRate = 1. # The accept rate for MCMC
     self._acceptCount = 1 # The total number of accepted samples
@@ -168,6 +173,17 @@ class MCMC(AdaptiveSampler):
     self._acceptInTune = 0 # The accepted number of samples for given tune interval
     self._accepted = False # The indication of current samples, True if accepted otherwise False
     self._stdProposalDefault = 0.2 # the initial scaling of the std of proposal distribution (only apply to default)
+    self._iteration = 0 # the number of samples generated by the (current) chain
+    self._engine = None # random number generator of the (current) chain, None to use the global one
+    self._numChains = 1 # the number of Markov chains sampled concurrently
+    self._chainLimit = None # the number of samples of each chain
+    self._chains = [] # the states of the chains, i.e. [{attribute: value}]
+    self._activeChain = None # the chain whose state is currently stored in the attributes
+    self._chainOfPrefix = {} # the chain of each sample in flight, i.e. {prefix: chain}
+    self._traces = {} # the samples of each chain after the burn-in, i.e. {chain: [[value of each variable]]}
+    # attributes that define the state of each chain
+    self._chainAttributes = ['_updateValues', '_currentRlz', 'netLogPosterior', '_acceptRate', '_acceptCount',
+                             '_tune', '_scaling', '_countsUntilTune', '_acceptInTune', '_accepted', '_iteration', '_engine']
     # assembler objects
     self.addAssemblerObject('proposal', InputData.Quantity.zero_to_infinity)
     self.addAssemblerObject('probabilityFunction', InputData.Quantity.zero_to_infinity)
@@ -218,10 +234,18 @@ class MCMC(AdaptiveSampler):
       tuneInterval = init.findFirst('tuneInterval')
       if tuneInterval is not None:
         self._tuneInterval = tuneInterval.value
+      chains = init.findFirst('chains')
+      if chains is not None:
+        self._numChains = chains.value
     else:
       self.raiseAnError(IOError, 'MCMC', self.name, 'needs the samplerInit block')
     if self._burnIn >= self.limit:
       self.raiseAnError(IOError, 'Provided "burnIn" value must be less than "limit" value!')
+    if self._numChains < 1:
+      self.raiseAnError(IOError, 'Provided "chains" value must be a positive integer!')
+    # the limit is for each chain
+    self._chainLimit = self.limit
+    self.limit = self._chainLimit * self._numChains
     # TargetEvaluation Node (Required)
     targetEval = paramInput.findFirst('TargetEvaluation')
     self._targetEvaluation = targetEval.value
@@ -325,8 +349,141 @@ class MCMC(AdaptiveSampler):
         self.raiseAnError(IOError, 'variable "{}" requires continuous distribution, but "{}" is provided!'.format(var, distType))
 
     meta = ['LogPosterior', 'AcceptRate']
+    if self._numChains > 1:
+      meta.append('chainID')
     self.addMetaKeys(meta)
 
+  def _initializeChains(self):
+    """
+      Initializes the states of the Markov chains, once the attributes are set up for the first chain.
+      To be called at the end of the initialization of the inheritors.
+      @ In, None
+      @ Out, None
+    """
+    self._iteration = 0
+    self._chainOfPrefix = {}
+    self._traces = dict((chain, []) for chain in range(self._numChains))
+    if self._numChains > 1:
+      # each chain draws from its own generator, so the results do not depend on the order the jobs finish
+      self._engine = self._newChainEngine(0)
+    first = dict((attr, getattr(self, attr)) for attr in self._chainAttributes)
+    self._chains = [first]
+    self._activeChain = 0
+    for chain in range(1, self._numChains):
+      state = copy.deepcopy(dict(first, _engine=None))
+      for attr, value in state.items():
+        setattr(self, attr, value)
+      self._engine = self._newChainEngine(chain)
+      self._startChain()
+      self._chains.append(dict((attr, getattr(self, attr)) for attr in self._chainAttributes))
+    # back to the first chain
+    for attr, value in first.items():
+      setattr(self, attr, value)
+
+  def _newChainEngine(self, chain):
+    """
+      Creates the random number generator of a chain
+      @ In, chain, int, the chain
+      @ Out, engine, instance, the random number generator
+    """
+    engine = randomUtils.newRNG()
+    engine.seed(self.initSeed + chain)
+    return engine
+
+  def _startChain(self):
+    """
+      Sets the starting point of a new chain (other than the first one), sampling the prior distributions.
+      The variables with a "probabilityFunction" start from the values of the first chain.
+      @ In, None
+      @ Out, None
+    """
+    for distName, elementList in self.distributions2variablesMapping.items():
+      totDim = max(self.distributions2variablesIndexList[distName])
+      elemDict = {}
+      for elem in elementList:
+        elemDict.update(elem)
+      if totDim == 1:
+        for var in elemDict:
+          if var in self._updateValues:
+            self._updateValues[var] = self._rvs(self.distDict[var])
+      else:
+        orderedVars = [k for k, v in sorted(elemDict.items(), key=lambda item: item[1])]
+        if orderedVars[0] in self._updateValues:
+          value = self._rvs(self.distDict[orderedVars[0]])
+          for i, var in enumerate(orderedVars):
+            self._updateValues[var] = value[i]
+
+  def _switchChain(self, chain):
+    """
+      Stores the state of the current chain, and loads the state of the requested one in the attributes
+      @ In, chain, int, the chain to load
+      @ Out, None
+    """
+    if chain == self._activeChain:
+      return
+    self._chains[self._activeChain] = dict((attr, getattr(self, attr)) for attr in self._chainAttributes)
+    for attr, value in self._chains[chain].items():
+      setattr(self, attr, value)
+    self._activeChain = chain
+
+  def _chainAttribute(self, chain, attr):
+    """
+      Gets an attribute of the state of a chain
+      @ In, chain, int, the chain
+      @ In, attr, str, the attribute
+      @ Out, value, object, the value of the attribute
+    """
+    return getattr(self, attr) if chain == self._activeChain else self._chains[chain][attr]
+
+  def _nextChain(self):
+    """
+      Finds the chain that will provide the next sample, i.e. the one with less samples among
+      the chains without a sample in flight
+      @ In, None
+      @ Out, chain, int, the next chain (None if no chain can provide a sample)
+    """
+    busy = set(self._chainOfPrefix.values())
+    available = [chain for chain in range(self._numChains)
+                 if chain not in busy and self._chainAttribute(chain, '_iteration') < self._chainLimit]
+    if not available:
+      return None
+    return min(available, key=lambda chain: self._chainAttribute(chain, '_iteration'))
+
+  def _rvs(self, dist):
+    """
+      Draws a random value from a distribution, using the random number generator of the current chain
+      @ In, dist, Distribution, the distribution
+      @ Out, value, float or np.array, the random value
+    """
+    if self._engine is None:
+      return dist.rvs()
+    if dist.getDimensionality() == 1:
+      return dist.ppf(randomUtils.random(engine=self._engine))
+    if dist.type != 'MultivariateNormal':
+      self.raiseAnError(IOError, 'Multiple chains can only sample multivariate "MultivariateNormal" distributions, but got "{}"!'.format(dist.type))
+    mean = np.asarray(dist.mu, dtype=float)
+    cov = np.asarray(dist.covariance, dtype=float).reshape(len(mean), len(mean))
+    # the (adapted) covariance could be only semi-definite, so use its eigendecomposition
+    eigVals, eigVecs = np.linalg.eigh(cov)
+    normal = np.atleast_1d(randomUtils.randomNormal(size=(len(mean),), engine=self._engine))
+    return mean + eigVecs.dot(np.sqrt(np.clip(eigVals, 0.0, None)) * normal)
+
+  def generateInput(self, model, oldInput):
+    """
+      Provides the next sample of the next available chain, see Sampler.generateInput
+      @ In, model, model instance, it is the instance of a RAVEN model
+      @ In, oldInput, list, a list of the original needed inputs for the model (e.g. list of files, etc. etc)
+      @ Out, generateInput, tuple(int,list or dict), see Sampler.generateInput
+    """
+    chain = self._nextChain()
+    self._switchChain(chain)
+    self._iteration += 1
+    if self._numChains > 1:
+      self.inputInfo['chainID'] = chain
+    found, newInput = AdaptiveSampler.generateInput(self, model, oldInput)
+    self._chainOfPrefix[self.inputInfo['prefix']] = chain
+    return found, newInput
+
   def localGenerateInput(self, model, myInput):
     """
       Provides the next sample to take.
@@ -358,18 +515,23 @@ class MCMC(AdaptiveSampler):
       @ In, myInput, list, the generating input
       @ Out, None
     """
-    self._localReady = True
     AdaptiveSampler.localFinalizeActualSampling(self, jobObject, model, myInput)
     prefix = jobObject.getMetadata()['prefix']
-    full = self._targetEvaluation.realization(index=self.counter-1)
+    self._switchChain(self._chainOfPrefix.pop(prefix))
+    # the realization of this job has just been collected, so it is the last one
+    full = self._targetEvaluation.realization(index=-1)
+    if np.atleast_1d(full['prefix'])[0] != prefix:
+      _, full = self._targetEvaluation.realization(matchDict={'prefix': prefix})
     rlz = dict((var, full[var]) for var in (list(self.toBeCalibrated.keys()) + [self._likelihood] + list(self.dependentSample.keys())))
-    rlz['traceID'] = self.counter
-    rlz['LogPosterior'] = self.inputInfo['LogPosterior']
-    rlz['AcceptRate'] = self.inputInfo['AcceptRate']
-    if self.counter == 1:
+    rlz['traceID'] = self._iteration
+    rlz['LogPosterior'] = self.netLogPosterior
+    rlz['AcceptRate'] = self._acceptRate
+    if self._numChains > 1:
+      rlz['chainID'] = self._activeChain
+    if self._iteration == 1:
       self._addToSolutionExport(rlz)
       self._currentRlz = rlz
-    if self.counter > 1:
+    if self._iteration > 1:
       alpha = self._useRealization(rlz, self._currentRlz)
       self.netLogPosterior = alpha
       self._accepted = self._checkAcceptance(alpha)
@@ -378,7 +540,7 @@ class MCMC(AdaptiveSampler):
         self._addToSolutionExport(rlz)
         self._updateValues = dict((var, rlz[var]) for var in self._updateValues)
       else:
-        self._currentRlz.update({'traceID':self.counter, 'LogPosterior': self.inputInfo['LogPosterior'], 'AcceptRate':self.inputInfo['AcceptRate']})
+        self._currentRlz.update({'traceID':self._iteration, 'LogPosterior': rlz['LogPosterior'], 'AcceptRate':rlz['AcceptRate']})
         self._addToSolutionExport(self._currentRlz)
         self._updateValues = dict((var, self._currentRlz[var]) for var in self._updateValues)
     if self._tune:
@@ -407,11 +569,11 @@ class MCMC(AdaptiveSampler):
       @ In, alpha, float, the accepted probabilty
       @ Out, acceptable, bool, True if we accept the new sampled point
     """
-    acceptValue = np.log(self._acceptDist.rvs())
+    acceptValue = np.log(self._rvs(self._acceptDist))
     acceptable = alpha > acceptValue
     if acceptable:
       self._acceptCount += 1
-    self._acceptRate = self._acceptCount/self.counter
+    self._acceptRate = self._acceptCount/self._iteration
     return acceptable
 
   def localStillReady(self, ready):
@@ -422,6 +584,8 @@ class MCMC(AdaptiveSampler):
       @ Out, ready, bool, a boolean representing whether the caller is prepared for another input.
     """
     ready = AdaptiveSampler.localStillReady(self, ready)
+    # each chain waits for its sample to be collected before proposing the next one
+    ready = ready and self._nextChain() is not None
     return ready
 
   def _localHandleFailedRuns(self, failedRuns):
@@ -449,10 +613,54 @@ class MCMC(AdaptiveSampler):
       @ In, rlz, dict, sampled realization
       @ Out, None
     """
-    if self._burnIn < self.counter:
+    if self._burnIn < self._iteration:
+      if self._numChains > 1:
+        self._traces[self._activeChain].append([float(rlz[var]) for var in self.toBeCalibrated])
       rlz = dict((var, np.atleast_1d(val)) for var, val in rlz.items())
       self._solutionExport.addRealization(rlz)
 
+  def finalizeSampler(self, failedRuns):
+    """
+      Method called at the end of the Step when no more samples will be taken.  Closes out sampler for step.
+      @ In, failedRuns, list, list of JobHandler.ExternalRunner objects
+      @ Out, None
+    """
+    AdaptiveSampler.finalizeSampler(self, failedRuns)
+    if self._numChains > 1:
+      self._reportConvergence()
+
+  def _reportConvergence(self):
+    """
+      Reports the Gelman-Rubin diagnostic of the chains, also as metadata of the solution export
+      @ In, None
+      @ Out, None
+    """
+    length = min(len(trace) for trace in self._traces.values())
+    if length < 2:
+      self.raiseAWarning('Not enough samples after the burn-in to compute the Gelman-Rubin diagnostic of the chains!')
+      return
+    traces = np.asarray([trace[:length] for trace in self._traces.values()])
+    rHat = self.gelmanRubin(traces)
+    diagnostics = {}
+    for var, value in zip(self.toBeCalibrated, rHat):
+      self.raiseAMessage('Gelman-Rubin R-hat of "{}" over {} chains: {:1.4f}'.format(var, self._numChains, value))
+      diagnostics[var] = {'Rhat': value}
+    if self._solutionExport is not None:
+      self._solutionExport.addMeta(self.type, diagnostics)
+
+  @staticmethod
+  def gelmanRubin(traces):
+    """
+      Computes the Gelman-Rubin potential scale reduction factor (R-hat) of multiple chains
+      @ In, traces, np.array, the samples of the chains, shaped (chains, samples, variables)
+      @ Out, rHat, np.array, the R-hat of each variable
+    """
+    n = traces.shape[1]
+    within = traces.var(axis=1, ddof=1).mean(axis=0)
+    between = n * traces.mean(axis=1).var(axis=0, ddof=1)
+    varHat = (n - 1.0) / n * within + between / n
+    return np.sqrt(varHat / within)
+
   @staticmethod
   def tuneScalingParam(scale, acceptRate):
     """
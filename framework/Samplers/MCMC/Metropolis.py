@@ -114,6 +114,7 @@ class Metropolis(MCMC):
       if self._updateValues[var] is None:
         value = dist.rvs()
         self._updateValues[var] = value
+    self._initializeChains()
 
   def localGenerateInput(self, model, myInput):
     """
@@ -124,13 +125,12 @@ class Metropolis(MCMC):
       @ In, myInput, list, a list of the original needed inputs for the model (e.g. list of files, etc.)
       @ Out, None
     """
-    if self.counter < 2:
+    if self._iteration < 2:
       MCMC.localGenerateInput(self, model, myInput)
     else:
-      self._localReady = False
       for key, value in self._updateValues.items():
         # update value based on proposal distribution
-        newVal = value + self._proposal[key].rvs() * self._scaling
+        newVal = value + self._rvs(self._proposal[key]) * self._scaling
         self.values[key] = newVal
         if key in self.distDict:
           ## check the lowerBound and upperBound
@@ -188,13 +188,3 @@ class Metropolis(MCMC):
     netLogPosterior += netLogLikelihood
     netLogPosterior = min(0.0, netLogPosterior)
     return netLogPosterior
-
-  def localStillReady(self, ready):
-    """
-      Determines if sampler is prepared to provide another input.  If not, and
-      if jobHandler is finished, this will end sampling.
-      @ In,  ready, bool, a boolean representing whether the caller is prepared for another input.
-      @ Out, ready, bool, a boolean representing whether the caller is prepared for another input.
-    """
-    ready = self._localReady and MCMC.localStillReady(self, ready)
-    return ready
@@ -81,6 +81,7 @@ class MonteCarlo(ForwardSampler):
     """
     super().__init__()
     self.printTag = 'SAMPLER MONTECARLO'
+    self.ableToGenerateInputBatch = True
     self.samplingType = None
     self.limit = None
 
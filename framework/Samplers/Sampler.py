@@ -22,6 +22,7 @@ import copy
 import abc
 import json
 import itertools
+import numbers
 import numpy as np
 from BaseClasses.InputDataUser import InputDataUser
 
@@ -199,6 +200,7 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
     self.batch                         = 1                         # determines the size of each sampling batch to run
     self.onlySampleAfterCollecting     = True                     # if True, then no new samples unless collection has occurred
     self.ableToHandelFailedRuns        = False                     # is this sampler able to handle failed runs?
+    self.ableToGenerateInputBatch      = False                     # can the samples of this sampler be generated in blocks (see generateInputBatch)?
     self.counter                       = 0                         # Counter of the samples performed (better the input generated!!!). It is reset by calling the function self.initialize
     self.auxcnt                        = 0                         # Aux counter of samples performed (for its usage check initialize method)
     self.limit                         = sys.maxsize               # maximum number of Samples (for example, Monte Carlo = Number of HistorySet to run, DET = Unlimited)
@@ -775,6 +777,7 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
       @ In, None
       @ Out, index, int, index of matching realization in restart (None if not found)
       @ Out, inExisting, dict, matching realization (None if not found)
+      @ Out, source, DataObject, the data object containing the matching realization (None if not found)
     """
     #check if point already exists
     if self.restartData is not None:
@@ -782,7 +785,25 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
     else:
       index = None
       inExisting = None
-    return index,inExisting
+    source = self.restartData if inExisting is not None else None
+    return index,inExisting,source
+
+  def _formatRestartRealization(self, inExisting, source, metadata):
+    """
+      Builds the realization of an already-evaluated point, to be used instead of sampling the Model.
+      @ In, inExisting, dict, the matching realization
+      @ In, source, DataObject, the data object containing the matching realization
+      @ In, metadata, dict, the sampler information of the point
+      @ Out, rlz, dict, the realization as {'inputs':dict, 'outputs':dict, 'metadata':dict}
+    """
+    # TODO use realization format as per new data object (no subspaces)
+    rlz = {}
+    # we've fixed it so the input and output space don't really matter, so use the source's own definition
+    # DO format the data as atleast_1d so it's consistent in the ExternalModel for users (right?)
+    rlz['inputs'] = dict((var,np.atleast_1d(inExisting[var])) for var in source.getVars('input'))
+    rlz['outputs'] = dict((var,np.atleast_1d(inExisting[var])) for var in source.getVars('output')+source.getVars('indexes'))
+    rlz['metadata'] = copy.deepcopy(metadata) # TODO need deepcopy only because inputInfo is on self
+    return rlz
 
   def _constantVariables(self):
     """
@@ -919,7 +940,7 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
       if self.distDict[key].getMemory():
         self.distDict[key].reset()
     ##### RESTART #####
-    index, inExisting = self._checkRestartForEvaluation()
+    index, inExisting, source = self._checkRestartForEvaluation()
     # reformat metadata into acceptable format for dataojbect
     # DO NOT format here, let that happen when a realization is made in collectOutput for each Model.  Sampler doesn't care about this.
     # self.inputInfo['ProbabilityWeight'] = np.atleast_1d(self.inputInfo['ProbabilityWeight'])
@@ -940,33 +961,57 @@ class Sampler(utils.metaclass_insert(abc.ABCMeta, BaseEntity), Assembler, InputD
       return 0, oldInput
     #otherwise, return the restart point
     else:
-      # TODO use realization format as per new data object (no subspaces)
-      self.raiseADebug('Point found in restart!')
-      rlz = {}
-      # we've fixed it so the input and output space don't really matter, so use restartData's own definition
-      # DO format the data as atleast_1d so it's consistent in the ExternalModel for users (right?)
-      rlz['inputs'] = dict((var,np.atleast_1d(inExisting[var])) for var in self.restartData.getVars('input'))
-      rlz['outputs'] = dict((var,np.atleast_1d(inExisting[var])) for var in self.restartData.getVars('output')+self.restartData.getVars('indexes'))
-      rlz['metadata'] = copy.deepcopy(self.inputInfo) # TODO need deepcopy only because inputInfo is on self
-      return 1, rlz
-
-  def generateInputBatch(self,myInput,model,batchSize,projector=None):
-    """
-      this function provide a mask to create several inputs at the same time
-      It call the generateInput function as many time as needed
-      @ In, myInput, list, list containing one input set
+      self.raiseADebug('Point found in "{}"!'.format(source.name))
+      return 1, self._formatRestartRealization(inExisting, source, self.inputInfo)
+
+  def generateInputBatch(self, model, oldInput, batchSize):
+    """
+      Generates a block of (at most) batchSize new samples, to be evaluated by a single
+      job of the model (see Model.submitBatch).
+      The samples are generated one at a time by generateInput, so that they are
+      identical to the ones submitted one per job, and then stacked into arrays.
+      Only the samplers flagged by "ableToGenerateInputBatch" can be used for this.
       @ In, model, model instance, it is the instance of a RAVEN model
-      @ In, batchSize, int, the number of input sets required
-      @ In, projector, object, optional, used for adaptive sampling to provide the projection of the solution on the success metric
-      @ Out, newInputs, list of list, list of the list of input sets
-    """
-    newInputs = []
-    while self.amIreadyToProvideAnInput() and (self.counter < batchSize):
-      if projector==None:
-        newInputs.append(self.generateInput(model,myInput))
+      @ In, oldInput, list, a list of the original needed inputs for the model (e.g. list of files, etc. etc)
+      @ In, batchSize, int, the maximum number of samples in the block
+      @ Out, batch, dict, the sampler information (as self.inputInfo) of the block, where the values of
+        the variables ('SampledVars', 'SampledVarsPb') and of the per-sample metadata are np.arrays
+        with one entry per sample; None if no new sample has been generated
+      @ Out, restartPoints, list, list of (realization, metadata) of the samples found in the restart
+    """
+    samples = []
+    restartPoints = []
+    while len(samples) < batchSize and self.amIreadyToProvideAnInput():
+      try:
+        found, newInput = self.generateInput(model, oldInput)
+      except utils.NoMoreSamplesNeeded:
+        if len(samples) == 0 and len(restartPoints) == 0:
+          raise
+        break
+      if found == 1:
+        restartPoints.append((newInput, copy.deepcopy(self.inputInfo)))
+      else:
+        # only the per-sample entries need to be stored, self.inputInfo is reused by the next sample
+        sample = dict(self.inputInfo)
+        sample['SampledVars'] = dict(self.inputInfo['SampledVars'])
+        sample['SampledVarsPb'] = dict(self.inputInfo['SampledVarsPb'])
+        samples.append(sample)
+    if len(samples) == 0:
+      return None, restartPoints
+    batch = {}
+    for key, value in samples[0].items():
+      if any(key not in sample for sample in samples):
+        continue
+      if key in ['SampledVars', 'SampledVarsPb']:
+        batch[key] = dict((var, np.concatenate([np.atleast_1d(sample[key][var]) for sample in samples])) for var in value)
+      elif isinstance(value, (numbers.Number, np.number)) or (isinstance(value, str) and any(sample[key] != value for sample in samples)):
+        batch[key] = np.asarray([sample[key] for sample in samples])
       else:
-        newInputs.append(self.generateInput(model,myInput,projector))
-    return newInputs
+        # shared by all the samples of the block (e.g. "SamplerType")
+        batch[key] = copy.deepcopy(value)
+    batch['batchId'] = 'batch_{}'.format(samples[0]['prefix'])
+    self.raiseADebug(' ... Generated block "{}" of {} samples'.format(batch['batchId'], len(samples)))
+    return batch, restartPoints
 
   @abc.abstractmethod
   def localGenerateInput(self,model,oldInput):
@@ -230,6 +230,7 @@ class Simulation(MessageUser):
     self.runInfoDict['numProcByRun'      ] = 1            # Total number of core used by one run (number of threads by number of mpi)
     self.runInfoDict['batchSize'         ] = 1            # number of contemporaneous runs
     self.runInfoDict['internalParallel'  ] = False        # activate internal parallel (parallel python). If True parallel python is used, otherwise multi-threading is used
+    self.runInfoDict['processPool'       ] = False        # if True, the internal objects are run in a pool of local worker processes instead of threads
     self.runInfoDict['ParallelCommand'   ] = ''           # the command that should be used to submit jobs in parallel (mpi)
     self.runInfoDict['ThreadingCommand'  ] = ''           # the command should be used to submit multi-threaded
     self.runInfoDict['totalNumCoresUsed' ] = 1            # total number of cores used by driver
@@ -614,6 +615,8 @@ class Simulation(MessageUser):
         self.runInfoDict['NumMPI'            ] = int(element.text)
       elif element.tag == 'internalParallel':
         self.runInfoDict['internalParallel'  ] = utils.interpretBoolean(element.text)
+      elif element.tag == 'processPool':
+        self.runInfoDict['processPool'       ] = utils.interpretBoolean(element.text)
       elif element.tag == 'batchSize':
         self.runInfoDict['batchSize'         ] = int(element.text)
       elif element.tag.lower() == 'maxqueuesize':
@@ -671,6 +674,8 @@ class Simulation(MessageUser):
         self.__modeHandlerDict[modeName] = module.__dict__[modeClass]
       else:
         self.raiseAnError(IOError,'RunInfo element "'+element.tag +'" unknown!')
+    if self.runInfoDict['internalParallel'] and self.runInfoDict['processPool']:
+      self.raiseAnError(IOError,'RunInfo elements "internalParallel" and "processPool" can not be both activated!')
 
   def printDicts(self):
     """
@@ -81,7 +81,7 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
     """
     super().__init__(**kwargs)
     self.parList    = []   # List of list [[role played in the step, class type, specialization, global name (user assigned by the input)]]
-    self.sleepTime  = 0.005  # Waiting time before checking if a run is finished
+    self.sleepTime  = 0.005  # Maximum waiting time before checking if a run is finished (woken up by the JobHandler)
     #If a step possess re-seeding instruction it is going to ask to the sampler to re-seed according
     #  re-seeding = a number to be used as a new seed
     #  re-seeding = 'continue' the use the already present random environment
@@ -113,7 +113,8 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
                        \xmlNode{MultiRun} XML block."""
 
     inputSpecification.addParam("sleepTime", InputTypes.FloatType,
-        descr='Determines the wait time between successive iterations within this step, in seconds.')
+        descr='Determines the maximum wait time between successive iterations within this step, in seconds. '
+              'The step is woken up as soon as a job is started or finished.')
     inputSpecification.addParam("re-seeding", InputTypes.StringType, descr=r"""
               this optional
               attribute could be used to control the seeding of the random number generator (RNG).
@@ -129,6 +130,15 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
               within the WorkingDir. Note this directory is only used for Steps with certain Models,
               such as Code.
               \default{True}""")
+    inputSpecification.addParam("batchEvaluation", InputTypes.IntegerType,
+        descr=r"""used in \xmlNode{MultiRun} steps only. If greater than 1, the samples are
+              generated in blocks of (at most) this size and each block is evaluated by a single job
+              of the model, avoiding the overhead of a job per sample. This is available for forward
+              samplers (e.g. \xmlString{MonteCarlo}, \xmlString{Grid}, \xmlString{Stratified}) with
+              static \xmlString{ROM} or vectorized \xmlString{ExternalModel} models and
+              \xmlString{PointSet} outputs only; otherwise, a warning is issued and the samples are
+              evaluated one per job.
+              \default{1}""")
 
     # for convenience, map subnodes to descriptions and loop through them
     subOptions = {'Input': 'Inputs to the step operation',
@@ -318,6 +328,10 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
       @ In, inDictionary, dict, contains the list of instances (see Simulation)
       @ Out, None
     """
+    # store the realizations that the databases are still holding in memory
+    for output in inDictionary.get('Output', []):
+      if isinstance(output, Database):
+        output.flush()
     if self.pauseEndStep:
       for i in range(len(inDictionary['Output'])):
         #if type(inDictionary['Output'][i]).__name__ not in ['str','bytes','unicode']:
@@ -500,6 +514,7 @@ class SingleRun(Step):
     ## get an input field in the outputs variable that is not in the inputs
     ## variable defined above? - DPM 4/6/2017
     #empty dictionary corresponds to sampling data in MultiRun
+    jobEvent = jobHandler.currentJobEvent()
     model.submit(inputs, None, jobHandler, **{'SampledVars':{'prefix':'None'}, 'additionalEdits':{}})
     while True:
       finishedJobs = jobHandler.getFinished()
@@ -534,7 +549,8 @@ class SingleRun(Step):
                                  str(self.failureHandling['repetitions'])+' times, failing all the times!!!')
       if jobHandler.isFinished() and len(jobHandler.getFinishedNoPop()) == 0:
         break
-      time.sleep(self.sleepTime)
+      # wait for a job to finish (sleepTime is the maximum wait)
+      jobEvent = jobHandler.waitForJobEvent(jobEvent, timeout=self.sleepTime)
     if sampler is not None:
       sampler.handleFailedRuns(self.failedRuns)
     else:
@@ -568,6 +584,9 @@ class MultiRun(SingleRun):
     self._samplerInitDict = {} #this is a dictionary that gets sent as key-worded list to the initialization of the sampler
     self.counter          = 0  #just an handy counter of the runs already performed
     self.printTag = 'STEP MULTIRUN'
+    self._batchEvaluation = 1  #number of samples evaluated by each model job (if the sampler and the model allow it)
+    self._useBatches      = False #are the samples evaluated in blocks in the current run of the step?
+    self._batchJobs       = {} #{job identifier: number of samples} of the blocks submitted
 
   def _localInputAndCheckParam(self,paramInput):
     """
@@ -579,6 +598,9 @@ class MultiRun(SingleRun):
     SingleRun._localInputAndCheckParam(self,paramInput)
     if self.samplerType not in [item[0] for item in self.parList]:
       self.raiseAnError(IOError,'It is not possible a multi-run without a sampler or optimizer!')
+    self._batchEvaluation = paramInput.parameterValues.get('batchEvaluation', 1)
+    if self._batchEvaluation < 1:
+      self.raiseAnError(IOError,'In Step named {} the attribute "batchEvaluation" must be a positive integer!'.format(self.name))
 
   def _initializeSampler(self,inDictionary):
     """
@@ -621,17 +643,21 @@ class MultiRun(SingleRun):
     self._outputCollectionLambda = []
     self._outputDictCollectionLambda = []
     # set up output collection lambdas
+    self._outputBatchCollectionLambda = []
     for outIndex, output in enumerate(inDictionary['Output']):
       if not isinstance(output, OutStreamEntity):
         if 'SolutionExport' in inDictionary.keys() and output.name == inDictionary['SolutionExport'].name:
           self._outputCollectionLambda.append((lambda x:None, outIndex))
           self._outputDictCollectionLambda.append((lambda x:None, outIndex))
+          self._outputBatchCollectionLambda.append((lambda x:None, outIndex))
         else:
           self._outputCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutput(x[0],x[1]), outIndex) )
           self._outputDictCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutputFromDict(x[0],x[1]), outIndex) )
+          self._outputBatchCollectionLambda.append( (lambda x: inDictionary['Model'].collectOutputBatch(x[0],x[1]), outIndex) )
       else:
         self._outputCollectionLambda.append((lambda x: x[1].addOutput(), outIndex))
         self._outputDictCollectionLambda.append((lambda x: x[1].addOutput(), outIndex))
+        self._outputBatchCollectionLambda.append((lambda x: x[1].addOutput(), outIndex))
     self._registerMetadata(inDictionary)
     self.raiseADebug('Generating input batch of size '+str(inDictionary['jobHandler'].runInfoDict['batchSize']))
     # set up and run the first batch of samples
@@ -642,6 +668,11 @@ class MultiRun(SingleRun):
       if not model.amITrained:
         model.raiseAnError(RuntimeError,'ROM model "%s" has not been trained yet, so it cannot be sampled!' %model.name+\
                                         ' Use a RomTrainer step to train it.')
+    self._batchJobs = {}
+    self._useBatches = self._batchEvaluation > 1 and self._checkBatchEvaluation(inDictionary)
+    if self._useBatches:
+      self._addNewBatches(inDictionary[self.samplerType], model, inDictionary['Input'], inDictionary['jobHandler'], inDictionary['jobHandler'].runInfoDict['batchSize'])
+      return
     for inputIndex in range(inDictionary['jobHandler'].runInfoDict['batchSize']):
       if inDictionary[self.samplerType].amIreadyToProvideAnInput():
         try:
@@ -670,6 +701,7 @@ class MultiRun(SingleRun):
         model.raiseAnError(RuntimeError,'ROM model "%s" has not been trained yet, so it cannot be sampled!' %model.name+\
                                         ' Use a RomTrainer step to train it.')
     # run step loop
+    jobEvent = jobHandler.currentJobEvent()
     while True:
       # collect finished jobs
       finishedJobs = jobHandler.getFinished()
@@ -688,11 +720,13 @@ class MultiRun(SingleRun):
           finishedJobList = [finishedJobObjs]
         for finishedJob in finishedJobList:
           finishedJob.trackTime('step_collected')
+          # number of samples evaluated by the job (None if not a block of samples)
+          batchRuns = self._batchJobs.get(finishedJob.identifier)
           # update number of collected runs
-          self.counter +=1
+          self.counter += 1 if batchRuns is None else batchRuns
           # collect run if it succeeded
           if finishedJob.getReturnCode() == 0:
-            for myLambda, outIndex in self._outputCollectionLambda:
+            for myLambda, outIndex in (self._outputCollectionLambda if batchRuns is None else self._outputBatchCollectionLambda):
               myLambda([finishedJob,outputs[outIndex]])
               self.raiseADebug('Just collected job {j:^8} and sent to output "{o}"'
                               .format(j=finishedJob.identifier,
@@ -759,7 +793,8 @@ class MultiRun(SingleRun):
         # NOTE for some reason submission outside collection breaks the DET
         # however, it is necessary i.e. batch sampling
         self._addNewRuns(sampler, model, inputs, outputs, jobHandler, inDictionary, verbose=False)
-      time.sleep(self.sleepTime)
+      # block until a job is started or finished (sleepTime is the maximum wait)
+      jobEvent = jobHandler.waitForJobEvent(jobEvent, timeout=self.sleepTime)
     # END while loop that runs the step iterations (collection and submission-for-DET)
     # if any collected runs failed, let the sampler treat them appropriately, and any other closing-out actions
     sampler.finalizeSampler(self.failedRuns)
@@ -783,6 +818,9 @@ class MultiRun(SingleRun):
       @ Out, None
     """
     isEnsemble = isinstance(model, Models.EnsembleModel)
+    if self._useBatches:
+      self._addNewBatches(sampler, model, inputs, jobHandler, min(jobHandler.availability(isEnsemble), sampler.endJobRunnable()))
+      return
     ## In order to ensure that the queue does not grow too large, we will
     ## employ a threshold on the number of jobs the jobHandler can take,
     ## in addition, we cannot provide more jobs than the sampler can provide.
@@ -806,6 +844,54 @@ class MultiRun(SingleRun):
       if verbose:
         self.raiseADebug(' ... no available JobHandler spots currently (or the Sampler is done.)')
 
+  def _checkBatchEvaluation(self, inDictionary):
+    """
+      Checks if the samples of this step can be evaluated in blocks (see the "batchEvaluation" attribute)
+      @ In, inDictionary, dict, contains the list of instances (see Simulation)
+      @ Out, canBatch, bool, True if the blocks of samples can be used
+    """
+    sampler = inDictionary[self.samplerType]
+    reasons = []
+    if not sampler.ableToGenerateInputBatch:
+      reasons.append('the sampler "{}" of type "{}" does not generate its samples in blocks'.format(sampler.name, sampler.type))
+    elif len(sampler.variableShapes) > 0:
+      reasons.append('the sampler "{}" samples vector variables'.format(sampler.name))
+    if not inDictionary['Model'].canEvaluateBatch():
+      reasons.append('the model "{}" cannot evaluate blocks of samples'.format(inDictionary['Model'].name))
+    for output in inDictionary['Output']:
+      if not isinstance(output, OutStreamEntity) and output.type != 'PointSet':
+        reasons.append('the output "{}" is not a PointSet'.format(output.name))
+    if len(reasons) > 0:
+      self.raiseAWarning('"batchEvaluation" has been requested in Step "{}", but {}. The samples will be evaluated one per job!'.format(self.name, '; '.join(reasons)))
+      return False
+    self.raiseADebug('Evaluating the samples in blocks of (at most) {} samples per job'.format(self._batchEvaluation))
+    return True
+
+  def _addNewBatches(self, sampler, model, inputs, jobHandler, slots):
+    """
+      Fills the available spaces of the jobHandler queue with blocks of samples, each one evaluated by a single job
+      @ In, sampler, Sampler, the sampler in charge of generating the samples
+      @ In, model, Model, the model in charge of evaluating the samples
+      @ In, inputs, object, the raven object used as the input in this step
+      @ In, jobHandler, object, the raven object used to handle jobs
+      @ In, slots, int, the maximum number of jobs to submit
+      @ Out, None
+    """
+    for _ in range(slots):
+      if not sampler.amIreadyToProvideAnInput():
+        break
+      try:
+        batch, restartPoints = sampler.generateInputBatch(model, inputs, self._batchEvaluation)
+      except utils.NoMoreSamplesNeeded:
+        self.raiseAMessage(' ... Sampler returned "NoMoreSamplesNeeded".  Continuing...')
+        break
+      # "submit" the samples found in the restart as finished runs
+      for rlz, metadata in restartPoints:
+        jobHandler.addFinishedJob(rlz, metadata=metadata)
+      if batch is not None:
+        model.submitBatch(inputs, sampler.type, jobHandler, batch)
+        self._batchJobs[batch['batchId']] = len(batch['prefix'])
+
   def _findANewInputToRun(self, sampler, model, inputs, outputs, jobHandler):
     """
       Repeatedly calls Sampler until a new run is found or "NoMoreSamplesNeeded" is raised.
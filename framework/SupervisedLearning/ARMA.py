@@ -28,10 +28,9 @@ import collections
 import utils.importerUtils
 statsmodels = utils.importerUtils.importModuleLazy("statsmodels", globals())
 import numpy as np
-import functools
 from scipy.linalg import solve_discrete_lyapunov
 from scipy import stats
-from scipy.signal import find_peaks
+from scipy.signal import find_peaks, lfilter
 from scipy.stats import rv_histogram
 
 #External Modules End--------------------------------------------------------------------------------
@@ -492,13 +491,11 @@ class ARMA(supervisedLearning):
       scaling = {}
       for target in (t for t in self.target if t != self.pivotParameterID):
         scaling[target] = self._evaluateScales(self.growthFactors[target], cycles)
-      # create synthetic history for each cycle
-      for y in cycles:
-        self.raiseADebug('Evaluating cycle', y)
-        vals = copy.deepcopy(featureVals) # without deepcopy, the vals are modified in-place -> why should this matter?
-        result = self._evaluateCycle(vals)
-        for target, value in ((t, v) for (t, v) in result.items() if t != self.pivotParameterID): #, growthInfos in self.growthFactors.items():
-          finalResult[target][y][:] = value # [:] is a size checker
+      # create synthetic history for each cycle, all at once
+      self.raiseADebug('Evaluating {} cycles'.format(self.numCycles))
+      result = self._evaluateCycles(featureVals, self.numCycles)
+      for target, value in ((t, v) for (t, v) in result.items() if t != self.pivotParameterID): #, growthInfos in self.growthFactors.items():
+        finalResult[target][:] = value # [:] is a size checker
       # apply growth factors
       for target in (t for t in finalResult if t != self.pivotParameterID):
         scaling = self._evaluateScales(self.growthFactors[target], cycles)
@@ -508,7 +505,8 @@ class ARMA(supervisedLearning):
       finalResult['_indexMap'] = dict((target, ['Cycle', self.pivotParameterID]) for target in self.target if target != self.pivotParameterID)
       return finalResult
     else:
-      return self._evaluateCycle(featureVals)
+      result = self._evaluateCycles(featureVals, 1)
+      return dict((target, value if target == self.pivotParameterID else value[0]) for target, value in result.items())
 
   def _evaluateScales(self, growthInfos, cycles):
     """
@@ -529,24 +527,42 @@ class ARMA(supervisedLearning):
         scales[y] = old
     return scales
 
-  def _evaluateCycle(self, featureVals):
+  def _evaluateCycles(self, featureVals, numHistories):
     """
+      Generates many synthetic histories at once.
+      The random numbers are drawn in the same order as generating the histories one after the other,
+      then the ARMA and VARMA recursions and the transformations are applied to all the histories together.
       @ In, featureVals, float, a scalar feature value is passed as scaling factor
-      @ Out, returnEvaluation, dict, dictionary of values for each target (and pivot parameter)
+      @ In, numHistories, int, number of histories to generate
+      @ Out, returnEvaluation, dict, dictionary of values for each target shaped [histories, pivotValues]
+                                     (and pivot parameter)
     """
     if featureVals.size > 1:
       self.raiseAnError(ValueError, 'The input feature for ARMA for evaluation cannot have size greater than 1. ')
 
+    # the peaks are sampled from the same generator of the correlated noise, history by history,
+    # so in this case generate the histories one at a time to preserve the random streams
+    if numHistories > 1 and any(target in self.peaks for target in self.target):
+      evaluations = [self._evaluateCycles(featureVals, 1) for _ in range(numHistories)]
+      returnEvaluation = dict((target, np.vstack([evaluation[target] for evaluation in evaluations])) for target in self.target)
+      returnEvaluation[self.pivotParameterID] = self.pivotParameterValues
+      return returnEvaluation
+
     # Instantiate a normal distribution for time series synthesis (noise part)
     # TODO USE THIS, but first retrofix rvs on norm to take "size=") for number of results
 
     # make sure pivot value is in return object
     returnEvaluation = {self.pivotParameterID:self.pivotParameterValues}
+    numTimes = len(self.pivotParameterValues)
 
     # TODO when we have output printing for ROMs, the distinct signals here could be outputs!
     # leaving "debuggFile" as examples of this, in comments
     #debuggFile = open('signal_bases.csv','w')
     #debuggFile.writelines('Time,'+','.join(str(x) for x in self.pivotParameterValues)+'\n')
+    # noise for the uncorrelated ARMAs of many histories, in the order they are used below
+    # (a single history draws it ARMA by ARMA, see _generateARMASignal)
+    armaNoise = iter(self._drawARMANoise(numHistories)) if numHistories > 1 else None
+
     correlatedSample = None
     for target in self.target:
       # start with the random gaussian signal
@@ -561,63 +577,55 @@ class ARMA(supervisedLearning):
           # have we already taken the correlated sample yet?
           if correlatedSample is None:
             # if not, take the samples now
-            unzeroedSample = self._generateVARMASignal(self.varmaResult[0],
-                                                       numSamples=self._masks[target]['notZeroFilterMask'].sum(),
-                                                       randEngine=self.normEngine.rvs,
-                                                       rvsIndex=0)
+            varmaRequests = [(self.varmaResult[0], self._masks[target]['notZeroFilterMask'].sum(), 0)]
             ## zero sampling is dependent on whether the trained model is a VARMA or ARMA
             if self.varmaNoise[1] is not None:
-              zeroedSample = self._generateVARMASignal(self.varmaResult[1],
-                                                       numSamples=self._masks[target]['zeroFilterMask'].sum(),
-                                                       randEngine=self.normEngine.rvs,
-                                                       rvsIndex=1)
+              varmaRequests.append((self.varmaResult[1], self._masks[target]['zeroFilterMask'].sum(), 1))
+            samples = self._generateVARMASignals(varmaRequests, numHistories)
+            unzeroedSample = samples[0]
+            if self.varmaNoise[1] is not None:
+              zeroedSample = samples[1]
+            elif armaNoise is None:
+              zeroedSample = self._generateARMASignal(self.varmaResult[1],
+                                                      numSamples=self._masks[target]['zeroFilterMask'].sum())
+              zeroedSample = zeroedSample[np.newaxis, :, np.newaxis]
             else:
-              result = self.varmaResult[1]
-              sample = self._generateARMASignal(result,
-                                                numSamples = self._masks[target]['zeroFilterMask'].sum(),
-                                                randEngine = self.randomEng)
-              zeroedSample = np.zeros((self._masks[target]['zeroFilterMask'].sum(),1))
-              zeroedSample[:, 0] = sample
+              zeroedSample = self._filterARMANoise(self.varmaResult[1], next(armaNoise))[:, :, np.newaxis]
             correlatedSample = True # placeholder, signifies we've sampled the correlated distribution
           # reconstruct base signal from samples
           ## initialize
-          signal = np.zeros(len(self.pivotParameterValues))
+          signal = np.zeros((numHistories, numTimes))
           ## first the data from the non-zero portions of the original signal
-          signal[self._masks[self.zeroFilterTarget]['notZeroFilterMask']] = unzeroedSample[:,corrIndex]
+          signal[:, self._masks[self.zeroFilterTarget]['notZeroFilterMask']] = unzeroedSample[:, :, corrIndex]
           ## then the data from the zero portions (if the filter target, don't bother because they're zero anyway)
           if target != self.zeroFilterTarget:
             # fix offset since we didn't include zero-filter target in zeroed correlated arma
             indexOffset = 0 if corrIndex < filterTargetIndex else -1
-            signal[self._masks[self.zeroFilterTarget]['zeroFilterMask']] = zeroedSample[:,corrIndex+indexOffset]
+            signal[:, self._masks[self.zeroFilterTarget]['zeroFilterMask']] = zeroedSample[:, :, corrIndex+indexOffset]
         # if no zero-filtering (but still correlated):
         else:
           ## check if sample taken yet
           if correlatedSample is None:
             ## if not, do so now
-            correlatedSample = self._generateVARMASignal(self.varmaResult[0],
-                                                         numSamples = len(self.pivotParameterValues),
-                                                         randEngine = self.normEngine.rvs,
-                                                         rvsIndex = 0)
+            correlatedSample = self._generateVARMASignals([(self.varmaResult[0], numTimes, 0)], numHistories)[0]
           # take base signal from sample
-          signal = correlatedSample[:,self.correlations.index(target)]
+          signal = correlatedSample[:, :, corrIndex]
       # if NOT correlated
       else:
         result = self.armaResult[target] # ARMAResults object
         # generate baseline ARMA + noise
+        if armaNoise is None:
+          numSamples = self._masks[target]['notZeroFilterMask'].sum() if target == self.zeroFilterTarget else numTimes
+          sample = np.atleast_2d(self._generateARMASignal(result, numSamples=numSamples))
+        else:
+          sample = self._filterARMANoise(result, next(armaNoise))
         # are we zero-filtering?
         if target == self.zeroFilterTarget:
-          sample = self._generateARMASignal(result,
-                                            numSamples = self._masks[target]['notZeroFilterMask'].sum(),
-                                            randEngine = self.randomEng)
-
           ## if so, then expand result into signal space (functionally, put back in all the zeros)
-          signal = np.zeros(len(self.pivotParameterValues))
-          signal[self._masks[target]['notZeroFilterMask']] = sample
+          signal = np.zeros((numHistories, numTimes))
+          signal[:, self._masks[target]['notZeroFilterMask']] = sample
         else:
           ## if not, no extra work to be done here!
-          sample = self._generateARMASignal(result,
-                                            numSamples = len(self.pivotParameterValues),
-                                            randEngine = self.randomEng)
           signal = sample
       # END creating base signal
       # DEBUG adding arbitrary variables for debugging, TODO find a more elegant way, leaving these here as markers
@@ -635,18 +643,19 @@ class ARMA(supervisedLearning):
         #returnEvaluation[target+'_2fourier'] = copy.copy(signal)
         #debuggFile.writelines('signal_fourier,'+','.join(str(x) for x in self.fourierResults[target]['predict'])+'\n')
       if target in self.peaks:
-        signal = self._transformBackPeaks(signal,windowDict=self.peaks[target])
+        # there is only one history here, see above
+        signal = np.atleast_2d(self._transformBackPeaks(signal[0], windowDict=self.peaks[target]))
         #debuggFile.writelines('signal_peak,'+','.join(str(x) for x in signal)+'\n')
 
       # if enforcing the training data CDF, apply that transform now
       if self.preserveInputCDF:
-        signal = self._transformThroughInputCDF(signal, self._trainingCDF[target])
+        signal = np.array([self._transformThroughInputCDF(history, self._trainingCDF[target]) for history in signal])
 
       # Re-zero out zero filter target's zero regions
       if target == self.zeroFilterTarget:
         # DEBUG adding arbitrary variables
         #returnEvaluation[target+'_3zerofilter'] = copy.copy(signal)
-        signal[self._masks[target]['zeroFilterMask']] = 0.0
+        signal[:, self._masks[target]['zeroFilterMask']] = 0.0
 
       # Domain limitations
       for domain,requests in self.outTruncation.items():
@@ -665,7 +674,7 @@ class ARMA(supervisedLearning):
       #returnEvaluation[target+'_5scaled'] = copy.copy(signal)
 
       # sanity check on the signal
-      assert(signal.size == returnEvaluation[self.pivotParameterID].size)
+      assert(signal.shape == (numHistories, returnEvaluation[self.pivotParameterID].size))
       #debuggFile.writelines('final,'+','.join(str(x) for x in signal)+'\n')
       returnEvaluation[target] = signal
     # END for target in targets
@@ -704,27 +713,62 @@ class ARMA(supervisedLearning):
     denormed = self._sampleICDF(denormed, params)
     return denormed
 
+  def _drawARMANoise(self, numHistories):
+    """
+      Draws the random noise for the uncorrelated ARMAs of many histories at once.
+      The numbers are the same that generating the histories one after the other would draw.
+      @ In, numHistories, int, number of histories
+      @ Out, noise, list(np.array), noise for each ARMA shaped [histories, samples + burn-in], in the order
+                                    they are sampled for each history (see _evaluateCycles)
+    """
+    burnin = 2*max(self.P,self.Q)
+    sizes = []
+    correlatedSample = False
+    for target in self.target:
+      if target in self.correlations:
+        # the zeroed correlated variables can be sampled through an ARMA (see __trainLocal__)
+        if len(self.varmaResult) > 1 and not correlatedSample and self.varmaNoise[1] is None:
+          sizes.append(self._masks[target]['zeroFilterMask'].sum() + burnin)
+        correlatedSample = True
+      elif target == self.zeroFilterTarget:
+        sizes.append(self._masks[target]['notZeroFilterMask'].sum() + burnin)
+      else:
+        sizes.append(len(self.pivotParameterValues) + burnin)
+    if not sizes:
+      return []
+    # one row per history, filled as subsequent draws would
+    allNoise = randomUtils.randomNormal(size=(numHistories, sum(sizes)), keepMatrix=True, engine=self.randomEng)
+    allNoise = allNoise.reshape(numHistories, sum(sizes))
+    noise = np.split(allNoise, np.cumsum(sizes)[:-1], axis=1)
+    return noise
+
+  def _filterARMANoise(self, model, noise):
+    """
+      Generates synthetic histories from fitted parameters, given the white noise.
+      Equivalent to statsmodels' arma_generate_sample, but for many histories at once.
+      @ In, model, statsmodels.tsa.arima_model.ARMAResults, fitted ARMA such as otained from _trainARMA
+      @ In, noise, np.array, standard normal noise shaped [histories, samples + burn-in]
+      @ Out, hist, np.array(float), synthetic ARMA signals shaped [histories, samples]
+    """
+    burnin = 2*max(self.P,self.Q) # @alfoa, 2020
+    eta = np.sqrt(model.sigma2) * noise
+    hist = lfilter(np.append(1., model.maparams), np.append(1., -model.arparams), eta, axis=-1)[..., burnin:]
+    return hist
+
   def _generateARMASignal(self, model, numSamples=None,randEngine=None):
     """
       Generates a synthetic history from fitted parameters.
       @ In, model, statsmodels.tsa.arima_model.ARMAResults, fitted ARMA such as otained from _trainARMA
       @ In, numSamples, int, optional, number of samples to take (default to pivotParameters length)
-      @ In, randEngine, instance, optional, method to call to get random samples (for example "randEngine(size=6)")
+      @ In, randEngine, instance, optional, random number generator
       @ Out, hist, np.array(float), synthetic ARMA signal
     """
     if numSamples is None:
       numSamples =  len(self.pivotParameterValues)
     if randEngine is None:
       randEngine=self.randomEng
-    import statsmodels.tsa
-    hist = statsmodels.tsa.arima_process.arma_generate_sample(ar = np.append(1., -model.arparams),
-                                                    ma = np.append(1., model.maparams),
-                                                    nsample = numSamples,
-                                                    distrvs = functools.partial(randomUtils.randomNormal,engine=randEngine),
-                                       # functool.partial provide the random number generator as a function
-                                       # with normal distribution and take engine as the positional arguments keywords.
-                                                    scale = np.sqrt(model.sigma2),
-                                                    burnin = 2*max(self.P,self.Q)) # @alfoa, 2020
+    noise = randomUtils.randomNormal(size=(numSamples + 2*max(self.P,self.Q),), keepMatrix=True, engine=randEngine)
+    hist = self._filterARMANoise(model, noise)
     return hist
 
   def _generateFourierSignal(self, pivots, periods):
@@ -752,34 +796,45 @@ class ARMA(supervisedLearning):
     """
     if numSamples is None:
       numSamples = len(self.pivotParameterValues)
-    # sample measure, state shocks
-    ## TODO it appears that measure shock always has a 0 variance multivariate normal, so just create it
-    numVariables = len(self.correlations)
-    if rvsIndex == 1:
-      # TODO implicit; this indicates that we're sampling ZEROED correlated variables,
-      # -> so the dimensionality is actually one less (since we don't train the VARMA coupled to the all-zeroes variable)
-      numVariables -= 1
-    measureShocks = np.zeros([numSamples, numVariables])
-    ## state shocks come from sampling multivariate
-    noiseDist = self.varmaNoise
-    initDist = self.varmaInit
-    if rvsIndex is not None:
-      noiseDist = noiseDist[rvsIndex]
-      initDist = initDist[rvsIndex]
-    # with NUMPY:
-    mean = noiseDist.mu
-    cov = noiseDist.covariance.reshape([len(mean)]*2)
-    stateShocks = np.random.multivariate_normal(mean, cov, numSamples)
-    # with CROW:
-    #stateShocks = np.array([noiseDist.rvs() for _ in range(numSamples)])
-    # pick an intial by sampling multinormal distribution
-    init = np.array(initDist.rvs())
-    obs, states = model.ssm.simulate(numSamples,
-                                     initial_state=init,
-                                     measurement_shocks=measureShocks,
-                                     state_shocks=stateShocks)
-    # add zeros back in for zeroed variable, if necessary? FIXME -> looks like no, this is done later in _evaluateCycle
-    return obs
+    hist = self._generateVARMASignals([(model, numSamples, rvsIndex)], 1)[0][0]
+    return hist
+
+  def _generateVARMASignals(self, requests, numHistories):
+    """
+      Generates sets of correlated synthetic histories from fitted parameters, for many histories at once.
+      The random numbers are drawn history by history, in the order of the requests, as subsequent calls to
+      _generateVARMASignal would; then the VARMAs are simulated for all the histories together.
+      @ In, requests, list(tuple), (model, numSamples, rvsIndex) for each VARMA to sample (see _generateVARMASignal)
+      @ In, numHistories, int, number of histories
+      @ Out, samples, list(np.array), synthetic signals for each request shaped [histories, samples, variables]
+    """
+    noise = [([], []) for _ in requests]
+    for _ in range(numHistories):
+      for r, (_, numSamples, rvsIndex) in enumerate(requests):
+        ## state shocks come from sampling multivariate
+        noiseDist = self.varmaNoise
+        initDist = self.varmaInit
+        if rvsIndex is not None:
+          noiseDist = noiseDist[rvsIndex]
+          initDist = initDist[rvsIndex]
+        # with NUMPY:
+        mean = noiseDist.mu
+        cov = noiseDist.covariance.reshape([len(mean)]*2)
+        noise[r][0].append(np.random.multivariate_normal(mean, cov, numSamples))
+        # with CROW:
+        #stateShocks = np.array([noiseDist.rvs() for _ in range(numSamples)])
+        # pick an intial by sampling multinormal distribution
+        noise[r][1].append(np.array(initDist.rvs()))
+    samples = []
+    for (model, numSamples, _), (stateShocks, init) in zip(requests, noise):
+      smoother = model.ssm
+      ## TODO it appears that measure shock always has a 0 variance multivariate normal, so just create it
+      measureShocks = np.zeros((numHistories, numSamples, smoother.k_endog))
+      matrices = dict((name, smoother[name]) for name in ['design', 'obs_intercept', 'transition', 'state_intercept', 'selection'])
+      obs = mathUtils.simulateStateSpace(matrices, measureShocks, np.array(stateShocks), np.array(init))
+      # add zeros back in for zeroed variable, if necessary? FIXME -> looks like no, this is done later in _evaluateCycles
+      samples.append(obs)
+    return samples
 
   def _interpolateDist(self, x, y, Xlow, Xhigh, Ylow, Yhigh, inMask):
     """
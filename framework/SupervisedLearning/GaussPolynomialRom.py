@@ -41,6 +41,9 @@ class GaussPolynomialRom(supervisedLearning):
   """
     Gauss Polynomial Rom Class
   """
+  ROMmultiRequest = True # the polynomial expansion is evaluated at all the requested points at once
+  _batchCells = 2**20    # maximum number of (point,polynomial) entries of the basis matrix built at once in evaluation
+
   def __confidenceLocal__(self,featureVals):
     """
       This should return an estimation of the quality of the prediction.
@@ -94,6 +97,8 @@ class GaussPolynomialRom(supervisedLearning):
     self.polys         = None #dict{varName: OrthoPolynomial object}, has polynomials for evaluation
     self.indexSet      = None #array of tuples, polynomial order combinations
     self.polyCoeffDict = None #dict{index set point, float}, polynomial combination coefficients for each combination
+    self._indexArray   = None #np.array(nPolys,nFeatures), polynomial orders of the combinations, in the order of self._coeffs
+    self._coeffs       = None #np.array(nPolys,nTargets), polynomial combination coefficients of all the targets
     self.numRuns       = None #number of runs to generate ROM; default is len(self.sparseGrid)
     self.itpDict       = {}   #dict{varName: dict{attribName:value} }
     self.featv         = None  # list of feature variables
@@ -148,6 +153,22 @@ class GaussPolynomialRom(supervisedLearning):
     if self.maxPolyOrder < 1:
       self.raiseAnError(IOError,'Polynomial order cannot be less than 1 currently.')
 
+  def __setstate__(self, d):
+    """
+      Initialize the ROM with the data contained in newstate
+      @ In, d, dict, it contains all the information needed by the ROM to be initialized
+      @ Out, None
+    """
+    supervisedLearning.__setstate__(self, d)
+    # ROMs pickled before the coefficients were stored as a matrix
+    if '_coeffs' not in d:
+      self._indexArray = None
+      self._coeffs = None
+      if self.polyCoeffDict:
+        indices = list(self.polyCoeffDict[self.target[0]].keys())
+        self._indexArray = np.array(indices,dtype=int).reshape(len(indices),len(self.features))
+        self._coeffs = np.array([[self.polyCoeffDict[target][idx] for target in self.target] for idx in indices])
+
   def writeXML(self, writeTo, requests = None, skip = None):
     """
       Adds requested entries to XML node.
@@ -278,6 +299,47 @@ class GaussPolynomialRom(supervisedLearning):
       tot*=self.polys[varName](o,p)
     return tot
 
+  def _toStandardPoints(self,featureVals):
+    """
+      Converts points from the distributions domain to the quadratures standard domain.
+      @ In, featureVals, np.array, (nPoints,nFeatures) points to convert
+      @ Out, stdPts, np.array, (nPoints,nFeatures) converted points
+    """
+    stdPts = np.zeros(featureVals.shape)
+    for p,varName in enumerate(self.sparseGrid.varNames):
+      stdPts[:,p] = self.distDict[varName].convertToQuad(self.quads[varName].type,featureVals[:,p])
+    return stdPts
+
+  def _basisMatrix(self,stdPts):
+    """
+      Evaluates each polynomial combination of the index set at each of the given points (generalized
+      Vandermonde matrix). The 1-D polynomials of each variable are tabulated once, up to the highest order
+      required, at each distinct coordinate, and the combinations are products of columns of the tables.
+      @ In, stdPts, np.array, (nPoints,nFeatures) points in the quadratures standard domain
+      @ Out, basis, np.array, (nPoints,nPolys) products of polynomial evaluations, ordered as self._indexArray
+    """
+    basis = np.ones((len(stdPts),len(self._indexArray)))
+    maxOrders = self._indexArray.max(axis=0)
+    for p,varName in enumerate(self.sparseGrid.varNames):
+      coords,inverse = np.unique(stdPts[:,p],return_inverse=True)
+      table = self.polys[varName].evaluateTable(maxOrders[p],coords)
+      basis *= table[inverse.ravel()][:,self._indexArray[:,p]]
+    return basis
+
+  def _evaluateBatch(self,featureVals):
+    """
+      Evaluates all the targets at a batch of points, limiting the size of the basis matrix built at once.
+      @ In, featureVals, np.array, (nPoints,nFeatures) points at which to evaluate the ROM
+      @ Out, values, np.array, (nPoints,nTargets) evaluations
+    """
+    featureVals = np.asarray(featureVals,dtype=float)
+    values = np.zeros((len(featureVals),len(self.target)))
+    chunk = max(1,self._batchCells//len(self._indexArray))
+    for start in range(0,len(featureVals),chunk):
+      stdPts = self._toStandardPoints(featureVals[start:start+chunk])
+      values[start:start+chunk] = self._basisMatrix(stdPts).dot(self._coeffs)
+    return values
+
   def __trainLocal__(self,featureVals,targetVals):
     """
       Trains ROM.
@@ -289,66 +351,31 @@ class GaussPolynomialRom(supervisedLearning):
       self.raiseAnError(RuntimeError,'ROM has not yet been initialized!  Has the Sampler associated with this ROM been used?')
     self.raiseADebug('training',self.features,'->',self.target)
     self.featv, self.targv = featureVals,targetVals
-    self.polyCoeffDict = {key: dict({}) for key in self.target}
     #check equality of point space
     self.raiseADebug('...checking required points are available...')
-    fvs = []
-    tvs = {key: list({}) for key in self.target}
-    sgs = list(self.sparseGrid.points())
-    missing=[]
-    kdTree = spatial.KDTree(featureVals)
-    #TODO this is slowest loop in this algorithm, by quite a bit.
-    for pt in sgs:
-      #KDtree way
-      distances,idx = kdTree.query(pt,k=1,distance_upper_bound=1e-9) #FIXME how to set the tolerance generically?
-      #KDTree repots a "not found" as at infinite distance with index len(data)
-      if idx >= len(featureVals):
-        found = False
-      else:
-        found = True
-        point = tuple(featureVals[idx])
-      #end KDTree way
-      if found:
-        fvs.append(point)
-        for cnt, target in enumerate(self.target):
-          tvs[target].append(targetVals[idx,cnt])
-      else:
-        missing.append(pt)
-    if len(missing)>0:
+    sgs = np.array(self.sparseGrid.points())
+    kdTree = spatial.cKDTree(featureVals)
+    #KDTree reports a "not found" as at infinite distance with index len(data)
+    _,idx = kdTree.query(sgs,k=1,distance_upper_bound=1e-9) #FIXME how to set the tolerance generically?
+    missing = idx >= len(featureVals)
+    if missing.any():
       msg='\n'
       msg+='DEBUG missing feature vals:\n'
-      for i in missing:
-        msg+='  '+str(i)+'\n'
+      for i in sgs[missing]:
+        msg+='  '+str(tuple(i))+'\n'
       self.raiseADebug(msg)
       self.raiseADebug('sparse:',sgs)
-      self.raiseADebug('solns :',fvs)
+      self.raiseADebug('solns :',featureVals[idx[~missing]])
       self.raiseAnError(IOError,'input values do not match required values!')
-    #make translation matrix between lists, also actual-to-standardized point map
-    self.raiseADebug('...constructing translation matrices...')
-    translate={}
-    for i in range(len(fvs)):
-      translate[tuple(fvs[i])]=sgs[i]
-    standardPoints = {}
-    for pt in fvs:
-      stdPt = []
-      for i,p in enumerate(pt):
-        varName = self.sparseGrid.varNames[i]
-        stdPt.append( self.distDict[varName].convertToQuad(self.quads[varName].type,p) )
-      standardPoints[tuple(pt)] = stdPt[:]
-    #make polynomials
-    self.raiseADebug('...constructing polynomials...')
+    #the projection matrix maps the solutions at the quadrature points to the coefficients of all the targets
+    self.raiseADebug('...constructing projection matrix...')
     self.norm = np.prod(list(self.distDict[v].measureNorm(self.quads[v].type) for v in self.distDict.keys()))
-    for i,idx in enumerate(self.indexSet):
-      idx=tuple(idx)
-      for target in self.target:
-        self.polyCoeffDict[target][idx]=0
-        wtsum=0
-        for pt,soln in zip(fvs,tvs[target]):
-          tupPt = tuple(pt)
-          stdPt = standardPoints[tupPt]
-          wt = self.sparseGrid.weights(translate[tupPt])
-          self.polyCoeffDict[target][idx]+=soln*self._multiDPolyBasisEval(idx,stdPt)*wt
-        self.polyCoeffDict[target][idx]*=self.norm
+    indices = list(tuple(idx) for idx in self.indexSet)
+    self._indexArray = np.array(indices,dtype=int).reshape(len(indices),len(self.features))
+    weights = np.array(self.sparseGrid.weights())
+    projection = self._basisMatrix(self._toStandardPoints(featureVals[idx])).T * (weights*self.norm)
+    self._coeffs = projection.dot(targetVals[idx])
+    self.polyCoeffDict = dict((target,dict(zip(indices,self._coeffs[:,t]))) for t,target in enumerate(self.target))
     self.amITrained=True
     self.raiseADebug('...training complete!')
 
@@ -413,29 +440,18 @@ class GaussPolynomialRom(supervisedLearning):
       return self.polyCoeffDict[target][tuple([0]*len(self.features))]
     elif r==2:
       return sum(s**2 for s in self.polyCoeffDict[target].values())
-    tot=0
-    for pt,wt in self.sparseGrid:
-      tot+=self.__evaluateLocal__([pt])[target]**r*wt
-    tot*=self.norm
+    values = self.__evaluateLocal__(np.array(self.sparseGrid.points()))[target]
+    tot = np.dot(values**r,self.sparseGrid.weights())*self.norm
     return tot
 
   def __evaluateLocal__(self,featureVals):
     """
-      Evaluates a point.
-      @ In, featureVals, list, of values at which to evaluate the ROM
-      @ Out, returnDict, dict, the evaluated point for each target
+      Evaluates a set of points.
+      @ In, featureVals, np.array, (nPoints,nFeatures) values at which to evaluate the ROM
+      @ Out, returnDict, dict, {target: np.array(nPoints)} the evaluated points for each target
     """
-    featureVals=featureVals[0]
-    returnDict={}
-    stdPt = np.zeros(len(featureVals))
-    for p,pt in enumerate(featureVals):
-      varName = self.sparseGrid.varNames[p]
-      stdPt[p] = self.distDict[varName].convertToQuad(self.quads[varName].type,pt)
-    for target in self.target:
-      tot=0
-      for idx,coeff in self.polyCoeffDict[target].items():
-        tot+=coeff*self._multiDPolyBasisEval(idx,stdPt)
-      returnDict[target] = tot
+    values = self._evaluateBatch(np.atleast_2d(featureVals))
+    returnDict = dict((target,values[:,t]) for t,target in enumerate(self.target))
     return returnDict
 
   def _printPolynomial(self):
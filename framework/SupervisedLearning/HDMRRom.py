@@ -144,6 +144,7 @@ class HDMRRom(GaussPolynomialRom):
     self.refSoln = {key:dict({}) for key in self.target}
     for i in range(len(featureVals)):
       ft[tuple(featureVals[i])]=targetVals[i,:]
+    ftPoints = np.array(list(ft.keys()))
 
     #get the reference case
     self.refpt = tuple(self.__fillPointWithRef((),[]))
@@ -158,8 +159,10 @@ class HDMRRom(GaussPolynomialRom):
       tvals=np.zeros((len(SG),len(self.target)))
       for i in range(len(SG)):
         getpt=tuple(self.__fillPointWithRef(combo,SG[i][0]))
-        #the 1e-10 is to be consistent with RAVEN's CSV print precision
-        tvals[i,:] = ft[tuple(mathUtils.NDInArray(np.array(list(ft.keys())),getpt,tol=1e-10)[2])]
+        if getpt not in ft:
+          #the 1e-10 is to be consistent with RAVEN's CSV print precision
+          getpt = tuple(mathUtils.NDInArray(ftPoints,getpt,tol=1e-10)[2])
+        tvals[i,:] = ft[getpt]
         for fp,fpt in enumerate(SG[i][0]):
           fvals[i][fp] = fpt
       for i,c in enumerate(combo):
@@ -227,23 +230,24 @@ class HDMRRom(GaussPolynomialRom):
 
   def __evaluateLocal__(self,featureVals):
     """
-      Evaluates a point.
-      @ In, featureVals, list(float), list of values at which to evaluate the ROM
-      @ Out, tot, float, the evaluated point
+      Evaluates a set of points, each subset ROM evaluating all of them at once on its cut-hypervolume.
+      @ In, featureVals, np.array, (nPoints,nFeatures) values at which to evaluate the ROM
+      @ Out, returnDict, dict, {target: np.array(nPoints)} the evaluated points for each target
     """
     #am I trained?
-    returnDict = dict.fromkeys(self.target,None)
     if not self.amITrained:
       self.raiseAnError(IOError,'Cannot evaluate, as ROM is not trained!')
-    for target in self.target:
-      tot = 0
-      for term,mult in self.reducedTerms.items():
-        if term == ():
-          tot += self.refSoln[target]*mult
-        else:
-          cutVals = [list(featureVals[0][self.features.index(j)] for j in term)]
-          tot += self.ROMs[term].__evaluateLocal__(cutVals)[target]*mult
-      returnDict[target] = tot
+    featureVals = np.atleast_2d(featureVals)
+    returnDict = dict((target,np.zeros(len(featureVals))) for target in self.target)
+    for term,mult in self.reducedTerms.items():
+      if term == ():
+        for target in self.target:
+          returnDict[target] += self.refSoln[target]*mult
+      else:
+        cutVals = featureVals[:,[self.features.index(j) for j in term]]
+        termVals = self.ROMs[term].__evaluateLocal__(cutVals)
+        for target in self.target:
+          returnDict[target] += termVals[target]*mult
     return returnDict
 
   def __mean__(self,targ=None):
@@ -51,6 +51,7 @@ class MSR(NDinterpolatorRom):
     from an input point cloud consisting of an arbitrary number of input
     parameters and one or more response values per input point
   """
+  ROMmultiRequest = False # the kde predictor evaluates a single point per request
   def __init__(self, **kwargs):
     """
       A constructor that will appropriately intialize a supervised learning object
@@ -38,6 +38,7 @@ class NDinterpolatorRom(supervisedLearning):
   """
   A Reduced Order Model for interpolating N-dimensional data
   """
+  ROMmultiRequest = True
   def __init__(self, **kwargs):
     """
       A constructor that will appropriately intialize a supervised learning object
@@ -106,17 +107,27 @@ class NDinterpolatorRom(supervisedLearning):
       Perform regression on samples in featureVals.
       For an one-class model, +1 or -1 is returned.
       @ In, featureVals, numpy.array 2-D, features
-      @ Out, prediction, numpy.array 1-D, predicted values
+      @ Out, prediction, dict, {target: numpy.array 1-D of predicted values}
     """
-    prediction = {} #np.zeros((featureVals.shape[0]))
-    for index, target in enumerate(self.target):
-      prediction[target] = np.zeros((featureVals.shape[0]))
-      for n_sample in range(featureVals.shape[0]):
-        featv = interpolationND.vectd(featureVals[n_sample][:])
-        prediction[target][n_sample] = self.interpolator[index].interpolateAt(featv)
-      self.raiseAMessage('NDinterpRom   : Prediction by ' + self.__class__.ROMtype + ' for target '+target+'. Predicted value is ' + str(prediction[target][n_sample]))
+    values = self._evaluateBatch(np.atleast_2d(featureVals))
+    self.raiseADebug('NDinterpRom   : Prediction by ' + self.__class__.ROMtype + ' of ' + str(values.shape[0]) + ' points')
+    prediction = dict((target, values[:, index]) for index, target in enumerate(self.target))
     return prediction
 
+  def _evaluateBatch(self, featureVals):
+    """
+      Evaluates all the targets at a batch of points.
+      The crow interpolators are evaluated one point at a time, sharing the conversion of the point among the targets.
+      @ In, featureVals, numpy.array 2-D, shape (n_samples, n_features), the points
+      @ Out, values, numpy.array 2-D, shape (n_samples, n_targets), the predicted values
+    """
+    values = np.zeros((featureVals.shape[0], len(self.target)))
+    for nSample in range(featureVals.shape[0]):
+      featv = interpolationND.vectd(featureVals[nSample][:])
+      for index in range(len(self.target)):
+        values[nSample, index] = self.interpolator[index].interpolateAt(featv)
+    return values
+
   def __returnInitialParametersLocal__(self):
     """
       Returns a dictionary with the parameters and their initial values
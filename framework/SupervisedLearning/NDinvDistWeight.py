@@ -23,11 +23,12 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 #End compatibility block for Python 3----------------------------------------------------------------
 
 #External Modules------------------------------------------------------------------------------------
+import numpy as np
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
-from utils import utils
-interpolationND = utils.findCrowModule("interpolationND")
 from .NDinterpolatorRom import NDinterpolatorRom
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -35,8 +36,13 @@ class NDinvDistWeight(NDinterpolatorRom):
   """
     An N-dimensional model that interpolates data based on a inverse weighting of
     their training data points?
+    The weights are the inverse of the Minkowski distances (of order p) raised to the
+    number of features plus one, as in the crow InverseDistanceWeighting interpolator.
+    All the targets are evaluated at once, sharing the distances; optionally, only the
+    k nearest training points (found through a KD-tree) are used.
   """
   ROMtype         = 'NDinvDistWeight'
+  _batchCells     = 2**20 # maximum number of distances computed at once (points times training points)
   def __init__(self, **kwargs):
     """
       A constructor that will appropriately intialize a supervised learning object
@@ -47,17 +53,110 @@ class NDinvDistWeight(NDinterpolatorRom):
     self.printTag = 'ND-INVERSEWEIGHT ROM'
     if not 'p' in self.initOptionDict.keys():
       self.raiseAnError(IOError,'the <p> parameter must be provided in order to use NDinvDistWeigth as ROM!!!!')
+    self.p = float(self.initOptionDict['p'])
+    if self.p <= 0:
+      self.raiseAnError(IOError,'the <p> parameter of NDinvDistWeigth must be greater than zero!')
+    self.knn = self.initOptionDict.get('knn', None) # number of nearest training points used (None for all)
+    if self.knn is not None:
+      self.knn = int(self.knn)
+      if self.knn < 1:
+        self.raiseAnError(IOError,'the <knn> parameter of NDinvDistWeigth must be a positive integer!')
+      if self.p < 1:
+        self.raiseAnError(IOError,'the <knn> parameter of NDinvDistWeigth requires <p> greater or equal than 1!')
     self.__initLocal__()
 
+  def __getstate__(self):
+    """
+      Overwrite state (for pickle-ing)
+      The KD-tree is not pickled, since it is rebuilt by the training.
+      @ In, None
+      @ Out, state, dict, namespace dictionary
+    """
+    state = NDinterpolatorRom.__getstate__(self)
+    state.pop('_tree', None)
+    return state
+
+  def __setstate__(self, state):
+    """
+      Initialize the ROM with the data contained in state
+      @ In, state, dict, it contains all the information needed by the ROM to be initialized
+      @ Out, None
+    """
+    # ROMs pickled by previous versions
+    state.setdefault('p', float(state['initOptionDict']['p']))
+    state.setdefault('knn', None)
+    NDinterpolatorRom.__setstate__(self, state)
+
   def __initLocal__(self):
     """
       Method used to add additional initialization features used by pickling
       @ In, None
       @ Out, None
     """
-    self.interpolator = []
-    for _ in range(len(self.target)):
-      self.interpolator.append(interpolationND.InverseDistanceWeighting(float(self.initOptionDict['p'])))
+    self.interpolator = []  # no crow interpolator, the evaluation is performed here (see _evaluateBatch)
+    self._points = None     # training points, shape (n_samples, n_features)
+    self._values = None     # training values, shape (n_samples, n_targets)
+    self._tree = None       # KD-tree of the training points (only for the k nearest points evaluation)
+
+  def __trainLocal__(self,featureVals,targetVals):
+    """
+      Perform training on samples in featureVals with responses y.
+      @ In, featureVals, {array-like, sparse matrix}, shape=[n_samples, n_features],
+        an array of input feature values
+      @ Out, targetVals, array, shape = [n_samples], an array of output target
+        associated with the corresponding points in featureVals
+    """
+    self.featv, self.targv = featureVals,targetVals
+    self._points = np.asarray(featureVals, dtype=float)
+    self._values = np.asarray(targetVals, dtype=float).reshape(len(self._points), -1)
+    if self.knn is not None and self.knn < len(self._points):
+      self._tree = cKDTree(self._points)
+    else:
+      self._tree = None
+
+  def _evaluateBatch(self, featureVals):
+    """
+      Evaluates all the targets at a batch of points.
+      @ In, featureVals, numpy.array 2-D, shape (n_samples, n_features), the points
+      @ Out, values, numpy.array 2-D, shape (n_samples, n_targets), the predicted values
+    """
+    featureVals = np.asarray(featureVals, dtype=float)
+    if self._tree is not None:
+      distances, neighbors = self._tree.query(featureVals, k=self.knn, p=self.p)
+      return self._weightedAverage(distances.reshape(len(featureVals), -1), neighbors.reshape(len(featureVals), -1))
+    values = np.zeros((len(featureVals), self._values.shape[1]))
+    chunk = max(1, self._batchCells // len(self._points))
+    for start in range(0, len(featureVals), chunk):
+      distances = cdist(featureVals[start:start+chunk], self._points, 'minkowski', p=self.p)
+      values[start:start+chunk] = self._weightedAverage(distances)
+    return values
+
+  def _weightedAverage(self, distances, neighbors=None):
+    """
+      Computes the inverse distance weighted averages of the training values.
+      If a point coincides with training points, the value of the first one (in the training order) is taken.
+      @ In, distances, numpy.array 2-D, shape (n_samples, n_neighbors), distances from the training points
+      @ In, neighbors, numpy.array 2-D, optional, shape (n_samples, n_neighbors), indices of the training
+        points (if None, all the training points in the training order)
+      @ Out, average, numpy.array 2-D, shape (n_samples, n_targets), the weighted averages
+    """
+    exact = distances == 0.0
+    with np.errstate(divide='ignore', invalid='ignore'):
+      weights = (1.0 / distances)**(self._points.shape[1] + 1)
+      weights[exact] = 0.0
+      if neighbors is None:
+        average = np.dot(weights, self._values)
+      else:
+        average = np.einsum('ij,ijk->ik', weights, self._values[neighbors])
+      average /= weights.sum(axis=1)[:, np.newaxis]
+    coincident = np.where(exact.any(axis=1))[0]
+    if len(coincident):
+      if neighbors is None:
+        first = exact[coincident].argmax(axis=1)
+      else:
+        first = np.where(exact[coincident], neighbors[coincident], len(self._points)).min(axis=1)
+      average[coincident] = self._values[first]
+    return average
 
   def __resetLocal__(self):
     """
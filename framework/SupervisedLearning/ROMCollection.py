@@ -21,6 +21,7 @@
 from __future__ import division, print_function, absolute_import
 import copy
 import warnings
+import multiprocessing
 from collections import defaultdict, OrderedDict
 import pprint
 
@@ -217,6 +218,11 @@ class Segments(Collection):
     self._divisionInstructions = divisionMode
     if len(self._divisionInstructions) > 1:
       self.raiseAnError(NotImplementedError, 'Segmented ROMs do not yet handle multiple subspaces!')
+    # number of processes training and evaluating the segment ROMs
+    workersNode = inputSpecs.findFirst('numWorkers')
+    self._numWorkers = 1 if workersNode is None else workersNode.value
+    if self._numWorkers < 1:
+      self.raiseAnError(IOError, '<numWorkers> must be a positive integer, got {}!'.format(self._numWorkers))
 
   ###############
   # RUN METHODS #
@@ -326,9 +332,8 @@ class Segments(Collection):
     nextEntry = 0  # index to fill next data set into
     self.raiseADebug('Sampling from {} segments ...'.format(len(self._roms)))
     roms = self._getSequentialRoms()
-    for r, rom in enumerate(roms):
-      self.raiseADebug('Evaluating ROM segment', r)
-      subResults = rom.evaluate(evaluationDict)
+    allSubResults = self._evaluateSubdomainROMs(roms, evaluationDict)
+    for r, subResults in enumerate(allSubResults):
       ## DEBUGGING OPTIONS
       # year = getattr(self, 'DEBUGGYEAR', 0)
       #This is the place have debugg file
@@ -407,6 +412,54 @@ class Segments(Collection):
       result['_indexMap'] = indexMap
     return result
 
+  def _evaluateSubdomainROMs(self, roms, evaluationDict):
+    """
+      Evaluates the ROMs of the subdomains, in parallel if more processes are requested.
+      The same ROM can be listed more than once (e.g. the representative ROM of a cluster): its evaluations
+      are always performed in order by the same process, so that its random state evolves as in serial.
+      @ In, roms, list(supervisedLearning), ROMs to evaluate (in order)
+      @ In, evaluationDict, dict, realization to evaluate
+      @ Out, allSubResults, list(dict), results of each ROM
+    """
+    # group the requests by ROM
+    unique = OrderedDict()
+    for r, rom in enumerate(roms):
+      unique.setdefault(id(rom), (rom, []))[1].append(r)
+    workers = self._getNumWorkers(len(unique))
+    if workers == 1:
+      allSubResults = []
+      for r, rom in enumerate(roms):
+        self.raiseADebug('Evaluating ROM segment', r)
+        allSubResults.append(rom.evaluate(evaluationDict))
+      return allSubResults
+    self.raiseADebug('Evaluating {} ROM segments with {} processes ...'.format(len(roms), workers))
+    tasks = [(rom, evaluationDict, len(positions), _segmentSeed(rom, positions[0])) for rom, positions in unique.values()]
+    reseeds = [_disableReseed(rom) for rom, _ in unique.values()]
+    with _getSegmentContext().Pool(workers) as pool:
+      outcomes = pool.map(_evaluateSegmentROM, tasks, chunksize=1)
+    allSubResults = [None] * len(roms)
+    for (rom, positions), reseed, (evaluated, subResults) in zip(unique.values(), reseeds, outcomes):
+      # keep the state (e.g. of the random engine) the ROM reached in the process
+      rom.__dict__.update(evaluated.__dict__)
+      _restoreReseed(rom, reseed)
+      for r, result in zip(positions, subResults):
+        allSubResults[r] = result
+    return allSubResults
+
+  def _getNumWorkers(self, numTasks):
+    """
+      Determines how many processes to use for training or evaluating the subdomain ROMs.
+      @ In, numTasks, int, number of ROMs to train or evaluate
+      @ Out, workers, int, number of processes (1 means serial, in this process)
+    """
+    # ROMs pickled before the option existed are run serially
+    workers = min(getattr(self, '_numWorkers', 1), numTasks)
+    # daemonic processes (e.g. the workers of the JobHandler) cannot start new processes
+    if workers > 1 and multiprocessing.current_process().daemon:
+      self.raiseADebug('Segment ROMs are trained and evaluated serially inside a daemonic process')
+      workers = 1
+    return workers
+
   def _getSequentialRoms(self):
     """
       Returns ROMs in sequential order. Trivial for Segmented.
@@ -511,29 +564,44 @@ class Segments(Collection):
     if pivotID not in self._indexValues:
       self._indexValues[pivotID] = trainingSet[pivotID][0]
     # loop over clusters and train data
+    ## with more processes, the ROMs are all created first and then trained in parallel
+    workers = self._getNumWorkers(len(counter))
     roms = []
+    tasks = []
     for i, subdiv in enumerate(counter):
       # slicer for data selection
       picker = slice(subdiv[0], subdiv[-1] + 1)
-      ## TODO we need to be slicing all the data, not just one realization, once we support non-ARMA segmentation.
-      data = dict((var, [copy.deepcopy(trainingSet[var][0][picker])]) for var in trainingSet)
       # renormalize the pivot if requested, e.g. by shifting values
       norm = self._divisionPivotShift[pivotID]
+      delta = None
       if norm:
         if norm == 'zero':
           # left-shift pivot so subspace starts at 0 each time
-          delta = data[pivotID][0][0]
+          delta = trainingSet[pivotID][0][picker][0]
         elif norm == 'first':
           # left-shift so that first entry is equal to pivot's first value (maybe not zero)
-          delta = data[pivotID][0][0] - trainingSet[pivotID][0][0]
-        data[pivotID][0] -= delta
+          delta = trainingSet[pivotID][0][picker][0] - trainingSet[pivotID][0][0]
       # create a new ROM and train it!
       newROM = copy.deepcopy(templateROM)
       newROM.name = '{}_seg{}'.format(self._romName, i)
       newROM.adjustLocalRomSegment(self._romGlobalAdjustments, picker)
-      self.raiseADebug('Training segment', i, picker)
-      newROM.train(data)
       roms.append(newROM)
+      if workers == 1:
+        self.raiseADebug('Training segment', i, picker)
+        _trainSegmentROM(newROM, trainingSet, picker, pivotID, delta)
+      else:
+        tasks.append((picker, pivotID, delta))
+    if tasks:
+      self.raiseADebug('Training {} segments with {} processes ...'.format(len(roms), workers))
+      seeds = [_segmentSeed(rom, r) for r, rom in enumerate(roms)]
+      # the training set is shared with (not sent to) the processes
+      with _getSegmentContext().Pool(workers, initializer=_initSegmentWorker, initargs=(trainingSet,)) as pool:
+        reseeds = [_disableReseed(rom) for rom in roms]
+        trained = pool.map(_trainSharedSegmentROM, [(rom, seed) + task for rom, seed, task in zip(roms, seeds, tasks)], chunksize=1)
+      roms = []
+      for newROM, reseed in zip(trained, reseeds):
+        _restoreReseed(newROM, reseed)
+        roms.append(newROM)
     # format array for future use
     roms = np.array(roms)
     return roms
@@ -858,6 +926,7 @@ class Clusters(Segments):
     labelMap = self._clusterInfo['labels']
     clusters = sorted(list(set(labelMap)))
     pivotLen = 0
+    roms = []
     for cluster in clusters:
       # choose a ROM
       # TODO implement a distribution-based method for representative ROMs
@@ -868,8 +937,10 @@ class Clusters(Segments):
         ## option 2: choose randomly
         segmentIndex, clusterIndex = self._getSegmentIndexFromClusterIndex(cluster, labelMap, chooseRandom=True)
         rom = self._clusterInfo['map'][cluster][clusterIndex]
-      # evaluate the ROM
-      subResults = rom.evaluate(evaluationDict)
+      roms.append(rom)
+    # evaluate the ROMs
+    allSubResults = self._evaluateSubdomainROMs(roms, evaluationDict)
+    for cluster, subResults in zip(clusters, allSubResults):
       # collect results
       newLen = len(subResults[pivotID])
       pivotLen += newLen
@@ -1598,3 +1669,110 @@ class Interpolated(supervisedLearning):
         associated with the corresponding points in featureVals
     """
     pass
+
+
+
+#
+#
+#
+#
+# Functions run by the processes training and evaluating the subdomain ROMs in parallel.
+# They are module functions so that they can be pickled.
+_sharedTrainingSet = None # training data shared with the processes of a pool (set by _initSegmentWorker)
+
+def _getSegmentContext():
+  """
+    Returns the multiprocessing context used for the pools of segment processes.
+    "fork" shares the training data and the imported modules with the processes without serializing them.
+    @ In, None
+    @ Out, context, multiprocessing.context.BaseContext, the context
+  """
+  return multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+
+def _initSegmentWorker(trainingSet):
+  """
+    Initializes a process training segment ROMs, storing the (read-only) training data.
+    @ In, trainingSet, dict, data on which ROMs should be trained
+    @ Out, None
+  """
+  global _sharedTrainingSet
+  _sharedTrainingSet = trainingSet
+
+def _trainSegmentROM(rom, trainingSet, picker, pivotID, delta):
+  """
+    Trains a ROM on a subdomain of the training data.
+    @ In, rom, supervisedLearning, the ROM to train
+    @ In, trainingSet, dict, data on which ROMs should be trained
+    @ In, picker, slice, the subdomain of the pivot parameter
+    @ In, pivotID, str, name of the pivot parameter
+    @ In, delta, float, shift of the pivot values (None if not shifted)
+    @ Out, None
+  """
+  ## TODO we need to be slicing all the data, not just one realization, once we support non-ARMA segmentation.
+  data = dict((var, [copy.deepcopy(trainingSet[var][0][picker])]) for var in trainingSet)
+  if delta is not None:
+    data[pivotID][0] -= delta
+  rom.train(data)
+
+def _trainSharedSegmentROM(task):
+  """
+    Trains a ROM on a subdomain of the training data shared with this process.
+    @ In, task, tuple, (rom, seed, picker, pivotID, delta), with "seed" the seed for numpy in this task (see _segmentSeed)
+    @ Out, rom, supervisedLearning, the trained ROM
+  """
+  rom, seed, picker, pivotID, delta = task
+  np.random.seed(seed)
+  _trainSegmentROM(rom, _sharedTrainingSet, picker, pivotID, delta)
+  return rom
+
+def _evaluateSegmentROM(task):
+  """
+    Evaluates a ROM one or more times.
+    @ In, task, tuple, (rom, evaluationDict, repeat, seed), with "seed" the seed for numpy in this task (see _segmentSeed)
+    @ Out, rom, supervisedLearning, the evaluated ROM (with its updated state)
+    @ Out, subResults, list(dict), the results of the evaluations
+  """
+  rom, evaluationDict, repeat, seed = task
+  np.random.seed(seed)
+  subResults = [rom.evaluate(evaluationDict) for _ in range(repeat)]
+  return rom, subResults
+
+def _segmentSeed(rom, position):
+  """
+    Derives the seed for numpy in the process task of a subdomain ROM from the ROM itself (its seed and the state
+    of its random engine), so that it neither depends on nor advances the random stream of the main process.
+    The ROMs drawing their random numbers from their own engine (e.g. the ARMA) get the same results as in serial;
+    the ones also drawing from numpy get results that are reproducible, but different from the serial ones.
+    @ In, rom, supervisedLearning, the ROM
+    @ In, position, int, position of the ROM among the subdomain ROMs
+    @ Out, seed, int, the seed
+  """
+  entropy = [position]
+  seed = getattr(rom, 'seed', None)
+  if seed is not None:
+    entropy.append(abs(int(seed)))
+  engine = getattr(rom, 'randomEng', None)
+  if hasattr(engine, 'get_rng_state'):
+    entropy.append(int(engine.get_rng_state()))
+  return int(np.random.SeedSequence(entropy).generate_state(1)[0])
+
+def _disableReseed(rom):
+  """
+    Prevents a ROM from being reseeded while sent to (or from) a process, so that it keeps its random state.
+    @ In, rom, supervisedLearning, the ROM
+    @ Out, reseed, bool, the previous setting (None if the ROM is never reseeded)
+  """
+  reseed = getattr(rom, 'reseedCopies', None)
+  if reseed is not None:
+    rom.reseedCopies = False
+  return reseed
+
+def _restoreReseed(rom, reseed):
+  """
+    Restores the reseeding setting of a ROM changed by _disableReseed.
+    @ In, rom, supervisedLearning, the ROM
+    @ In, reseed, bool, the previous setting (None if the ROM is never reseeded)
+    @ Out, None
+  """
+  if reseed is not None:
+    rom.reseedCopies = reseed
@@ -43,6 +43,7 @@ class SciKitLearn(supervisedLearning):
   # the normalization strategy is defined through the Boolean value in the dictionary below:
   # {mainClass:{subtype:(classPointer,Output type (float or int), boolean -> External Z-normalization needed)}
   ROMtype = 'SciKitLearn'
+  ROMmultiRequest = True
 
   ## This seems more manual than it needs to be, why not use something like:
   # import os, sys, pkgutil, inspect
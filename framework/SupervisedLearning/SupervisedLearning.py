@@ -47,6 +47,7 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta), MessageUser):
   qualityEstType   = []    # this describe the type of estimator returned known type are 'distance', 'probability'. The values are returned by the self.__confidenceLocal__(Features)
   ROMtype          = ''    # the broad class of the interpolator
   ROMtimeDependent = False # is this ROM able to treat time-like (any monotonic variable) explicitly in its formulation?
+  ROMmultiRequest  = False # is this ROM able to evaluate several points (rows of featureVals) in a single __evaluateLocal__ call?
 
   @staticmethod
   def checkArrayConsistency(arrayIn,isDynamic=False):
@@ -313,6 +314,15 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta), MessageUser):
       @ In, edict, dict, evaluation dictionary
       @ Out, evaluate, dict, {target: evaluated points}
     """
+    featureValues = self._getFeatureValues(edict)
+    return self.__evaluateLocal__(featureValues)
+
+  def _getFeatureValues(self, edict):
+    """
+      Converts an evaluation dictionary into the (normalized) evaluation matrix used by the kernels.
+      @ In, edict, dict, evaluation dictionary
+      @ Out, featureValues, np.array, evaluation matrix shaped [points, features]
+    """
     if type(edict) != dict:
       self.raiseAnError(IOError,'method "evaluate". The evaluate request/s need/s to be provided through a dictionary. Type of the in-object is ' + str(type(edict)))
     names, values  = list(edict.keys()), list(edict.values())
@@ -330,7 +340,7 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta), MessageUser):
         if not resp[0]:
           self.raiseAnError(IOError,'In training set for feature '+feat+':'+resp[1])
         featureValues[:,cnt] = ((values[names.index(feat)] - self.muAndSigmaFeatures[feat][0]))/self.muAndSigmaFeatures[feat][1]
-    return self.__evaluateLocal__(featureValues)
+    return featureValues
 
   def reset(self):
     """
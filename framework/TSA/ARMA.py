@@ -234,6 +234,56 @@ class ARMA(TimeSeriesAnalyzer):
       synthetic[:, t] = new
     return synthetic
 
+  def generateBatch(self, params, pivot, settings, numSamples):
+    """
+      Generates many synthetic histories from fitted parameters at once.
+      The random perturbations are drawn in the same order as subsequent calls to "generate" would,
+      then the ARMA state space models are simulated for all the histories together.
+      @ In, params, dict, characterization such as otained from self.characterize()
+      @ In, pivot, np.array(float), pivot parameter values
+      @ In, settings, dict, settings for this ROM
+      @ In, numSamples, int, number of histories to generate
+      @ Out, synthetic, np.array(float), synthetic ARMA signals shaped [samples, pivotValues, targets]
+    """
+    numTimes = len(pivot)
+    synthetic = np.zeros((numSamples, numTimes, len(params)))
+    # draw the perturbations, sample by sample as "generate" would
+    noise = dict((target, ([], [], [])) for target in params)
+    for _ in range(numSamples):
+      for target, data in params.items():
+        armaData = data['arma']
+        msrShocks, stateShocks, initialState = self._generateNoise(armaData['model'], armaData['initials'], numTimes)
+        # as in statsmodels, only the first column of the initial state is used
+        initialState = np.asarray(initialState)
+        if initialState.ndim < 2:
+          initialState = np.atleast_2d(initialState).T
+        noise[target][0].append(np.ravel(msrShocks))
+        noise[target][1].append(np.ravel(stateShocks))
+        noise[target][2].append(initialState[:, 0])
+    # simulate all the histories together
+    for t, (target, data) in enumerate(params.items()):
+      armaData = data['arma']
+      model = armaData['model']
+      modelParams = np.hstack([[armaData.get('const', 0)],
+                               armaData['ar'],
+                               armaData['ma'],
+                               [armaData.get('var', 1)]])
+      # state space representation for the simulation period, as in model.simulate
+      model.update(modelParams)
+      end = min(model.nobs, numTimes)
+      simModel = model.ssm.extend(np.empty((numTimes - end, model.k_endog)), start=0, end=end)
+      matrices = dict((name, simModel[name]) for name in ['design', 'obs_intercept', 'transition', 'state_intercept', 'selection'])
+      msrShocks, stateShocks, initialState = (np.array(x) for x in noise[target])
+      new = mathUtils.simulateStateSpace(matrices,
+                                         msrShocks.reshape(numSamples, numTimes, -1),
+                                         stateShocks.reshape(numSamples, numTimes, -1),
+                                         initialState)[:, :, 0]
+      if settings.get('gaussianize', True):
+        # back-transform through CDF
+        new = mathUtils.degaussianize(new, params[target]['cdf'])
+      synthetic[:, :, t] = new
+    return synthetic
+
   def writeXML(self, writeTo, params):
     """
       Allows the engine to put whatever it wants into an XML to print to file.
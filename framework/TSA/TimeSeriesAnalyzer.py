@@ -16,6 +16,7 @@
   checking time histories.
 """
 import abc
+import numpy as np
 
 from utils import utils, InputData, InputTypes
 
@@ -119,6 +120,21 @@ class TimeSeriesAnalyzer(utils.metaclass_insert(abc.ABCMeta, object)):
       @ Out, synthetic, np.array(float), synthetic signal
     """
 
+  def generateBatch(self, params, pivot, settings, numSamples):
+    """
+      Generates many synthetic histories from fitted parameters at once.
+      The histories are the same that subsequent calls to "generate" would provide.
+      @ In, params, dict, training parameters as from self.characterize
+      @ In, pivot, np.array, time-like array values
+      @ In, settings, dict, additional settings specific to algorithm
+      @ In, numSamples, int, number of histories to generate
+      @ Out, synthetic, np.array(float), synthetic signals shaped [samples, pivotValues, targets]
+    """
+    # DEFAULT IMPLEMENTATION, generate one signal at a time
+    # -> overload in inheritors to vectorize
+    synthetic = np.array([self.generate(params, pivot, settings) for _ in range(numSamples)])
+    return synthetic
+
   def writeXML(self, writeTo, params):
     """
       Allows the engine to put whatever it wants into an XML to print to file.
@@ -25,6 +25,7 @@ import copy
 import pickle as pk
 import string
 import difflib
+import json
 
 from utils import utils, mathUtils
 from BaseClasses import InputDataUser, MessageUser
@@ -64,7 +65,7 @@ class hdf5Database(InputDataUser, MessageUser):
   """
     class to create a h5py (hdf5) database
   """
-  def __init__(self,name, databaseDir, filename, exist, variables=None):
+  def __init__(self,name, databaseDir, filename, exist, variables=None, compression=None):
     """
       Constructor
       @ In, name, string, name of this database
@@ -72,6 +73,7 @@ class hdf5Database(InputDataUser, MessageUser):
       @ In, filename, string, the database filename
       @ In, exist, bool, does it exist?
       @ In, variables, list, the user wants to store just some specific variables (default =None => all variables are stored)
+      @ In, compression, str, optional, compression filter of the datasets ("gzip" or "lzf", default =None => not compressed)
       @ Out, None
     """
     super().__init__()
@@ -80,6 +82,8 @@ class hdf5Database(InputDataUser, MessageUser):
     self.name       = name
     # check if we have to store all the variables
     self.variables = variables
+    # compression filter of the datasets
+    self.compression = compression
     # Database type :
     # -> The structure type is "inferred" by the first group is going to be added
     # * MC  = MonteCarlo => Storing by a Parallel structure
@@ -357,7 +361,7 @@ class hdf5Database(InputDataUser, MessageUser):
       begin = np.concatenate(([0],end[0:-1]))
       group.attrs[b'data_begin_endIntfloat'] = _dumps((begin.tolist(),end.tolist()))
       # get data names
-      group.create_dataset(name + "_dataIntFloat", dtype="float", data=(np.concatenate( list(dataIntFloat.values())).ravel()))
+      group.create_dataset(name + "_dataIntFloat", dtype="float", data=(np.concatenate( list(dataIntFloat.values())).ravel()), compression=self.compression)
       group.attrs[b'hasIntfloat'] = True
     # get size of each data variable (other type)
     varKeysOther = list(dataOther.keys())
@@ -578,6 +582,14 @@ class hdf5Database(InputDataUser, MessageUser):
 
     return(newData,attrs)
 
+  def flush(self):
+    """
+      Function to write to disk the data added to the database
+      @ In, None
+      @ Out, None
+    """
+    self.h5FileW.flush()
+
   def closeDatabaseW(self):
     """
       Function to close the database
@@ -617,3 +629,414 @@ class hdf5Database(InputDataUser, MessageUser):
     return parentGroupName
 
 
+
+#
+#  **********************************
+#  *  COLUMNAR HDF5 DATABASE CLASS  *
+#  **********************************
+#
+
+class hdf5ColumnarDatabase(InputDataUser, MessageUser):
+  """
+    class to create a h5py (hdf5) database with a columnar layout: instead of a group for each realization,
+    the values of each variable (for all the realizations) are stored in a single chunked and compressed dataset.
+    Structure of the file:
+      - attribute "layout" = "columnar" (plus "layoutVersion" and "nRealizations");
+      - dataset "names", the names (prefixes) of the realizations, in insertion order;
+      - dataset "data/<variable>", the values of the variable, one realization after the other;
+      - dataset "offsets/<variable>", only for the variables that do not have a single value in all the realizations,
+        the position in "data/<variable>" of the first value of each realization (plus the total number of values);
+      - dataset "shapes/<variable>", only for the variables with multidimensional values in some realizations,
+        the shape of the values of each realization (as "2,3"; "" if the values are 1D). The values are stored
+        flattened in "data/<variable>" and reshaped when read.
+    Realizations are collected in memory and written to the file in batches.
+  """
+  layoutVersion = 1
+  chunkSize = 4096                                        # number of values in each chunk of the datasets
+  skipVars = ('SampledVars', 'SampledVarsPb', 'crowDist') # sampler information not stored (as in NetCDF databases)
+
+  @staticmethod
+  def isColumnar(filenameAndPath):
+    """
+      Checks if an existing file has been created by this class.
+      @ In, filenameAndPath, str, path of the file
+      @ Out, isColumnar, bool, True if the file has the columnar layout
+    """
+    with h5.File(filenameAndPath, 'r') as h5File:
+      layout = h5File.attrs.get('layout', None)
+    return utils.toString(layout) == 'columnar' if layout is not None else False
+
+  def __init__(self, name, databaseDir, filename, exist, variables=None, compression='gzip', bufferSize=100):
+    """
+      Constructor
+      @ In, name, string, name of this database
+      @ In, databaseDir, string, database directory (full path)
+      @ In, filename, string, the database filename
+      @ In, exist, bool, does it exist?
+      @ In, variables, list, the user wants to store just some specific variables (default =None => all variables are stored)
+      @ In, compression, str, optional, compression filter of the datasets ("gzip", "lzf" or None)
+      @ In, bufferSize, int, optional, number of realizations collected in memory before writing them
+      @ Out, None
+    """
+    super().__init__()
+    self.name = name
+    self.variables = variables
+    self.type = 'MC'                # only parallel (not hierarchical) structures are supported
+    self.printTag = 'DATABASE HDF5'
+    self.compression = compression
+    self.bufferSize = bufferSize
+    self.fileExist = exist
+    self.onDiskFile = filename
+    self.databaseDir = databaseDir
+    self.filenameAndPath = os.path.join(self.databaseDir, self.onDiskFile)
+    self.fileOpen = False
+    self._names = []                # names of all the realizations (stored or buffered)
+    self._nameIndex = {}            # {name: index of the realization}
+    self._kinds = {}                # {variable: kind of the values, i.e. "float", "bool", "str" or "json"}
+    self._buffer = []               # realizations (as {variable: (1D array, shape or None)}) not yet written to file
+    if self.fileExist:
+      if not os.path.exists(self.filenameAndPath):
+        self.raiseAnError(IOError, 'database file has not been found, searched Path is: ' + self.filenameAndPath)
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath, 'r+')
+      if utils.toString(self.h5FileW.attrs.get('layout', '')) != 'columnar':
+        self.raiseAnError(IOError, f'The database "{self.name}" at "{self.filenameAndPath}" does not have a columnar layout!')
+      self._names = list(self.h5FileW['names'].asstr()[:])
+      self._nameIndex = dict((rname, r) for r, rname in enumerate(self._names))
+      self._kinds = dict((var, utils.toString(dataset.attrs['kind'])) for var, dataset in self.h5FileW['data'].items())
+      self.raiseAMessage('TOTAL NUMBER OF REALIZATIONS = ' + str(len(self._names)))
+    else:
+      self.h5FileW = self.openDatabaseW(self.filenameAndPath, 'w')
+      self.h5FileW.attrs['layout'] = 'columnar'
+      self.h5FileW.attrs['layoutVersion'] = self.layoutVersion
+      self.h5FileW.attrs['nRealizations'] = 0
+      self.h5FileW.create_dataset('names', shape=(0,), maxshape=(None,), dtype=h5.string_dtype(),
+                                  chunks=(self.chunkSize,), compression=self.compression)
+      self.h5FileW.create_group('data')
+      self.h5FileW.create_group('offsets')
+      self.h5FileW.create_group('shapes')
+
+  def __len__(self):
+    """
+      Overload len method
+      @ In, None
+      @ Out, __len__, int, number of realizations
+    """
+    return len(self._names)
+
+  def addExpectedMeta(self, keys, params={}):
+    """
+      Store expected metadata
+      @ In, keys, set(), the metadata list
+      @ In, params, dict, optional, {key:[indexes]}, keys of the dictionary are the variable names,
+        values of the dictionary are lists of the corresponding indexes/coordinates of given variable
+      @ Out, None
+    """
+    self.h5FileW.attrs.create('expectedMetadata', data=sorted(keys), dtype=h5.string_dtype())
+
+  def provideExpectedMetaKeys(self):
+    """
+      Provides the registered list of metadata keys for this entity.
+      @ In, None
+      @ Out, meta, tuple, (set(str),dict), expected keys (empty if none) and dictionary of expected keys corresponding to their indexes
+        i.e. {keys, [indexes]}
+    """
+    meta = set(utils.toString(key) for key in self.h5FileW.attrs.get('expectedMetadata', []))
+    return meta, {}
+
+  def addGroupInit(self, groupName, attributes=None):
+    """
+      Function to store the name of the root group (as in hdf5Database) and its attributes.
+      In the columnar layout there are no groups, so they are stored as attributes of the file.
+      @ In, groupName, string, group name
+      @ In, attributes, dict, optional, dictionary of attributes that must be added as metadata (None by default)
+      @ Out, None
+    """
+    self.h5FileW.attrs.update({} if attributes is None else attributes)
+    self.h5FileW.attrs['rootname'] = groupName + "_" + datetime.now().strftime("%m-%d-%Y-%H-%S")
+
+  def addGroup(self, rlz):
+    """
+      Function to add a realization into the database
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, None
+    """
+    parentID = rlz.get("RAVEN_parentID", [None])[0]
+    if parentID is not None and utils.toString(parentID) != 'None':
+      self.raiseAnError(IOError, f'The columnar layout of database "{self.name}" cannot store hierarchical (e.g. DET) '+
+                        'realizations; use the "groups" layout instead!')
+    prefix = rlz.get("prefix")
+    self.addRealization(str(prefix if mathUtils.isSingleValued(prefix) else prefix[0]), rlz)
+
+  def addRealization(self, name, rlz):
+    """
+      Function to add a realization with a given name into the database
+      @ In, name, str, the name of the realization (it is modified if already present)
+      @ In, rlz, dict, dictionary with the data and metadata to add
+      @ Out, None
+    """
+    if self.variables is not None:
+      # check if all variables are contained in the rlz dictionary
+      if not set(self.variables).issubset(rlz.keys()):
+        self.raiseAnError(IOError, "Not all the requested variables have been passed in the realization. Missing are: "+
+                          ",".join(list(set(self.variables).symmetric_difference(set(rlz.keys())))))
+    entry = {}
+    for var, value in rlz.items():
+      if var in self.skipVars:
+        continue
+      value = np.asarray(value)
+      # multidimensional values are stored flattened, keeping their shape to restore them when read
+      shape = value.shape if value.ndim > 1 else None
+      values = np.ravel(value)
+      kind = self.__getKind(var, values)
+      # as in hdf5Database, only the numeric variables are filtered
+      if kind == 'float' and self.variables is not None and var not in self.variables:
+        continue
+      entry[var] = (self.__encode(kind, values), shape)
+    while name in self._nameIndex:
+      name = name + "_" + name
+    self._nameIndex[name] = len(self._names)
+    self._names.append(name)
+    self._buffer.append(entry)
+    if len(self._buffer) >= self.bufferSize:
+      self.flush()
+
+  def __getKind(self, var, values):
+    """
+      Gets the kind of values of a variable, and checks it is consistent with the one of the values already stored.
+      @ In, var, str, the variable name
+      @ In, values, np.ndarray, the (1D) values of the variable
+      @ Out, kind, str, the kind of the values ("float", "bool", "str" or "json")
+    """
+    dtypeKind = values.dtype.kind
+    if dtypeKind == 'b':
+      kind = 'bool'
+    elif dtypeKind in 'iuf':
+      kind = 'float'
+    elif dtypeKind in 'US':
+      kind = 'str'
+    elif all(isinstance(val, (str, bytes)) for val in values):
+      kind = 'str'
+    elif all(isinstance(val, dict) for val in values):
+      kind = 'json'
+    elif all(mathUtils.isAFloatOrInt(val) for val in values):
+      kind = 'float'
+    else:
+      self.raiseAnError(TypeError, f'Database "{self.name}": values of variable "{var}" cannot be stored in the columnar layout!')
+    stored = self._kinds.setdefault(var, kind)
+    if stored != kind:
+      if {stored, kind} != {'bool', 'float'}:
+        self.raiseAnError(TypeError, f'Database "{self.name}": variable "{var}" has "{kind}" values, but "{stored}" values are stored!')
+      kind = stored
+    return kind
+
+  @staticmethod
+  def __encode(kind, values):
+    """
+      Converts the values of a variable in the type used to store them.
+      @ In, kind, str, the kind of the values
+      @ In, values, np.ndarray, the (1D) values
+      @ Out, encoded, np.ndarray, the values to store
+    """
+    if kind == 'float':
+      return values.astype(float)
+    if kind == 'bool':
+      return values.astype(bool)
+    if kind == 'str':
+      return np.array([val.decode() if isinstance(val, bytes) else str(val) for val in values], dtype=object)
+    return np.array([json.dumps(val) for val in values], dtype=object)
+
+  @staticmethod
+  def __decode(dataset, begin, end):
+    """
+      Reads values from a dataset, converting them back to their original type.
+      @ In, dataset, h5py.Dataset, the dataset of a variable
+      @ In, begin, int, the first value to read
+      @ In, end, int, the end of the values to read
+      @ Out, values, np.ndarray, the values
+    """
+    kind = utils.toString(dataset.attrs['kind'])
+    if kind == 'str':
+      return np.asarray(dataset.asstr()[begin:end], dtype=str)
+    if kind == 'json':
+      values = np.empty(end - begin, dtype=object)
+      values[:] = [json.loads(val) for val in dataset.asstr()[begin:end]]
+      return values
+    return dataset[begin:end]
+
+  def flush(self):
+    """
+      Function to write to disk the realizations collected in memory
+      @ In, None
+      @ Out, None
+    """
+    if not self._buffer:
+      return
+    stored = int(self.h5FileW.attrs['nRealizations'])
+    new = len(self._buffer)
+    names = self.h5FileW['names']
+    names.resize((stored + new,))
+    names[stored:] = np.array(self._names[stored:stored + new], dtype=object)
+    dataGroup, offsetsGroup, shapesGroup = self.h5FileW['data'], self.h5FileW['offsets'], self.h5FileW['shapes']
+    for var in set(dataGroup).union(*self._buffer):
+      kind = self._kinds[var]
+      pieces = [entry[var][0] for entry in self._buffer if var in entry]
+      lengths = np.array([len(entry[var][0]) if var in entry else 0 for entry in self._buffer])
+      shapes = [entry[var][1] if var in entry else None for entry in self._buffer]
+      if var not in dataGroup:
+        dataset = dataGroup.create_dataset(var, shape=(0,), maxshape=(None,), chunks=(self.chunkSize,),
+                                           dtype=h5.string_dtype() if kind in ('str', 'json') else kind,
+                                           compression=self.compression)
+        dataset.attrs['kind'] = kind
+        if stored:
+          # the realizations already stored do not have this variable
+          offsetsGroup.create_dataset(var, data=np.zeros(stored + 1, dtype=int), maxshape=(None,), chunks=(self.chunkSize,))
+      dataset = dataGroup[var]
+      if var not in offsetsGroup and np.any(lengths != 1):
+        # each realization has a single value so far
+        offsetsGroup.create_dataset(var, data=np.arange(stored + 1), maxshape=(None,), chunks=(self.chunkSize,))
+      size = len(dataset)
+      if pieces:
+        values = np.concatenate(pieces)
+        dataset.resize((size + len(values),))
+        dataset[size:] = values
+      if var in offsetsGroup:
+        offsets = offsetsGroup[var]
+        offsets.resize((stored + new + 1,))
+        offsets[stored + 1:] = size + np.cumsum(lengths)
+      if var not in shapesGroup and any(shape is not None for shape in shapes):
+        # the realizations already stored have 1D values
+        shapesGroup.create_dataset(var, data=np.full(stored, '', dtype=object), maxshape=(None,), dtype=h5.string_dtype(),
+                                   chunks=(self.chunkSize,), compression=self.compression)
+      if var in shapesGroup:
+        shapesDataset = shapesGroup[var]
+        shapesDataset.resize((stored + new,))
+        shapesDataset[stored:] = np.array(['' if shape is None else ','.join(str(dim) for dim in shape) for shape in shapes],
+                                          dtype=object)
+    self.h5FileW.attrs['nRealizations'] = stored + new
+    self._buffer = []
+    self.h5FileW.flush()
+
+  def retrieveAllHistoryNames(self, rootName=None):
+    """
+      Function to create a list of all the realization names present in the database
+      @ In, rootName, string, optional, if present, only the names that end with it are returned
+      @ Out, workingList, list, List of the realization names
+    """
+    if rootName:
+      rname = utils.toString(rootName)
+      return [name for name in self._names if name.endswith(rname)]
+    return list(self._names)
+
+  def getVariable(self, var, start=None, stop=None):
+    """
+      Reads the values of a variable for a range of realizations, without reading the rest of the database.
+      @ In, var, str, the variable name
+      @ In, start, int, optional, the index of the first realization (default: the first one)
+      @ In, stop, int, optional, the end of the range of realizations (default: the last one)
+      @ Out, values, np.ndarray or list, the values of the realizations (np.ndarray if the variable has a single
+        value in each realization, list of np.ndarray otherwise, with the original shape of multidimensional values)
+    """
+    self.flush()
+    if var not in self.h5FileW['data']:
+      self.raiseAnError(KeyError, f'Variable "{var}" not found in database "{self.name}"!')
+    dataset = self.h5FileW['data'][var]
+    start, stop, _ = slice(start, stop).indices(len(self._names))
+    stop = max(start, stop)
+    shapes = self.h5FileW['shapes'].get(var, None)
+    if var not in self.h5FileW['offsets']:
+      values = self.__decode(dataset, start, stop)
+      if shapes is None:
+        return values
+      values = [values[r:r + 1] for r in range(stop - start)]
+    else:
+      offsets = self.h5FileW['offsets'][var][start:stop + 1]
+      allValues = self.__decode(dataset, offsets[0], offsets[-1])
+      offsets -= offsets[0]
+      values = [allValues[offsets[r]:offsets[r + 1]] for r in range(stop - start)]
+    if shapes is not None:
+      for r, shape in enumerate(shapes.asstr()[start:stop]):
+        if shape:
+          values[r] = values[r].reshape(tuple(int(dim) for dim in shape.split(',')))
+    return values
+
+  def allRealizations(self):
+    """
+      Function to retrieve all the realizations, reading each variable at once
+      @ In, None
+      @ Out, rlzs, list, list of the realizations (dict), in insertion order
+    """
+    self.flush()
+    rlzs = [{} for _ in self._names]
+    for var in self.h5FileW['data']:
+      values = self.getVariable(var)
+      if isinstance(values, np.ndarray):
+        for r, rlz in enumerate(rlzs):
+          rlz[var] = values[r:r + 1]
+      else:
+        for rlz, vals in zip(rlzs, values):
+          if len(vals):
+            rlz[var] = vals
+    return rlzs
+
+  def _getRealizationByName(self, name, options={}):
+    """
+      Function to retrieve the realization named "name"
+      @ In, name, string, realization name
+      @ In, options, dict, dictionary of options (not used, present for compatibility with hdf5Database)
+      @ Out, (newData,attrs), tuple, tuple where position 0 = dict containing the realization, 1 = dictionary of some attributes
+    """
+    index = self._nameIndex.get(name, None)
+    if index is None:
+      self.raiseAnError(IOError, 'Realization named ' + name + ' not found in database "' + self.name + '"!')
+    newData = {}
+    for var in self.h5FileW['data']:
+      values = self.getVariable(var, index, index + 1)
+      values = values if isinstance(values, np.ndarray) else values[0]
+      if len(values):
+        newData[var] = values
+    attrs = {'nVars':len(newData.keys()), 'varKeys':newData.keys()}
+    return newData, attrs
+
+  def closeDatabaseW(self):
+    """
+      Function to close the database, writing the realizations still in memory
+      @ In,  None
+      @ Out, None
+    """
+    if self.fileOpen:
+      self.flush()
+      self.h5FileW.close()
+    self.fileOpen = False
+
+  def openDatabaseW(self, filename, mode='w'):
+    """
+      Function to open the database
+      @ In, filename, string, name of the file (string)
+      @ In, mode, string, open mode (default "w=write")
+      @ Out, fh5, hdf5 object, instance of hdf5
+    """
+    fh5 = h5.File(filename, mode)
+    self.fileOpen = True
+    return fh5
+
+def convertToColumnar(oldFile, newFile, compression='gzip'):
+  """
+    Converts a database created by hdf5Database (a group for each realization) into the columnar layout.
+    Only parallel (e.g. MonteCarlo) databases can be converted, since hierarchical (DET) ones cannot be stored
+    in the columnar layout.
+    @ In, oldFile, str, path of the database to convert
+    @ In, newFile, str, path of the converted database (overwritten if existing)
+    @ In, compression, str, optional, compression filter of the new datasets
+    @ Out, None
+  """
+  oldDatabase = hdf5Database('old_database', os.path.dirname(os.path.abspath(oldFile)), os.path.basename(oldFile), True)
+  newDatabase = hdf5ColumnarDatabase('new_database', os.path.dirname(os.path.abspath(newFile)), os.path.basename(newFile),
+                                     False, compression=compression)
+  meta, _ = oldDatabase.provideExpectedMetaKeys()
+  newDatabase.addExpectedMeta(meta)
+  # the names are kept (and in insertion order), since they identify the realizations
+  for name in oldDatabase.retrieveAllHistoryNames():
+    rlz, _ = oldDatabase._getRealizationByName(name, {'reconstruct':False})
+    newDatabase.addRealization(name, rlz)
+  newDatabase.closeDatabaseW()
+  oldDatabase.closeDatabaseW()
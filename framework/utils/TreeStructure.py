@@ -456,6 +456,7 @@ class HierarchicalNode(MessageUser):
     self.parent    = None
     self.depth     = 0
     self.iterCounter = 0
+    self._nameIndex = {name:[self]} # {name:[nodes]}, index of the nodes of the whole tree, shared by all of them
 
   def __eq__(self,other):
     """
@@ -558,6 +559,7 @@ class HierarchicalNode(MessageUser):
     else:
       node.depth      = self.depth + 1
     self._branches.append(node)
+    self._addToIndex(node)
 
   def updateDepth(self):
     """
@@ -581,6 +583,7 @@ class HierarchicalNode(MessageUser):
     for nod in nodes:
       nod.parentname = self.name
       nod.parent     = self
+      self._addToIndex(nod)
     self._branches.extend(nodes)
 
   def insertBranch(self, pos, node):
@@ -593,6 +596,7 @@ class HierarchicalNode(MessageUser):
     node.parentname = self.name
     node.parent     = self
     self._branches.insert(pos, node)
+    self._addToIndex(node)
 
   def removeBranch(self, node):
     """
@@ -601,6 +605,59 @@ class HierarchicalNode(MessageUser):
       @ Out, None
     """
     self._branches.remove(node)
+    self._removeFromIndex(node)
+
+  def _addToIndex(self, node):
+    """
+      Method used to add a (sub)tree that has been attached to this node to the name index of the tree
+      @ In, node, Node, the root of the attached (sub)tree
+      @ Out, None
+    """
+    for sub in node.iter():
+      sub._nameIndex = self._nameIndex
+      self._nameIndex.setdefault(sub.name, []).append(sub)
+
+  def _removeFromIndex(self, node):
+    """
+      Method used to remove a (sub)tree that has been detached from this node from the name index of the tree.
+      The detached (sub)tree gets its own index.
+      @ In, node, Node, the root of the detached (sub)tree
+      @ Out, None
+    """
+    index = {}
+    for sub in node.iter():
+      # nodes with the same name are equal (see __eq__), so check the identity
+      others = [nod for nod in self._nameIndex.get(sub.name, []) if nod is not sub]
+      if others:
+        self._nameIndex[sub.name] = others
+      else:
+        self._nameIndex.pop(sub.name, None)
+      sub._nameIndex = index
+      index.setdefault(sub.name, []).append(sub)
+
+  def findByName(self, name):
+    """
+      Method used to find a node with a given name in the whole tree this node belongs to.
+      It uses the name index of the tree, so it does not traverse the tree.
+      @ In, name, string, the name of the node
+      @ Out, node, Node, the first added node with that name, None if not found
+    """
+    nodes = self._nameIndex.get(name)
+    return nodes[0] if nodes else None
+
+  def rename(self, newName):
+    """
+      Method used to change the name of this node, updating the name index of the tree
+      @ In, newName, string, the new name
+      @ Out, None
+    """
+    others = [nod for nod in self._nameIndex.get(self.name, []) if nod is not self]
+    if others:
+      self._nameIndex[self.name] = others
+    else:
+      self._nameIndex.pop(self.name, None)
+    self.name = newName
+    self._nameIndex.setdefault(newName, []).append(self)
 
   def findBranch(self, path):
     """
@@ -641,6 +698,8 @@ class HierarchicalNode(MessageUser):
       @ Out, None
     """
     self.values.clear()
+    for node in self._branches:
+      self._removeFromIndex(node)
     self._branches = []
 
   def get(self, key, default=None):
@@ -874,7 +933,7 @@ class HierarchicalTree(MessageUser):
     else:
       node = self.find(path)
     if node != None:
-      node.name = newName
+      node.rename(newName)
 
   def iter(self, name=None):
     """
@@ -923,6 +982,14 @@ class HierarchicalTree(MessageUser):
       path = "." + path
     return self._rootnode.findBranch(path)
 
+  def findByName(self, name):
+    """
+      Method to find the node with a given name anywhere in the tree, using the name index (no traversal)
+      @ In, name, string, the node name
+      @ Out, findByName, Node, first added node with that name or None if no node was found
+    """
+    return self._rootnode.findByName(name)
+
   def findall(self, path):
     """
       Method to find the all toplevel nodes with a given name
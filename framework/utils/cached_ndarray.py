@@ -384,3 +384,273 @@ class cNDarray(object):
     assert(abs(index) < self.width)
     self.values = np.delete(self.values,index,axis=1)
     self.width -= 1
+
+## types of the entries that can be stored in the typed (not object) columns of the cColumnarArray
+_columnTypes = {float: np.float64, np.float64: np.float64,
+                int: np.int64, np.int64: np.int64,
+                bool: np.bool_, np.bool_: np.bool_}
+
+def _canCast(value, dtype):
+  """
+    Checks if a single value can be stored in a typed column without changing its kind.
+    @ In, value, object, the value to store
+    @ In, dtype, np.dtype, the type of the column
+    @ Out, _canCast, bool, True if the value is a scalar castable to dtype ('same_kind' rule)
+  """
+  if not np.isscalar(value):
+    return False
+  return np.can_cast(np.min_scalar_type(value), dtype, 'same_kind')
+
+class cColumnarArray(object):
+  """
+    Column-wise caching of realizations, used to collect the samples in the DataObjects.
+    Differently from the cNDarray, each entity (column) is stored in its own np.ndarray: if all the entries
+    of a column are scalars of the same type (float, int or bool), the column is a contiguous typed array,
+    otherwise (e.g. strings, np.ndarray values of ND variables, mixed types) it is an object array.
+    As in the cNDarray, the cached capacity is quadrupled when it is exhausted.
+  """
+  ### CONSTRUCTOR ###
+  def __init__(self, width, length=None):
+    """
+      Constructor.
+      @ In, width, int, the number of entities aka columns
+      @ In, length, int, optional, initial capacity (number of samples) to allocate
+      @ Out, None
+    """
+    self.size     = 0                                   # number of rows (samples) with actual data
+    self.width    = width                               # number of entities aka columns
+    self.capacity = max(1, length if length is not None else 100) # cached size of each column
+    self.columns  = [None]*width                        # np.ndarray for each column, allocated at the first entry
+
+  ### PROPERTIES ###
+  @property
+  def shape(self):
+    """
+      Shape property, as used in np.ndarray structures.
+      @ In, None
+      @ Out, (int,int), the (#rows, #columns) of useful data in this cached array
+    """
+    return (self.size,self.width)
+
+  ### BUILTINS ###
+  def __array__(self, dtype = None):
+    """
+      so that numpy's array() returns values
+      @ In, dtype, np.type, the requested type of the array
+      @ Out, __array__, numpy.ndarray, the requested array
+    """
+    data = self.getData()
+    return data if dtype is None else data.astype(dtype)
+
+  def __getitem__(self,val):
+    """
+      Get item method. As for a 2D np.ndarray, "val" can be a row index, a (row, column) tuple or any other
+      slicing object (e.g. :, 1:3, np.where(...)); selecting a single column is cheap, the other selections
+      (with more than one row) need to assemble the full object array.
+      @ In, val, slice object, the slicing object
+      @ Out, __getitem__, np.ndarray or object, the element(s)
+    """
+    if isinstance(val, tuple) and len(val) == 2:
+      rows, cols = val
+      if isinstance(cols, (int, np.integer)):
+        return self.getColumn(cols)[rows]
+      if isinstance(rows, (int, np.integer)):
+        cols = list(cols) if isinstance(cols, tuple) else cols
+        return self._getRow(rows, np.arange(self.width)[cols])
+    elif isinstance(val, (int, np.integer)):
+      return self._getRow(val, range(self.width))
+    return self.getData()[val]
+
+  def __setitem__(self,val,value):
+    """
+      Set item method, for a single element.
+      @ In, val, tuple, the (row, column) indices of the element
+      @ In, value, object, the new value of the element
+      @ Out, None
+    """
+    row, col = val
+    self._store(col, range(self.size)[row], value)
+
+  def __iter__(self):
+    """
+      Overload of iterator
+      @ In, None
+      @ Out, __iter__, iterator, iterator over the rows
+    """
+    return (self._getRow(r, range(self.width)) for r in range(self.size))
+
+  def __len__(self):
+    """
+      Return size, which is the number of samples, independent of entities, containing useful data.
+      Does not include cached entries that have not yet been filled.
+      @ In, None
+      @ Out, __len__, integer, size
+    """
+    return self.size
+
+  def __repr__(self):
+    """
+      overload of __repr__ function
+      @ In, None
+      @ Out, __repr__, string, the representation string
+    """
+    return repr(self.getData())
+
+  ### UTILITY FUNCTIONS ###
+  def append(self,entry):
+    """
+      Append method, adds a single sample (row).
+      @ In, entry, list or np.ndarray, the value of each entity in the sample (length must be the width)
+      @ Out, None
+    """
+    if len(entry) != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need {} entries, but got {}!'.format(self.width, len(entry)))
+    if self.size + 1 > self.capacity:
+      self._grow(self.size + 1)
+    for c, value in enumerate(entry):
+      self._store(c, self.size, value)
+    self.size += 1
+
+  def extend(self,columns):
+    """
+      Adds several samples (rows) at once, provided column by column. Typed 1D np.ndarray columns
+      are copied with a single assignment; the entries of the other columns are stored one by one.
+      @ In, columns, list, for each entity the sequence (e.g. np.ndarray) of its values in the new samples
+      @ Out, None
+    """
+    if len(columns) != self.width:
+      raise IOError('Tried to add new data to cColumnarArray.  Need {} columns, but got {}!'.format(self.width, len(columns)))
+    lengths = set(len(vals) for vals in columns)
+    if len(lengths) > 1:
+      raise IOError('Tried to add new data to cColumnarArray.  Columns have different lengths: {}'.format(sorted(lengths)))
+    new = lengths.pop() if lengths else 0
+    if new == 0:
+      return
+    if self.size + new > self.capacity:
+      self._grow(self.size + new)
+    start = self.size
+    for c, vals in enumerate(columns):
+      if isinstance(vals, np.ndarray) and vals.ndim == 1 and vals.dtype != object:
+        column = self.columns[c]
+        if column is None:
+          dtype = _columnTypes.get(vals.dtype.type, None)
+          if dtype is not None:
+            column = self.columns[c] = np.empty(self.capacity, dtype=dtype)
+        # same rule of _store: the values are copied if they can be cast to the column type (e.g. int into float)
+        if column is not None and column.dtype != object and np.can_cast(vals.dtype, column.dtype, 'same_kind'):
+          column[start:start+new] = vals
+          continue
+      for r in range(new):
+        self._store(c, start+r, vals[r])
+    self.size += new
+
+  def addEntity(self,vals,firstEver=False):
+    """
+      Adds a column to the dataset.
+      @ In, vals, list, as list(#,#,#) where # is either single-valued or numpy array
+      @ Out, None
+    """
+    # the entries of new columns are usually arrays (e.g. misaligned indexes), so use an object column
+    new = np.empty(self.capacity, dtype=object)
+    for r, value in enumerate(vals):
+      new[r] = value
+    self.columns.append(new)
+    self.width += 1
+
+  def getColumn(self,index):
+    """
+      Returns the values of an entity, as a (typed if possible) np.ndarray.
+      @ In, index, int, index of the column
+      @ Out, getColumn, np.ndarray, values of the column up to the used size
+    """
+    column = self.columns[index]
+    if column is None:
+      return np.empty(0, dtype=object)
+    return column[:self.size]
+
+  def getData(self):
+    """
+      Returns the data as a 2D object array.
+      @ In, None
+      @ Out, getData, np.ndarray, data up to the used size with shape (# samples, # entities)
+    """
+    data = np.empty((self.size,self.width),dtype=object)
+    for c in range(self.width):
+      if self.size > 0:
+        # list keeps the np scalar types of the typed columns (and does not unfold the arrays of the object ones)
+        data[:,c] = list(self.getColumn(c))
+    return data
+
+  def removeEntity(self,index):
+    """
+      Removes a column from this dataset
+      @ In, index, int, index of entry to remove
+      @ Out, None
+    """
+    assert(abs(index) < self.width)
+    self.columns.pop(index)
+    self.width -= 1
+
+  def _getRow(self,index,cols):
+    """
+      Returns (some of) the entries of a sample.
+      @ In, index, int, index of the row
+      @ In, cols, iterable, indices of the columns to return
+      @ Out, row, np.ndarray, object array with the requested entries
+    """
+    index = range(self.size)[index]
+    cols = list(cols)
+    row = np.empty(len(cols),dtype=object)
+    for i, c in enumerate(cols):
+      row[i] = self.columns[c][index]
+    return row
+
+  def _grow(self,needed):
+    """
+      Increases the capacity of the columns to (at least) the needed number of samples.
+      @ In, needed, int, required capacity
+      @ Out, None
+    """
+    # same growth factor of cNDarray (and c1darray): the capacity is quadrupled
+    while self.capacity < needed:
+      self.capacity += self.capacity*3
+    for c, column in enumerate(self.columns):
+      if column is not None:
+        new = np.empty(self.capacity, dtype=column.dtype)
+        new[:self.size] = column[:self.size]
+        self.columns[c] = new
+
+  def _store(self,col,row,value):
+    """
+      Stores a value in a column, switching the column to an object array if the value cannot be cast
+      to its type (e.g. a float in an int column, while an int in a float column is kept typed).
+      @ In, col, int, index of the column
+      @ In, row, int, index of the row
+      @ In, value, object, the value to store
+      @ Out, None
+    """
+    column = self.columns[col]
+    if column is None:
+      column = self.columns[col] = np.empty(self.capacity, dtype=_columnTypes.get(type(value), object))
+    elif column.dtype != object and not _canCast(value, column.dtype):
+      column = self._toObjectColumn(col, row)
+    try:
+      column[row] = value
+    except OverflowError:
+      # e.g. python integers not representable as int64
+      column = self._toObjectColumn(col, row)
+      column[row] = value
+
+  def _toObjectColumn(self,col,row):
+    """
+      Converts a typed column into an object array.
+      @ In, col, int, index of the column
+      @ In, row, int, index of the row being stored; the rows before it (also beyond the used size,
+        when called while extending) are already filled and are kept
+      @ Out, column, np.ndarray, the new object column
+    """
+    filled = max(self.size, row)
+    column = np.empty(self.capacity, dtype=object)
+    column[:filled] = list(self.columns[col][:filled])
+    self.columns[col] = column
+    return column
@@ -0,0 +1,33 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+ This file contains the utilities shared by the operators of the Genetic Algorithm.
+ created on 10/18/2026
+ @author: agent
+"""
+
+import numpy as np
+import xarray as xr
+
+def chromosomesToDataArray(chromosomes, variables):
+  """
+    Wraps an array of chromosomes in the container used by the Genetic Algorithm operators
+    @ In, chromosomes, np.array, the chromosomes (nChromosomes x nGenes)
+    @ In, variables, list, the genes (variables) names
+    @ Out, chromosomes, xr.DataArray, the chromosomes with dims ['chromosome','Gene']
+  """
+  return xr.DataArray(chromosomes,
+                      dims=['chromosome','Gene'],
+                      coords={'chromosome': np.arange(np.shape(chromosomes)[0]),
+                              'Gene':variables})
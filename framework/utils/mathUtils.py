@@ -677,6 +677,71 @@ def evalFourier(period,C,p,t):
   fourier = C * np.sin(2. * np.pi * t / period + p)
   return fourier
 
+def simulateStateSpace(matrices, msrShocks, stateShocks, initialState):
+  """
+    Simulates many realizations of a linear Gaussian state space model at once, given the shocks:
+      y_t = d_t + Z_t a_t + e_t
+      a_{t+1} = c_t + T_t a_t + R_t h_t
+    Each matrix can be time-varying, in which case its last axis is the time-like one
+    (as in statsmodels' state space representations).
+    @ In, matrices, dict, 'design' (Z), 'obs_intercept' (d), 'transition' (T), 'state_intercept' (c)
+                          and 'selection' (R) matrices of the model
+    @ In, msrShocks, np.array, measurement shocks e shaped [samples, time, k_endog]
+    @ In, stateShocks, np.array, state shocks h shaped [samples, time, k_posdef]
+    @ In, initialState, np.array, initial states a_0 shaped [samples, k_states]
+    @ Out, simulated, np.array, simulated observations y shaped [samples, time, k_endog]
+  """
+  numTimes = msrShocks.shape[1]
+  # number of dimensions of the time-invariant matrices
+  rank = {'design': 2, 'obs_intercept': 1, 'transition': 2, 'state_intercept': 1, 'selection': 2}
+  timeVarying = dict((name, matrices[name].ndim > r) for name, r in rank.items())
+  # the state shocks always enter through the selection matrix, so apply it at once if possible
+  if not timeVarying['selection']:
+    stateShocks = stateShocks @ matrices['selection'].T
+  simulated = np.zeros(msrShocks.shape)
+  state = np.array(initialState, dtype=float)
+  for t in range(numTimes):
+    mats = dict((name, matrices[name][..., t] if timeVarying[name] else matrices[name]) for name in rank)
+    simulated[:, t, :] = mats['obs_intercept'] + state @ mats['design'].T + msrShocks[:, t, :]
+    shocks = stateShocks[:, t, :] @ mats['selection'].T if timeVarying['selection'] else stateShocks[:, t, :]
+    state = mats['state_intercept'] + state @ mats['transition'].T + shocks
+  return simulated
+
+def andersonMixing(iterates, residuals, relaxation=1.0):
+  """
+    Computes the next iterate of a fixed-point iteration x = G(x) using the Anderson mixing of the history
+    of the iterates and of their residuals f = G(x) - x (with a history of one, it reduces to a relaxed
+    Picard iteration).
+    @ In, iterates, list(np.array), the last iterates x (the most recent last)
+    @ In, residuals, list(np.array), the residuals f of the iterates (same order of the iterates)
+    @ In, relaxation, float, optional, the mixing (relaxation) parameter
+    @ Out, new, np.array, the next iterate
+  """
+  x = np.asarray(iterates[-1], dtype=float)
+  f = np.asarray(residuals[-1], dtype=float)
+  new = x + relaxation * f
+  if len(iterates) > 1:
+    deltaX = np.diff(np.asarray(iterates, dtype=float), axis=0).T
+    deltaF = np.diff(np.asarray(residuals, dtype=float), axis=0).T
+    gamma = np.linalg.lstsq(deltaF, f, rcond=None)[0]
+    new -= (deltaX + relaxation * deltaF) @ gamma
+  return new
+
+def aitkenRelaxation(prevResidual, residual, prevRelaxation):
+  """
+    Computes the dynamic relaxation factor of the (vector) Aitken acceleration of a fixed-point iteration
+    x = G(x), so that the next iterate is x + factor * f, with f = G(x) - x the residual.
+    @ In, prevResidual, np.array, the residual of the previous iterate
+    @ In, residual, np.array, the residual of the current iterate
+    @ In, prevRelaxation, float, the relaxation factor used for the previous iterate
+    @ Out, relaxation, float, the relaxation factor for the current iterate
+  """
+  delta = np.asarray(residual, dtype=float) - np.asarray(prevResidual, dtype=float)
+  norm = np.dot(delta, delta)
+  if norm == 0.:
+    return prevRelaxation
+  return -prevRelaxation * np.dot(prevResidual, delta) / norm
+
 def orderClusterLabels(originalLabels):
   """
     Regulates labels such that the first unique one to appear is 0, second one is 1, and so on.
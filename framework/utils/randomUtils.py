@@ -59,6 +59,36 @@ class BoxMullerGenerator:
       val = self.queue[engine].pop()
     return val
 
+  def generateArray(self, n, engine=None):
+    """
+      Provides an array of normally-distributed pseudorandom values, identical to the values that
+      "n" subsequent calls to "generate" would yield, without looping over them.
+      @ In, n, int, number of values to provide
+      @ In, engine, instance, optional, random number generator
+      @ Out, vals, np.array, random values
+    """
+    vals = np.zeros(n)
+    with self.__queueLock:
+      queue = self.queue[engine]
+      # values already in the queue come first
+      start = 0
+      while queue and start < n:
+        vals[start] = queue.pop()
+        start += 1
+      remaining = n - start
+      if remaining > 0:
+        pairs = (remaining + 1) // 2
+        u = random(2, pairs, keepMatrix=True, engine=engine)
+        z1, z2 = self._transform(u[:, 0], u[:, 1])
+        # "generate" pops the second value of each pair first
+        new = np.empty(2 * pairs)
+        new[0::2] = z2
+        new[1::2] = z1
+        vals[start:] = new[:remaining]
+        if remaining % 2:
+          queue.append(z1[-1])
+    return vals
+
   def createSamples(self,engine=None):
     """
       Sample calculator.  Because Box Muller does batches of 2, add them to a queue.
@@ -66,6 +96,16 @@ class BoxMullerGenerator:
       @ Out, (z1,z2), tuple, two independent random values
     """
     u1,u2 = random(2,engine=engine)
+    return self._transform(u1, u2)
+
+  @staticmethod
+  def _transform(u1, u2):
+    """
+      Box-Muller transform of uniform samples into normal samples.
+      @ In, u1, float or np.array, uniform samples on [0,1]
+      @ In, u2, float or np.array, uniform samples on [0,1]
+      @ Out, (z1,z2), tuple, independent normal samples
+    """
     z1 = np.sqrt(-2.*np.log(u1))*np.cos(2.*np.pi*u2)
     z2 = np.sqrt(-2.*np.log(u1))*np.sin(2.*np.pi*u2)
     return z1,z2
@@ -144,10 +184,8 @@ def random(dim=1, samples=1, keepMatrix=False, engine=None):
   if isinstance(engine, np.random.RandomState):
     vals = engine.rand(samples,dim)
   elif isinstance(engine, findCrowModule('randomENG').RandomClass):
-    vals = np.zeros([samples, dim])
-    for i in range(len(vals)):
-      for j in range(len(vals[0])):
-        vals[i][j] = engine.random()
+    # filled row by row, as subsequent calls to engine.random() would do
+    vals = np.fromiter(engine.randomVector(samples*dim), dtype=float, count=samples*dim).reshape(samples, dim)
   # regardless of stoch env
   if keepMatrix:
     return vals
@@ -169,9 +207,7 @@ def randomNormal(size=(1,), keepMatrix=False, engine=None):
   if isinstance(engine, np.random.RandomState):
     vals = engine.randn(*size)
   elif isinstance(engine, findCrowModule('randomENG').RandomClass):
-    vals = np.zeros(np.prod(size))
-    for i in range(len(vals)):
-      vals[i] = boxMullerGen.generate(engine=engine)
+    vals = boxMullerGen.generateArray(int(np.prod(size)), engine=engine)
     vals.shape = size
   if keepMatrix:
     return vals
@@ -17,11 +17,15 @@ This implements comparing CSV files in order.
 from __future__ import division, print_function, unicode_literals, absolute_import
 import sys
 import csv
+import itertools
+
+import numpy as np
 
 from Tester import Differ
 
 whoAmI = False # enable to show test dir and out files
 debug = False # enable to increase printing
+chunk_rows = 10000 # number of rows read and compared at once
 
 def to_float(s_val):
   """
@@ -34,6 +38,23 @@ def to_float(s_val):
   except ValueError:
     return s_val
 
+def to_floats(values):
+  """
+    Converts the strings to floats, where possible.
+    @ In, values, list(str), values to convert
+    @ Out, floats, np.ndarray, the float values (nan where not a float)
+    @ Out, is_number, np.ndarray, True where the value is a float
+  """
+  try:
+    # usually, all the values of a column are numbers
+    return np.array(values, dtype=float), np.ones(len(values), dtype=bool)
+  except ValueError:
+    converted = [to_float(val) for val in values]
+    is_number = np.array([isinstance(val, float) for val in converted], dtype=bool)
+    floats = np.array([val if number else np.nan for val, number in zip(converted, is_number)],
+                      dtype=float)
+    return floats, is_number
+
 class OrderedCSVDiffer:
   """
     Used for comparing two CSV files without regard for column, row orders
@@ -92,22 +113,107 @@ class OrderedCSVDiffer:
     """
     if not is_number:
       return a_obj == b_obj, 0
+    match, diff = self.matches_array(np.array([a_obj], dtype=float),
+                                     np.array([b_obj], dtype=float), tol)
+    return bool(match[0]), float(diff[0])
+
+  def matches_array(self, a_arr, b_arr, tol):
+    """
+      Determines if two arrays of floats match within tolerance, element by element.
+      @ In, a_arr, np.ndarray, first values ("measured")
+      @ In, b_arr, np.ndarray, second values ("actual")
+      @ In, tol, float, tolerance at which to hold match
+      @ Out, matches, np.ndarray, True where matching
+      @ Out, diff, np.ndarray, metric difference between entries (relative diff)
+    """
     if self.__ignore_sign:
-      a_obj = abs(a_obj)
-      b_obj = abs(b_obj)
-    if abs(a_obj) < self.__zero_threshold:
-      a_obj = 0.0
-    if abs(b_obj) < self.__zero_threshold:
-      b_obj = 0.0
-    if self.__check_absolute_values:
-      return abs(a_obj-b_obj) < tol, abs(a_obj-b_obj)
-    # otherwise, relative error
-    scale = abs(b_obj) if b_obj != 0 else 1.0
-    return abs(a_obj - b_obj) < scale * tol, abs((a_obj - b_obj) / scale)
+      a_arr = np.abs(a_arr)
+      b_arr = np.abs(b_arr)
+    a_arr = np.where(np.abs(a_arr) < self.__zero_threshold, 0.0, a_arr)
+    b_arr = np.where(np.abs(b_arr) < self.__zero_threshold, 0.0, b_arr)
+    with np.errstate(invalid='ignore', over='ignore'):
+      delta = np.abs(a_arr - b_arr)
+      if self.__check_absolute_values:
+        return delta < tol, delta
+      # otherwise, relative error
+      scale = np.where(b_arr != 0, np.abs(b_arr), 1.0)
+      return delta < scale * tol, delta / scale
+
+  def compare_rows(self, gold_rows, test_rows, gold_headers, test_indexes, first_row):
+    """
+      Compares a chunk of rows, column by column.
+      @ In, gold_rows, list(list(str)), rows of the gold file
+      @ In, test_rows, list(list(str)), rows of the test file, same length of gold_rows
+      @ In, gold_headers, list(str), names of the columns
+      @ In, test_indexes, list(int), for each gold column, the index of the test column
+      @ In, first_row, int, index of the first row of the chunk
+      @ Out, problems, list((int, int, str)), (row, column, message) of the differences
+      @ Out, diffs, list(np.ndarray), metric differences of the compared entries
+    """
+    problems = []
+    diffs = []
+    row_ids = range(len(gold_rows))
+    if test_indexes == range(len(gold_headers)):
+      # identical rows match, unless they contain not finite numbers (nan, inf), whose
+      # representation is the only one of a float containing an "n"
+      row_ids = [row for row, (gold, test) in enumerate(zip(gold_rows, test_rows))
+                 if gold != test or 'n' in ''.join(gold).lower()]
+      diffs.append(np.zeros((len(gold_rows) - len(row_ids)) * len(gold_headers)))
+      if not row_ids:
+        return problems, diffs
+      gold_rows = [gold_rows[row] for row in row_ids]
+      test_rows = [test_rows[row] for row in row_ids]
+    row_ids = np.asarray(row_ids)
+    gold_columns = list(itertools.zip_longest(*gold_rows, fillvalue=''))
+    test_columns = list(itertools.zip_longest(*test_rows, fillvalue=''))
+    for column, name in enumerate(gold_headers):
+      gold_column = gold_columns[column] if column < len(gold_columns) else ('',)*len(gold_rows)
+      test_index = test_indexes[column]
+      test_column = test_columns[test_index] if test_index < len(test_columns) \
+                    else ('',)*len(test_rows)
+      # identical entries match, unless they are not finite numbers
+      rows = [row for row, (gold, test) in enumerate(zip(gold_column, test_column))
+              if gold != test or 'n' in gold.lower()]
+      diffs.append(np.zeros(len(gold_column) - len(rows)))
+      if not rows:
+        continue
+      if len(rows) == len(gold_column):
+        ids = row_ids
+        gold_strings = gold_column
+        test_strings = test_column
+      else:
+        ids = row_ids[rows]
+        gold_strings = [gold_column[row] for row in rows]
+        test_strings = [test_column[row] for row in rows]
+      gold_values, gold_numbers = to_floats(gold_strings)
+      test_values, test_numbers = to_floats(test_strings)
+      # different types
+      for index in np.nonzero(gold_numbers != test_numbers)[0]:
+        problems.append((first_row + ids[index], column, "Different types in "+name+" for "
+                         +str(to_float(gold_strings[index]))+" and "
+                         +str(to_float(test_strings[index]))))
+      # numbers
+      numbers = gold_numbers & test_numbers
+      match, diff = self.matches_array(gold_values[numbers], test_values[numbers], self.__rel_err)
+      diffs.append(diff)
+      for index in np.nonzero(numbers)[0][~match]:
+        problems.append((first_row + ids[index], column, "Different values in "+name+" for "
+                         +str(float(gold_values[index]))+" and "
+                         +str(float(test_values[index]))))
+      # strings
+      words = ~(gold_numbers | test_numbers)
+      diffs.append(np.zeros(np.count_nonzero(words)))
+      for index in np.nonzero(words)[0]:
+        if gold_strings[index] != test_strings[index]:
+          problems.append((first_row + ids[index], column, "Different values in "+name+" for "
+                           +str(gold_strings[index])+" and "
+                           +str(test_strings[index])))
+    return problems, diffs
 
   def diff(self):
     """
       Run the comparison.
+      The files are read and compared in chunks of rows, to bound the memory used by large files.
       @ In, None
       @ Out, same, bool, if True then files are the same
       @ Out, messages, str, messages to print on fail
@@ -119,22 +225,14 @@ class OrderedCSVDiffer:
       msg = []
       # load test file
       try:
-        try:
-          test_csv_file = open(test_filename, newline='')
-        except TypeError:
-          #We must be in Python 2
-          test_csv_file = open(test_filename, 'rb')
+        test_csv_file = open(test_filename, newline='')
       # if file doesn't exist, that's another problem
       except IOError:
         msg.append('Test file does not exist!')
         same = False
       # load gold file
       try:
-        try:
-          gold_csv_file = open(gold_filename, newline='')
-        except TypeError:
-          #We must be in Python 2
-          gold_csv_file = open(gold_filename, 'rb')
+        gold_csv_file = open(gold_filename, newline='')
       # if file doesn't exist, that's another problem
       except IOError:
         msg.append('Gold file does not exist!')
@@ -143,65 +241,71 @@ class OrderedCSVDiffer:
       if not same:
         self.finalize_message(same, msg, test_filename)
         continue
-      # at this point, we've loaded both files (even if they're empty), so compare them.
-      ## first, cover the case when both files are empty.
-      gold_rows = list(csv.reader(gold_csv_file))
-      test_rows = list(csv.reader(test_csv_file))
-      ## at this point, both files have data loaded
-      ## check columns using symmetric difference
-      gold_headers = gold_rows[0]
-      test_headers = test_rows[0]
-      diff_columns = set(gold_headers)^set(test_headers)
-      if len(diff_columns) > 0:
-        same = False
-        msg.append('Columns are not the same! Different: {}'.format(', '.join(diff_columns)))
-        self.finalize_message(same, msg, test_filename)
-        continue
-      ## check index length
-      if len(gold_rows) != len(test_rows):
-        same = False
-        msg.append('Different number of entires in Gold ({}) versus Test ({})!'
-                   .format(len(gold_rows), len(test_rows)))
-        self.finalize_message(same, msg, test_filename)
-        continue
-      ## at this point both CSVs have the same shape, with the same header contents.
-      ## figure out column indexs
-      if gold_headers == test_headers:
-        test_indexes = range(len(gold_headers))
-      else:
-        test_indexes = [test_headers.index(s) for s in gold_headers]
-      # So now for a test row:
-      #  gold_row[x][y] should match test_row[x][test_indexes[y]]
-      ## check for matching rows
-      diffs = []
-      for idx in range(1, len(gold_rows)):
-        gold_row = gold_rows[idx]
-        test_row = test_rows[idx]
-        for column in range(len(gold_row)):
-          gold_value = to_float(gold_row[column])
-          test_value = to_float(test_row[test_indexes[column]])
-          match_is_number = isinstance(gold_value, float)
-          val_is_number = isinstance(test_value, float)
-          if match_is_number != val_is_number:
-            same = False
-            msg.append("Different types in "+gold_headers[column]+" for "
-                       +str(gold_value)+" and "
-                       +str(test_value))
-          else:
-            match, diff = self.matches(gold_value, test_value, match_is_number, self.__rel_err)
-            diffs.append(diff)
-            if not match:
-              same = False
-              msg.append("Different values in "+gold_headers[column]+" for "
-                         +str(gold_value)+" and "
-                         +str(test_value))
-      if diffs:
-        msg.append('| Difference | statistics:')
-        msg.append('  MEAN    diff.: {:1.9e}'.format(sum(diffs)/float(len(diffs))))
-        msg.append('  LARGEST diff.: {:1.9e}'.format(max(diffs)))
+      with test_csv_file, gold_csv_file:
+        same, msg = self.diff_files(csv.reader(gold_csv_file), csv.reader(test_csv_file))
       self.finalize_message(same, msg, test_filename)
     return self.__same, self.__message
 
+  def diff_files(self, gold_reader, test_reader):
+    """
+      Compares the content of two CSV files.
+      @ In, gold_reader, csv.reader, reader of the gold file
+      @ In, test_reader, csv.reader, reader of the test file
+      @ Out, same, bool, True if the files are the same
+      @ Out, msg, list(str), messages that explain differences
+    """
+    msg = []
+    ## check columns using symmetric difference
+    gold_headers = next(gold_reader, [])
+    test_headers = next(test_reader, [])
+    diff_columns = set(gold_headers)^set(test_headers)
+    if len(diff_columns) > 0:
+      msg.append('Columns are not the same! Different: {}'.format(', '.join(diff_columns)))
+      return False, msg
+    ## at this point both CSVs have the same header contents.
+    ## figure out column indexs
+    if gold_headers == test_headers:
+      test_indexes = range(len(gold_headers))
+    else:
+      test_indexes = [test_headers.index(s) for s in gold_headers]
+    # So now for a test row:
+    #  gold_row[x][y] should match test_row[x][test_indexes[y]]
+    ## check for matching rows, one chunk at a time
+    problems = []
+    diff_count = 0
+    diff_sum = 0.0
+    diff_max = None
+    rows = 1
+    while True:
+      gold_rows = list(itertools.islice(gold_reader, chunk_rows))
+      test_rows = list(itertools.islice(test_reader, chunk_rows))
+      if len(gold_rows) != len(test_rows):
+        ## check index length
+        gold_length = rows + len(gold_rows) + sum(1 for _ in gold_reader)
+        test_length = rows + len(test_rows) + sum(1 for _ in test_reader)
+        msg.append('Different number of entires in Gold ({}) versus Test ({})!'
+                   .format(gold_length, test_length))
+        return False, msg
+      if not gold_rows:
+        break
+      chunk_problems, chunk_diffs = self.compare_rows(gold_rows, test_rows, gold_headers,
+                                                      test_indexes, rows)
+      problems.extend(chunk_problems)
+      for diffs in chunk_diffs:
+        if len(diffs):
+          diff_count += len(diffs)
+          diff_sum += diffs.sum()
+          diff_max = diffs.max() if diff_max is None else max(diff_max, diffs.max())
+      rows += len(gold_rows)
+    # messages in the order of the rows, then of the columns
+    problems.sort(key=lambda problem: problem[:2])
+    msg.extend(problem[2] for problem in problems)
+    if diff_count:
+      msg.append('| Difference | statistics:')
+      msg.append('  MEAN    diff.: {:1.9e}'.format(diff_sum/float(diff_count)))
+      msg.append('  LARGEST diff.: {:1.9e}'.format(diff_max))
+    return not problems, msg
+
 
 class OrderedCSV(Differ):
   """
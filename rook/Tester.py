@@ -155,6 +155,7 @@ class TestResult:
     self.message = None
     self.output = None
     self.runtime = None
+    self.diff_time = None
 
 
 class Differ:
@@ -565,6 +566,7 @@ class Tester:
       return self.results
     self.process_results(output)
     self._wait_for_all_written()
+    start_time = time.time()
     for differ in self.__differs:
       same, message = differ.check_output()
       if not same:
@@ -572,6 +574,7 @@ class Tester:
           self.results.group = self.group_diff
           self.results.message = "" #remove success message.
         self.results.message += "\n" + message
+    self.results.diff_time = time.time() - start_time
     return self.results
 
   def _wait_for_all_written(self):
@@ -77,6 +77,9 @@ parser.add_argument('--heavy', action='store_true',
                     help='Run only heavy tests')
 parser.add_argument('--no-color', action='store_true',
                     help='disable ANSI escape colors')
+parser.add_argument('--timing-report', dest='timing_report', type=int,
+                    help='print the given number of slowest tests, with the time spent '+
+                    'running them and checking their outputs (default: 0)')
 
 parser.add_argument('--list-testers', action='store_true', dest='list_testers',
                     help='Print out the possible testers')
@@ -262,6 +265,26 @@ def sec_format(runtime):
     return "{:6.2f}sec".format(runtime)
   return "  None!  "
 
+def print_timing_report(test_results, number):
+  """
+    Prints the slowest tests, with the time spent running them and checking their outputs.
+    @ In, test_results, list(Tester.TestResult), the results of the tests (None if not run)
+    @ In, number, int, the number of tests to print
+    @ Out, None
+  """
+  timed = [(test_result.runtime + (test_result.diff_time or 0.0), test_result, timed_name)
+           for test_result, timed_name in zip(test_results, test_name_list)
+           if test_result is not None and isinstance(test_result.runtime, float)]
+  timed.sort(key=lambda entry: entry[0], reverse=True)
+  total = sum(entry[0] for entry in timed)
+  print("Slowest {} of {} tests ({} total):".format(min(number, len(timed)), len(timed),
+                                                   sec_format(total).strip()))
+  print("  {:>9s} {:>9s} {:>9s}  {}".format("total", "run", "diff", "test"))
+  for test_time, test_result, timed_name in timed[:number]:
+    print("  {} {} {}  {}{}{}".format(sec_format(test_time), sec_format(test_result.runtime),
+                                      sec_format(test_result.diff_time), Colors.name, timed_name,
+                                      Colors.norm))
+
 def process_result(index, _input_data, output_data):
   """
     This is a callback function that Processes the result of a test.
@@ -480,17 +503,20 @@ if __name__ == "__main__":
   print(Colors.norm)
 
   csv_report = open("test_report.csv", "w")
-  csv_report.write(",".join(["name", "passed", "group", "time"])+"\n")
+  csv_report.write(",".join(["name", "passed", "group", "time", "diff_time"])+"\n")
   for result, test_name in zip(output_list, test_name_list):
     if result is not None:
       group_name = Tester.get_group_name(result.group)
       out_line = ",".join([test_name, str(result.group == Tester.group_success),
-                           group_name, str(result.runtime)])
+                           group_name, str(result.runtime), str(result.diff_time)])
     else:
-      out_line = ",".join([test_name, str(False), "NO_PREREQ", str(0.0)])
+      out_line = ",".join([test_name, str(False), "NO_PREREQ", str(0.0), str(0.0)])
     csv_report.write(out_line+"\n")
   csv_report.close()
 
+  if args.timing_report is not None and int(args.timing_report) > 0:
+    print_timing_report(output_list, int(args.timing_report))
+
   print("PASSED: {}{}{}".format(Colors.okay, results["pass"], Colors.norm))
   print("SKIPPED: {}{}{}".format(Colors.skip, results["skipped"], Colors.norm))
   print("FAILED: {}{}{}".format(Colors.fail, results["fail"], Colors.norm))
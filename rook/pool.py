@@ -23,7 +23,6 @@ try:
   import queue
 except ImportError:
   import Queue as queue
-import time
 
 warnings.simplefilter('default', DeprecationWarning)
 
@@ -37,7 +36,7 @@ class RunnerThread(threading.Thread):
     """
       Initializes with an input queue and an output queue
       Functions and ids in the input_queue will be run and the output
-      put into the output queue
+      put into the output queue. A None in the input queue stops the runner.
       @ In, input_queueo, queue.Queue, queue with the input data and functions to run
       @ In, output_queue, queue.Queue, queue to put result data
       @ Out, None
@@ -46,31 +45,33 @@ class RunnerThread(threading.Thread):
     self.__output_queue = output_queue
     self.__done = False
     threading.Thread.__init__(self)
+    self.daemon = True
 
   def run(self):
     """
-      Runs the functions until the queue is empty.
+      Runs the functions until a None is found in the queue.
       @ In, None
       @ Out, None
     """
-    try:
-      #Keep going as long as there are items in the queue
-      while True:
-        id_num, function, data = self.__input_queue.get(block=False)
-        try:
-          output = function(data)
-        except Exception as fail:
-          #Note, if this occurs, there is a problem in the
-          # test system.  (Such as if a Tester or subclass throws an exception
-          # instead of calling set_fail)
-          print("Caught test system execption", fail, "running", data)
-          traceback.print_exc()
-          output = fail
-        self.__output_queue.put((id_num, output))
+    #Keep going until told to stop, waiting for new items in the queue
+    while True:
+      item = self.__input_queue.get()
+      if item is None:
         self.__input_queue.task_done()
-    except queue.Empty:
-      self.__done = True
-      return
+        self.__done = True
+        return
+      id_num, function, data = item
+      try:
+        output = function(data)
+      except Exception as fail:
+        #Note, if this occurs, there is a problem in the
+        # test system.  (Such as if a Tester or subclass throws an exception
+        # instead of calling set_fail)
+        print("Caught test system execption", fail, "running", data)
+        traceback.print_exc()
+        output = fail
+      self.__output_queue.put((id_num, output))
+      self.__input_queue.task_done()
 
   def is_done(self):
     """
@@ -84,6 +85,7 @@ class RunnerThread(threading.Thread):
 class MultiRun:
   """
   This creates queues and runner threads to process the functions.
+  The results are collected as soon as they are put in the output queue, without polling.
   """
   def __init__(self, function_list, number_jobs, ready_to_run=None):
     """
@@ -133,68 +135,31 @@ class MultiRun:
     self.__ready_to_run[id_num] = True
     function, data = self.__function_list[id_num]
     self.__input_queue.put((id_num, function, data))
-    self.__restart_runners()
-
-  def __restart_runners(self):
-    """
-      Restarts any dead runners
-      @ In, None
-      @ Out, None
-    """
-    for i in range(len(self.__runners)):
-      if self.__runners[i].is_done() or not self.__runners[i].is_alive():
-        #Restart since it is done.  Otherwise might not be any runners still
-        # running
-        self.__runners[i] = RunnerThread(self.__input_queue, self.__output_queue)
-        self.__runners[i].start()
-
-  def __runner_count(self):
-    """
-      Returns how many runners are not done.
-      @ In, None
-      @ Out, runner_count, int, alive runners
-    """
-    runner_count = 0
-    for i in range(len(self.__runners)):
-      if self.__runners[i].is_alive():
-        runner_count += 1
-    return runner_count
 
   def process_results(self, process_function=None):
     """
       Process results and return the output in an array.
       If a process_function is passed in, it will be called with
       process_function(index, input, output) after the output is created.
+      The jobs that are never enabled (for example, because their prerequisites
+      failed) have a None output.
       @ In, process_function, function, optional, function called after each input finishes.
       @ Out, return_array, list, includes the outputs of the functions.
     """
     return_array = [None]*len(self.__function_list)
     output_count = 0
-    count_down = 10
-    while output_count < len(return_array):
-      while output_count + self.__not_ready < len(return_array):
-        #This is debug information meant to help if the test system deadlocks
-        # It could be commented out, but probably should not be deleted.
-        #print("debug numbers oc", output_count, "nr", self.__not_ready,
-        #      "lra", len(return_array), "rc", self.__runner_count(), "ie",
-        #      self.__input_queue.empty(), "oe", self.__output_queue.empty())
-        if self.__runner_count() == 0 and not self.__input_queue.empty():
-          print("restarting runners")
-          self.__restart_runners()
-        id_num, output = self.__output_queue.get()
-        count_down = 10
-        return_array[id_num] = output
-        output_count += 1
-        if process_function is not None:
-          _, data = self.__function_list[id_num]
-          process_function(id_num, data, output)
-      time.sleep(0.1)
-      if count_down <= 0:
-        #Check and see if any runners are still running
-        runner_count = self.__runner_count()
-        if runner_count == 0:
-          break
-      count_down -= 1
+    # jobs are only enabled by process_function, so once all the enabled jobs
+    # are done there is nothing left to wait for
+    while output_count + self.__not_ready < len(return_array):
+      id_num, output = self.__output_queue.get()
+      return_array[id_num] = output
+      output_count += 1
+      if process_function is not None:
+        _, data = self.__function_list[id_num]
+        process_function(id_num, data, output)
+    # stop the runners
+    for _ in self.__runners:
+      self.__input_queue.put(None)
     assert self.__output_queue.empty(), "Output queue not empty"
     return return_array
 
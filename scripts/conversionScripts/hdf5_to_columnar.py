@@ -0,0 +1,43 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Converts an HDF5 database with the "groups" layout (a group for each realization) into
+  the "columnar" layout (a dataset for each variable).
+  Usage: python hdf5_to_columnar.py oldDatabase.h5 newDatabase.h5 [compression]
+  where compression is "gzip" (default), "lzf" or "none".
+"""
+import os, sys
+
+sys.path.append(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),os.pardir,os.pardir,'framework')))
+from utils.utils import find_crow
+find_crow(os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),os.pardir,os.pardir,'framework')))
+
+import MessageHandler
+from h5py_interface_creator import convertToColumnar
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'quiet', 'callerLength':10, 'tagLength':10})
+
+if __name__=='__main__':
+  if len(sys.argv) not in [3, 4]:
+    raise IOError('Expected the filename of the database to convert, the new filename and optionally the compression, but instead got %i arguments: %s' %(len(sys.argv)-1,sys.argv[1:]))
+  oldDataBase = sys.argv[1]
+  newDataBase = sys.argv[2]
+  compression = sys.argv[3] if len(sys.argv) == 4 else 'gzip'
+  if os.path.abspath(oldDataBase) == os.path.abspath(newDataBase):
+    raise IOError('The filenames must be different!!!')
+  if not os.path.isfile(oldDataBase):
+    raise IOError('ERROR: File not found: '+oldDataBase)
+  convertToColumnar(oldDataBase, newDataBase, compression=None if compression == 'none' else compression)
+  print("CONVERSION PERFORMED!")
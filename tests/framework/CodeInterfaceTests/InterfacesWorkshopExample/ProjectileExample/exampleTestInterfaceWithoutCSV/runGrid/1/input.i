@@ -0,0 +1,5 @@
+v0 = 6.9
+angle = 45
+x0 = 0
+y0 = 0
+timeOption = 1
@@ -0,0 +1,5 @@
+x0 = 0
+y0 = 0
+v0 = 30
+angle = 45
+timeOption = 1
@@ -0,0 +1,37 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  External model counting its evaluations in "self", to check that the state
+  changed in the worker processes is sent back to the master.
+"""
+
+def initialize(self, runInfoDict, inputFiles):
+  """
+    Sets the evaluation counter (at the first Step only: it counts the evaluations of all the Steps)
+    @ In, runInfoDict, dict, the RunInfo information
+    @ In, inputFiles, list, the input files
+    @ Out, None
+  """
+  if not hasattr(self, 'evaluations'):
+    self.evaluations = 0
+
+def run(self, Input):
+  """
+    Evaluates the model, counting the evaluation
+    @ In, Input, dict, the input variables
+    @ Out, None
+  """
+  self.evaluations += 1
+  self.count = self.evaluations
+  self.ans = 2.0 * self.x
@@ -0,0 +1,28 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# number of evaluations actually performed by the model
+evaluations = 0
+
+def run(raven, inputs):
+  """
+    Evaluates a parabola, counting the evaluations.
+    @ In, raven, object, raven self
+    @ In, inputs, dict, key-value pairs
+    @ Out, None
+  """
+  global evaluations
+  evaluations += 1
+  raven.evaluation = float(evaluations)
+  raven.ans = (raven.x - 0.5)**2 + (raven.y + 0.5)**2
@@ -0,0 +1,27 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Paraboloid used to generate the training data of the ROMs.
+  Its "run" works on arrays as well, so it can evaluate whole blocks of samples.
+"""
+vectorizedRun = True
+
+def run(self, Input):
+  """
+    Evaluates the paraboloid
+    @ In, self, object, the external model container
+    @ In, Input, dict, the sampled variables (arrays of the block of samples, if evaluated in blocks)
+    @ Out, None
+  """
+  self.z = self.x**2 + 0.5*self.y**2 + self.x*self.y
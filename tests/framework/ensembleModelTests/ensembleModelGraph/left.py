@@ -0,0 +1,31 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Independent sub-model "left" of the EnsembleModel: it records if the other
+  independent sub-model was running at the same time.
+"""
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import peerBarrier
+
+def run(self, Input):
+  """
+    Evaluates the model
+    @ In, self, object, object to store members on
+    @ In, Input, dict, dictionary containing inputs from RAVEN
+    @ Out, None
+  """
+  self.leftOut = 2.0 * self.x
+  self.leftConcurrent = peerBarrier.meet((float(self.waitForPeer), float(self.x)), 'left', self.waitForPeer > 0)
@@ -0,0 +1,37 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Meeting point of the independent sub-models "left" and "right" of the EnsembleModel,
+  used to detect if they are running at the same time.
+"""
+import threading
+
+_condition = threading.Condition()
+_started = {} # {sample key: set of the models started}
+
+def meet(key, name, wait, timeout=60.):
+  """
+    Registers the start of a model for a sample and (optionally) waits for the other model of the pair
+    @ In, key, hashable, the identifier of the sample
+    @ In, name, str, the name of the model
+    @ In, wait, bool, True to wait for the other model to start
+    @ In, timeout, float, optional, maximum waiting time (s)
+    @ Out, concurrent, float, 1. if both the models of the pair started before this one ended, 0. otherwise
+  """
+  with _condition:
+    _started.setdefault(key, set()).add(name)
+    _condition.notify_all()
+    if wait:
+      _condition.wait_for(lambda: len(_started[key]) > 1, timeout)
+    return 1. if len(_started[key]) > 1 else 0.
@@ -604,6 +604,86 @@ data.setSelectiveOutput('operator','mean')
 data.addRealization(rlz0)
 checkRlz('PointSet selective default',data.realization(index=3),{'a':0.5,'x':1.34})
 
+######################################
+#        ADDING MANY REALIZATIONS    #
+######################################
+xml = createElement('PointSet',attrib={'name':'test'})
+xml.append(createElement('Input',text='a,b'))
+xml.append(createElement('Output',text='x,z'))
+rlzs = {'a': np.array([1.0, 2.0, 3.0, 4.0]),
+        'b': np.array([5, 6, 7, 8]),
+        'x': np.array([0.1, 0.2, 0.3, 0.4]),
+        'z': np.array(['one', 'two', 'three', 'four'])}
+# one by one
+dataOne = DataObjects.PointSet()
+dataOne.messageHandler = mh
+dataOne._readMoreXML(xml)
+for r in range(4):
+  dataOne.addRealization(dict((var, vals[r:r+1]) for var, vals in rlzs.items()))
+# all together
+dataAll = DataObjects.PointSet()
+dataAll.messageHandler = mh
+dataAll._readMoreXML(xml)
+dataAll.addRealizations(rlzs)
+checkSame('PointSet addRealizations size',len(dataAll),4)
+checkSame('PointSet addRealizations float column',dataAll._collector.columns[dataAll._orderedVars.index('a')].dtype,np.float64)
+rlzAll, rlzOne = dataAll.realization(index=2), dataOne.realization(index=2)
+checkTrue('PointSet addRealizations rlz',all(rlzAll[var] == rlzOne[var] for var in ['a','b','x','z']))
+checkTrue('PointSet addRealizations same data',dataAll.asDataset().equals(dataOne.asDataset()))
+# inconsistent lengths
+try:
+  dataAll.addRealizations({'a': np.array([1.0, 2.0]), 'b': np.array([1]), 'x': np.array([1.0]), 'z': np.array(['no'])})
+  checkTrue('PointSet addRealizations inconsistent lengths',False)
+except IndexError:
+  checkTrue('PointSet addRealizations inconsistent lengths',True)
+
+######################################
+#    MATCHING MANY REALIZATIONS      #
+######################################
+# enough realizations to search them with the index tree, both in the data and in the collector
+data = DataObjects.PointSet()
+data.messageHandler = mh
+data._readMoreXML(xml)
+grid = np.arange(300, dtype=float)
+data.addRealizations({'a': grid % 10, 'b': grid // 10, 'x': grid, 'z': np.array(list('r{}'.format(int(g) % 3) for g in grid))})
+data.asDataset()
+for g in range(300, 400):
+  data.addRealization({'a': np.array([g % 10]), 'b': np.array([g // 10]), 'x': np.array([float(g)]), 'z': np.array(['r{}'.format(g % 3)])})
+# in the data
+idx, rlz = data.realization(matchDict={'a': 3.0, 'b': 12})
+checkSame('PointSet match many, data index',idx,123)
+checkSame('PointSet match many, data x',rlz['x'],123.0)
+# in the collector (index within the collector)
+idx, rlz = data.realization(matchDict={'a': 3.0, 'b': 32})
+checkSame('PointSet match many, collector index',idx,23)
+checkSame('PointSet match many, collector x',rlz['x'],323.0)
+# within tolerance only
+idx, rlz = data.realization(matchDict={'a': 3.0 + 1e-9, 'b': 32}, tol=1e-6)
+checkSame('PointSet match many, tolerance',idx,23)
+idx, rlz = data.realization(matchDict={'a': 3.0 + 1e-3, 'b': 32}, tol=1e-6)
+checkTrue('PointSet match many, out of tolerance',rlz is None)
+checkSame('PointSet match many, out of tolerance index',idx,400)
+# mixed with strings and antimatches
+idx, rlz = data.realization(matchDict={'a': 3.0, 'b': 32, 'z': 'r2'})
+checkSame('PointSet match many, string',idx,23)
+idx, rlz = data.realization(matchDict={'a': 3.0, 'b': 32, 'z': 'r0'})
+checkTrue('PointSet match many, wrong string',rlz is None)
+idx, rlz = data.realization(matchDict={'a': 3.0, 'b': 32}, noMatchDict={'x': [1.0, 323.0]})
+checkTrue('PointSet match many, antimatch',rlz is None)
+# strings only
+idx, rlz = data.realization(matchDict={'z': 'r1'})
+checkSame('PointSet match many, string only',idx,1)
+# all the matches in the collector
+idx, rlzs = data.realization(matchDict={'z': 'r1', 'b': 34}, first=False)
+checkSame('PointSet match many, all matches',idx,[40, 43, 46, 49])
+checkSame('PointSet match many, all matches x',list(r['x'] for r in rlzs),[340.0, 343.0, 346.0, 349.0])
+# changing values updates the index
+data._changeVariableValue(323, 'a', 11.0)
+idx, rlz = data.realization(matchDict={'a': 11.0, 'b': 32})
+checkSame('PointSet match many, changed value',idx,23)
+idx, rlz = data.realization(matchDict={'a': 3.0, 'b': 32})
+checkTrue('PointSet match many, changed value old',rlz is None)
+
 
 # TODO more exhaustive tests are needed, but this is sufficient for initial work.
 
@@ -0,0 +1,197 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the columnar layout of the HDF5 databases
+  (h5py_interface_creator.hdf5ColumnarDatabase) and for the conversion from the group layout.
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os, sys
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils.utils import find_crow
+find_crow(frameworkDir)
+import MessageHandler
+from h5py_interface_creator import hdf5Database, hdf5ColumnarDatabase, convertToColumnar
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkSame(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if updateResults:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking answer",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def checkArray(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two arrays
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the array to compare
+    @ In, expected, np.ndarray, the expected array
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  value, expected = np.asarray(value), np.asarray(expected)
+  res = value.shape == expected.shape and value.dtype.kind == expected.dtype.kind and np.all(value == expected)
+  if updateResults:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def makeRlz(r):
+  """
+    Creates a realization to store
+    @ In, r, int, the realization number
+    @ Out, rlz, dict, the realization
+  """
+  rlz = {'prefix':np.array([str(r+1)]),
+         'x':np.array([float(r)]),
+         'flag':np.array([r % 2 == 0]),
+         'label':np.array(['case{}'.format(r)]),
+         'y':np.arange(r + 1, dtype=float)}
+  if r >= 3:
+    # variable added to the last realizations only
+    rlz['late'] = np.array([10.0 * r])
+  return rlz
+
+workDir = os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])), 'columnar')
+if not os.path.isdir(workDir):
+  os.makedirs(workDir)
+
+######################################
+#   WRITE AND READ COLUMNAR LAYOUT   #
+######################################
+db = hdf5ColumnarDatabase('test', workDir, 'columnar.h5', False, bufferSize=2)
+for r in range(5):
+  db.addGroup(makeRlz(r))
+db.addGroup(makeRlz(0)) # same prefix as the first one
+db.addExpectedMeta(set(['flag', 'label']))
+checkSame('length',len(db),6)
+checkSame('names',db.retrieveAllHistoryNames(),['1','2','3','4','5','1_1'])
+# the realizations still in memory are read as well
+checkArray('scalar column',db.getVariable('x'),[0.,1.,2.,3.,4.,0.])
+checkArray('scalar slice',db.getVariable('x',2,4),[2.,3.])
+checkArray('bool column',db.getVariable('flag',0,3),[True,False,True])
+checkArray('string column',db.getVariable('label',4),['case4','case0'])
+history = db.getVariable('y',1,3)
+checkSame('history slice length',len(history),2)
+checkArray('history slice',history[1],[0.,1.,2.])
+db.closeDatabaseW()
+
+# reopen the file
+db = hdf5ColumnarDatabase('test', workDir, 'columnar.h5', True)
+checkSame('columnar detected',hdf5ColumnarDatabase.isColumnar(os.path.join(workDir,'columnar.h5')),True)
+checkSame('reopened names',db.retrieveAllHistoryNames(),['1','2','3','4','5','1_1'])
+checkSame('expected metadata',db.provideExpectedMetaKeys()[0],set(['flag','label']))
+rlz, _ = db._getRealizationByName('4')
+checkSame('realization variables',set(rlz.keys()),set(['prefix','x','flag','label','y','late']))
+checkArray('realization history',rlz['y'],np.arange(4,dtype=float))
+checkArray('realization string',rlz['label'],['case3'])
+checkArray('realization late variable',rlz['late'],[30.])
+rlz, _ = db._getRealizationByName('2')
+checkSame('missing variable not returned','late' in rlz,False)
+allRlz = db.allRealizations()
+checkSame('all realizations',len(allRlz),6)
+checkArray('all realizations, last history',allRlz[-1]['y'],[0.])
+checkArray('all realizations, scalar',allRlz[2]['x'],[2.])
+# append to an existing file
+db.addGroup(makeRlz(6))
+checkSame('appended length',len(db),7)
+checkArray('appended history',db.getVariable('y',6)[0],np.arange(7,dtype=float))
+db.closeDatabaseW()
+
+######################################
+#      MULTIDIMENSIONAL VALUES       #
+######################################
+db = hdf5ColumnarDatabase('test', workDir, 'shapes.h5', False, bufferSize=2)
+fields = [np.arange(2.), np.arange(3.), np.arange(6.).reshape(2,3), np.ones((1,1)), np.arange(24.).reshape(2,3,4)]
+for r, field in enumerate(fields):
+  # the first realizations (with 1D values) are written before the first multidimensional value
+  db.addGroup({'prefix':np.array([str(r+1)]), 'field':field, 'cell':np.full((1,1), float(r))})
+checkArray('ND values in memory',db.getVariable('field',2,3)[0],fields[2])
+db.closeDatabaseW()
+db = hdf5ColumnarDatabase('test', workDir, 'shapes.h5', True)
+for r, values in enumerate(db.getVariable('field')):
+  checkArray('ND values {}'.format(r),values,fields[r])
+cells = db.getVariable('cell',1,3)
+checkSame('single valued ND values length',len(cells),2)
+checkArray('single valued ND values',cells[1],np.full((1,1),2.))
+rlz, _ = db._getRealizationByName('5')
+checkArray('ND realization',rlz['field'],fields[4])
+allRlz = db.allRealizations()
+checkArray('all realizations, ND values',allRlz[2]['field'],fields[2])
+checkArray('all realizations, 1D values',allRlz[1]['field'],fields[1])
+db.closeDatabaseW()
+
+######################################
+#   CONVERSION FROM THE GROUP LAYOUT #
+######################################
+old = hdf5Database('old', workDir, 'groups.h5', False)
+for r in range(5):
+  old.addGroup(makeRlz(r))
+old.addExpectedMeta(set(['flag']))
+old.closeDatabaseW()
+convertToColumnar(os.path.join(workDir,'groups.h5'), os.path.join(workDir,'converted.h5'))
+old = hdf5Database('old', workDir, 'groups.h5', True)
+new = hdf5ColumnarDatabase('new', workDir, 'converted.h5', True)
+checkSame('converted names',new.retrieveAllHistoryNames(),old.retrieveAllHistoryNames())
+checkSame('converted metadata',new.provideExpectedMetaKeys()[0],set(['flag']))
+for name in old.retrieveAllHistoryNames():
+  oldRlz, _ = old._getRealizationByName(name,{'reconstruct':False})
+  newRlz, _ = new._getRealizationByName(name)
+  checkSame('converted variables '+name,set(newRlz.keys()),set(oldRlz.keys()))
+  for var in oldRlz:
+    checkArray('converted '+var+' '+name,newRlz[var],oldRlz[var])
+old.closeDatabaseW()
+new.closeDatabaseW()
+
+for fileName in ['columnar.h5', 'shapes.h5', 'groups.h5', 'converted.h5']:
+  os.remove(os.path.join(workDir, fileName))
+os.rmdir(workDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.columnarHDF5</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>h5py_interface_creator.hdf5ColumnarDatabase</classesTested>
+    <description>
+       This test performs Unit Tests for the columnar layout of the HDF5 databases and for the conversion
+       of the databases with the group layout.
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
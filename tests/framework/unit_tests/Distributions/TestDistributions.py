@@ -1134,6 +1134,24 @@ checkAnswer("UniformDiscrete rvs10",UniformDiscrete.selectedRvs(discardedElems),
 checkAnswer("UniformDiscrete rvs11",UniformDiscrete.selectedRvs(discardedElems),4)
 checkAnswer("UniformDiscrete rvs12",UniformDiscrete.selectedRvs(discardedElems),3)
 
+#Test the array evaluations (they must be identical to the point by point ones)
+from utils import randomUtils
+probabilities = np.linspace(0.01,0.99,99)
+for name, dist in [('uniform',uniform), ('normal',normal), ('truncNormal',truncNormal), ('gamma',gamma), ('beta',beta),
+                   ('triangular',triangular), ('logistic',logistic), ('exponential',exponential), ('logNormal',logNormal), ('weibull',weibull)]:
+  points = np.array([dist.ppf(p) for p in probabilities])
+  checkAnswer(name+" array ppf",np.abs(dist.ppf(probabilities)-points).max(),0.0,tol=0.0)
+  checkAnswer(name+" array cdf",np.abs(dist.cdf(points)-np.array([dist.cdf(x) for x in points])).max(),0.0,tol=0.0)
+  checkAnswer(name+" array pdf",np.abs(dist.pdf(points)-np.array([dist.pdf(x) for x in points])).max(),0.0,tol=0.0)
+  randomUtils.randomSeed(42)
+  samples = np.array([dist.rvs() for _ in range(20)])
+  randomUtils.randomSeed(42)
+  checkAnswer(name+" array rvs",np.abs(dist.rvs(20)-samples).max(),0.0,tol=0.0)
+randomUtils.randomSeed(42)
+samples = np.array([Categorical.rvs() for _ in range(20)])
+randomUtils.randomSeed(42)
+checkAnswer("Categorical array rvs",np.abs(Categorical.rvs(20)-samples).max(),0.0,tol=0.0)
+
 
 print(results)
 
@@ -1164,6 +1182,7 @@ sys.exit(results["fail"])
       <revision author="cogljj" date="2016-04-12">Converting Distributions to use the new input system. All distributions have been converted.</revision>
       <revision author="alfoa" date="2017-01-21">Adding this test description.</revision>
       <revision author="alfoa" date="2018-05-10">Added Log Uniform distribution unit test</revision>
+      <revision author="agent" date="2026-10-18">Added checks of the array evaluations of cdf, ppf, pdf and rvs</revision>
     </revisions>
     <requirements>R-RE-1</requirements>
   </TestInfo>
@@ -0,0 +1,155 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the DTW metric (anti-diagonal dynamic programming, Sakoe-Chiba band,
+  LB_Keogh lower bound and pairwise mode) against a cell by cell dynamic programming.
+  It cannot be considered part of the active code but of the regression test system
+"""
+import os, sys
+import numpy as np
+import scipy.spatial.distance as spatialDistance
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils.utils import find_crow
+find_crow(frameworkDir)
+from Metrics.DTW import DTW
+
+results = {"pass":0,"fail":0}
+
+def checkFloat(comment,value,expected,tol=1e-10,updateResults=True):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  res = abs(value - expected) <= tol * max(1.0, abs(expected))
+  if updateResults:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking float",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def checkTrue(comment,value,updateResults=True):
+  """
+    This method is aimed to check a condition
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, bool, the condition
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, value, bool, the condition
+  """
+  if updateResults:
+    if value:
+      results["pass"] += 1
+    else:
+      print("checking condition",comment,'| failed')
+      results["fail"] += 1
+  return value
+
+def referenceDTW(x, y, localDistance, window=None):
+  """
+    Computes the DTW distance filling the cost matrix cell by cell
+    @ In, x, np.ndarray, history with shape (n_samples, n_time_steps)
+    @ In, y, np.ndarray, history with shape (n_samples, n_time_steps)
+    @ In, localDistance, str, scipy distance
+    @ In, window, int, optional, radius of the Sakoe-Chiba band
+    @ Out, distance, float, the DTW distance
+  """
+  cost = spatialDistance.cdist(x.T, y.T, metric=localDistance)
+  r, c = cost.shape
+  band = max(r, c) if window is None else max(window, abs(r - c))
+  acc = np.full((r + 1, c + 1), np.inf)
+  acc[0, 0] = 0.
+  for i in range(r):
+    for j in range(c):
+      if abs(i - j) <= band:
+        acc[i + 1, j + 1] = cost[i, j] + min(acc[i, j], acc[i, j + 1], acc[i + 1, j])
+  return acc[-1, -1]
+
+def makeDTW(localDistance, order=0, window=None):
+  """
+    Creates a DTW metric
+    @ In, localDistance, str, scipy distance
+    @ In, order, int, optional, DTW order
+    @ In, window, int, optional, radius of the Sakoe-Chiba band
+    @ Out, dtw, DTW, the metric
+  """
+  dtw = DTW()
+  dtw.localDistance = localDistance
+  dtw.order = order
+  dtw.window = window
+  return dtw
+
+rng = np.random.RandomState(42)
+
+######################################
+#        SINGLE PAIR DISTANCE        #
+######################################
+for localDistance in ['euclidean', 'cityblock', 'chebyshev', 'sqeuclidean', 'cosine']:
+  for window in [None, 0, 3]:
+    dtw = makeDTW(localDistance, window=window)
+    for r, c in [(20, 25), (30, 30), (1, 5), (6, 1)]:
+      x = rng.rand(2, r)
+      y = rng.rand(2, c)
+      checkFloat('{} window {} lengths {} {}'.format(localDistance, window, r, c), dtw.dtwDistance(x, y),
+                 referenceDTW(x, y, localDistance, window))
+# one dimensional histories, identical up to a time shift
+x = np.sin(np.linspace(0., 6., 50))
+dtw = makeDTW('euclidean')
+checkFloat('evaluate', dtw.evaluate(x, x), 0.)
+checkTrue('shifted histories', dtw.evaluate(x[:-3], x[3:]) < np.abs(x[:-3] - x[3:]).sum())
+# derivative DTW
+dtw = makeDTW('euclidean', order=1)
+checkFloat('derivative DTW', dtw.evaluate(x, x + 5.), 0.)
+
+######################################
+#   LOWER BOUND AND PAIRWISE MODE    #
+######################################
+dtw = makeDTW('euclidean', window=5)
+histories = [rng.rand(3, 40) for _ in range(12)] + [rng.rand(3, 30) for _ in range(3)]
+expected = np.array([[referenceDTW(a, b, 'euclidean', 5) for b in histories] for a in histories])
+distances = dtw.evaluate(histories, None)
+checkTrue('pairwise shape', distances.shape == (15, 15))
+checkFloat('pairwise distances', np.abs(distances - expected).max(), 0.)
+others = histories[:4]
+checkFloat('pairwise distances with others', np.abs(dtw.pairwiseDistance(histories, others) - expected[:, :4]).max(), 0.)
+bound = dtw.lowerBound(np.stack(histories[:11]), np.stack(histories[1:12]))
+checkTrue('LB_Keogh lower bound', np.all(bound <= expected[np.arange(11), np.arange(1, 12)] + 1e-12))
+checkTrue('no lower bound for different lengths', dtw.lowerBound(np.stack(histories[:1]), np.stack(histories[-1:])) is None)
+cutoff = 0.5 * (np.sort(expected.ravel())[100] + np.sort(expected.ravel())[101])
+pruned = dtw.pairwiseDistance(histories, cutoff=cutoff)
+checkTrue('pruned distances', np.all(np.where(expected > cutoff, np.isinf(pruned), np.isclose(pruned, expected))))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.DTW</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>Metrics.DTW</classesTested>
+    <description>
+       This test performs Unit Tests for the DTW metric: the anti-diagonal dynamic programming, the Sakoe-Chiba band,
+       the LB_Keogh lower bound and the pairwise mode are checked against a cell by cell dynamic programming.
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,173 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Testing for the array-based Genetic Algorithm operators and bookkeeping
+"""
+import os
+import sys
+from itertools import combinations
+
+import numpy as np
+import xarray as xr
+
+ravenPath = os.path.abspath(os.path.join(__file__, *['..'] * 5, 'framework'))
+print('... located RAVEN at:', ravenPath)
+sys.path.append(ravenPath)
+import Driver
+from utils import randomUtils
+from Optimizers.GeneticAlgorithm import GeneticAlgorithm
+from Optimizers.crossOverOperators.crossovers import returnInstance as crossoversReturnInstance
+from Optimizers.mutators.mutators import returnInstance as mutatorsReturnInstance
+
+#
+#
+# checkers
+#
+def checkFloat(comment, value, expected, tol=1e-10, update=True):
+  """
+    This method compares two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = abs(value - expected) <= tol
+  if update:
+    if not res:
+      print("checking float", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
+  return res
+
+def checkSame(comment, value, expected, update=True):
+  """
+    This method compares two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking string", comment, '|', value, "!=", expected)
+      results["fail"] += 1
+  return res
+
+results = {'pass': 0, 'fail': 0}
+
+randomUtils.randomSeed(42)
+optVars = ['x1', 'x2', 'x3', 'x4', 'x5']
+rng = np.random.RandomState(7)
+
+#
+# Hausdorff distances, against the chromosome by chromosome definition
+#
+ga = GeneticAlgorithm()
+a = rng.rand(30, 5)
+b = rng.rand(20, 5)
+nearest = np.array([min(np.linalg.norm(ai - bj, 2) for bj in b) for ai in a])
+checkFloat('Distance of a single chromosome', ga._popDist(a[3], b), nearest[3])
+checkFloat('Generational distance', ga._GD(a, b), nearest.max())
+checkFloat('Modified generational distance', ga._GDp(a, b, 3), np.mean(nearest**3)**(1/3))
+nearestB = np.array([min(np.linalg.norm(bi - aj, 2) for aj in a) for bi in b])
+checkFloat('Hausdorff distance', ga._ahd(a, b), max(nearest.max(), nearestB.max()))
+checkFloat('Average Hausdorff distance', ga._ahdp(a, b, 2), max(np.mean(nearest**2)**0.5, np.mean(nearestB**2)**0.5))
+
+#
+# children identical to the population
+#
+population = rng.randint(0, 3, (40, 5)).astype(float)
+children = rng.randint(0, 3, (60, 5)).astype(float)
+# the child j is compared with the chromosomes i <= j of the population
+expected = [j for i in range(len(population)) for j in range(i, len(children)) if all(population[i] == children[j])]
+checkSame('Repeated children', list(ga._findRepeatedChromosomes(population, children)), sorted(set(expected)))
+checkSame('No repeated children', ga._findRepeatedChromosomes(population + 10, children).size, 0)
+# a child only identical to a later chromosome of the population is not repeated, -0. is the same as 0.
+population = np.array([[1., 2.], [0., 5.], [3., 4.]])
+children = np.array([[3., 4.], [-0., 5.], [1., 2.]])
+checkSame('Repeated children, population order', list(ga._findRepeatedChromosomes(population, children)), [1, 2])
+checkSame('Repeated genes', GeneticAlgorithm._hasRepeatedGenes([[1, 2, 3], [3, 1, 3]]), True)
+checkSame('No repeated genes', GeneticAlgorithm._hasRepeatedGenes([[1, 2, 3], [3, 1, 2]]), False)
+
+#
+# crossovers: each child takes every gene from one of the parents of its couple
+#
+parents = xr.DataArray(rng.randint(0, 100, (5, 5)).astype(float),
+                       dims=['chromosome', 'Gene'],
+                       coords={'chromosome': np.arange(5), 'Gene': optVars})
+pairs = list(combinations(range(5), 2))
+for name in ['onePointCrossover', 'uniformCrossover', 'twoPointsCrossover']:
+  crossover = crossoversReturnInstance('tester', name)
+  xover = crossover(parents, variables=optVars, crossoverProb=0.9, points=None)
+  checkSame('{} number of children'.format(name), xover.shape, (2*len(pairs), 5))
+  valid = True
+  for p, (i, j) in enumerate(pairs):
+    first, second = parents.values[i], parents.values[j]
+    child1, child2 = xover.values[2*p], xover.values[2*p+1]
+    fromFirst = child1 == first
+    valid &= bool(np.all(fromFirst | (child1 == second)))
+    valid &= bool(np.all(np.where(fromFirst, child2 == second, child2 == first)))
+  checkSame('{} genes inherited'.format(name), valid, True)
+## two points crossover: the exchanged sequence can start at the first gene and end at the last one
+crossover = crossoversReturnInstance('tester', 'twoPointsCrossover')
+couple = xr.DataArray(np.array([np.arange(5.), np.arange(5.) + 10]),
+                      dims=['chromosome', 'Gene'],
+                      coords={'chromosome': np.arange(2), 'Gene': optVars})
+swapped = np.zeros(5, dtype=bool)
+for _ in range(50):
+  xover = crossover(couple, [[0, 1]], variables=optVars)
+  swapped |= xover.values[0] != couple.values[0]
+checkSame('twoPointsCrossover exchanged genes', bool(np.all(swapped)), True)
+
+#
+# mutators: the mutated children keep the same genes, reordered
+#
+offSprings = xr.DataArray(np.tile(np.arange(5.), (8, 1)),
+                          dims=['chromosome', 'Gene'],
+                          coords={'chromosome': np.arange(8), 'Gene': optVars})
+for name in ['swapMutator', 'scrambleMutator', 'inversionMutator']:
+  mutator = mutatorsReturnInstance('tester', name)
+  mutated = mutator(offSprings.copy(deep=True), locs=None, mutationProb=1.0, variables=optVars)
+  checkSame('{} genes kept'.format(name), bool(np.all(np.sort(mutated.values, axis=1) == np.arange(5.))), True)
+swapped = mutatorsReturnInstance('tester', 'swapMutator')(offSprings, locs=[1, 3], mutationProb=1.0, variables=optVars)
+checkSame('swapMutator swapped genes', bool(np.all(swapped.values == [0., 3., 2., 1., 4.])), True)
+## inversion: the mirrored sequence can start at the first gene and end at the last one
+mutator = mutatorsReturnInstance('tester', 'inversionMutator')
+moved = np.zeros(5, dtype=bool)
+for _ in range(20):
+  mutated = mutator(offSprings.copy(deep=True), mutationProb=1.0, variables=optVars)
+  moved |= np.any(mutated.values != np.arange(5.), axis=0)
+checkSame('inversionMutator mirrored genes', bool(np.all(moved)), True)
+## bit flip: a single gene of each child takes another value of the same gene in the other children
+mutator = mutatorsReturnInstance('tester', 'bitFlipMutator')
+original = rng.randint(0, 6, (8, 5)).astype(float)
+original[0] = 6.
+flipped = mutator(xr.DataArray(original.copy(), dims=['chromosome', 'Gene'], coords={'chromosome': np.arange(8), 'Gene': optVars}),
+                  mutationProb=1.0, sampleRange='local', variables=optVars).values
+changed = flipped != original
+checkSame('bitFlipMutator one gene flipped', list(changed.sum(axis=1)), [1]*8)
+checkSame('bitFlipMutator local values', all(flipped[c, g] in original[:, g] for c, g in zip(*np.nonzero(changed))), True)
+
+#
+# end
+#
+print('Results:', results)
+sys.exit(results['fail'])
@@ -0,0 +1,158 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the matrix-based training and the batched evaluation of the
+  GaussPolynomialRom, comparing them with the term by term definition of the expansion.
+  It can not be considered part of the active code but of the regression test system
+"""
+import os, sys
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+from utils.utils import find_crow
+find_crow(frameworkDir)
+import MessageHandler
+import Distributions
+import Quadratures
+import OrthoPolynomials
+import IndexSets
+from SupervisedLearning.GaussPolynomialRom import GaussPolynomialRom
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,value,expected,tol=1e-10,updateResults=True):
+  """
+    This method is aimed to compare two arrays of floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the array to compare
+    @ In, expected, np.ndarray, the expected array
+    @ In, tol, float, optional, the (relative) tolerance
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  value, expected = np.asarray(value), np.asarray(expected)
+  res = value.shape == expected.shape and np.allclose(value, expected, rtol=tol, atol=tol)
+  if updateResults:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def model(points):
+  """
+    The model to reproduce: target "a" is a polynomial in x and y, target "b" is not a polynomial
+    @ In, points, np.ndarray, (n_samples, 3) the x, y, z points
+    @ Out, values, np.ndarray, (n_samples, 2) the a, b values
+  """
+  x, y, z = points.T
+  return np.column_stack([x**2*y + 3.*x - y, np.exp(0.1*(x + y + z))])
+
+def standardPoint(rom, point):
+  """
+    Converts a point to the quadratures standard domain, one variable at a time
+    @ In, rom, GaussPolynomialRom, the ROM
+    @ In, point, np.ndarray, the point
+    @ Out, stdPt, list, the converted point
+  """
+  return list(rom.distDict[var].convertToQuad(rom.quads[var].type, p) for var, p in zip(rom.sparseGrid.varNames, point))
+
+#
+# uniform x with Legendre, normal y with Hermite, normal z with Legendre on its CDF
+#
+dists = {'x':Distributions.Uniform(1.0, 3.0), 'y':Distributions.Normal(0.5, 2.0), 'z':Distributions.Normal(1.0, 0.5)}
+rules = {'x':('Legendre', None, 'Legendre'), 'y':('Hermite', None, 'Hermite'), 'z':('CDF', 'Legendre', 'Legendre')}
+features = ['x', 'y', 'z']
+quads = {}
+polys = {}
+for var in features:
+  dists[var].initializeDistribution()
+  quadType, subType, polyType = rules[var]
+  quads[var] = Quadratures.factory.returnInstance(quadType, Subtype=subType)
+  quads[var].initialize(dists[var])
+  polys[var] = OrthoPolynomials.factory.returnInstance(polyType)
+  polys[var].initialize(quads[var])
+iSet = IndexSets.factory.returnInstance('TotalDegree')
+iSet.initialize(features, dict((var, 1.) for var in features), 4)
+sparseGrid = Quadratures.factory.returnInstance('smolyak')
+sparseGrid.initialize(features, iSet, dists, quads, None)
+
+rom = GaussPolynomialRom(messageHandler=mh, Features=features, Target=['a', 'b'], IndexSet='TotalDegree', PolynomialOrder=4)
+rom.initialize({'SG':sparseGrid, 'dists':dists, 'quads':quads, 'polys':polys, 'iSet':iSet})
+points = np.array(sparseGrid.points())
+# training points in a different order than the sparse grid ones
+order = np.random.RandomState(3).permutation(len(points))
+values = model(points[order])
+rom.train({'x':points[order, 0], 'y':points[order, 1], 'z':points[order, 2], 'a':values[:, 0], 'b':values[:, 1]})
+
+# tables of 1-D polynomials
+for var in features:
+  coords = np.array([-0.9, -0.2, 0.0, 0.35, 0.8])
+  expected = [[polys[var](o, c) for o in range(5)] for c in coords]
+  checkArray('polynomial table '+var, polys[var].evaluateTable(4, coords), expected)
+
+# coefficients, against the sum over the quadrature points of each polynomial
+solutions = model(points)
+for t, target in enumerate(['a', 'b']):
+  for idx in iSet:
+    expected = 0
+    for point, soln in zip(points, solutions[:, t]):
+      expected += soln*rom._multiDPolyBasisEval(tuple(idx), standardPoint(rom, point))*sparseGrid.weights(tuple(point))
+    checkArray('coefficient '+target+' '+str(tuple(idx)), rom.polyCoeffDict[target][tuple(idx)], expected*rom.norm)
+
+# evaluation, against the sum of the polynomials at each point
+queries = np.column_stack([1.0 + 2.0*np.random.RandomState(5).rand(50), np.random.RandomState(6).normal(0.5, 2.0, 50), np.random.RandomState(7).normal(1.0, 0.5, 50)])
+evaluated = rom.__evaluateLocal__(queries)
+for t, target in enumerate(['a', 'b']):
+  expected = [sum(coeff*rom._multiDPolyBasisEval(idx, standardPoint(rom, query)) for idx, coeff in rom.polyCoeffDict[target].items()) for query in queries]
+  checkArray('evaluation '+target, evaluated[target], expected)
+checkArray('polynomial reproduced', evaluated['a'], model(queries)[:, 0])
+checkArray('single point', rom.__evaluateLocal__([queries[0]])['b'], evaluated['b'][:1])
+rom._batchCells = 7*len(iSet)
+checkArray('small batches', rom._evaluateBatch(queries), np.column_stack([evaluated['a'], evaluated['b']]))
+
+# moments
+checkArray('mean', rom.__mean__('a'), (4./12. + 4.)*0.5 + 3.*2. - 0.5)
+expected = sum(sum(coeff*rom._multiDPolyBasisEval(idx, standardPoint(rom, point)) for idx, coeff in rom.polyCoeffDict['b'].items())**3*wt for point, wt in zip(points, sparseGrid.weights()))
+checkArray('third moment', rom.__evaluateMoment__(3, 'b'), expected*rom.norm)
+
+# ROMs stored before the coefficient matrix was introduced
+state = rom.__getstate__()
+del state['_coeffs'], state['_indexArray']
+restored = GaussPolynomialRom.__new__(GaussPolynomialRom)
+restored.__setstate__(state)
+checkArray('restored evaluation', restored._evaluateBatch(queries), np.column_stack([evaluated['a'], evaluated['b']]))
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.GaussPolynomialRom</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>SupervisedLearning.GaussPolynomialRom, OrthoPolynomials.OrthogonalPolynomial</classesTested>
+    <description>
+       This test performs Unit Tests for the matrix-based training and the batched evaluation of the GaussPolynomialRom,
+       comparing the coefficients, the evaluations and the moments with the term by term definition of the expansion.
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,147 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the batched evaluation of the NDinvDistWeight ROM,
+  comparing it with the crow InverseDistanceWeighting interpolator.
+  It can not be considered part of the active code but of the regression test system
+"""
+import os, sys
+import pickle as pk
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+from utils.utils import find_crow
+find_crow(frameworkDir)
+from utils import utils
+interpolationND = utils.findCrowModule("interpolationND")
+import MessageHandler
+from SupervisedLearning.NDinvDistWeight import NDinvDistWeight
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,value,expected,tol=1e-10,updateResults=True):
+  """
+    This method is aimed to compare two arrays of floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the array to compare
+    @ In, expected, np.ndarray, the expected array
+    @ In, tol, float, optional, the (relative) tolerance
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  value, expected = np.asarray(value), np.asarray(expected)
+  res = value.shape == expected.shape and np.allclose(value, expected, rtol=tol, atol=tol)
+  if updateResults:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+def crowInterpolation(points, values, p, queries):
+  """
+    Evaluates the crow InverseDistanceWeighting interpolator, one target and one point at a time
+    @ In, points, np.ndarray, training points, shape (n_samples, n_features)
+    @ In, values, np.ndarray, training values, shape (n_samples, n_targets)
+    @ In, p, int, the power parameter
+    @ In, queries, np.ndarray, evaluation points, shape (n_queries, n_features)
+    @ Out, expected, np.ndarray, the interpolated values, shape (n_queries, n_targets)
+  """
+  expected = np.zeros((len(queries), values.shape[1]))
+  for index in range(values.shape[1]):
+    interpolator = interpolationND.InverseDistanceWeighting(float(p))
+    interpolator.fit(interpolationND.vectd2d(points), interpolationND.vectd(values[:, index]))
+    for n, query in enumerate(queries):
+      expected[n, index] = interpolator.interpolateAt(interpolationND.vectd(query))
+  return expected
+
+def makeRom(p, numFeatures, knn=None):
+  """
+    Creates a NDinvDistWeight ROM
+    @ In, p, int, the power parameter
+    @ In, numFeatures, int, the number of features
+    @ In, knn, int, optional, the number of nearest training points
+    @ Out, rom, NDinvDistWeight, the ROM
+  """
+  options = {'messageHandler':mh, 'Features':['x{}'.format(i) for i in range(numFeatures)], 'Target':['a', 'b', 'c'], 'p':p}
+  if knn is not None:
+    options['knn'] = knn
+  return NDinvDistWeight(**options)
+
+rng = np.random.RandomState(42)
+for numFeatures, p in [(2, 2), (3, 1), (4, 3)]:
+  points = rng.rand(200, numFeatures)
+  values = np.column_stack([points.sum(axis=1), np.sin(points[:, 0]), points[:, -1]**2])
+  # random points, plus some training points
+  queries = np.vstack([rng.rand(100, numFeatures), points[:5]])
+  expected = crowInterpolation(points, values, p, queries)
+  rom = makeRom(p, numFeatures)
+  rom.__trainLocal__(points, values)
+  prediction = rom.__evaluateLocal__(queries)
+  for index, target in enumerate(['a', 'b', 'c']):
+    checkArray('all points, d={}, p={}, target {}'.format(numFeatures, p, target), prediction[target], expected[:, index])
+  # small batches must give the same values
+  rom._batchCells = 7 * len(points)
+  checkArray('small batches, d={}, p={}'.format(numFeatures, p), rom._evaluateBatch(queries), expected)
+  # using all the training points as nearest points is the same
+  rom = makeRom(p, numFeatures, knn=len(points))
+  rom.__trainLocal__(points, values)
+  checkArray('knn all points, d={}, p={}'.format(numFeatures, p), rom._evaluateBatch(queries), expected)
+  # k nearest points, against the brute force evaluation
+  rom = makeRom(p, numFeatures, knn=8)
+  rom.__trainLocal__(points, values)
+  knnValues = rom._evaluateBatch(queries)
+  for n, query in enumerate(queries[:10]):
+    distances = (np.abs(points - query)**p).sum(axis=1)**(1.0/p)
+    nearest = np.argsort(distances)[:8]
+    checkArray('knn point {}, d={}, p={}'.format(n, numFeatures, p), knnValues[n], crowInterpolation(points[nearest], values[nearest], p, [query])[0])
+  checkArray('knn training points, d={}, p={}'.format(numFeatures, p), knnValues[-5:], values[:5])
+  # pickled ROMs are retrained
+  rom.amITrained = True
+  unpickled = pk.loads(pk.dumps(rom))
+  checkArray('pickled, d={}, p={}'.format(numFeatures, p), unpickled._evaluateBatch(queries), knnValues)
+
+# duplicated training points: the first one is used
+points = np.array([[0., 0.], [1., 0.], [1., 0.], [0., 1.]])
+values = np.array([[1.], [2.], [3.], [4.]])
+for knn in [None, 3]:
+  options = {'messageHandler':mh, 'Features':['x', 'y'], 'Target':['a'], 'p':2}
+  if knn is not None:
+    options['knn'] = knn
+  rom = NDinvDistWeight(**options)
+  rom.__trainLocal__(points, values)
+  checkArray('duplicated training points, knn={}'.format(knn), rom._evaluateBatch(np.array([[1., 0.]]))[:, 0], [2.])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.NDinvDistWeight</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>SupervisedLearning.NDinvDistWeight</classesTested>
+    <description>
+       This test performs Unit Tests for the batched evaluation of the NDinvDistWeight ROM, comparing it with the
+       crow InverseDistanceWeighting interpolator, also using only the nearest training points.
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -0,0 +1,213 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the training and evaluation of the segment ROMs of the
+  ROMCollection.Segments with more processes (numWorkers), comparing them with the serial ones.
+  It can not be considered part of the active code but of the regression test system
+"""
+import os, sys
+import copy
+import xml.etree.ElementTree as ET
+import numpy as np
+
+# find location of crow, message handler
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+sys.path.append(frameworkDir)
+from utils.utils import find_crow
+find_crow(frameworkDir)
+import MessageHandler
+from Models import ROM
+from SupervisedLearning.ROMCollection import Segments
+
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'silent', 'callerLength':10, 'tagLength':10})
+
+results = {"pass":0,"fail":0}
+
+def checkArray(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two arrays of floats, that must be identical
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, np.ndarray, the array to compare
+    @ In, expected, np.ndarray, the expected array
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  value, expected = np.asarray(value), np.asarray(expected)
+  res = value.shape == expected.shape and bool(np.all(value == expected))
+  if updateResults:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking array",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
+class SegmentROM(object):
+  """
+    Minimal segment ROM: the mean of the training signal plus noise. As the ARMA, it draws the noise from its own
+    random engine (and, if requested, from numpy), and it is reseeded from numpy when copied, unless asked not to.
+  """
+  def __init__(self, useNumpy, reseedCopies):
+    """
+      Constructor.
+      @ In, useNumpy, bool, if True the noise also has a component drawn from numpy
+      @ In, reseedCopies, bool, if True the copies are reseeded from numpy
+      @ Out, None
+    """
+    self.target = ['Time', 'signal']
+    self.pivotParameterID = 'Time'
+    self.useNumpy = useNumpy
+    self.reseedCopies = reseedCopies
+    self.seed = 42
+    self.randomEng = np.random.RandomState(self.seed)
+    self.mean = None
+    self.length = None
+
+  def __setstate__(self, d):
+    """
+      Sets state of object from pickling.
+      @ In, d, dict, stateful dictionary
+      @ Out, None
+    """
+    self.__dict__.update(d)
+    if self.reseedCopies:
+      self.seed = np.random.randint(1, 2e9)
+      self.randomEng = np.random.RandomState(self.seed)
+
+  def adjustLocalRomSegment(self, settings, picker):
+    """
+      Adjusts the ROM for the segment (nothing to do).
+      @ In, settings, object, global settings
+      @ In, picker, slice, the segment
+      @ Out, None
+    """
+    pass
+
+  def getGlobalRomSegmentSettings(self, trainingDict, divisions):
+    """
+      Global training (nothing to do).
+      @ In, trainingDict, dict, the training data
+      @ In, divisions, tuple, the segments
+      @ Out, settings, object, global settings
+      @ Out, trainingDict, dict, the training data
+    """
+    return None, trainingDict
+
+  def finalizeLocalRomSegmentEvaluation(self, settings, evaluation, picker):
+    """
+      Adjusts the evaluation of the segment (nothing to do).
+      @ In, settings, object, global settings
+      @ In, evaluation, dict, the evaluation
+      @ In, picker, slice, the segment
+      @ Out, evaluation, dict, the evaluation
+    """
+    return evaluation
+
+  def finalizeGlobalRomSegmentEvaluation(self, settings, evaluation):
+    """
+      Adjusts the evaluation (nothing to do).
+      @ In, settings, object, global settings
+      @ In, evaluation, dict, the evaluation
+      @ Out, evaluation, dict, the evaluation
+    """
+    return evaluation
+
+  def train(self, data):
+    """
+      Trains the ROM.
+      @ In, data, dict, the training data of the segment
+      @ Out, None
+    """
+    self.mean = np.mean(data['signal'][0]) + (np.random.rand() if self.useNumpy else 0.0)
+    self.length = len(data['Time'][0])
+
+  def evaluate(self, edict):
+    """
+      Evaluates the ROM.
+      @ In, edict, dict, the request
+      @ Out, evaluation, dict, the evaluation
+    """
+    signal = self.mean + self.randomEng.normal(size=self.length)
+    if self.useNumpy:
+      signal += np.random.normal(size=self.length)
+    return {'Time': np.arange(self.length, dtype=float), 'signal': signal}
+
+def createSegments(numWorkers, useNumpy=False, reseedCopies=False):
+  """
+    Creates a segmented collection of SegmentROMs.
+    @ In, numWorkers, int, number of processes
+    @ In, useNumpy, bool, optional, if True the noise also has a component drawn from numpy
+    @ In, reseedCopies, bool, optional, if True the copies are reseeded from numpy
+    @ Out, segments, Segments, the collection
+  """
+  xml = ET.fromstring('<ROM name="segmented" subType="ARMA"><Target>Time,signal</Target><Features>scaling</Features>' +
+                      '<pivotParameter>Time</pivotParameter><Segment grouping="segment"><subspace divisions="6">Time</subspace>' +
+                      '<numWorkers>{}</numWorkers></Segment></ROM>'.format(numWorkers))
+  paramInput = ROM.getInputSpecification()()
+  paramInput.parseNode(xml)
+  return Segments(messageHandler=mh, name='segmented', paramInput=paramInput, modelInstance=SegmentROM(useNumpy, reseedCopies),
+                  Features=['scaling'], Target=['Time', 'signal'])
+
+def run(numWorkers, useNumpy=False, reseedCopies=False):
+  """
+    Trains and evaluates (twice) a segmented collection.
+    @ In, numWorkers, int, number of processes
+    @ In, useNumpy, bool, optional, if True the noise also has a component drawn from numpy
+    @ In, reseedCopies, bool, optional, if True the copies are reseeded from numpy
+    @ Out, run, tuple, (means of the segment ROMs, the two evaluations, the next number of numpy)
+  """
+  np.random.seed(7)
+  segments = createSegments(numWorkers, useNumpy, reseedCopies)
+  segments.train(copy.deepcopy(trainingSet), skipAssembly=True)
+  evaluations = [segments.evaluate({})['signal'] for _ in range(2)]
+  return [rom.mean for rom in segments._roms], evaluations, np.random.rand()
+
+time = np.arange(120, dtype=float)
+trainingSet = {'Time': [time], 'signal': [np.sin(time/10.)]}
+
+# ROMs drawing from their own random engine: the same results as in serial, and the same random stream of numpy
+for reseed in [False, True]:
+  serial = run(1, reseedCopies=reseed)
+  parallel = run(3, reseedCopies=reseed)
+  checkArray('trained ROMs, reseed {}'.format(reseed), parallel[0], serial[0])
+  checkArray('first evaluation, reseed {}'.format(reseed), parallel[1][0], serial[1][0])
+  checkArray('second evaluation, reseed {}'.format(reseed), parallel[1][1], serial[1][1])
+  checkArray('numpy stream, reseed {}'.format(reseed), parallel[2], serial[2])
+checkArray('evaluations differ', np.all(serial[1][0] == serial[1][1]), False)
+
+# ROMs also drawing from numpy: reproducible results, independent of the number of processes
+first = run(3, useNumpy=True)
+checkArray('reproducible training', run(3, useNumpy=True)[0], first[0])
+checkArray('reproducible evaluation', run(3, useNumpy=True)[1], first[1])
+checkArray('same results with a different number of processes', run(2, useNumpy=True)[1], first[1])
+checkArray('numpy stream not advanced', first[2], run(1)[2])
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.ROMCollectionParallel</name>
+    <author>agent</author>
+    <created>2026-10-18</created>
+    <classesTested>SupervisedLearning.ROMCollection.Segments</classesTested>
+    <description>
+       This test performs Unit Tests for the training and evaluation of the segment ROMs of the Segments collection
+       with more processes (numWorkers): the results must match the serial ones for ROMs drawing their random numbers
+       from their own engine, and be reproducible for ROMs also drawing from numpy.
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
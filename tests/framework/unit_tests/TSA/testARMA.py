@@ -325,6 +325,17 @@ checkFloat('Simple denorm 250', 2.051286365253135, new[250], tol=1e-6)
 checkFloat('Simple denorm 500', -0.5047179383332892, new[500], tol=1e-6)
 checkFloat('Simple denorm 999', 1.3200315405820204, new[999], tol=1e-6)
 
+##########
+# Batch generation reproduces subsequent single generations
+#
+randomUtils.randomSeed(42, engine=None)
+single = np.array([arma.generate(params, pivot, settings) for _ in range(3)])
+randomUtils.randomSeed(42, engine=None)
+batch = arma.generateBatch(params, pivot, settings, 3)
+checkSame('Batch generate shape', batch.shape, (3, len(pivot), 1))
+for s in range(3):
+  checkArray(f'Batch generate sample {s}', batch[s, :, 0], single[s, :, 0], float, tol=1e-8)
+
 print(results)
 
 sys.exit(results["fail"])
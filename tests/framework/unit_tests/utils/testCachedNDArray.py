@@ -58,6 +58,24 @@ def checkAnswer(comment,value,expected,tol=1e-10,updateResults=True):
       results["pass"] += 1
     return True
 
+def checkSame(comment,value,expected,updateResults=True):
+  """
+    This method is aimed to compare two identical things
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, object, the value to compare
+    @ In, expected, object, the expected value
+    @ In, updateResults, bool, optional, if True updates global results
+    @ Out, res, bool, True if same
+  """
+  res = value == expected
+  if updateResults:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking answer",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+  return res
+
 
 #establish test array
 origin = np.array([-3.14,2.99792,2.718,8.987,0.618])
@@ -105,6 +123,72 @@ else:
   print('checking string representation does not match:\n'+msg,'\n!=\n'+right)
   results['fail']+=1
 
+#test columnar array
+testColumns = cached_ndarray.cColumnarArray(width=4,length=2)
+for i in range(5):
+  testColumns.append([np.float64(i*0.5), np.int64(i), 'a{}'.format(i), np.arange(3)+i])
+checkAnswer('columnar length',len(testColumns),5)
+checkAnswer('columnar capacity growth',testColumns.capacity,8)
+checkSame('columnar float column type',testColumns.columns[0].dtype,np.float64)
+checkSame('columnar int column type',testColumns.columns[1].dtype,np.int64)
+checkSame('columnar string column type',testColumns.columns[2].dtype,object)
+checkSame('columnar ND column type',testColumns.columns[3].dtype,object)
+checkAnswer('columnar column',testColumns[:,0].sum(),5.0)
+checkAnswer('columnar element',testColumns[3,1],3)
+row = testColumns[2]
+checkAnswer('columnar row, 0',row[0],1.0)
+checkSame('columnar row, 2',row[2],'a2')
+checkAnswer('columnar row, 3',row[3][-1],4)
+checkSame('columnar row element type',type(row[0]),np.float64)
+#test extend
+testColumns.extend([np.array([3.0,3.5]), np.array([5,6]), np.array(['b','c']), np.array([[0,0,0],[1,1,1]])])
+checkAnswer('columnar extend length',len(testColumns),7)
+checkAnswer('columnar extend float',testColumns[-1,0],3.5)
+checkSame('columnar extend string',testColumns[5,2],'b')
+checkAnswer('columnar extend ND',testColumns[6,3].sum(),3)
+#test switching to object column on mixed types
+testColumns.append([np.float64(4.0), 7.5, 'd', np.arange(2)])
+checkSame('columnar mixed type column',testColumns.columns[1].dtype,object)
+checkSame('columnar mixed type old entry',type(testColumns[0,1]),np.int64)
+checkAnswer('columnar mixed type new entry',testColumns[7,1],7.5)
+#test set item
+testColumns[0,0] = 10.0
+checkAnswer('columnar set item',testColumns[:,0].sum(),25.5)
+#test entities
+testColumns.removeEntity(2)
+checkAnswer('columnar remove entity',testColumns.width,3)
+checkAnswer('columnar remove entity, shape',testColumns.getData().shape[1],3)
+testColumns.addEntity([np.zeros(2)]*len(testColumns))
+checkAnswer('columnar add entity',testColumns[-1][-1].size,2)
+checkAnswer('columnar selection',len(testColumns[np.where(testColumns[:,0] > 2.0)]),4)
+#test extend with a column switching to object partway through the new samples
+mixed = cached_ndarray.cColumnarArray(width=1,length=2)
+mixed.extend([np.array([1.0,'x',3],dtype=object)])
+checkSame('columnar extend mixed column',list(mixed[:,0]),[1.0,'x',3])
+switched = cached_ndarray.cColumnarArray(width=1,length=2)
+switched.extend([np.array([1,2])])
+switched.extend([[3,4,5.5]])
+checkSame('columnar extend int to float column',list(switched[:,0]),[1,2,3,4,5.5])
+checkSame('columnar extend int to float column type',switched.columns[0].dtype,object)
+#test ints stored in a float column, which stays typed
+casted = cached_ndarray.cColumnarArray(width=1,length=2)
+casted.append([1.5])
+casted.append([2])
+casted.extend([np.array([3,4])])
+casted.extend([[5,6.5]])
+checkSame('columnar int in float column type',casted.columns[0].dtype,np.float64)
+checkSame('columnar int in float column',list(casted[:,0]),[1.5,2.0,3.0,4.0,5.0,6.5])
+casted = cached_ndarray.cColumnarArray(width=1,length=2)
+casted.append([1])
+casted.append([1.5])
+checkSame('columnar float in int column type',casted.columns[0].dtype,object)
+checkSame('columnar float in int column',list(casted[:,0]),[1,1.5])
+casted = cached_ndarray.cColumnarArray(width=1,length=2)
+casted.append([0.5])
+casted.append([2**70])
+checkSame('columnar large int in float column type',casted.columns[0].dtype,object)
+checkSame('columnar large int in float column',casted[1,0],2**70)
+
 print(results)
 
 sys.exit(results["fail"])
@@ -121,6 +205,7 @@ sys.exit(results["fail"])
     <revisions>
       <revision author="talbpaul" date="2016-11-08">Relocated utils tests</revision>
       <revision author="alfoa" date="2017-01-21">Adding this test description.</revision>
+      <revision author="agent" date="2026-10-18">Added tests of the cColumnarArray</revision>
     </revisions>
   </TestInfo>
 """
@@ -409,6 +409,50 @@ checkAnswer('isABoolean str'  ,mathUtils.isABoolean("True"),False)
 checkAnswer('isABoolean 3.14' ,mathUtils.isABoolean(3.14  ),False)
 checkAnswer('isABoolean long' ,mathUtils.isABoolean(123456789012345678901234567890),False)
 
+### simulateStateSpace
+# AR(1) with intercept and measurement noise, for two realizations at once
+ar = 0.6
+stateShocks = np.array([[0.5, -1.0, 0.25, 2.0], [1.0, 0.0, -0.5, 0.1]])
+msrShocks = np.array([[0.1, 0.0, -0.1, 0.2], [0.0, 0.3, 0.0, -0.2]])
+init = np.array([1.0, -2.0])
+matrices = {'design': np.array([[1.0]]),
+            'obs_intercept': np.array([3.0]),
+            'transition': np.array([[ar]]),
+            'state_intercept': np.array([0.0]),
+            'selection': np.array([[1.0]])}
+simulated = mathUtils.simulateStateSpace(matrices, msrShocks[:, :, np.newaxis], stateShocks[:, :, np.newaxis], init[:, np.newaxis])
+checkTrue('simulateStateSpace shape', simulated.shape, (2, 4, 1))
+for s in range(2):
+  state = init[s]
+  expected = []
+  for t in range(4):
+    expected.append(3.0 + state + msrShocks[s, t])
+    state = ar * state + stateShocks[s, t]
+  checkArray('simulateStateSpace realization {}'.format(s), simulated[s, :, 0], expected)
+# time-varying intercept
+matrices['obs_intercept'] = np.array([[0.0, 1.0, 2.0, 3.0]])
+simulatedTV = mathUtils.simulateStateSpace(matrices, msrShocks[:, :, np.newaxis], stateShocks[:, :, np.newaxis], init[:, np.newaxis])
+checkArray('simulateStateSpace time-varying', simulatedTV[0, :, 0] - simulated[0, :, 0], [-3.0, -2.0, -1.0, 0.0])
+
+### andersonMixing, aitkenRelaxation
+# linear fixed-point problem x = A x + c
+A = np.array([[0.5, 0.4], [-0.3, 0.8]])
+c = np.array([1.0, 2.0])
+fixedPoint = np.linalg.solve(np.eye(2) - A, c)
+iterates = [np.zeros(2)]
+residuals = [A @ iterates[0] + c - iterates[0]]
+checkArray('andersonMixing relaxed picard', mathUtils.andersonMixing(iterates, residuals, 0.5), 0.5 * residuals[0])
+for _ in range(3):
+  iterates.append(mathUtils.andersonMixing(iterates, residuals))
+  residuals.append(A @ iterates[-1] + c - iterates[-1])
+# with a history larger than the problem size, the solution is exact
+checkArray('andersonMixing linear', iterates[-1], fixedPoint)
+# scalar linear problem x = 0.5 x + 1, solved exactly by the Aitken acceleration
+relaxation = mathUtils.aitkenRelaxation(np.array([1.0]), np.array([0.5]), 1.0)
+checkAnswer('aitkenRelaxation', relaxation, 2.0)
+checkArray('aitkenRelaxation step', np.array([1.0]) + relaxation * np.array([0.5]), [2.0])
+checkAnswer('aitkenRelaxation converged', mathUtils.aitkenRelaxation(np.array([0.5]), np.array([0.5]), 0.7), 0.7)
+
 ###################
 # Variable Groups #
 ###################
@@ -481,6 +525,8 @@ sys.exit(results["fail"])
       <revision author="talbpaul" date="2016-11-08">Relocated utils tests</revision>
       <revision author="alfoa" date="2017-01-21">Adding this test description.</revision>
       <revision author="alfoa" date="2019-03-04">Moved methods isAString, isAFloat, isAInteger, isABoolean from mathUtils to utils</revision>
+      <revision author="agent" date="2026-10-18">Added simulateStateSpace test</revision>
+      <revision author="agent" date="2026-10-18">Added andersonMixing and aitkenRelaxation tests</revision>
     </revisions>
   </TestInfo>
 """
@@ -211,6 +211,16 @@ vals = randomUtils.randomNormal((5,3),engine=eng)
 checkAnswer('randomNormal number of samples for local engine provided',len(vals),5)
 checkAnswer('randomNormal size of sample for local engine provided',len(vals[0]),3)
 
+## many points are the same as subsequent single values (including an odd number of them)
+engine = randomUtils.newRNG()
+engine.seed(42)
+singles = [randomUtils.randomNormal(engine=engine) for _ in range(4)]
+vals = randomUtils.randomNormal(3,engine=engine)
+singles += [randomUtils.randomNormal(engine=engine) for _ in range(9)]
+engine.seed(42)
+block = list(randomUtils.randomNormal(7,engine=engine)) + list(randomUtils.randomNormal((3,3),engine=engine).ravel())
+checkArray('randomNormal many points same as single values',block,singles[:4]+list(vals)+singles[4:])
+
 ### randomIntegers(), sampling integers in a range
 randomUtils.randomSeed(42,engine=None)
 randomUtils.randomSeed(42,engine=eng)
@@ -170,6 +170,50 @@ checkSame('Equivalency only text !=:',a!=b,False)
 ##############
 # TODO
 
+# name index of hierarchical trees
+root = TS.HierarchicalNode('DET_1')
+tree = TS.HierarchicalTree(root)
+first = TS.HierarchicalNode('DET_1-1')
+second = TS.HierarchicalNode('DET_1-2')
+root.appendBranch(first)
+root.appendBranch(second)
+## a subtree built separately is indexed when attached
+sub = TS.HierarchicalNode('DET_1-1-1')
+subsub = TS.HierarchicalNode('DET_1-1-1-1')
+sub.appendBranch(subsub)
+first.appendBranch(sub)
+for node in [root, first, second, sub, subsub]:
+  checkSame('Indexed node '+node.name+':',tree.findByName(node.name) is node,True)
+  checkSame('Indexed node '+node.name+' from a branch:',second.findByName(node.name) is node,True)
+checkSame('Index matches traversal:',tree.findByName('DET_1-1-1-1') is list(root.iter('DET_1-1-1-1'))[0],True)
+checkSame('Missing node:',tree.findByName('DET_1-3'),None)
+## inserted and extended branches
+inserted = TS.HierarchicalNode('DET_1-0')
+root.insertBranch(0,inserted)
+extended = [TS.HierarchicalNode('DET_1-2-1'),TS.HierarchicalNode('DET_1-2-2')]
+second.extendBranch(extended)
+checkSame('Inserted node:',tree.findByName('DET_1-0') is inserted,True)
+checkSame('Extended node:',tree.findByName('DET_1-2-2') is extended[1],True)
+## equal nodes with the same name: the first added one is found, the removed one is not
+twin = TS.HierarchicalNode('DET_1-2-1')
+first.appendBranch(twin)
+checkSame('Duplicated name:',tree.findByName('DET_1-2-1') is extended[0],True)
+second.removeBranch(extended[0])
+checkSame('Removed duplicated name:',tree.findByName('DET_1-2-1') is twin,True)
+## removed subtrees get their own index
+first.removeBranch(sub)
+checkSame('Removed subtree:',tree.findByName('DET_1-1-1-1'),None)
+checkSame('Removed subtree index:',sub.findByName('DET_1-1-1-1') is subsub,True)
+checkSame('Removed subtree root index:',subsub.findByName('DET_1'),None)
+## renamed nodes
+tree.updateNodeName('DET_1-0','DET_1-3')
+checkSame('Renamed node:',tree.findByName('DET_1-3') is inserted,True)
+checkSame('Renamed node old name:',tree.findByName('DET_1-0'),None)
+## cleared nodes
+second.clearBranch()
+checkSame('Cleared branch:',tree.findByName('DET_1-2-2'),None)
+checkSame('Cleared node still indexed:',tree.findByName('DET_1-2') is second,True)
+
 ##################
 # Metadata Tests #
 ##################
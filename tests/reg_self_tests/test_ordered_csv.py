@@ -19,29 +19,33 @@ sys.path.append(test_system_dir)
 rook_system_dir = os.path.join(base_dir,"rook")
 sys.path.append(rook_system_dir)
 
+import OrderedCSVDiffer as OrderedCSVModule
 from OrderedCSVDiffer import OrderedCSVDiffer
 
 print(OrderedCSVDiffer)
 
 results = {"pass":0,"fail":0}
 
-for expected_same, filename in [(True,"same.csv"),
-                                (True,"col_swap.csv"),
-                                (False,"diff_len.csv"),
-                                (False,"diff_num.csv"),
-                                (False,"diff_word.csv"),
-                                (False,"diff_col_word.csv"),
-                                (False,"diff_type.csv")]:
-  orig = os.path.join(my_dir, filename)
-  gold = os.path.join(my_dir, "gold", filename)
-  differ = OrderedCSVDiffer([filename], [gold])
-  same, message = differ.diff()
-  print(message)
-  if expected_same != same:
-    print("Expected:",expected_same,"Got",same,"Message",message)
-    results["fail"] += 1
-  else:
-    results["pass"] += 1
+# the files are compared in chunks of rows, check chunks smaller than the files too
+for chunk_rows in [OrderedCSVModule.chunk_rows, 1]:
+  OrderedCSVModule.chunk_rows = chunk_rows
+  for expected_same, filename in [(True,"same.csv"),
+                                  (True,"col_swap.csv"),
+                                  (False,"diff_len.csv"),
+                                  (False,"diff_num.csv"),
+                                  (False,"diff_word.csv"),
+                                  (False,"diff_col_word.csv"),
+                                  (False,"diff_type.csv")]:
+    orig = os.path.join(my_dir, filename)
+    gold = os.path.join(my_dir, "gold", filename)
+    differ = OrderedCSVDiffer([filename], [gold])
+    same, message = differ.diff()
+    print(message)
+    if expected_same != same:
+      print("Expected:",expected_same,"Got",same,"Message",message)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
 
 
 print(results)